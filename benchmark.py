@@ -0,0 +1,322 @@
+# Startup and memory benchmark for the OKTS app.
+#
+# Runs MainWindow under QT_QPA_PLATFORM=offscreen against a local HTTP server
+# that serves stand-ins for the web tab pages, and records:
+#   - time to first window (process start -> first paint of MainWindow)
+#   - construction time of every tab
+#   - time to loadFinished for every WebBrowserTab*
+#   - peak RSS of the app and of its renderer processes together
+#
+# Recorded copies of the real pages (python benchmark.py --record) are served
+# from benchmark_pages/ when present, otherwise generated pages are used.
+#
+#   python benchmark.py --output bench.json
+#   python benchmark.py --baseline bench.json --threshold 20
+#
+# With --baseline the exit code is 1 when any metric is more than --threshold
+# percent worse than the baseline.
+import time
+PROCESS_T0 = time.perf_counter()
+
+import os
+import sys
+import json
+import shutil
+import argparse
+import statistics
+import subprocess
+import tempfile
+import threading
+import urllib.request
+from functools import partial
+from http.server import ThreadingHTTPServer, SimpleHTTPRequestHandler
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+PAGES_DIR = HERE / "benchmark_pages"
+LOAD_TIMEOUT_S = 30
+RSS_SAMPLE_MS = 50
+# Differences below these are noise, whatever the percentage says
+ABSOLUTE_SLACK = {"ms": 5.0, "mb": 5.0}
+
+
+# ------------------------- Stand-in pages -------------------------
+def synthetic_page(title, paragraphs=300):
+    # A page with some weight: text, a style sheet, a script and images, all
+    # served locally so the HTTP cache is exercised as well
+    body = "\n".join(
+        f"<p>{title} paragraph {n}. Lorem ipsum dolor sit amet, consectetur adipiscing elit, "
+        f"sed do eiusmod tempor incididunt ut labore et dolore magna aliqua.</p>"
+        for n in range(paragraphs)
+    )
+    images = "\n".join(f'<img src="/assets/image{n}.svg" width="64" height="64">' for n in range(8))
+    return f"""<!DOCTYPE html>
+<html><head><meta charset="utf-8"><title>{title}</title>
+<link rel="stylesheet" href="/assets/style.css">
+<script src="/assets/script.js"></script></head>
+<body><h1>{title}</h1>{images}{body}</body></html>
+"""
+
+
+def synthetic_pdf(pages=20):
+    # Minimal valid PDF with one line of text per page
+    objects = ["<< /Type /Catalog /Pages 2 0 R >>", None, "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for page in range(pages):
+        text = f"BT /F1 14 Tf 72 720 Td (5.{page + 1}.1 Benchmark rule text for page {page + 1}) Tj ET"
+        objects.append(f"<< /Length {len(text)} >>\nstream\n{text}\nendstream")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {len(objects)} 0 R >>")
+        kids.append(f"{len(objects)} 0 R")
+    objects[1] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {pages} >>"
+
+    out = "%PDF-1.4\n"
+    offsets = []
+    for number, body in enumerate(objects, start=1):
+        offsets.append(len(out.encode("latin-1")))
+        out += f"{number} 0 obj\n{body}\nendobj\n"
+    xref = len(out.encode("latin-1"))
+    out += f"xref\n0 {len(objects) + 1}\n0000000000 65535 f \n"
+    out += "".join(f"{offset:010d} 00000 n \n" for offset in offsets)
+    out += f"trailer\n<< /Size {len(objects) + 1} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n"
+    return out.encode("latin-1")
+
+
+def web_tab_classes():
+    import main2
+    return [(title, tab_class) for title, tab_class in main2.TABS if issubclass(tab_class, main2.BrowserTab)]
+
+
+def page_name(tab_class):
+    return f"{tab_class.__name__}.pdf" if tab_class.__name__ == "WebBrowserTab5" else f"{tab_class.__name__}.html"
+
+
+def prepare_site(directory):
+    # Recordings win over generated pages
+    assets = directory / "assets"
+    assets.mkdir(parents=True, exist_ok=True)
+    (assets / "style.css").write_text("body { font-family: sans-serif; } p { margin: 4px; }\n" * 200)
+    (assets / "script.js").write_text("var data = [" + ",".join(str(n) for n in range(20000)) + "];\n")
+    for n in range(8):
+        (assets / f"image{n}.svg").write_text(
+            f'<svg xmlns="http://www.w3.org/2000/svg" width="64" height="64">'
+            f'<circle cx="32" cy="32" r="{8 + n * 3}" fill="#00{n}0ff"/></svg>')
+
+    for title, tab_class in web_tab_classes():
+        name = page_name(tab_class)
+        if (PAGES_DIR / name).exists():
+            shutil.copy(PAGES_DIR / name, directory / name)
+        elif name.endswith(".pdf"):
+            (directory / name).write_bytes(synthetic_pdf())
+        else:
+            (directory / name).write_text(synthetic_page(title), encoding="utf-8")
+
+
+def record_pages():
+    # Saves the current HTML of every tab page (the document only, not its
+    # scripts and images) into benchmark_pages/
+    PAGES_DIR.mkdir(exist_ok=True)
+    import main2
+    for title, tab_class in web_tab_classes():
+        url = main2.RULEBOOKS["Handgun"] if tab_class.__name__ == "WebBrowserTab5" else tab_class.start_url
+        request = urllib.request.Request(url, headers={"User-Agent": main2.USER_AGENT})
+        try:
+            with urllib.request.urlopen(request, timeout=60) as response:
+                (PAGES_DIR / page_name(tab_class)).write_bytes(response.read())
+            print(f"recorded {title}")
+        except OSError as e:
+            print(f"could not record {title}: {e}")
+
+
+class QuietHandler(SimpleHTTPRequestHandler):
+    def log_message(self, format, *args):
+        pass
+
+
+def start_server(directory):
+    server = ThreadingHTTPServer(("127.0.0.1", 0), partial(QuietHandler, directory=str(directory)))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+
+# ------------------------- Measured run ---------------------------
+def run_child(port, result_path):
+    # Runs in a fresh process so imports and Chromium start cold
+    os.environ["QT_QPA_PLATFORM"] = "offscreen"
+    from PyQt6.QtCore import QEventLoop, QTimer, QObject, QEvent
+    import main2
+
+    base = f"http://127.0.0.1:{port}"
+    for title, tab_class in web_tab_classes():
+        tab_class.start_url = f"{base}/{page_name(tab_class)}"
+
+    app = main2.create_application([sys.argv[0]], "OKTS Benchmark")
+
+    # Fresh settings and data for every run, no lifecycle freezing, prefetch
+    # or snapshots
+    settings = main2.app_settings()
+    settings.clear()
+    settings.setValue("rulebooks/Handgun/url", f"{base}/WebBrowserTab5.pdf")
+    settings.setValue("rulebooks/last", "Handgun")
+    settings.setValue("lifecycle/freeze_after_s", 3600)
+    settings.setValue("lifecycle/discard_after_min", 600)
+    settings.setValue("lifecycle/memory_budget_mb", 0)
+    settings.setValue("prefetch/enabled", False)
+    settings.setValue("snapshots/enabled", False)
+    settings.setValue("watch/enabled", False)
+    shutil.rmtree(main2.app_data_dir(), ignore_errors=True)
+
+    results = {"tabs": {}}
+    peaks = {"app": 0, "renderers": 0}
+    window = None
+
+    def sample_rss():
+        peaks["app"] = max(peaks["app"], main2.process_rss(os.getpid()) or 0)
+        if window is not None:
+            pids = {tab.web_view.page().renderProcessPid() for tab in window.lifecycle.web_tabs()}
+            peaks["renderers"] = max(peaks["renderers"], sum(main2.process_rss(pid) or 0 for pid in pids))
+
+    sampler = QTimer()
+    sampler.timeout.connect(sample_rss)
+    sampler.start(RSS_SAMPLE_MS)
+
+    class FirstPaint(QObject):
+        def __init__(self):
+            super().__init__()
+            self.loop = QEventLoop()
+
+        def eventFilter(self, watched, event):
+            # Watches the whole application only until the window first paints,
+            # because start_main_window shows the window before returning it
+            if (event.type() == QEvent.Type.Paint and isinstance(watched, main2.MainWindow)
+                    and "time_to_first_window_ms" not in results):
+                results["time_to_first_window_ms"] = (time.perf_counter() - PROCESS_T0) * 1000
+                self.loop.quit()
+            return False
+
+    # Same resources, style sheet, blocklist and window setup as main()
+    first_paint = FirstPaint()
+    app.installEventFilter(first_paint)
+    window = main2.start_main_window(app)
+    window.resize(1280, 800)
+    QTimer.singleShot(int(LOAD_TIMEOUT_S * 1000), first_paint.loop.quit)
+    first_paint.loop.exec()
+    app.removeEventFilter(first_paint)
+
+    for index, (title, tab_class) in enumerate(main2.TABS):
+        start = time.perf_counter()
+        window.tab_widget.setCurrentIndex(index)
+        tab = window.tab_widget.widget(index).widget
+        metrics = {"construct_ms": (time.perf_counter() - start) * 1000}
+
+        if isinstance(tab, main2.BrowserTab):
+            loop = QEventLoop()
+            finished = {}
+            tab.web_view.loadFinished.connect(lambda ok: (finished.setdefault("ok", ok), loop.quit()))
+            QTimer.singleShot(int(LOAD_TIMEOUT_S * 1000), loop.quit)
+            loop.exec()
+            metrics["load_finished_ms"] = (time.perf_counter() - start) * 1000
+            metrics["load_ok"] = finished.get("ok", False)
+        results["tabs"][tab_class.__name__] = metrics
+
+    # Let the renderers settle before the last RSS samples
+    loop = QEventLoop()
+    QTimer.singleShot(1000, loop.quit)
+    loop.exec()
+    sample_rss()
+
+    results["peak_app_rss_mb"] = peaks["app"] / 1e6
+    results["peak_renderer_rss_mb"] = peaks["renderers"] / 1e6
+    Path(result_path).write_text(json.dumps(results, indent=2))
+
+
+# ------------------------- Driver ---------------------------------
+def flatten(results, prefix=""):
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        elif isinstance(value, (int, float)) and not isinstance(value, bool):
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def unflatten(flat):
+    results = {}
+    for key, value in flat.items():
+        node = results
+        *parents, leaf = key.split(".")
+        for parent in parents:
+            node = node.setdefault(parent, {})
+        node[leaf] = value
+    return results
+
+
+def run_benchmark(runs):
+    with tempfile.TemporaryDirectory() as site:
+        prepare_site(Path(site))
+        server = start_server(Path(site))
+        port = server.server_address[1]
+        samples = []
+        try:
+            for run in range(runs):
+                result_path = Path(site) / f"result{run}.json"
+                env = dict(os.environ, QT_QPA_PLATFORM="offscreen")
+                subprocess.run([sys.executable, __file__, "--child", str(port), str(result_path)],
+                               env=env, cwd=HERE, check=True)
+                samples.append(flatten(json.loads(result_path.read_text())))
+        finally:
+            server.shutdown()
+
+    # Median per metric over the runs
+    keys = sorted(set().union(*samples))
+    return {key: statistics.median(sample[key] for sample in samples if key in sample) for key in keys}
+
+
+def compare(current, baseline, threshold):
+    regressions = []
+    for key, base in sorted(baseline.items()):
+        if key not in current:
+            continue
+        value = current[key]
+        slack = ABSOLUTE_SLACK["mb"] if key.endswith("_mb") else ABSOLUTE_SLACK["ms"]
+        change = (value - base) / base * 100 if base else 0.0
+        worse = value > base * (1 + threshold / 100) and value - base > slack
+        print(f"{'REGRESSED' if worse else 'ok':>9}  {key:<45} {base:10.1f} -> {value:10.1f}  ({change:+.1f}%)")
+        if worse:
+            regressions.append(key)
+    return regressions
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OKTS startup and memory benchmark")
+    parser.add_argument("--output", default="bench_output.json", help="where to write the results")
+    parser.add_argument("--baseline", help="results of an earlier run to compare with")
+    parser.add_argument("--threshold", type=float, default=15.0, help="allowed slowdown in percent")
+    parser.add_argument("--runs", type=int, default=3, help="runs to take the median of")
+    parser.add_argument("--record", action="store_true", help="record the real tab pages and exit")
+    parser.add_argument("--child", nargs=2, metavar=("PORT", "RESULT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        run_child(int(args.child[0]), args.child[1])
+        return 0
+    if args.record:
+        record_pages()
+        return 0
+
+    current = run_benchmark(args.runs)
+    Path(args.output).write_text(json.dumps(unflatten(current), indent=2))
+    print(f"results written to {args.output}")
+
+    if args.baseline:
+        baseline = flatten(json.loads(Path(args.baseline).read_text()))
+        regressions = compare(current, baseline, args.threshold)
+        if regressions:
+            print(f"{len(regressions)} metric(s) regressed by more than {args.threshold:g}%")
+            return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,135 @@
+# Tracker / ad blocking for the web tabs.
+#
+# The blocklist is compiled into a trie of reversed host labels
+# ("www.google-analytics.com" -> com, google-analytics, www), so a request is
+# checked by walking at most one dict lookup per label of its host, however
+# many rules there are. Compiling tens of thousands of rules takes a while, so
+# the result is cached with marshal next to the user data and loaded in the
+# background; requests made before it is ready are simply let through.
+#
+# Imported from main2.load_webengine(), since the interceptor needs QtWebEngine.
+import marshal
+import re
+import zlib
+
+from PyQt6.QtCore import pyqtSignal
+from PyQt6.QtWebEngineCore import QWebEngineUrlRequestInterceptor, QWebEngineUrlRequestInfo
+
+END = ""  # Trie key marking a blocked domain; host labels are never empty
+CACHE_VERSION = 1
+
+# hosts files ("0.0.0.0 example.com"), plain domain lists and the
+# "||example.com^" form of adblock lists are accepted
+HOSTS_LINE_RE = re.compile(r"^(?:0\.0\.0\.0|127\.0\.0\.1|::1?)\s+(\S+)")
+ADBLOCK_LINE_RE = re.compile(r"^\|\|([a-z0-9.\-]+)\^?$")
+DOMAIN_RE = re.compile(r"^[a-z0-9\-_]+(\.[a-z0-9\-_]+)+$")
+IGNORED_HOSTS = {"localhost", "localhost.localdomain", "local", "broadcasthost", "0.0.0.0"}
+
+# Blocked requests never download, so the bytes saved are estimated from
+# typical transfer sizes per resource type
+ResourceType = QWebEngineUrlRequestInfo.ResourceType
+ESTIMATED_BYTES = {
+    ResourceType.ResourceTypeScript: 60_000,
+    ResourceType.ResourceTypeSubFrame: 80_000,
+    ResourceType.ResourceTypeImage: 15_000,
+    ResourceType.ResourceTypeStylesheet: 20_000,
+    ResourceType.ResourceTypeMedia: 200_000,
+    ResourceType.ResourceTypeFontResource: 30_000,
+    ResourceType.ResourceTypeXhr: 2_000,
+    ResourceType.ResourceTypePing: 500,
+}
+DEFAULT_ESTIMATED_BYTES = 5_000
+
+
+def parse_rule(line):
+    line = line.strip().lower()
+    if not line or line[0] in "#!":
+        return None
+    match = HOSTS_LINE_RE.match(line) or ADBLOCK_LINE_RE.match(line)
+    host = match.group(1) if match else line
+    host = host.split("#", 1)[0].strip().rstrip(".")
+    if host.startswith("*."):
+        host = host[2:]
+    if host in IGNORED_HOSTS or not DOMAIN_RE.match(host):
+        return None
+    return host
+
+
+def compile_blocklist(text):
+    trie = {}
+    for line in text.splitlines():
+        host = parse_rule(line)
+        if host is None:
+            continue
+        node = trie
+        for label in reversed(host.split(".")):
+            if END in node:
+                break  # A parent domain is already blocked
+            node = node.setdefault(label, {})
+        else:
+            # Everything below a blocked domain is blocked too
+            node.clear()
+            node[END] = True
+    return trie
+
+
+def is_blocked(trie, host):
+    node = trie
+    for label in reversed(host.lower().rstrip(".").split(".")):
+        node = node.get(label)
+        if node is None:
+            return False
+        if END in node:
+            return True
+    return False
+
+
+def load_blocklist(text, cache_path):
+    # The cache is keyed on a checksum of the list text, which is far cheaper
+    # than parsing it again
+    key = (CACHE_VERSION, zlib.crc32(text.encode("utf-8")), len(text))
+    try:
+        cached_key, trie = marshal.loads(cache_path.read_bytes())
+        if tuple(cached_key) == key:
+            return trie
+    except (OSError, ValueError, EOFError, TypeError):
+        pass
+    trie = compile_blocklist(text)
+    try:
+        tmp_path = cache_path.with_suffix(".tmp")
+        tmp_path.write_bytes(marshal.dumps((key, trie)))
+        tmp_path.replace(cache_path)
+    except OSError:
+        pass
+    return trie
+
+
+class BlocklistInterceptor(QWebEngineUrlRequestInterceptor):
+    # One per page, so blocked requests can be counted per tab; the compiled
+    # trie is shared and set once it has loaded
+    trie = None
+    blocked = pyqtSignal()
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.blocked_requests = 0
+        self.bytes_saved = 0
+
+    def interceptRequest(self, info):
+        trie = BlocklistInterceptor.trie
+        if not trie:
+            return
+        # Never block what the user navigated to, nor anything on a site that
+        # is itself on the list (they opened it on purpose)
+        if info.resourceType() == ResourceType.ResourceTypeMainFrame:
+            return
+        host = info.requestUrl().host()
+        if not is_blocked(trie, host):
+            return
+        first_party = info.firstPartyUrl().host()
+        if first_party and is_blocked(trie, first_party):
+            return
+        info.block(True)
+        self.blocked_requests += 1
+        self.bytes_saved += ESTIMATED_BYTES.get(info.resourceType(), DEFAULT_ESTIMATED_BYTES)
+        self.blocked.emit()
@@ -0,0 +1,207 @@
+# IPSC power factor, division and scoring rules, without any Qt.
+#
+# Shared by the app (main2.py) and the headless JSON service (service.py), so
+# both classify and score the same way. Limits per discipline and season come
+# from rulesets.json. Each division is compiled into a ThresholdTable: the
+# sorted PF limits and the class each one starts, so classifying a PF, or a
+# whole array of them, is one binary search. numpy is imported where it is
+# first needed.
+import bisect
+import json
+import math
+
+
+# ------------------------- Power Factor -------------------------
+DEFAULT_DISCIPLINE = "Handgun"
+PF_CLASS_CODES = {None: 0, "Minor": 1, "Major": 2}
+
+
+class ThresholdTable:
+    STATUSES = (None, "Minor", "Major")
+
+    def __init__(self, minor=None, major=None):
+        self.minor = minor
+        self.major = major
+        limits = sorted((limit, code) for code, limit in ((1, minor), (2, major)) if limit is not None)
+        self.limits = [limit for limit, _ in limits]
+        self.codes = [0] + [code for _, code in limits]
+
+    def code(self, power_factor):
+        # NaN would sort above every limit; an invalid PF makes no class
+        if not math.isfinite(power_factor):
+            return 0
+        return self.codes[bisect.bisect_right(self.limits, power_factor)]
+
+    def status(self, power_factor):
+        return self.STATUSES[self.code(power_factor)]
+
+    def status_codes(self, power_factors):
+        import numpy as np
+        codes = np.array(self.codes, dtype=np.int8)
+        power_factors = np.asarray(power_factors, dtype=float)
+        found = codes[np.searchsorted(self.limits, power_factors, side="right")]
+        return np.where(np.isfinite(power_factors), found, np.int8(0))
+
+
+class Ruleset:
+    def __init__(self, discipline, season, divisions):
+        self.discipline = discipline
+        self.season = season
+        self.divisions = {name: ThresholdTable(limits.get("minor"), limits.get("major"))
+                          for name, limits in divisions.items()}
+
+    def __repr__(self):
+        return f"Ruleset({self.discipline!r}, {self.season!r})"
+
+
+def compile_rulesets(*texts):
+    # Later files add seasons or replace ones with the same discipline and season
+    rulesets = {}
+    for text in texts:
+        data = json.loads(text)
+        if data.get("format") != 1:
+            raise ValueError(f"Unknown ruleset format {data.get('format')!r}")
+        for entry in data["rulesets"]:
+            ruleset = Ruleset(entry["discipline"], str(entry["season"]), entry["divisions"])
+            rulesets[ruleset.discipline, ruleset.season] = ruleset
+    return rulesets
+
+
+def calculate_power_factor(bullet_weight, velocity):
+    try:
+        weight = float(bullet_weight)
+        velocity = float(velocity)
+    except ValueError:
+        return None
+    # float() also accepts "nan" and "inf"
+    if not (math.isfinite(weight) and math.isfinite(velocity)):
+        return None
+    return (weight * velocity) / 1000
+
+def division_status(power_factor, thresholds):
+    return thresholds.status(power_factor)
+
+def division_status_codes(power_factors, thresholds):
+    # Vectorised division_status: 0 = not okay, 1 = Minor, 2 = Major
+    return thresholds.status_codes(power_factors)
+
+def calculate_power_factors(bullet_weights, velocities):
+    # Vectorised calculate_power_factor; NaN marks an invalid entry
+    import numpy as np
+    weights = np.asarray(bullet_weights, dtype=float)
+    velocities = np.asarray(velocities, dtype=float)
+    return (weights * velocities) / 1000
+
+
+# ------------------------- Match Scoring ------------------------
+# IPSC scoring for a whole match at once: every array is competitors x
+# stages, so a 300 competitor, 12 stage match is a handful of numpy
+# operations. Hits per stage are A, C, D, misses, no-shoots and procedurals;
+# the competitor's power factor class decides what C and D are worth.
+SCORE_COLUMNS = ("A", "C", "D", "M", "NS", "P")
+HIT_VALUES = [(5, 3, 1), (5, 3, 1), (5, 4, 2)]  # A, C, D by class: under minor, Minor, Major
+PENALTY_POINTS = 10  # Per miss, no-shoot and procedural
+PF_CLASS_NAMES = ("No score", "Minor", "Major")
+
+
+def power_factor_classes(divisions, power_factors, thresholds):
+    # 0 = under minor (or unknown division), 1 = Minor, 2 = Major
+    # thresholds: division name -> ThresholdTable
+    import numpy as np
+    divisions = np.asarray(divisions)
+    power_factors = np.asarray(power_factors, dtype=float)
+    classes = np.zeros(len(divisions), dtype=np.int8)
+    for name, limits in thresholds.items():
+        in_division = divisions == name
+        classes[in_division] = division_status_codes(power_factors[in_division], limits)
+    return classes
+
+
+def score_match(hits, times, divisions, power_factors, stage_max_points, thresholds):
+    # hits: competitors x stages x SCORE_COLUMNS counts, times: competitors x
+    # stages in seconds (0 = stage not shot). Competitors under minor get a
+    # hit factor but no stage points and don't set the stage's best hit factor.
+    import numpy as np
+    hits = np.asarray(hits, dtype=float)
+    times = np.asarray(times, dtype=float)
+    stage_max_points = np.asarray(stage_max_points, dtype=float)
+    classes = power_factor_classes(divisions, power_factors, thresholds)
+
+    values = np.array(HIT_VALUES, dtype=float)[classes]  # competitors x 3
+    raw = np.einsum("nsk,nk->ns", hits[:, :, :3], values) - PENALTY_POINTS * hits[:, :, 3:].sum(axis=2)
+    stage_score = np.maximum(raw, 0)
+    shot = times > 0
+    hit_factor = np.divide(stage_score, times, out=np.zeros_like(stage_score), where=shot)
+
+    # Best hit factor per division and stage, then stage points relative to it
+    names, division_index = np.unique(np.asarray(divisions), return_inverse=True)
+    eligible = classes > 0
+    best = np.zeros((len(names), hits.shape[1]))
+    np.maximum.at(best, division_index[eligible], hit_factor[eligible])
+    best_for_competitor = best[division_index]
+    stage_points = np.divide(hit_factor, best_for_competitor, out=np.zeros_like(hit_factor),
+                             where=best_for_competitor > 0) * stage_max_points
+    stage_points[~eligible] = 0
+
+    match_points = stage_points.sum(axis=1)
+    division_best = np.zeros(len(names))
+    np.maximum.at(division_best, division_index, match_points)
+    best_total = division_best[division_index]
+    percent = np.divide(match_points, best_total, out=np.zeros_like(match_points), where=best_total > 0) * 100
+
+    # Place within the division, by match points
+    order = np.lexsort((-match_points, division_index))
+    group_start = np.searchsorted(division_index[order], division_index[order])
+    place = np.empty(len(order), dtype=int)
+    place[order] = np.arange(len(order)) - group_start + 1
+
+    return {
+        "divisions": names,
+        "division_index": division_index,
+        "best_hit_factor": best,
+        "classes": classes,
+        "stage_score": stage_score,
+        "hit_factor": hit_factor,
+        "stage_points": stage_points,
+        "match_points": match_points,
+        "percent": percent,
+        "place": place,
+    }
+
+
+# ------------------------- Chrono Check -------------------------
+CHRONO_FIRST_SHOTS = 3
+CHRONO_RETEST_SHOTS = 6
+
+
+def chrono_weight(weights, velocities):
+    # The second weighed bullet only counts once the six round retest is done
+    if len(velocities) >= CHRONO_RETEST_SHOTS:
+        return max(weights[:2])
+    return weights[0]
+
+
+def chrono_check(declared, thresholds, weights, velocities):
+    # IPSC chrono procedure: the first weighed bullet and the mean of the
+    # first three velocities. Below the declared factor, three more rounds are
+    # fired and the best three of the six count; still below, a second bullet
+    # is weighed and the heavier one counts. Returns (pf, scored class code,
+    # next step or None); the class never goes above what was declared.
+    declared_code = PF_CLASS_NAMES.index(declared)
+    velocities = velocities[:CHRONO_RETEST_SHOTS]
+    if len(velocities) < CHRONO_FIRST_SHOTS or not weights:
+        return None, 0, f"Fire {CHRONO_FIRST_SHOTS} rounds and weigh a bullet"
+    if len(velocities) > CHRONO_FIRST_SHOTS:
+        counted = sorted(velocities, reverse=True)[:CHRONO_FIRST_SHOTS]
+    else:
+        counted = velocities
+    weight = chrono_weight(weights, velocities)
+    pf = calculate_power_factor(weight, sum(counted) / len(counted))
+    code = PF_CLASS_CODES[division_status(pf, thresholds)]
+    next_step = None
+    if code < declared_code:
+        if len(velocities) < CHRONO_RETEST_SHOTS:
+            next_step = f"Fire {CHRONO_RETEST_SHOTS - len(velocities)} more rounds"
+        elif len(weights) < 2:
+            next_step = "Weigh a second bullet"
+    return pf, min(code, declared_code), next_step
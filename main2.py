@@ -1,406 +1,2157 @@
+import time
+STARTUP_T0 = time.perf_counter()
+
 import sys
 import os
+import re
+import csv
+import json
+import math
+import bisect
+import hashlib
+import html
+import sqlite3
+from collections import deque
 import webbrowser
 from os import *
 from PyQt6.QtWidgets import (
     QApplication, QMainWindow, QLineEdit, QLabel, QGridLayout, QMessageBox, QToolTip,
-    QTabWidget, QWidget, QVBoxLayout, QToolButton, QToolBar, QCheckBox, QFileDialog,QPushButton, QGridLayout
+    QTabWidget, QWidget, QVBoxLayout, QToolButton, QToolBar, QCheckBox, QFileDialog,QPushButton, QGridLayout,
+    QComboBox, QListWidget, QListWidgetItem, QSplitter, QTableWidget, QTableWidgetItem, QTableView,
+    QHeaderView, QSpinBox, QSplashScreen, QMenu, QDialog, QHBoxLayout, QInputDialog
+)
+from PyQt6.QtGui import QColor, QFont, QIcon, QAction, QBrush, QPixmap
+from PyQt6.QtCore import (
+    QUrl, QFile, QSettings, QObject, QTimer, QStandardPaths, QSaveFile, QIODevice,
+    QRunnable, QThreadPool, Qt, QAbstractTableModel, QModelIndex, QEvent, QEventLoop,
+    QPointF, QSortFilterProxyModel, pyqtSignal
+)
+from PyQt6.QtNetwork import QNetworkAccessManager, QNetworkRequest, QNetworkReply
+from pathlib import Path
+from ipsc import (
+    DEFAULT_DISCIPLINE, ThresholdTable, compile_rulesets, calculate_power_factor, calculate_power_factors,
+    division_status, division_status_codes, SCORE_COLUMNS, HIT_VALUES, PENALTY_POINTS, PF_CLASS_NAMES,
+    score_match, chrono_check, chrono_weight,
 )
-from PyQt6.QtGui import QColor, QFont, QIcon
-from PyQt6.QtWebEngineWidgets import QWebEngineView
-from PyQt6.QtCore import QUrl, QFile
-from PyQt6.QtWebEngineCore import QWebEngineProfile, QWebEnginePage, QWebEngineSettings,QWebEngineCookieStore
-
-# ---------------------- IPSC Calculator Tab ---------------------
-# IPSC Power Factor Divisions
-DIVISIONS = {
-    "Production": {"minor": 125, "major": None},  # No Major
-    "Standard": {"minor": 125, "major": 170},
-   # "Modified": {"minor": 125, "major": 160},
-    "Revolver": {"minor": 125, "major": 170},
-    "Open": {"minor": 125, "major": 160},
-    "Classic": {"minor": 125, "major": 170},
-}
 
-def calculate_power_factor(bullet_weight, velocity):
-    try:
-        weight = float(bullet_weight)
-        velocity = float(velocity)
-        return (weight * velocity) / 1000
-    except ValueError:
-        return None
+# numpy, QtPdf and QtWebEngine are imported where they are first needed;
+# together they take longer to load than the whole calculator window.
+# QtWebEngine is loaded through load_webengine() below.
+QWebEngineView = QWebEngineProfile = QWebEnginePage = QWebEngineSettings = QWebEngineDownloadRequest = None
 
-def validate_and_update_status(power_factor, division_labels):
-    for division, thresholds in DIVISIONS.items():
-        label = division_labels[division]
-        label.setText(division)
+# ------------------------- Settings -----------------------------
+# Defaults, can be overridden per user through QSettings
+LAZY_TABS = True    # Only build a tab the first time it is opened
+WARM_TAB = ""       # Tab title or class name to build at startup anyway
 
-        if power_factor is not None:
-            if thresholds["major"] and power_factor >= thresholds["major"]:
-                label.setText(f"{division} - Major Okay")
-                label.setStyleSheet("background-color: blue;")
-            elif thresholds["minor"] and power_factor >= thresholds["minor"]:
-                label.setText(f"{division} - Minor Okay")
-                label.setStyleSheet("background-color: green;")
-            else:
-                label.setStyleSheet("background-color: red;")
+def log_phase(name):
+    print(f"startup: {name} at {(time.perf_counter() - STARTUP_T0) * 1000:.0f} ms")
 
-class IPSCCalculatorTab(QWidget):
-    def __init__(self):
-        super().__init__()
+def app_settings():
+    # Organisation/application names are set in main(); the benchmark uses
+    # its own application name so it never touches the user's settings
+    if QApplication.organizationName():
+        return QSettings()
+    return QSettings("OKTS", "OKTS Dynamisk APP")
 
-        layout = QGridLayout()
+def app_data_dir(*parts):
+    # Per-user data folder for caches and local databases
+    path = Path(QStandardPaths.writableLocation(QStandardPaths.StandardLocation.AppDataLocation), *parts)
+    path.mkdir(parents=True, exist_ok=True)
+    return path
 
-        # Input widgets
-        self.bullet_weight_input = QLineEdit()
-        layout.addWidget(QLabel("Bullet Weight (gr):"), 0, 0)
-        layout.addWidget(self.bullet_weight_input, 0, 1)
 
-        self.velocity_input = QLineEdit()
-        layout.addWidget(QLabel("Velocity (fps):"), 1, 0)
-        layout.addWidget(self.velocity_input, 1, 1)
+# ---------------------- Background Work -------------------------
+class TaskSignals(QObject):
+    finished = pyqtSignal(object)
+    failed = pyqtSignal(object)
 
-        # Results label
-        self.power_factor_result = QLabel()
-        layout.addWidget(QLabel("Power Factor:"), 2, 0)
-        layout.addWidget(self.power_factor_result, 2, 1)
 
-        # Division status labels
-        self.division_labels = {}
-        row = 3
-        for division, thresholds in DIVISIONS.items():
-            label = QLabel(division)
-            label.setToolTip(f"Minimum Minor PF: {thresholds['minor']}\nMinimum Major PF: {thresholds['major']}")
-            label.setFont(QFont('Arial', 10))
-            self.division_labels[division] = label
-            layout.addWidget(label, row, 0, 1, 2)
-            row += 1
-
-        # Connect input change to calculation
-        self.bullet_weight_input.textChanged.connect(self.update_power_factor)
-        self.velocity_input.textChanged.connect(self.update_power_factor)
-
-        self.setLayout(layout)
-
-    def update_power_factor(self):
-        power_factor = calculate_power_factor(self.bullet_weight_input.text(), self.velocity_input.text())
-
-        if power_factor is not None:
-            self.power_factor_result.setText(str(power_factor))
-        else:
-            self.power_factor_result.setText("Invalid Input")
-
-        validate_and_update_status(power_factor, self.division_labels)
-
-# ------------------------ Web Browser Tab -----------------------
-class WebBrowserTab(QWidget):
-    def __init__(self):
+class BackgroundTask(QRunnable):
+    def __init__(self, fn, args):
         super().__init__()
+        self.fn = fn
+        self.args = args
+        self.signals = TaskSignals()
 
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(layout)
-
-        # Toolbar
-        toolbar = QToolBar()
-        layout.addWidget(toolbar)
-
-        # Address bar and buttons
-        self.address_bar = QLineEdit()
-        self.address_bar.returnPressed.connect(self.load_url)
-        toolbar.addWidget(self.address_bar)
-
+    def run(self):
+        try:
+            result = self.fn(*self.args)
+        except Exception as e:
+            self.signals.failed.emit(e)
+        else:
+            self.signals.finished.emit(result)
 
-        back_button = QToolButton()
-        back_button.setText("<")
-        back_button.clicked.connect(self.go_back)
-        toolbar.addWidget(back_button)
 
+# Signal objects of running tasks; kept alive until their result is delivered
+_running_tasks = set()
 
-        forward_button = QToolButton()
-        forward_button.setText(">")
-        forward_button.clicked.connect(self.go_forward)
-        toolbar.addWidget(forward_button)
+def run_in_background(fn, *args, on_done=None, on_error=None):
+    # Runs fn(*args) on the Qt thread pool, callbacks run on the GUI thread
+    task = BackgroundTask(fn, args)
+    signals = task.signals
+    _running_tasks.add(signals)
 
-        # Toolbar Additions
-        #self.case_sensitive_checkbox = QCheckBox("Case Sensitive")
-        #toolbar.addWidget(self.case_sensitive_checkbox)  # Add the checkbox to the toolbar
-        self.search_bar = QLineEdit()
-        self.search_bar.returnPressed.connect(self.search_text)
-        toolbar.addWidget(self.search_bar)
+    def finished(result):
+        _running_tasks.discard(signals)
+        if on_done is not None:
+            on_done(result)
 
-        search_button = QToolButton()
-        search_button.setText("Find")
-        search_button.clicked.connect(self.search_text)
-        toolbar.addWidget(search_button)
+    def failed(error):
+        _running_tasks.discard(signals)
+        if on_error is not None:
+            on_error(error)
+        else:
+            print(f"Background task failed: {error!r}")
 
-        # Web View
-        self.web_view = QWebEngineView()
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PdfViewerEnabled, True)
+    signals.finished.connect(finished)
+    signals.failed.connect(failed)
+    QThreadPool.globalInstance().start(task)
+    return signals
 
-        self.web_view.load(QUrl("https://www.okts.no/profile/1101668018/dynamisk"))
-        self.web_view.urlChanged.connect(self.update_address_bar)
-        layout.addWidget(self.web_view)
+# ---------------------- IPSC Calculator Tab ---------------------
+# IPSC power factor limits per discipline and season come from
+# rulesets.json (built into resources_rc, plus an optional copy in the app
+# data folder) and are compiled by ipsc.compile_rulesets.
+class RulesetSelection(QObject):
+    # The ruleset in use; tabs listing divisions follow the changed signal
+    changed = pyqtSignal(object)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        texts = []
+        bundled = QFile(":/okts/rulesets.json")
+        if bundled.open(QIODevice.OpenModeFlag.ReadOnly):
+            texts.append(bytes(bundled.readAll()).decode("utf-8"))
+            bundled.close()
+        else:
+            texts.append((Path(__file__).with_name("rulesets.json")).read_text(encoding="utf-8"))
+        self.rulesets = compile_rulesets(*texts)
+        user_file = app_data_dir() / "rulesets.json"
+        if user_file.exists():
+            # A broken user file must not keep the app from starting
+            try:
+                self.rulesets.update(compile_rulesets(user_file.read_text(encoding="utf-8")))
+            except (OSError, UnicodeDecodeError, ValueError, KeyError, TypeError, AttributeError) as e:
+                message = f"{user_file} was not loaded, using the built-in rulesets:\n{e!r}"
+                print(message)
+                QTimer.singleShot(0, lambda: QMessageBox.warning(None, "Rulesets", message))
+
+        settings = app_settings()
+        self.ruleset = None
+        self.select(settings.value("rulesets/discipline", DEFAULT_DISCIPLINE, type=str),
+                    settings.value("rulesets/season", "", type=str), save=False)
+
+    def disciplines(self):
+        return list(dict.fromkeys(discipline for discipline, _ in self.rulesets))
+
+    def seasons(self, discipline):
+        return sorted((season for name, season in self.rulesets if name == discipline), reverse=True)
+
+    def select(self, discipline, season="", save=True):
+        # An unknown season falls back to the newest one of the discipline
+        if discipline not in self.disciplines():
+            discipline = DEFAULT_DISCIPLINE
+        if season not in self.seasons(discipline):
+            season = self.seasons(discipline)[0]
+        ruleset = self.rulesets[discipline, season]
+        if ruleset is self.ruleset:
+            return
+        self.ruleset = ruleset
+        if save:
+            app_settings().setValue("rulesets/discipline", discipline)
+            app_settings().setValue("rulesets/season", season)
+        self.changed.emit(ruleset)
+
+_ruleset_selection = None
+
+def ruleset_selection():
+    global _ruleset_selection
+    if _ruleset_selection is None:
+        _ruleset_selection = RulesetSelection(QApplication.instance())
+    return _ruleset_selection
+
+def current_divisions():
+    return ruleset_selection().ruleset.divisions
+
+# Style sheets per status, built once; re-polishing a label is the costly part
+STATUS_STYLES = {
+    None: "",
+    "Major": "background-color: blue;",
+    "Minor": "background-color: green;",
+    "Fail": "background-color: red;",
+}
 
-    def search_text(self, found=None):
-        try:
-            text_to_find = self.search_bar.text()
 
-            # Clear Previous Highlights (Optional)
-            self.web_view.page().findText("")
+class DivisionLabel(QLabel):
+    # Remembers what it shows so unchanged updates don't touch Qt at all
+    def __init__(self, text):
+        super().__init__(text)
+        self.state = (text, None)
 
-            # Perform the search (PyQt6 Compatibility)
-            if self.case_sensitive_checkbox.isChecked():
-                self.web_view.page().findText(text_to_find, QWebEnginePage.FindFlags.FindCaseSensitive)
-            else:
-                self.web_view.page().findText(text_to_find)
-
-            if found:
-                # Scroll to the found text (Approximate)
-                self.web_view.page().runJavaScript("window.scrollTo(0,0);")
-    
-                # Apply highlighting style
-                self.web_view.page().runJavaScript(
-                    f"window.find('{text_to_find}');"
-                    )
-            else:
-                print("Not Found.")
+    def set_state(self, text, status):
+        if (text, status) == self.state:
+            return False
+        if text != self.state[0]:
+            self.setText(text)
+        if status != self.state[1]:
+            self.setStyleSheet(STATUS_STYLES[status])
+        self.state = (text, status)
+        return True
 
 
-        except Exception as e:
+def validate_and_update_status(power_factor, division_labels, mean_power_factor=None):
+    # For a shot string power_factor is the worst shot and mean_power_factor
+    # the string's average; the colour always follows the worst shot.
+    # Returns True when any label changed.
+    changed = False
+    for division, thresholds in current_divisions().items():
+        text, status = division, None
 
-            print(f"Search Error: {e}")
+        if power_factor is not None:
+            status = division_status(power_factor, thresholds) or "Fail"
+            if status != "Fail":
+                text = f"{division} - {status} Okay"
+
+            if mean_power_factor is not None:
+                mean_status = division_status(mean_power_factor, thresholds)
+                if mean_status != division_status(power_factor, thresholds):
+                    text = f"{text} (mean: {mean_status or 'not'} okay)"
+
+        changed |= division_labels[division].set_state(text, status)
+    return changed
+
+
+class LatencyHistogram:
+    # Log2 buckets in milliseconds: <0.5, <1, <2, ... <256, and the rest
+    BUCKETS_MS = [0.5 * 2 ** i for i in range(10)]
+
+    def __init__(self, name):
+        self.name = name
+        self.counts = [0] * (len(self.BUCKETS_MS) + 1)
+        self.samples = deque(maxlen=2000)
+        self.total = 0.0
+        self.count = 0
+
+    def record(self, seconds):
+        ms = seconds * 1000
+        self.counts[bisect.bisect_right(self.BUCKETS_MS, ms)] += 1
+        self.samples.append(ms)
+        self.total += ms
+        self.count += 1
+
+    def percentile(self, p):
+        if not self.samples:
+            return None
+        ordered = sorted(self.samples)
+        return ordered[min(int(len(ordered) * p / 100), len(ordered) - 1)]
+
+    def summary(self):
+        labels = [f"<{bound:g}ms" for bound in self.BUCKETS_MS] + [f">={self.BUCKETS_MS[-1]:g}ms"]
+        return {
+            "name": self.name,
+            "count": self.count,
+            "mean_ms": self.total / self.count if self.count else None,
+            "p50_ms": self.percentile(50),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": max(self.samples, default=None),
+            "histogram": dict(zip(labels, self.counts)),
+        }
+
+    def dump(self, path):
+        Path(path).write_text(json.dumps(self.summary(), indent=2), encoding="utf-8")
+
+CALC_LATENCY = LatencyHistogram("calculator keystroke to repaint")
+CALC_DEBOUNCE_MS = 10
+
+# ------------------------- Match Scoring ------------------------
+# Score sheet import; the scoring itself is ipsc.score_match.
+
+# Match score sheets: one row per competitor and stage
+MATCH_COLUMN_RES = {
+    "competitor": re.compile(r"^(competitor|name|shooter|skytter|navn|number|nr)\b", re.IGNORECASE),
+    "division": re.compile(r"^(division|divisjon|klasse)\b", re.IGNORECASE),
+    "pf": re.compile(r"^(pf|power ?factor)\b", re.IGNORECASE),
+    "stage": re.compile(r"^(stage|post|stasjon)\b", re.IGNORECASE),
+    "A": re.compile(r"^a$", re.IGNORECASE),
+    "C": re.compile(r"^c$", re.IGNORECASE),
+    "D": re.compile(r"^d$", re.IGNORECASE),
+    "M": re.compile(r"^(m|miss(es)?|bom)$", re.IGNORECASE),
+    "NS": re.compile(r"^(ns|no[- ]?shoots?)$", re.IGNORECASE),
+    "P": re.compile(r"^(p|proc(edurals?)?|prosedyre(feil)?)$", re.IGNORECASE),
+    "time": re.compile(r"^(time|tid)\b", re.IGNORECASE),
+    "max_points": re.compile(r"^max", re.IGNORECASE),
+}
 
 
+def match_power_factor(text, thresholds):
+    # A measured PF, or a declared "Major"/"Minor" scored as the lowest PF
+    # of that class, capped at the classes the division has
+    pf = parse_number(text)
+    if pf is not None:
+        return pf
+    declared = text.strip().lower()
+    if declared not in ("major", "minor") or thresholds is None:
+        return None
+    limit = thresholds.major if declared == "major" else None
+    if limit is None:
+        limit = thresholds.minor
+    return limit if limit is not None else 0.0
+
+
+def read_match_file(path, thresholds):
+    # Returns competitors [(name, division, pf)], stage names, hits, times
+    # and stage max points. Without a max points column a stage is worth 5
+    # points per scoring hit, i.e. the most A+C+D+M anyone shot on it.
+    # thresholds (division -> ThresholdTable) turn a declared class into a PF.
+    import numpy as np
+    _, rows, columns = read_table(path, MATCH_COLUMN_RES, ("competitor", "division", "pf", "stage", "time"))
+
+    competitors, stages, entries = {}, {}, []
+    for row in rows:
+        def cell(key):
+            index = columns.get(key)
+            return row[index] if index is not None and index < len(row) else ""
+        name = cell("competitor")
+        if not name:
+            continue
+        if name not in competitors:
+            pf = match_power_factor(cell("pf"), thresholds.get(cell("division")))
+            if pf is None:
+                raise ValueError(f"{name}: PF {cell('pf')!r} is neither a number nor Major/Minor")
+            competitors[name] = (name, cell("division"), pf)
+        stages.setdefault(cell("stage"), parse_number(cell("max_points")))
+        counts = [parse_number(cell(key)) or 0 for key in SCORE_COLUMNS]
+        entries.append((name, cell("stage"), counts, parse_number(cell("time")) or 0.0))
+
+    competitor_index = {name: index for index, name in enumerate(competitors)}
+    stage_index = {name: index for index, name in enumerate(stages)}
+    hits = np.zeros((len(competitors), len(stages), len(SCORE_COLUMNS)))
+    times = np.zeros((len(competitors), len(stages)))
+    for name, stage, counts, time_s in entries:
+        hits[competitor_index[name], stage_index[stage]] = counts
+        times[competitor_index[name], stage_index[stage]] = time_s
+
+    required_hits = hits[:, :, :4].sum(axis=2).max(axis=0)
+    stage_max_points = np.array([points if points else 5 * required
+                                 for points, required in zip(stages.values(), required_hits)])
+    return list(competitors.values()), list(stages), hits, times, stage_max_points
+
+
+# ---------------------- Chronograph Import ----------------------
+# Reads LabRadar, MagnetoSpeed, Garmin Xero and plain CSV exports. The header
+# row is recognised by a velocity column (V0, Speed, Velocity, ...), an
+# optional bullet weight column is used when present. Each header row starts
+# a new series; summary rows and rows without a number in the velocity
+# column are skipped.
+VELOCITY_COLUMN_RE = re.compile(r"^(v0|vel|velocity|speed|hastighet)\b", re.IGNORECASE)
+WEIGHT_COLUMN_RE = re.compile(r"^(weight|bullet|vekt|kulevekt)\b", re.IGNORECASE)
+SERIES_NAME_RE = re.compile(r"^(series|serie|string)", re.IGNORECASE)
+MPS_TO_FPS = 3.28084
+
+
+def parse_number(text):
+    try:
+        return float(text.strip().replace(",", "."))
+    except ValueError:
+        return None
 
-    def update_address_bar(self, url):
-        self.address_bar.setText(url.toString())
 
-    def handle_link_clicked(self, url):
-        self.web_view.load(url)  # Navigate to the new URL
+def guess_delimiter(lines):
+    # Exports have ragged preambles that csv.Sniffer gives up on, so take the
+    # separator found on most lines; ";" and tab win ties since "," can also
+    # be the decimal mark in those files
+    return max(";\t,", key=lambda candidate: sum(candidate in line for line in lines[:50]))
+
+
+def read_table(path, column_res, required):
+    # CSV/TSV file with a header row. Returns the header, the data rows
+    # (cells stripped, blank rows dropped) and {key: column index} for each
+    # pattern in column_res the header matched.
+    lines = Path(path).read_text(encoding="utf-8-sig", errors="replace").splitlines()
+    rows = [[cell.strip() for cell in row] for row in csv.reader(lines, delimiter=guess_delimiter(lines)) if any(row)]
+    if not rows:
+        raise ValueError("The file is empty")
+    columns = {}
+    for index, cell in enumerate(rows[0]):
+        for key, pattern in column_res.items():
+            if key not in columns and pattern.match(cell):
+                columns[key] = index
+                break
+    missing = [key for key in required if key not in columns]
+    if missing:
+        raise ValueError(f"Missing columns: {', '.join(missing)}")
+    return rows[0], rows[1:], columns
+
+
+def read_chrono_file(path):
+    # Returns a list of (series name, velocities in fps, bullet weights or None)
+    raw = Path(path).read_bytes()
+    if raw.startswith((b"\xff\xfe", b"\xfe\xff")):
+        text = raw.decode("utf-16")
+    else:
+        text = raw.decode("utf-8-sig", errors="replace")
+    text = text.replace("\x00", "")
+    lines = text.splitlines()
+
+    rows = list(csv.reader(lines, delimiter=guess_delimiter(lines)))
+
+    series = []
+    name = None
+    metric = False
+    velocity_col = weight_col = None
+    velocities, weights = [], []
+
+    def finish_series():
+        if velocities:
+            label = name or f"Series {len(series) + 1}"
+            series.append((label, velocities, weights if weight_col is not None else None))
+
+    for row in rows:
+        cells = [cell.strip() for cell in row]
+        if not any(cells):
+            continue
+        # Preamble lines such as "Series No;0001" or "Units velocity;m/s"
+        if SERIES_NAME_RE.match(cells[0]) and len(cells) > 1 and cells[1]:
+            name = f"{cells[0]} {cells[1]}"
+        if cells[0].lower().startswith("unit"):
+            units = " ".join(cells[1:]).lower()
+            if "m/s" in units:
+                metric = True
+            elif "fps" in units or "ft/s" in units:
+                metric = False
+
+        header = [index for index, cell in enumerate(cells) if VELOCITY_COLUMN_RE.match(cell)]
+        if header:
+            finish_series()
+            velocities, weights = [], []
+            velocity_col = header[0]
+            weight_col = next((index for index, cell in enumerate(cells) if WEIGHT_COLUMN_RE.match(cell)), None)
+            # A unit in the column title, e.g. "Speed (m/s)", wins over the preamble
+            unit = cells[velocity_col].lower()
+            if "m/s" in unit:
+                metric = True
+            elif "fps" in unit or "ft/s" in unit:
+                metric = False
+            continue
+
+        if velocity_col is None:
+            # No header at all: a plain column of velocities
+            if len(cells) == 1 and parse_number(cells[0]) is not None:
+                velocities.append(parse_number(cells[0]))
+            continue
+
+        if velocity_col >= len(cells):
+            continue
+        # Summary rows ("AVERAGE SPEED,1051.8") carry a label in the shot column
+        if velocity_col > 0 and cells[0] and parse_number(cells[0]) is None:
+            continue
+        velocity = parse_number(cells[velocity_col])
+        if velocity is None:
+            continue
+        velocities.append(velocity * MPS_TO_FPS if metric else velocity)
+        if weight_col is not None:
+            weight = parse_number(cells[weight_col]) if weight_col < len(cells) else None
+            weights.append(weight if weight is not None else math.nan)
+
+    finish_series()
+    return series
+
+
+def chrono_statistics(series, bullet_weight):
+    # One pass over every shot of every series: the shots are concatenated,
+    # and per-series sums, extremes and pass counts come from grouped numpy
+    # reductions rather than a Python loop per shot.
+    import numpy as np
+    series = [entry for entry in series if entry[1]]
+    if not series:
+        return []
+    counts = np.array([len(velocities) for _, velocities, _ in series])
+    starts = np.concatenate(([0], np.cumsum(counts)[:-1]))
+    group = np.repeat(np.arange(len(series)), counts)
+
+    velocities = np.concatenate([np.asarray(v, dtype=float) for _, v, _ in series])
+    weights = np.concatenate([
+        np.asarray(w, dtype=float) if w is not None else np.full(len(v), bullet_weight, dtype=float)
+        for _, v, w in series
+    ])
+    pf = calculate_power_factors(weights, velocities)
+
+    valid = ~np.isnan(pf)
+    shots = np.bincount(group, weights=valid, minlength=len(series))
+    v = np.where(valid, velocities, 0.0)
+    mean_v = np.bincount(group, weights=v) / np.maximum(shots, 1)
+    sq_dev = np.where(valid, (velocities - mean_v[group]) ** 2, 0.0)
+    sd_v = np.sqrt(np.bincount(group, weights=sq_dev) / np.maximum(shots - 1, 1))
+    max_v = np.maximum.reduceat(np.where(valid, velocities, -np.inf), starts)
+    min_v = np.minimum.reduceat(np.where(valid, velocities, np.inf), starts)
+    mean_pf = np.bincount(group, weights=np.where(valid, pf, 0.0)) / np.maximum(shots, 1)
+    min_pf = np.minimum.reduceat(np.where(valid, pf, np.inf), starts)
+
+    passing = {}
+    for division, thresholds in current_divisions().items():
+        passing[division] = {}
+        for factor, limit in (("minor", thresholds.minor), ("major", thresholds.major)):
+            if limit is not None:
+                hits = np.bincount(group, weights=valid & (pf >= limit), minlength=len(series))
+                passing[division][factor] = 100 * hits / np.maximum(shots, 1)
+
+    results = []
+    for index, (name, _, _) in enumerate(series):
+        if not shots[index]:
+            continue
+        results.append({
+            "series": name,
+            "shots": int(shots[index]),
+            "mean": float(mean_v[index]),
+            "sd": float(sd_v[index]),
+            "es": float(max_v[index] - min_v[index]),
+            "mean_pf": float(mean_pf[index]),
+            "min_pf": float(min_pf[index]),
+            "passing": {division: {factor: float(percent[index]) for factor, percent in factors.items()}
+                        for division, factors in passing.items()},
+        })
+    return results
+
+
+# ------------------------- Shot Strings -------------------------
+class ShotString:
+    # Running velocity statistics, updated in O(1) per shot (Welford's method)
+    def __init__(self, velocities=()):
+        self.velocities = []
+        self.count = 0
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+        for velocity in velocities:
+            self.add(velocity)
+
+    def add(self, velocity):
+        self.velocities.append(velocity)
+        self.count += 1
+        delta = velocity - self.mean
+        self.mean += delta / self.count
+        self.m2 += delta * (velocity - self.mean)
+        self.min = min(self.min, velocity)
+        self.max = max(self.max, velocity)
+
+    def remove_last(self):
+        velocity = self.velocities.pop()
+        if self.count == 1:
+            self.__init__()
+            return
+        # Welford in reverse; only the extremes need a rescan, and only when
+        # the removed shot was one of them
+        delta = velocity - self.mean
+        self.mean = (self.mean * self.count - velocity) / (self.count - 1)
+        self.m2 -= delta * (velocity - self.mean)
+        self.count -= 1
+        if velocity in (self.min, self.max):
+            self.min = min(self.velocities)
+            self.max = max(self.velocities)
+
+    @property
+    def sd(self):
+        return math.sqrt(max(self.m2, 0.0) / (self.count - 1)) if self.count > 1 else 0.0
+
+    @property
+    def es(self):
+        return self.max - self.min if self.count else 0.0
+
+
+class ShotStringStore:
+    # Saved strings per load name, in shot_strings.json in the app data folder
+    def __init__(self, path=None):
+        self.path = path or app_data_dir() / "shot_strings.json"
+        try:
+            self.loads = json.loads(Path(self.path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.loads = {}
 
+    def names(self):
+        return sorted(self.loads)
 
-    def load_url(self):
-        url = QUrl(self.address_bar.text())
-        self.web_view.load(url)
-
-    def go_back(self):
-        self.web_view.back()
+    def strings(self, load):
+        return self.loads.get(load, [])
 
-    def go_forward(self):
-        self.web_view.forward()
+    def save_string(self, load, bullet_weight, velocities):
+        self.loads.setdefault(load, []).append({
+            "saved": time.strftime("%Y-%m-%d %H:%M"),
+            "bullet_weight": bullet_weight,
+            "velocities": list(velocities),
+        })
+        Path(self.path).write_text(json.dumps(self.loads, indent=1), encoding="utf-8")
 
 
-#tab 3 web
-class WebBrowserTab1(QWidget):
+class IPSCCalculatorTab(QWidget):
     def __init__(self):
         super().__init__()
 
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(layout)
-
-        # Toolbar
-        toolbar = QToolBar()
-        layout.addWidget(toolbar)
-
-        # Address bar and buttons
-        self.address_bar = QLineEdit()
-        self.address_bar.returnPressed.connect(self.load_url)
-        toolbar.addWidget(self.address_bar)
-
-        back_button = QToolButton()
-        back_button.setText("<")
-        back_button.clicked.connect(self.go_back)
-        toolbar.addWidget(back_button)
-
-        forward_button = QToolButton()
-        forward_button.setText(">")
-        forward_button.clicked.connect(self.go_forward)
-        toolbar.addWidget(forward_button)
+        layout = QGridLayout()
 
-        # Toolbar Additions
-        #self.case_sensitive_checkbox = QCheckBox("Case Sensitive")
-        #toolbar.addWidget(self.case_sensitive_checkbox)  # Add the checkbox to the toolbar
-        self.search_bar = QLineEdit()
-        self.search_bar.returnPressed.connect(self.search_text)
-        toolbar.addWidget(self.search_bar)
+        # Input widgets
+        self.bullet_weight_input = QLineEdit()
+        layout.addWidget(QLabel("Bullet Weight (gr):"), 0, 0)
+        layout.addWidget(self.bullet_weight_input, 0, 1)
 
-        search_button = QToolButton()
-        search_button.setText("Find")
-        search_button.clicked.connect(self.search_text)
-        toolbar.addWidget(search_button)
+        self.velocity_input = QLineEdit()
+        layout.addWidget(QLabel("Velocity (fps):"), 1, 0)
+        layout.addWidget(self.velocity_input, 1, 1)
 
-        # Web View
-        self.web_view = QWebEngineView()
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PdfViewerEnabled, True)
+        # Results label
+        self.power_factor_result = QLabel()
+        layout.addWidget(QLabel("Power Factor:"), 2, 0)
+        layout.addWidget(self.power_factor_result, 2, 1)
 
-        self.web_view.load(QUrl("https://shootnscoreit.com/"))
-        self.web_view.urlChanged.connect(self.update_address_bar)
-        layout.addWidget(self.web_view)
+        # Ruleset: discipline and season
+        self.discipline_box = QComboBox()
+        self.discipline_box.currentTextChanged.connect(lambda discipline: ruleset_selection().select(discipline))
+        self.season_box = QComboBox()
+        self.season_box.currentTextChanged.connect(
+            lambda season: ruleset_selection().select(self.discipline_box.currentText(), season))
+        layout.addWidget(self.discipline_box, 3, 0)
+        layout.addWidget(self.season_box, 3, 1)
 
-    def search_text(self, found=None):
-        try:
-            text_to_find = self.search_bar.text()
+        # Division status labels, rebuilt by show_ruleset
+        self.division_labels = {}
+        self.division_layout = QVBoxLayout()
+        layout.addLayout(self.division_layout, 4, 0, 1, 2)
+        row = 5
+
+        # Shot string mode: Enter in the velocity field adds a shot
+        self.shot_string = ShotString()
+        self.string_store = ShotStringStore()
+
+        self.string_mode = QCheckBox("Shot string (press Enter to add each velocity)")
+        self.string_mode.toggled.connect(self.update_power_factor)
+        layout.addWidget(self.string_mode, row, 0, 1, 2)
+        row += 1
+
+        self.string_stats = QLabel()
+        layout.addWidget(self.string_stats, row, 0, 1, 2)
+        row += 1
+
+        string_buttons = QGridLayout()
+        self.load_name = QComboBox()
+        self.load_name.setEditable(True)
+        self.load_name.addItems(self.string_store.names())
+        self.load_name.setCurrentText("")
+        self.load_name.lineEdit().setPlaceholderText("Load name")
+        string_buttons.addWidget(self.load_name, 0, 0, 1, 4)
+        for column, (text, slot) in enumerate([
+            ("Undo shot", self.undo_shot),
+            ("New string", self.new_string),
+            ("Save string", self.save_string),
+            ("Compare saved", self.compare_strings),
+        ]):
+            button = QPushButton(text)
+            button.clicked.connect(slot)
+            string_buttons.addWidget(button, 1, column)
+        layout.addLayout(string_buttons, row, 0, 1, 2)
+        row += 1
+
+        self.velocity_input.returnPressed.connect(self.add_shot)
+
+        # Chronograph import, uses the bullet weight above unless the file has its own
+        import_button = QPushButton("Import chrono file...")
+        import_button.clicked.connect(self.import_chrono_file)
+        layout.addWidget(import_button, row, 0, 1, 2)
+        row += 1
+
+        self.chrono_table = QTableWidget()
+        self.chrono_table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.chrono_table.hide()
+        layout.addWidget(self.chrono_table, row, 0, 1, 2)
+        row += 1
+
+        # Input changes are coalesced into one recalculation; the time from
+        # the first keystroke to the next repaint goes into CALC_LATENCY
+        self.keystroke_time = None
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(CALC_DEBOUNCE_MS)
+        self.update_timer.timeout.connect(self.update_power_factor)
+        self.bullet_weight_input.textChanged.connect(self.schedule_update)
+        self.velocity_input.textChanged.connect(self.schedule_update)
+        self.power_factor_result.installEventFilter(self)
 
-            # Clear Previous Highlights (Optional)
-            self.web_view.page().findText("")
+        self.setLayout(layout)
+        self.show_ruleset(ruleset_selection().ruleset)
+        ruleset_selection().changed.connect(self.show_ruleset)
+
+    def show_ruleset(self, ruleset):
+        selection = ruleset_selection()
+        for box, items, current in ((self.discipline_box, selection.disciplines(), ruleset.discipline),
+                                    (self.season_box, selection.seasons(ruleset.discipline), ruleset.season)):
+            box.blockSignals(True)
+            box.clear()
+            box.addItems(items)
+            box.setCurrentText(current)
+            box.blockSignals(False)
+
+        for label in self.division_labels.values():
+            self.division_layout.removeWidget(label)
+            label.deleteLater()
+        self.division_labels = {}
+        for division, thresholds in ruleset.divisions.items():
+            label = DivisionLabel(division)
+            label.setToolTip(f"Minimum Minor PF: {thresholds.minor}\nMinimum Major PF: {thresholds.major}")
+            label.setFont(QFont('Arial', 10))
+            label.installEventFilter(self)
+            self.division_labels[division] = label
+            self.division_layout.addWidget(label)
+        self.update_power_factor()
+
+    def schedule_update(self):
+        if self.keystroke_time is None:
+            self.keystroke_time = time.perf_counter()
+        self.update_timer.start()
+
+    def eventFilter(self, watched, event):
+        if event.type() == QEvent.Type.Paint and self.keystroke_time is not None:
+            CALC_LATENCY.record(time.perf_counter() - self.keystroke_time)
+            self.keystroke_time = None
+        return False
+
+    def set_result_text(self, text):
+        if self.power_factor_result.text() == text:
+            return False
+        self.power_factor_result.setText(text)
+        return True
+
+    def finish_update(self, changed):
+        # Nothing to repaint means the update is visible already
+        if not changed and self.keystroke_time is not None:
+            CALC_LATENCY.record(time.perf_counter() - self.keystroke_time)
+            self.keystroke_time = None
 
-            # Perform the search (PyQt6 Compatibility)
-            if self.case_sensitive_checkbox.isChecked():
-                self.web_view.page().findText(text_to_find, QWebEnginePage.FindFlags.FindCaseSensitive)
-            else:
-                self.web_view.page().findText(text_to_find)
+    def update_power_factor(self):
+        if self.string_mode.isChecked():
+            self.finish_update(self.update_string_status())
+            return
 
-            if found:
-                # Scroll to the found text (Approximate)
-                self.web_view.page().runJavaScript("window.scrollTo(0,0);")
+        power_factor = calculate_power_factor(self.bullet_weight_input.text(), self.velocity_input.text())
 
-                # Apply highlighting style
-                self.web_view.page().runJavaScript(
-                    f"window.find('{text_to_find}');"
-                )
-            else:
-                print("Not Found.")
+        if power_factor is not None:
+            changed = self.set_result_text(str(power_factor))
+        else:
+            changed = self.set_result_text("Invalid Input")
 
+        changed |= validate_and_update_status(power_factor, self.division_labels)
+        self.finish_update(changed)
 
-        except Exception as e:
+    def update_string_status(self):
+        shots = self.shot_string
+        if not shots.count:
+            self.string_stats.setText("No shots yet")
+            changed = self.set_result_text("")
+            return validate_and_update_status(None, self.division_labels) | changed
 
-            print(f"Search Error: {e}")
+        self.string_stats.setText(
+            f"{shots.count} shots   mean {shots.mean:.1f}   SD {shots.sd:.1f}   ES {shots.es:.1f} fps"
+        )
+        worst_pf = calculate_power_factor(self.bullet_weight_input.text(), shots.min)
+        mean_pf = calculate_power_factor(self.bullet_weight_input.text(), shots.mean)
+        if worst_pf is None:
+            changed = self.set_result_text("Invalid Input")
+            return validate_and_update_status(None, self.division_labels) | changed
+        changed = self.set_result_text(f"{mean_pf:.1f} (worst shot {worst_pf:.1f})")
+        return validate_and_update_status(worst_pf, self.division_labels, mean_power_factor=mean_pf) | changed
+
+    def add_shot(self):
+        if not self.string_mode.isChecked():
+            return
+        velocity = parse_number(self.velocity_input.text())
+        if velocity is None or velocity <= 0:
+            return
+        self.shot_string.add(velocity)
+        self.velocity_input.clear()
+        self.update_string_status()
+
+    def undo_shot(self):
+        if self.shot_string.count:
+            self.shot_string.remove_last()
+            self.update_string_status()
+
+    def new_string(self):
+        self.shot_string = ShotString()
+        self.update_power_factor()
+
+    def save_string(self):
+        load = self.load_name.currentText().strip()
+        bullet_weight = parse_number(self.bullet_weight_input.text())
+        if not load or bullet_weight is None or not self.shot_string.count:
+            QMessageBox.information(self, "Save string", "Enter a load name, the bullet weight and at least one shot.")
+            return
+        self.string_store.save_string(load, bullet_weight, self.shot_string.velocities)
+        if self.load_name.findText(load) < 0:
+            self.load_name.addItem(load)
+        self.string_stats.setText(f"{self.string_stats.text()}   (saved to {load})")
+
+    def compare_strings(self):
+        load = self.load_name.currentText().strip()
+        saved = self.string_store.strings(load)
+        if not saved:
+            QMessageBox.information(self, "Compare strings", f"No saved strings for \"{load}\".")
+            return
+        series = [(entry["saved"], entry["velocities"], [entry["bullet_weight"]] * len(entry["velocities"]))
+                  for entry in saved]
+        self.show_chrono_results(chrono_statistics(series, None))
+
+    def import_chrono_file(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import chrono file", "", "Chrono exports (*.csv *.txt);;All files (*)")
+        if not path:
+            return
+        try:
+            series = read_chrono_file(path)
+        except (OSError, UnicodeError) as e:
+            QMessageBox.warning(self, "Import chrono file", f"Could not read {path}:\n{e}")
+            return
+
+        bullet_weight = parse_number(self.bullet_weight_input.text())
+        if bullet_weight is None and any(weights is None for _, _, weights in series):
+            QMessageBox.warning(self, "Import chrono file", "Enter the bullet weight first.")
+            return
+        results = chrono_statistics(series, bullet_weight)
+        if not results:
+            QMessageBox.information(self, "Import chrono file", "No velocities found in the file.")
+            return
+        self.show_chrono_results(results)
+
+    def show_chrono_results(self, results):
+        divisions = list(results[0]["passing"])
+        columns = ["Series", "Shots", "Mean (fps)", "SD", "ES", "Mean PF", "Min PF"] + divisions
+        self.chrono_table.clear()
+        self.chrono_table.setColumnCount(len(columns))
+        self.chrono_table.setHorizontalHeaderLabels(columns)
+        self.chrono_table.setRowCount(len(results))
+        for row, result in enumerate(results):
+            values = [
+                result["series"], str(result["shots"]), f"{result['mean']:.1f}", f"{result['sd']:.1f}",
+                f"{result['es']:.1f}", f"{result['mean_pf']:.1f}", f"{result['min_pf']:.1f}",
+            ]
+            for division in divisions:
+                passing = result["passing"][division]
+                values.append(" / ".join(f"{percent:.0f}% {factor}" for factor, percent in passing.items()))
+            for column, value in enumerate(values):
+                self.chrono_table.setItem(row, column, QTableWidgetItem(value))
+        self.chrono_table.resizeColumnsToContents()
+        self.chrono_table.show()
+
+# ------------------------- PF Matrix Tab ------------------------
+STATUS_COLORS = {0: QColor("red"), 1: QColor("green"), 2: QColor("blue")}
+
+
+class PFMatrixModel(QAbstractTableModel):
+    # Bullet weights (rows) x velocities (columns). The whole grid is computed
+    # with one numpy outer product; the view only asks for visible cells.
+    def __init__(self):
+        super().__init__()
+        import numpy as np
+        self.weights = np.array([])
+        self.velocities = np.array([])
+        self.pf = np.zeros((0, 0))
+        self.codes = np.zeros((0, 0), dtype=np.int8)
+        self.thresholds = ThresholdTable()
+        self.brushes = {code: QBrush(color) for code, color in STATUS_COLORS.items()}
+
+    def set_grid(self, weights, velocities, thresholds):
+        self.beginResetModel()
+        self.weights = weights
+        self.velocities = velocities
+        self.thresholds = thresholds
+        self.pf = calculate_power_factors(weights[:, None], velocities[None, :])
+        self.codes = division_status_codes(self.pf, thresholds)
+        self.endResetModel()
+
+    def minimum_velocity(self, weight, factor):
+        # Exact velocity where weight * velocity / 1000 reaches the threshold
+        threshold = getattr(self.thresholds, factor)
+        return threshold * 1000 / weight if threshold else None
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.weights)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.velocities)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return f"{self.pf[row, column]:.1f}"
+        if role == Qt.ItemDataRole.BackgroundRole:
+            return self.brushes[int(self.codes[row, column])]
+        if role == Qt.ItemDataRole.ToolTipRole:
+            status = {0: "Not okay", 1: "Minor Okay", 2: "Major Okay"}[int(self.codes[row, column])]
+            return f"{self.weights[row]:g} gr @ {self.velocities[column]:g} fps: PF {self.pf[row, column]:.2f}, {status}"
+        return None
 
-    def update_address_bar(self, url):
-        self.address_bar.setText(url.toString())
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        if orientation == Qt.Orientation.Horizontal:
+            return f"{self.velocities[section]:g}"
+        weight = self.weights[section]
+        text = f"{weight:g} gr"
+        for factor in ("minor", "major"):
+            velocity = self.minimum_velocity(weight, factor)
+            if velocity is not None:
+                text += f"  {factor} ≥ {velocity:.1f}"
+        return text
+
+
+class PFMatrixTab(QWidget):
+    def __init__(self):
+        super().__init__()
 
-    def handle_link_clicked(self, url):
-        self.web_view.load(url)  # Navigate to the new URL
+        layout = QGridLayout()
 
-    def load_url(self):
-        url = QUrl(self.address_bar.text())
-        self.web_view.load(url)
+        self.division_box = QComboBox()
+        self.division_box.addItems(current_divisions().keys())
+        layout.addWidget(QLabel("Division:"), 0, 0)
+        layout.addWidget(self.division_box, 0, 1, 1, 3)
+        ruleset_selection().changed.connect(self.show_ruleset)
+
+        # Range inputs: from, to, step
+        self.weight_range = [self.spin_box(50, 400, 115), self.spin_box(50, 400, 180), self.spin_box(1, 50, 1)]
+        self.velocity_range = [self.spin_box(300, 3500, 800), self.spin_box(300, 3500, 1400), self.spin_box(1, 100, 1)]
+        for row, (text, boxes) in enumerate([("Bullet weight (gr):", self.weight_range),
+                                             ("Velocity (fps):", self.velocity_range)], start=1):
+            layout.addWidget(QLabel(text), row, 0)
+            for column, box in enumerate(boxes, start=1):
+                layout.addWidget(box, row, column)
+
+        self.model = PFMatrixModel()
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        # Fixed section sizes so the view never measures 100k cells
+        self.table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.horizontalHeader().setDefaultSectionSize(48)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        layout.addWidget(self.table, 3, 0, 1, 4)
+        self.setLayout(layout)
 
-    def go_back(self):
-        self.web_view.back()
+        # Spin boxes fire on every step while held down; coalesce the updates
+        self.update_timer = QTimer(self)
+        self.update_timer.setSingleShot(True)
+        self.update_timer.setInterval(15)
+        self.update_timer.timeout.connect(self.update_grid)
+        self.division_box.currentTextChanged.connect(lambda *_: self.update_timer.start())
+        for box in self.weight_range + self.velocity_range:
+            box.valueChanged.connect(lambda *_: self.update_timer.start())
+
+        self.update_grid()
+
+    def spin_box(self, low, high, value):
+        box = QSpinBox()
+        box.setRange(low, high)
+        box.setValue(value)
+        return box
+
+    def update_grid(self):
+        import numpy as np
+        (w_from, w_to, w_step), (v_from, v_to, v_step) = (
+            [box.value() for box in self.weight_range], [box.value() for box in self.velocity_range])
+        weights = np.arange(min(w_from, w_to), max(w_from, w_to) + 1, w_step, dtype=float)
+        velocities = np.arange(min(v_from, v_to), max(v_from, v_to) + 1, v_step, dtype=float)
+        self.model.set_grid(weights, velocities, current_divisions()[self.division_box.currentText()])
+
+    def show_ruleset(self, ruleset):
+        division = self.division_box.currentText()
+        self.division_box.blockSignals(True)
+        self.division_box.clear()
+        self.division_box.addItems(ruleset.divisions.keys())
+        self.division_box.setCurrentText(division)
+        self.division_box.blockSignals(False)
+        self.update_grid()
+
+# ---------------------- Match Scoring Tab -----------------------
+class StandingsModel(QAbstractTableModel):
+    # Results of a match, one row per competitor in a fixed order (the view
+    # sorts through a proxy). The whole match is scored once on import; after
+    # that set_score() only redoes what one stage score can change: that
+    # stage's best hit factor and stage points in the competitor's division,
+    # and the division's totals. Only cells that really changed are reported
+    # to the view, and every edit goes into a journal for undo().
+    FIXED_COLUMNS = ["Place", "Competitor", "Division", "Class"]
+    TOTAL_COLUMNS = ["Match points", "%"]
 
-    def go_forward(self):
-        self.web_view.forward()
+    def __init__(self):
+        super().__init__()
+        self.competitors = []
+        self.stages = []
+        self.journal = []
+
+    def set_match(self, competitors, stages, hits, times, stage_max_points):
+        import numpy as np
+        self.beginResetModel()
+        self.competitors = competitors
+        self.stages = stages
+        self.hits = np.array(hits, dtype=float)
+        self.times = np.array(times, dtype=float)
+        self.stage_max_points = np.asarray(stage_max_points, dtype=float)
+        scores = score_match(self.hits, self.times, [division for _, division, _ in competitors],
+                             [pf for _, _, pf in competitors], self.stage_max_points, current_divisions())
+        for key, value in scores.items():
+            setattr(self, key, value)
+        self.members = [np.flatnonzero(self.division_index == index) for index in range(len(self.divisions))]
+        self.journal = []
+        self.endResetModel()
+
+    def rowCount(self, parent=QModelIndex()):
+        return len(self.competitors)
+
+    def columnCount(self, parent=QModelIndex()):
+        return len(self.FIXED_COLUMNS) + len(self.stages) + len(self.TOTAL_COLUMNS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole or orientation != Qt.Orientation.Horizontal:
+            return None
+        columns = self.FIXED_COLUMNS + [f"Stage {stage}" for stage in self.stages] + self.TOTAL_COLUMNS
+        return columns[section]
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        row, column = index.row(), index.column()
+        name, division, pf = self.competitors[row]
+        stage = column - len(self.FIXED_COLUMNS)
+        total = column - len(self.FIXED_COLUMNS) - len(self.stages)
+        if role == Qt.ItemDataRole.DisplayRole:
+            if column == 0:
+                return str(self.place[row])
+            if column == 1:
+                return name
+            if column == 2:
+                return division
+            if column == 3:
+                return f"{PF_CLASS_NAMES[self.classes[row]]} ({pf:.1f})"
+            if total == 0:
+                return f"{self.match_points[row]:.4f}"
+            if total == 1:
+                return f"{self.percent[row]:.2f}"
+            return f"{self.hit_factor[row, stage]:.4f}"
+        if role == Qt.ItemDataRole.ToolTipRole and 0 <= stage < len(self.stages):
+            return (f"{self.stage_score[row, stage]:.0f} points in {self.times[row, stage]:.2f} s, "
+                    f"{self.stage_points[row, stage]:.4f} stage points")
+        if role == Qt.ItemDataRole.UserRole:
+            # Sort keys for the proxy; the place column sorts by division first
+            if column == 0:
+                return f"{division}\0{self.place[row]:06d}"
+            if column in (1, 2):
+                return self.data(index)
+            if column == 3:
+                return int(self.classes[row])
+            if total == 0:
+                return float(self.match_points[row])
+            if total == 1:
+                return float(self.percent[row])
+            return float(self.hit_factor[row, stage])
+        return None
 
-class WebBrowserTab2(QWidget):
+    def score(self, competitor, stage):
+        return self.hits[competitor, stage].tolist(), float(self.times[competitor, stage])
+
+    def set_score(self, competitor, stage, counts, time_s, journal=True):
+        import numpy as np
+        if journal:
+            self.journal.append((competitor, stage) + self.score(competitor, stage))
+        self.hits[competitor, stage] = counts
+        self.times[competitor, stage] = time_s
+
+        # This competitor's stage result
+        a, c, d = HIT_VALUES[self.classes[competitor]]
+        hits = self.hits[competitor, stage]
+        raw = hits[0] * a + hits[1] * c + hits[2] * d - PENALTY_POINTS * hits[3:].sum()
+        self.stage_score[competitor, stage] = max(raw, 0)
+        self.hit_factor[competitor, stage] = self.stage_score[competitor, stage] / time_s if time_s > 0 else 0
+
+        # Stage points: everyone in the division if the stage's best hit
+        # factor moved, otherwise just this competitor
+        division = self.division_index[competitor]
+        members = self.members[division]
+        eligible = members[self.classes[members] > 0]
+        best = self.hit_factor[eligible, stage].max() if len(eligible) else 0.0
+        if best != self.best_hit_factor[division, stage]:
+            self.best_hit_factor[division, stage] = best
+            rows = eligible
+        else:
+            rows = eligible[eligible == competitor]
+        if best > 0:
+            self.stage_points[rows, stage] = self.hit_factor[rows, stage] / best * self.stage_max_points[stage]
+        else:
+            self.stage_points[rows, stage] = 0
+        self.match_points[rows] = self.stage_points[rows].sum(axis=1)
+
+        # Division totals
+        old_percent = self.percent[members].copy()
+        old_place = self.place[members].copy()
+        best_total = self.match_points[members].max()
+        self.percent[members] = self.match_points[members] / best_total * 100 if best_total > 0 else 0
+        self.place[members[np.argsort(-self.match_points[members], kind="stable")]] = np.arange(1, len(members) + 1)
+
+        stage_column = len(self.FIXED_COLUMNS) + stage
+        first_total = stage_column - stage + len(self.stages)
+        self.dataChanged.emit(self.index(competitor, stage_column), self.index(competitor, stage_column))
+        changed = set(rows.tolist()) | set(members[(self.percent[members] != old_percent)
+                                                    | (self.place[members] != old_place)].tolist())
+        for row in sorted(changed):
+            self.dataChanged.emit(self.index(row, 0), self.index(row, 0))
+            self.dataChanged.emit(self.index(row, first_total), self.index(row, first_total + 1))
+
+    def undo(self):
+        if not self.journal:
+            return None
+        competitor, stage, counts, time_s = self.journal.pop()
+        self.set_score(competitor, stage, counts, time_s, journal=False)
+        return competitor, stage
+
+
+class MatchScoringTab(QWidget):
+    # Imports a score sheet (see read_match_file), shows the standings and
+    # lets scores be corrected one stage at a time
     def __init__(self):
         super().__init__()
 
         layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
         self.setLayout(layout)
 
-        # Toolbar
-        toolbar = QToolBar()
-        layout.addWidget(toolbar)
-
-        # Address bar and buttons
-        self.address_bar = QLineEdit()
-        self.address_bar.returnPressed.connect(self.load_url)
-        toolbar.addWidget(self.address_bar)
-
-        back_button = QToolButton()
-        back_button.setText("<")
-        back_button.clicked.connect(self.go_back)
-        toolbar.addWidget(back_button)
-
-        forward_button = QToolButton()
-        forward_button.setText(">")
-        forward_button.clicked.connect(self.go_forward)
-        toolbar.addWidget(forward_button)
-
-        # Toolbar Additions
-        #self.case_sensitive_checkbox = QCheckBox("Case Sensitive")
-        #toolbar.addWidget(self.case_sensitive_checkbox)  # Add the checkbox to the toolbar
-        self.search_bar = QLineEdit()
-        self.search_bar.returnPressed.connect(self.search_text)
-        toolbar.addWidget(self.search_bar)
-
-        search_button = QToolButton()
-        search_button.setText("Find")
-        search_button.clicked.connect(self.search_text)
-        toolbar.addWidget(search_button)
-
-        # Web View
-        self.web_view = QWebEngineView()
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PdfViewerEnabled, True)
-
-        self.web_view.load(QUrl("https://www.google.com/maps/dir//sankthanshaugen+okts/data=!4m6!4m5!1m1!4e2!1m2!1m1!1s0x46416f995d1eb63d:0xe60aa231c80e0831?sa=X&ved=2ahUKEwjUzsDis7KEAxXxPhAIHazrBkcQ9Rd6BAgxEAA"))
-        self.web_view.urlChanged.connect(self.update_address_bar)
-        layout.addWidget(self.web_view)
-
-    def search_text(self, found=None):
+        import_button = QPushButton("Import scores (CSV)")
+        import_button.clicked.connect(self.import_scores)
+        layout.addWidget(import_button)
+
+        self.summary = QLabel("")
+        layout.addWidget(self.summary)
+
+        # Score correction: competitor, stage, hits and time
+        edit_layout = QGridLayout()
+        self.competitor_box = QComboBox()
+        self.stage_box = QComboBox()
+        edit_layout.addWidget(QLabel("Competitor:"), 0, 0)
+        edit_layout.addWidget(self.competitor_box, 0, 1, 1, 3)
+        edit_layout.addWidget(QLabel("Stage:"), 0, 4)
+        edit_layout.addWidget(self.stage_box, 0, 5)
+        self.hit_boxes = []
+        for column, name in enumerate(SCORE_COLUMNS):
+            box = QSpinBox()
+            box.setRange(0, 999)
+            self.hit_boxes.append(box)
+            edit_layout.addWidget(QLabel(f"{name}:"), 1 + column // 3, (column % 3) * 2)
+            edit_layout.addWidget(box, 1 + column // 3, (column % 3) * 2 + 1)
+        self.time_input = QLineEdit()
+        self.time_input.setPlaceholderText("Time (s)")
+        edit_layout.addWidget(QLabel("Time:"), 3, 0)
+        edit_layout.addWidget(self.time_input, 3, 1)
+        save_button = QPushButton("Save score")
+        save_button.clicked.connect(self.save_score)
+        edit_layout.addWidget(save_button, 3, 2, 1, 2)
+        self.undo_button = QPushButton("Undo")
+        self.undo_button.setEnabled(False)
+        self.undo_button.clicked.connect(self.undo)
+        edit_layout.addWidget(self.undo_button, 3, 4, 1, 2)
+        layout.addLayout(edit_layout)
+        self.competitor_box.currentIndexChanged.connect(self.show_score)
+        self.stage_box.currentIndexChanged.connect(self.show_score)
+
+        self.model = StandingsModel()
+        self.proxy = QSortFilterProxyModel(self)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(Qt.ItemDataRole.UserRole)
+        self.results_table = QTableView()
+        self.results_table.setModel(self.proxy)
+        self.results_table.setSortingEnabled(True)
+        self.results_table.sortByColumn(0, Qt.SortOrder.AscendingOrder)
+        self.results_table.verticalHeader().setVisible(False)
+        self.results_table.setSelectionBehavior(QTableView.SelectionBehavior.SelectRows)
+        self.results_table.clicked.connect(self.select_cell)
+        layout.addWidget(self.results_table)
+
+    def import_scores(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import scores", "", "Score sheets (*.csv *.txt);;All files (*)")
+        if not path:
+            return
         try:
-            text_to_find = self.search_bar.text()
+            competitors, stages, hits, times, stage_max_points = read_match_file(path, current_divisions())
+        except (OSError, ValueError) as e:
+            QMessageBox.warning(self, "Import scores", f"Could not read {path}:\n{e}")
+            return
+        started = time.perf_counter()
+        self.model.set_match(competitors, stages, hits, times, stage_max_points)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.summary.setText(f"{len(competitors)} competitors, {len(stages)} stages, scored in {elapsed_ms:.1f} ms")
+        self.match_loaded()
+
+    def match_loaded(self):
+        competitors, stages = self.model.competitors, self.model.stages
+        for box, items in ((self.competitor_box, [f"{name} ({division})" for name, division, _ in competitors]),
+                           (self.stage_box, [str(stage) for stage in stages])):
+            box.blockSignals(True)
+            box.clear()
+            box.addItems(items)
+            box.blockSignals(False)
+        self.show_score()
+        self.undo_button.setEnabled(False)
+        self.results_table.resizeColumnsToContents()
+
+    def select_cell(self, index):
+        # Clicking a stage cell picks that competitor and stage for editing
+        index = self.proxy.mapToSource(index)
+        self.competitor_box.setCurrentIndex(index.row())
+        stage = index.column() - len(StandingsModel.FIXED_COLUMNS)
+        if 0 <= stage < len(self.model.stages):
+            self.stage_box.setCurrentIndex(stage)
+
+    def show_score(self):
+        competitor, stage = self.competitor_box.currentIndex(), self.stage_box.currentIndex()
+        if competitor < 0 or stage < 0:
+            return
+        counts, time_s = self.model.score(competitor, stage)
+        for box, count in zip(self.hit_boxes, counts):
+            box.setValue(int(count))
+        self.time_input.setText(f"{time_s:.2f}")
+
+    def save_score(self):
+        competitor, stage = self.competitor_box.currentIndex(), self.stage_box.currentIndex()
+        time_s = parse_number(self.time_input.text())
+        if competitor < 0 or stage < 0 or time_s is None or time_s < 0:
+            return
+        self.model.set_score(competitor, stage, [box.value() for box in self.hit_boxes], time_s)
+        self.undo_button.setEnabled(True)
+
+    def undo(self):
+        undone = self.model.undo()
+        if undone is not None:
+            competitor, stage = undone
+            self.competitor_box.setCurrentIndex(competitor)
+            self.stage_box.setCurrentIndex(stage)
+            self.show_score()
+        self.undo_button.setEnabled(bool(self.model.journal))
+
+# ----------------------- Chrono Station -------------------------
+# PF checks at a match. Every check is appended to a per-match JSON lines
+# log that is flushed and fsynced before the result is shown, so a crash or
+# power cut loses at most a half-written last line, which is dropped on the
+# next load. A damaged line anywhere else is skipped and reported, never
+# cut. The log is indexed in memory by competitor number.
+class ChronoLog:
+    def __init__(self, path):
+        self.path = path
+        self.records = []
+        self.by_competitor = {}
+        self.bad_lines = []  # line numbers that could not be read
+        self.load()
+        self.file = path.open("a", encoding="utf-8")
+
+    def load(self):
+        if not self.path.exists():
+            return
+        data = self.path.read_bytes()
+        lines = data.splitlines(keepends=True)
+        for number, line in enumerate(lines, start=1):
+            if number == len(lines) and not line.endswith(b"\n"):
+                # Torn write at the end, cut it off so new lines start clean.
+                # Only this line: everything before it was written whole.
+                with self.path.open("r+b") as f:
+                    f.truncate(len(data) - len(line))
+                break
+            try:
+                record = json.loads(line)
+                record["competitor"]
+            except (ValueError, TypeError, KeyError):
+                # A damaged line in the middle is skipped but kept in the file
+                if line.strip():
+                    self.bad_lines.append(number)
+                continue
+            self.add_to_index(record)
+        if self.bad_lines:
+            print(f"{self.path}: skipped unreadable lines {', '.join(map(str, self.bad_lines))}")
+
+    def add_to_index(self, record):
+        self.records.append(record)
+        self.by_competitor.setdefault(record["competitor"], []).append(record)
+
+    def append(self, record):
+        self.file.write(json.dumps(record, ensure_ascii=False) + "\n")
+        self.file.flush()
+        os.fsync(self.file.fileno())
+        self.add_to_index(record)
+
+    def latest(self, competitor):
+        checks = self.by_competitor.get(competitor)
+        return checks[-1] if checks else None
+
+    def export_csv(self, path):
+        # The latest check per competitor, in competitor order
+        def order(competitor):
+            return (0, int(competitor), "") if competitor.isdigit() else (1, 0, competitor)
+        with Path(path).open("w", newline="", encoding="utf-8") as f:
+            writer = csv.writer(f, delimiter=";")
+            writer.writerow(["Competitor", "Division", "Declared", "Weight", "Velocities", "PF", "Result", "Checks"])
+            for competitor in sorted(self.by_competitor, key=order):
+                record = self.by_competitor[competitor][-1]
+                writer.writerow([
+                    competitor, record["division"], record["declared"],
+                    chrono_weight(record["weights"], record["velocities"]),
+                    " ".join(f"{velocity:g}" for velocity in record["velocities"]),
+                    f"{record['pf']:.1f}" if record["pf"] is not None else "", record["result"],
+                    len(self.by_competitor[competitor]),
+                ])
+
+    def close(self):
+        self.file.close()
+
+
+class ChronoStationTab(QWidget):
+    COLUMNS = ["Competitor", "Division", "Declared", "PF", "Result", "Checks"]
 
-            # Clear Previous Highlights (Optional)
-            self.web_view.page().findText("")
+    def __init__(self):
+        super().__init__()
+        self.log = None
+        self.rows = {}  # competitor -> table row
+        self.filled_from_log = False
 
-            # Perform the search (PyQt6 Compatibility)
-            if self.case_sensitive_checkbox.isChecked():
-                self.web_view.page().findText(text_to_find, QWebEnginePage.FindFlags.FindCaseSensitive)
-            else:
-                self.web_view.page().findText(text_to_find)
+        layout = QGridLayout()
+        self.setLayout(layout)
 
-            if found:
-                # Scroll to the found text (Approximate)
-                self.web_view.page().runJavaScript("window.scrollTo(0,0);")
+        self.match_input = QLineEdit(app_settings().value("chrono/match", "", type=str))
+        self.match_input.setPlaceholderText("Match name")
+        open_button = QPushButton("Open log")
+        open_button.clicked.connect(self.open_log)
+        layout.addWidget(QLabel("Match:"), 0, 0)
+        layout.addWidget(self.match_input, 0, 1)
+        layout.addWidget(open_button, 0, 2)
+
+        self.competitor_input = QLineEdit()
+        self.competitor_input.setPlaceholderText("Competitor number")
+        self.competitor_input.textChanged.connect(self.show_previous)
+        layout.addWidget(QLabel("Competitor:"), 1, 0)
+        layout.addWidget(self.competitor_input, 1, 1)
+
+        self.division_box = QComboBox()
+        self.division_box.addItems(current_divisions().keys())
+        ruleset_selection().changed.connect(self.show_ruleset)
+        self.declared_box = QComboBox()
+        self.division_box.currentTextChanged.connect(self.update_declared)
+        layout.addWidget(QLabel("Division:"), 2, 0)
+        layout.addWidget(self.division_box, 2, 1)
+        layout.addWidget(self.declared_box, 2, 2)
+
+        self.weight_input = QLineEdit()
+        self.weight_input.setPlaceholderText("Bullet weight(s) in grains, e.g. 124.2 or 124.2 124.6")
+        layout.addWidget(QLabel("Weights:"), 3, 0)
+        layout.addWidget(self.weight_input, 3, 1, 1, 2)
 
-                # Apply highlighting style
-                self.web_view.page().runJavaScript(
-                    f"window.find('{text_to_find}');"
-                )
-            else:
-                print("Not Found.")
+        self.velocity_input = QLineEdit()
+        self.velocity_input.setPlaceholderText("Velocities in fps, 3 or 6")
+        self.velocity_input.returnPressed.connect(self.record_check)
+        layout.addWidget(QLabel("Velocities:"), 4, 0)
+        layout.addWidget(self.velocity_input, 4, 1, 1, 2)
+
+        record_button = QPushButton("Record")
+        record_button.clicked.connect(self.record_check)
+        export_button = QPushButton("Export CSV")
+        export_button.clicked.connect(self.export)
+        layout.addWidget(record_button, 5, 1)
+        layout.addWidget(export_button, 5, 2)
+
+        self.result_label = QLabel("")
+        self.result_label.setWordWrap(True)
+        layout.addWidget(self.result_label, 6, 0, 1, 3)
+
+        self.results_table = QTableWidget(0, len(self.COLUMNS))
+        self.results_table.setHorizontalHeaderLabels(self.COLUMNS)
+        self.results_table.verticalHeader().setVisible(False)
+        layout.addWidget(self.results_table, 7, 0, 1, 3)
+
+        self.update_declared(self.division_box.currentText())
+        if self.match_input.text():
+            self.open_log()
+
+    def show_ruleset(self, ruleset):
+        self.division_box.clear()
+        self.division_box.addItems(ruleset.divisions.keys())
+
+    def update_declared(self, division):
+        self.declared_box.clear()
+        thresholds = current_divisions().get(division)
+        if thresholds is not None:
+            self.declared_box.addItems([name for name, limit in (("Major", thresholds.major), ("Minor", thresholds.minor))
+                                        if limit is not None])
+
+    def open_log(self):
+        name = re.sub(r"[^\w\- ]", "_", self.match_input.text().strip())
+        if not name:
+            return
+        if self.log is not None:
+            self.log.close()
+        app_settings().setValue("chrono/match", self.match_input.text().strip())
+        self.log = ChronoLog(app_data_dir("chrono") / f"{name}.jsonl")
+        self.rows = {}
+        self.results_table.setRowCount(0)
+        for competitor in self.log.by_competitor:
+            self.show_row(self.log.latest(competitor))
+        text = f"{len(self.log.records)} checks of {len(self.log.by_competitor)} competitors loaded"
+        if self.log.bad_lines:
+            text += f", {len(self.log.bad_lines)} unreadable lines skipped (see {self.log.path.name})"
+        self.result_label.setText(text)
+
+    def show_previous(self, competitor):
+        # Previous check of a competitor, for a re-check or a lookup
+        record = self.log.latest(competitor.strip()) if self.log is not None else None
+        if record is None:
+            # Don't leave another competitor's numbers in the form
+            if self.filled_from_log:
+                self.weight_input.clear()
+                self.velocity_input.clear()
+                self.result_label.clear()
+                self.filled_from_log = False
+            return
+        self.filled_from_log = True
+        self.division_box.setCurrentText(record["division"])
+        self.declared_box.setCurrentText(record["declared"])
+        self.weight_input.setText(" ".join(f"{weight:g}" for weight in record["weights"]))
+        self.velocity_input.setText(" ".join(f"{velocity:g}" for velocity in record["velocities"]))
+        self.show_result(record)
+
+    def record_check(self):
+        if self.log is None:
+            self.result_label.setText("Open a match log first")
+            return
+        competitor = self.competitor_input.text().strip()
+        weights = [parse_number(text) for text in self.weight_input.text().split()]
+        velocities = [parse_number(text) for text in re.split(r"[\s;]+", self.velocity_input.text().strip()) if text]
+        if not competitor or not weights or not velocities or None in weights or None in velocities:
+            self.result_label.setText("Enter competitor number, bullet weight(s) and velocities")
+            return
+
+        division, declared = self.division_box.currentText(), self.declared_box.currentText()
+        pf, code, next_step = chrono_check(declared, current_divisions()[division], weights, velocities)
+        record = {
+            "time": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "competitor": competitor,
+            "ruleset": f"{ruleset_selection().ruleset.discipline} {ruleset_selection().ruleset.season}",
+            "division": division,
+            "declared": declared,
+            "weights": weights,
+            "velocities": velocities,
+            "pf": pf,
+            "result": PF_CLASS_NAMES[code] if next_step is None else "Retest",
+            "next": next_step,
+        }
+        self.log.append(record)
+        self.filled_from_log = True
+        self.show_row(record)
+        self.show_result(record)
+
+    def show_result(self, record):
+        checks = len(self.log.by_competitor.get(record["competitor"], []))
+        pf = f"PF {record['pf']:.1f}" if record["pf"] is not None else "No PF"
+        text = f"{record['competitor']}: {pf}, {record['result']} (declared {record['declared']}, check {checks})"
+        if record["next"]:
+            text += f". Next: {record['next']}"
+        self.result_label.setText(text)
+
+    def show_row(self, record):
+        competitor = record["competitor"]
+        row = self.rows.get(competitor)
+        if row is None:
+            row = self.rows[competitor] = self.results_table.rowCount()
+            self.results_table.insertRow(row)
+        pf = f"{record['pf']:.1f}" if record["pf"] is not None else ""
+        values = [competitor, record["division"], record["declared"], pf, record["result"],
+                  str(len(self.log.by_competitor[competitor]))]
+        for column, value in enumerate(values):
+            self.results_table.setItem(row, column, QTableWidgetItem(value))
+
+    def export(self):
+        if self.log is None:
+            return
+        path, _ = QFileDialog.getSaveFileName(self, "Export chrono results", f"{self.match_input.text()}.csv",
+                                              "CSV (*.csv)")
+        if path:
+            self.log.export_csv(path)
+
+# ------------------------- Load Data Tab ------------------------
+# Local reloading data in SQLite (loads.sqlite3 in the app data folder),
+# imported from CSV. The PF of every load is computed on import with
+# calculate_power_factor and stored in an indexed column, so "which loads
+# make major" is an index range scan like the caliber, weight and powder
+# filters. The table fetches rows from the query cursor a page at a time as
+# it scrolls.
+GRAMS_TO_GRAINS = 15.4324
+LOAD_PAGE_ROWS = 256
+LOAD_FILTER_DELAY_MS = 50
+
+LOAD_COLUMN_RES = {
+    "caliber": re.compile(r"^(caliber|calibre|cartridge|kaliber)\b", re.IGNORECASE),
+    "bullet": re.compile(r"^(bullet|kule)\b(?!.*(weight|vekt|\(g|gr\b))", re.IGNORECASE),
+    "bullet_weight": re.compile(r"^((bullet |kule)?(weight|vekt)|gr(ains)?\b)", re.IGNORECASE),
+    "powder": re.compile(r"^(powder|krutt)\b", re.IGNORECASE),
+    "charge": re.compile(r"^(charge|ladning)\b", re.IGNORECASE),
+    "oal": re.compile(r"^(oal|col|c\.o\.l|cartridge length|patronlengde)\b", re.IGNORECASE),
+    "velocity": re.compile(r"^(velocity|v0|hastighet|speed)\b", re.IGNORECASE),
+    "source": re.compile(r"^(source|kilde)\b", re.IGNORECASE),
+}
+LOAD_FIELDS = list(LOAD_COLUMN_RES)
+
+
+class LoadDatabase:
+    def __init__(self, path):
+        self.path = path
+        self.connection = self.open_connection()
+
+    def open_connection(self):
+        # WAL, so the table's half-read query cursor doesn't block imports
+        connection = sqlite3.connect(str(self.path), timeout=10)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript("""
+            CREATE TABLE IF NOT EXISTS loads (
+                id INTEGER PRIMARY KEY, caliber TEXT, bullet TEXT, bullet_weight REAL, powder TEXT,
+                charge REAL, oal REAL, velocity REAL, source TEXT, pf REAL);
+            CREATE INDEX IF NOT EXISTS loads_caliber_weight ON loads (caliber, bullet_weight);
+            CREATE INDEX IF NOT EXISTS loads_powder ON loads (powder);
+            CREATE INDEX IF NOT EXISTS loads_pf ON loads (pf);
+        """)
+        return connection
+
+    def import_csv(self, path):
+        # Runs in the background with its own connection. Weights in grams
+        # and velocities in m/s are converted when the column title says so.
+        header, rows, columns = read_table(path, LOAD_COLUMN_RES, ("caliber", "bullet_weight", "velocity"))
+        grams = re.search(r"\(g\)|grams?\b|gram\b", header[columns["bullet_weight"]], re.IGNORECASE)
+        metric = "m/s" in header[columns["velocity"]].lower()
+
+        records = []
+        for row in rows:
+            values = {key: row[index] if index < len(row) else "" for key, index in columns.items()}
+            weight = parse_number(values["bullet_weight"])
+            velocity = parse_number(values["velocity"])
+            if not values["caliber"] or weight is None or velocity is None:
+                continue
+            if grams:
+                weight *= GRAMS_TO_GRAINS
+            if metric:
+                velocity *= MPS_TO_FPS
+            records.append((
+                values["caliber"], values.get("bullet", ""), round(weight, 1), values.get("powder", ""),
+                parse_number(values.get("charge", "")), parse_number(values.get("oal", "")), round(velocity),
+                values.get("source") or Path(path).name, calculate_power_factor(weight, velocity),
+            ))
+
+        connection = self.open_connection()
+        try:
+            with connection:
+                connection.executemany(
+                    "INSERT INTO loads (caliber, bullet, bullet_weight, powder, charge, oal, velocity, source, pf) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", records)
+        finally:
+            connection.close()
+        return len(records)
+
+    def distinct(self, column):
+        return [value for value, in self.connection.execute(
+            f"SELECT DISTINCT {column} FROM loads WHERE {column} != '' ORDER BY {column}")]
+
+    def query(self, caliber=None, min_weight=None, max_weight=None, powder=None, min_pf=None):
+        # Returns (row count, cursor over the matching rows)
+        conditions, params = [], []
+        for condition, value in (("caliber = ?", caliber), ("bullet_weight >= ?", min_weight),
+                                 ("bullet_weight <= ?", max_weight), ("powder = ?", powder), ("pf >= ?", min_pf)):
+            if value is not None:
+                conditions.append(condition)
+                params.append(value)
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+        count = self.connection.execute(f"SELECT COUNT(*) FROM loads {where}", params).fetchone()[0]
+        cursor = self.connection.execute(
+            f"SELECT {', '.join(LOAD_FIELDS)}, pf FROM loads {where} ORDER BY caliber, bullet_weight, pf", params)
+        return count, cursor
+
+
+class LoadDataModel(QAbstractTableModel):
+    HEADERS = ["Caliber", "Bullet", "Weight (gr)", "Powder", "Charge", "OAL", "Velocity (fps)", "Source", "PF"]
 
+    def __init__(self):
+        super().__init__()
+        self.cursor = None
+        self.rows = []
+        self.more = False
+
+    def set_cursor(self, cursor):
+        self.beginResetModel()
+        self.cursor = cursor
+        self.rows = cursor.fetchmany(LOAD_PAGE_ROWS)
+        self.more = len(self.rows) == LOAD_PAGE_ROWS
+        self.endResetModel()
+
+    def close_cursor(self):
+        # A half-read cursor keeps its read transaction, and with it the
+        # snapshot the next query on the connection would see
+        if self.cursor is not None:
+            self.cursor.close()
+        self.more = False
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self.more
+
+    def fetchMore(self, parent=QModelIndex()):
+        rows = self.cursor.fetchmany(LOAD_PAGE_ROWS)
+        self.more = len(rows) == LOAD_PAGE_ROWS
+        if rows:
+            self.beginInsertRows(QModelIndex(), len(self.rows), len(self.rows) + len(rows) - 1)
+            self.rows.extend(rows)
+            self.endInsertRows()
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.HEADERS)
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.HEADERS[section]
+        return None
 
-        except Exception as e:
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if role != Qt.ItemDataRole.DisplayRole:
+            return None
+        value = self.rows[index.row()][index.column()]
+        if value is None:
+            return ""
+        if index.column() == len(self.HEADERS) - 1:
+            return f"{value:.1f}"
+        return f"{value:g}" if isinstance(value, float) else str(value)
 
-            print(f"Search Error: {e}")
 
-    def update_address_bar(self, url):
-        self.address_bar.setText(url.toString())
+class LoadDataTab(QWidget):
+    ANY = "Any"
 
-    def handle_link_clicked(self, url):
-        self.web_view.load(url)  # Navigate to the new URL
+    def __init__(self):
+        super().__init__()
+        self.database = LoadDatabase(app_data_dir() / "loads.sqlite3")
 
-    def load_url(self):
-        url = QUrl(self.address_bar.text())
-        self.web_view.load(url)
+        layout = QGridLayout()
+        self.setLayout(layout)
 
-    def go_back(self):
-        self.web_view.back()
+        import_button = QPushButton("Import load data (CSV)")
+        import_button.clicked.connect(self.import_loads)
+        layout.addWidget(import_button, 0, 0, 1, 2)
+
+        self.caliber_box = QComboBox()
+        self.powder_box = QComboBox()
+        self.makes_box = QComboBox()
+        self.min_weight = QSpinBox()
+        self.max_weight = QSpinBox()
+        for box, value in ((self.min_weight, 0), (self.max_weight, 1000)):
+            box.setRange(0, 1000)
+            box.setValue(value)
+            box.setSuffix(" gr")
+        for row, (text, widget) in enumerate([("Caliber:", self.caliber_box), ("Powder:", self.powder_box),
+                                              ("Makes:", self.makes_box)], start=1):
+            layout.addWidget(QLabel(text), row, 0)
+            layout.addWidget(widget, row, 1, 1, 3)
+        layout.addWidget(QLabel("Bullet weight:"), 4, 0)
+        layout.addWidget(self.min_weight, 4, 1)
+        layout.addWidget(QLabel("to"), 4, 2)
+        layout.addWidget(self.max_weight, 4, 3)
+
+        self.status = QLabel("")
+        layout.addWidget(self.status, 5, 0, 1, 4)
+
+        self.model = LoadDataModel()
+        self.table = QTableView()
+        self.table.setModel(self.model)
+        self.table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeMode.Fixed)
+        self.table.verticalHeader().setDefaultSectionSize(22)
+        self.table.verticalHeader().setVisible(False)
+        layout.addWidget(self.table, 6, 0, 1, 4)
+
+        # Filters re-run the query after a short pause, not on every spin step
+        self.filter_timer = QTimer(self)
+        self.filter_timer.setSingleShot(True)
+        self.filter_timer.setInterval(LOAD_FILTER_DELAY_MS)
+        self.filter_timer.timeout.connect(self.run_query)
+        for box in (self.caliber_box, self.powder_box, self.makes_box):
+            box.currentIndexChanged.connect(lambda *_: self.filter_timer.start())
+        for box in (self.min_weight, self.max_weight):
+            box.valueChanged.connect(lambda *_: self.filter_timer.start())
+
+        self.show_ruleset(ruleset_selection().ruleset)
+        ruleset_selection().changed.connect(self.show_ruleset)
+        self.fill_choices()
+        self.run_query()
+
+    def set_items(self, box, items):
+        current = box.currentText()
+        box.blockSignals(True)
+        box.clear()
+        box.addItem(self.ANY)
+        for text, data in items:
+            box.addItem(text, data)
+        box.setCurrentText(current)
+        box.blockSignals(False)
+
+    def fill_choices(self):
+        self.set_items(self.caliber_box, [(caliber, caliber) for caliber in self.database.distinct("caliber")])
+        self.set_items(self.powder_box, [(powder, powder) for powder in self.database.distinct("powder")])
+
+    def show_ruleset(self, ruleset):
+        items = []
+        for division, thresholds in ruleset.divisions.items():
+            for factor, limit in (("major", thresholds.major), ("minor", thresholds.minor)):
+                if limit:
+                    items.append((f"{division} {factor} (PF {limit:g})", limit))
+        self.set_items(self.makes_box, items)
+        self.filter_timer.start()
+
+    def run_query(self):
+        def choice(box):
+            return box.currentData() if box.currentIndex() > 0 else None
+        started = time.perf_counter()
+        self.model.close_cursor()
+        count, cursor = self.database.query(
+            caliber=choice(self.caliber_box), powder=choice(self.powder_box), min_pf=choice(self.makes_box),
+            min_weight=self.min_weight.value() or None,
+            max_weight=self.max_weight.value() if self.max_weight.value() < self.max_weight.maximum() else None,
+        )
+        self.model.set_cursor(cursor)
+        elapsed_ms = (time.perf_counter() - started) * 1000
+        self.status.setText(f"{count} loads ({elapsed_ms:.1f} ms)")
+
+    def import_loads(self):
+        path, _ = QFileDialog.getOpenFileName(self, "Import load data", "", "CSV (*.csv *.txt);;All files (*)")
+        if not path:
+            return
+        self.status.setText(f"Importing {Path(path).name}...")
+        run_in_background(self.database.import_csv, path, on_done=self.loads_imported,
+                          on_error=lambda e: QMessageBox.warning(self, "Import load data", f"Could not import {path}:\n{e}"))
+
+    def loads_imported(self, count):
+        self.fill_choices()
+        self.run_query()
+        self.status.setText(f"{count} loads imported. {self.status.text()}")
 
-    def go_forward(self):
-        self.web_view.forward()
+# ------------------------ Web Browser Tab -----------------------
+# One persistent profile for all web tabs, so the HTTP cache and logins
+# survive restarts instead of using the default off-the-record profile
+PROFILE_NAME = "okts"
+HTTP_CACHE_SIZE_MB = 256
+USER_AGENT = "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:70.0) Gecko/20100101 Firefox/70.0"
+BLOCKLIST_ENABLED = True
+
+_web_profile = None
+
+def load_webengine():
+    # Importing QtWebEngine initialises Chromium, so it only happens when the
+    # first web tab or the web profile is needed
+    global QWebEngineView, QWebEngineProfile, QWebEnginePage, QWebEngineSettings, QWebEngineDownloadRequest
+    if QWebEngineView is None:
+        log_phase("loading QtWebEngine")
+        from PyQt6.QtWebEngineWidgets import QWebEngineView
+        from PyQt6.QtWebEngineCore import (
+            QWebEngineProfile, QWebEnginePage, QWebEngineSettings, QWebEngineDownloadRequest
+        )
+        log_phase("QtWebEngine loaded")
+
+def web_profile():
+    global _web_profile
+    if _web_profile is None:
+        load_webengine()
+        cache_mb = app_settings().value("web/cache_size_mb", HTTP_CACHE_SIZE_MB, type=int)
+        _web_profile = QWebEngineProfile(PROFILE_NAME, QApplication.instance())
+        _web_profile.setHttpCacheType(QWebEngineProfile.HttpCacheType.DiskHttpCache)
+        _web_profile.setHttpCacheMaximumSize(cache_mb * 1024 * 1024)
+        _web_profile.setPersistentCookiesPolicy(QWebEngineProfile.PersistentCookiesPolicy.ForcePersistentCookies)
+        _web_profile.setHttpUserAgent(USER_AGENT)
+        load_blocklist()
+    return _web_profile
+
+def load_blocklist():
+    # Tracker/ad blocklist (see blocklist.py): the bundled list plus an
+    # optional blocklist.txt in the app data folder, compiled off the UI
+    # thread once the web profile is created. Pages are not filtered until
+    # it is ready, so it never delays startup or the first page.
+    if not app_settings().value("blocklist/enabled", BLOCKLIST_ENABLED, type=bool):
+        return
+    from blocklist import BlocklistInterceptor
+    bundled = QFile(":/okts/blocklist.txt")
+    if not bundled.open(QIODevice.OpenModeFlag.ReadOnly):
+        return
+    text = bytes(bundled.readAll()).decode("utf-8")
+    bundled.close()
+
+    def set_trie(trie):
+        BlocklistInterceptor.trie = trie
+        log_phase("blocklist ready")
+
+    run_in_background(compile_blocklists, text, app_data_dir(), on_done=set_trie)
+
+def compile_blocklists(bundled, data_dir):
+    import blocklist
+    user_list = data_dir / "blocklist.txt"
+    text = bundled
+    if user_list.exists():
+        text += "\n" + user_list.read_text(encoding="utf-8", errors="replace")
+    return blocklist.load_blocklist(text, data_dir / "blocklist.cache")
+
+def clear_web_cache():
+    web_profile().clearHttpCache()
+    CACHE_STATS.reset()
+
+
+# Counts page resources served from the HTTP cache vs. the network, using the
+# Resource Timing API: a resource with transferSize 0 (or smaller than its
+# body, i.e. a 304 revalidation) came from the local cache. Cross-origin
+# entries without Timing-Allow-Origin report no sizes and are skipped.
+CACHE_STATS_JS = """
+(function () {
+    var entries = performance.getEntriesByType('navigation')
+        .concat(performance.getEntriesByType('resource'));
+    var hits = 0, misses = 0, saved = 0;
+    entries.forEach(function (e) {
+        if (!e.decodedBodySize) return;
+        if (e.transferSize < e.encodedBodySize || e.transferSize === 0) {
+            hits++;
+            saved += e.encodedBodySize - e.transferSize;
+        } else {
+            misses++;
+        }
+    });
+    return [hits, misses, saved];
+})();
+"""
+
+class CacheStats(QObject):
+    changed = pyqtSignal()
 
-# --------------------- Main Window Setup ------------------------
-class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
-        self.setWindowTitle("OKTS Dynamisk APP")
+        self.reset()
+
+    def reset(self):
+        self.hits = 0
+        self.misses = 0
+        self.bytes_saved = 0
+        self.changed.emit()
+
+    def add(self, result):
+        if not result:
+            return
+        hits, misses, saved = result
+        self.hits += int(hits)
+        self.misses += int(misses)
+        self.bytes_saved += int(saved)
+        self.changed.emit()
+
+    def summary(self):
+        return f"Cache: {self.hits} hits / {self.misses} misses ({self.bytes_saved / 1e6:.1f} MB saved)"
+
+CACHE_STATS = CacheStats()
+
+
+# ------------------------ Tab Snapshots -------------------------
+# On exit every open web tab stores its URL, back/forward list, scroll
+# position and an MHTML snapshot of the page. The next time the tab is opened
+# the snapshot is shown at once while the live page loads in a hidden page,
+# which takes its place when it has loaded. A snapshot larger than
+# SNAPSHOT_MAX_MB is not kept, and the least recently used ones are deleted
+# when together they exceed SNAPSHOT_BUDGET_MB.
+SNAPSHOTS_ENABLED = True
+SNAPSHOT_MAX_MB = 20
+SNAPSHOT_BUDGET_MB = 100
+SNAPSHOT_SAVE_TIMEOUT_MS = 3000
+SNAPSHOT_HISTORY_ITEMS = 20
+
+_tab_snapshots = None
+
+
+class SnapshotStore:
+    def __init__(self):
+        settings = app_settings()
+        self.enabled = settings.value("snapshots/enabled", SNAPSHOTS_ENABLED, type=bool)
+        self.max_bytes = settings.value("snapshots/max_mb", SNAPSHOT_MAX_MB, type=int) * 1024 * 1024
+        self.budget_bytes = settings.value("snapshots/budget_mb", SNAPSHOT_BUDGET_MB, type=int) * 1024 * 1024
+        self.directory = app_data_dir("snapshots")
+        self.index_path = self.directory / "index.json"
+        try:
+            self.entries = json.loads(self.index_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.entries = {}
+
+    def path(self, name):
+        return self.directory / f"{name}.mhtml"
+
+    def entry(self, name):
+        entry = self.entries.get(name) if self.enabled else None
+        if entry is not None:
+            entry["used"] = time.time()
+        return entry
+
+    def snapshot_url(self, name):
+        path = self.path(name)
+        return QUrl.fromLocalFile(str(path)) if path.exists() else None
+
+    def save_tabs(self, tabs):
+        # Called on exit. page.save() runs as a download, so wait for those to
+        # finish, but never longer than SNAPSHOT_SAVE_TIMEOUT_MS.
+        if not self.enabled:
+            return
+        loop = QEventLoop()
+        pending = [0]
+
+        def download_requested(download):
+            if not download.isSavePageDownload():
+                return
+            part = Path(download.downloadDirectory()) / download.downloadFileName()
+
+            def finished():
+                if download.state() == QWebEngineDownloadRequest.DownloadState.DownloadCompleted:
+                    part.replace(part.with_suffix(".mhtml"))
+                else:
+                    part.unlink(missing_ok=True)
+                pending[0] -= 1
+                if pending[0] <= 0:
+                    loop.quit()
+
+            download.isFinishedChanged.connect(finished)
+
+        profile = web_profile()
+        profile.downloadRequested.connect(download_requested)
+        for tab in tabs:
+            if self.save_tab(tab):
+                pending[0] += 1
+        if pending[0]:
+            QTimer.singleShot(SNAPSHOT_SAVE_TIMEOUT_MS, loop.quit)
+            loop.exec()
+        profile.downloadRequested.disconnect(download_requested)
+        self.evict()
+
+    def save_tab(self, tab):
+        name = type(tab).__name__
+        page = tab.web_view.page()
+        url = tab.current_url()
+        if not tab.snapshots or url.isEmpty():
+            return False
+        history = page.history()
+        scroll = page.scrollPosition()
+        self.entries[name] = {
+            "url": url.toString(),
+            "back": [item.url().toString() for item in history.backItems(SNAPSHOT_HISTORY_ITEMS)],
+            "forward": [item.url().toString() for item in history.forwardItems(SNAPSHOT_HISTORY_ITEMS)],
+            "scroll": [scroll.x(), scroll.y()],
+            "used": time.time(),
+        }
+        # Frozen and discarded pages, or a tab still showing last time's
+        # snapshot, keep the snapshot they already have
+        if (page.lifecycleState() != QWebEnginePage.LifecycleState.Active
+                or tab.live_page is not None or url.scheme() not in ("http", "https")):
+            return False
+        page.save(str(self.path(name).with_suffix(".part")),
+                  QWebEngineDownloadRequest.SavePageFormat.MimeHtmlSaveFormat)
+        return True
+
+    def evict(self):
+        sizes = {}
+        for name in self.entries:
+            path = self.path(name)
+            size = path.stat().st_size if path.exists() else 0
+            if size > self.max_bytes:
+                path.unlink()
+                size = 0
+            sizes[name] = size
+
+        # Least recently used snapshots go first; their URL and history are kept
+        total = 0
+        for name in sorted(self.entries, key=lambda name: self.entries[name]["used"], reverse=True):
+            total += sizes[name]
+            if total > self.budget_bytes:
+                self.path(name).unlink(missing_ok=True)
+                total -= sizes[name]
+        self.index_path.write_text(json.dumps(self.entries, indent=1), encoding="utf-8")
+
+def tab_snapshots():
+    global _tab_snapshots
+    if _tab_snapshots is None:
+        _tab_snapshots = SnapshotStore()
+    return _tab_snapshots
+
+
+# ------------------------- Page History -------------------------
+# Title, URL and text of every page loaded in a web tab go into an SQLite
+# FTS5 index, so old pages can be found by their content. Pages are queued on
+# the UI thread and written in batches by a background task every
+# HISTORY_FLUSH_MS; searching is a single ranked FTS query on the UI thread.
+HISTORY_ENABLED = True
+HISTORY_FLUSH_MS = 2000
+HISTORY_MAX_TEXT_CHARS = 200_000
+HISTORY_RESULTS = 50
+
+_page_history = None
+
+
+class PageHistory(QObject):
+    def __init__(self, path, parent=None):
+        super().__init__(parent)
+        self.path = path
+        self.enabled = app_settings().value("history/enabled", HISTORY_ENABLED, type=bool)
+        self.queue = []
+        self.writing = False
+        self.flush_timer = QTimer(self)
+        self.flush_timer.setSingleShot(True)
+        self.flush_timer.setInterval(HISTORY_FLUSH_MS)
+        self.flush_timer.timeout.connect(self.flush)
+        self.connection = self.open_connection()
+
+    def open_connection(self):
+        # One connection per thread; the background writer opens its own
+        connection = sqlite3.connect(str(self.path), timeout=10)
+        connection.execute("PRAGMA journal_mode=WAL")
+        connection.executescript("""
+            CREATE TABLE IF NOT EXISTS pages (
+                id INTEGER PRIMARY KEY, url TEXT UNIQUE, title TEXT, tab TEXT, visited REAL);
+            CREATE VIRTUAL TABLE IF NOT EXISTS page_text USING fts5(title, body);
+        """)
+        return connection
+
+    def add(self, url, title, tab, text):
+        if not self.enabled:
+            return
+        self.queue.append((url, title, tab, text[:HISTORY_MAX_TEXT_CHARS], time.time()))
+        if not self.flush_timer.isActive():
+            self.flush_timer.start()
+
+    def flush(self):
+        if not self.queue:
+            return
+        if self.writing:
+            # The previous batch is still being written, try again later
+            self.flush_timer.start()
+            return
+        batch, self.queue = self.queue, []
+        self.writing = True
+        run_in_background(self.write, batch, on_done=self.written, on_error=self.write_failed)
+
+    def written(self, count):
+        self.writing = False
+        if self.queue:
+            self.flush_timer.start()
+
+    def write_failed(self, error):
+        print(f"Could not save page history: {error!r}")
+        self.written(0)
+
+    def write(self, batch):
+        connection = self.open_connection()
+        try:
+            with connection:
+                for url, title, tab, text, visited in batch:
+                    # The FTS row shares its rowid with the pages row, so a
+                    # revisit replaces the text instead of adding a duplicate
+                    row = connection.execute("SELECT id FROM pages WHERE url = ?", (url,)).fetchone()
+                    if row is None:
+                        page_id = connection.execute(
+                            "INSERT INTO pages (url, title, tab, visited) VALUES (?, ?, ?, ?)",
+                            (url, title, tab, visited)).lastrowid
+                    else:
+                        page_id = row[0]
+                        connection.execute("UPDATE pages SET title = ?, tab = ?, visited = ? WHERE id = ?",
+                                           (title, tab, visited, page_id))
+                        connection.execute("DELETE FROM page_text WHERE rowid = ?", (page_id,))
+                    connection.execute("INSERT INTO page_text (rowid, title, body) VALUES (?, ?, ?)",
+                                       (page_id, title, text))
+        finally:
+            connection.close()
+        return len(batch)
+
+    def write_pending(self):
+        # On exit, whatever is still queued is written right away
+        self.flush_timer.stop()
+        if self.queue:
+            batch, self.queue = self.queue, []
+            self.write(batch)
+
+    def search(self, text, limit=HISTORY_RESULTS):
+        # Every word is matched as a prefix, quoted so FTS5 syntax in the
+        # query can't cause errors
+        words = WORD_RE.findall(text)
+        if not words:
+            return []
+        query = " ".join('"' + word.replace('"', '""') + '"*' for word in words)
+        return self.connection.execute("""
+            SELECT pages.url, pages.title, pages.tab, pages.visited,
+                   snippet(page_text, 1, '', '', '...', 12)
+            FROM page_text JOIN pages ON pages.id = page_text.rowid
+            WHERE page_text MATCH ?
+            ORDER BY bm25(page_text, 5.0, 1.0)
+            LIMIT ?""", (query, limit)).fetchall()
+
+def page_history():
+    global _page_history
+    if _page_history is None:
+        _page_history = PageHistory(app_data_dir() / "history.sqlite3", QApplication.instance())
+    return _page_history
+
+
+class HistorySearchDialog(QDialog):
+    # Search box over the page history; opening a hit loads it in the tab it
+    # was visited in
+    def __init__(self, main_window):
+        super().__init__(main_window)
+        self.main_window = main_window
+        self.setWindowTitle("Search history")
+        self.resize(700, 450)
+
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        self.search_box = QLineEdit()
+        self.search_box.setPlaceholderText("Search visited pages")
+        self.search_box.textChanged.connect(self.search)
+        self.search_box.returnPressed.connect(self.open_current)
+        layout.addWidget(self.search_box)
+        self.results = QListWidget()
+        self.results.setWordWrap(True)
+        self.results.itemActivated.connect(self.open_hit)
+        layout.addWidget(self.results)
+        self.status = QLabel()
+        layout.addWidget(self.status)
+
+    def search(self, text):
+        started = time.perf_counter()
+        try:
+            hits = page_history().search(text)
+        except sqlite3.Error as e:
+            self.status.setText(f"Search failed: {e}")
+            return
+        elapsed_ms = (time.perf_counter() - started) * 1000
+
+        self.results.clear()
+        for url, title, tab, visited, snippet in hits:
+            day = time.strftime("%Y-%m-%d", time.localtime(visited))
+            item = QListWidgetItem(f"{title or url}\n{day}  {url}\n{snippet}")
+            item.setData(Qt.ItemDataRole.UserRole, (url, tab))
+            self.results.addItem(item)
+        self.status.setText(f"{len(hits)} results in {elapsed_ms:.1f} ms" if text.strip() else "")
+
+    def open_current(self):
+        item = self.results.currentItem() or self.results.item(0)
+        if item is not None:
+            self.open_hit(item)
+
+    def open_hit(self, item):
+        url, tab = item.data(Qt.ItemDataRole.UserRole)
+        self.main_window.open_in_tab(tab, QUrl(url))
+        self.accept()
+
+
+class BrowserTab(QWidget):
+    # Shared toolbar + web view; subclasses only set the page they start on
+    start_url = ""
+    snapshots = True  # Restore the last page from a snapshot, see SnapshotStore
+    find_finished = pyqtSignal(int, int)  # active match, number of matches
 
-        tab_widget = QTabWidget()
-        tab_widget.addTab(IPSCCalculatorTab(), "IPSC Powerfactor")
-        tab_widget.addTab(WebBrowserTab(), "OKTS Dynamiske gruppe")
-        tab_widget.addTab(WebBrowserTab1(), "Shootandscoreit")
-        tab_widget.addTab(WebBrowserTab2(), "sankthanshaugen Maps")
-        tab_widget.addTab(WebBrowserTab3(), "Tåsen Maps")
-        tab_widget.addTab(WebBrowserTab4(), "DSSN")
-        tab_widget.addTab(WebBrowserTab5(), "IPSC Rules books")
-        tab_widget.addTab(LinkOpener(), "Eksterne links")
-        tab_widget.addTab(LinkOpener1(), "Rabatt for okts medlemmer")
-        self.setCentralWidget(tab_widget)
-
-class WebBrowserTab3(QWidget):
     def __init__(self):
         super().__init__()
 
@@ -411,366 +2162,1767 @@ class WebBrowserTab3(QWidget):
         # Toolbar
         toolbar = QToolBar()
         layout.addWidget(toolbar)
+        self.toolbar = toolbar
 
         # Address bar and buttons
         self.address_bar = QLineEdit()
         self.address_bar.returnPressed.connect(self.load_url)
         toolbar.addWidget(self.address_bar)
 
+
         back_button = QToolButton()
         back_button.setText("<")
         back_button.clicked.connect(self.go_back)
         toolbar.addWidget(back_button)
 
+
         forward_button = QToolButton()
         forward_button.setText(">")
         forward_button.clicked.connect(self.go_forward)
         toolbar.addWidget(forward_button)
 
-        # Toolbar Additions
-        #self.case_sensitive_checkbox = QCheckBox("Case Sensitive")
-        #toolbar.addWidget(self.case_sensitive_checkbox)  # Add the checkbox to the toolbar
+        # Find in page. Chromium searches asynchronously and reports the
+        # match count through findTextFinished, see show_find_result.
         self.search_bar = QLineEdit()
-        self.search_bar.returnPressed.connect(self.search_text)
+        self.search_bar.setPlaceholderText("Find in page")
+        self.search_bar.returnPressed.connect(self.find_next)
         toolbar.addWidget(self.search_bar)
 
+        self.case_sensitive_checkbox = QCheckBox("Case Sensitive")
+        self.case_sensitive_checkbox.toggled.connect(self.find_next)
+        toolbar.addWidget(self.case_sensitive_checkbox)
+
+        previous_button = QToolButton()
+        previous_button.setText("Prev")
+        previous_button.clicked.connect(self.find_previous)
+        toolbar.addWidget(previous_button)
+
         search_button = QToolButton()
         search_button.setText("Find")
-        search_button.clicked.connect(self.search_text)
+        search_button.clicked.connect(self.find_next)
         toolbar.addWidget(search_button)
 
-        # Web View
-        self.web_view = QWebEngineView()
-        self.web_view.page().profile().setHttpUserAgent(
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:70.0) Gecko/20100101 Firefox/70.0"
-        )
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PdfViewerEnabled, True)
+        self.match_label = QLabel()
+        toolbar.addWidget(self.match_label)
 
+        self.all_tabs_button = QToolButton()
+        self.all_tabs_button.setText("All tabs")
+        self.all_tabs_button.setToolTip("Search all open web tabs")
+        self.all_tabs_button.clicked.connect(self.search_all_tabs)
+        toolbar.addWidget(self.all_tabs_button)
 
+        self.blocked_label = QLabel()
+        toolbar.addWidget(self.blocked_label)
+
+        # Web View, on the shared persistent profile
+        load_webengine()
+        from blocklist import BlocklistInterceptor
+        # Per page rather than on the profile, so blocked requests are counted per tab
+        self.blocker = BlocklistInterceptor(self)
+        self.blocker.blocked.connect(self.update_blocked_label)
+        self.web_view = QWebEngineView()
+        self.web_view.setPage(self.new_page(self.web_view))
 
-        self.web_view.load(QUrl("https://www.google.com/maps/dir/59.920621,10.660327/OKTS+T%C3%A5sen,+T%C3%A5sen+Terrasse,+0873+Oslo/@59.9388828,10.6693672,13z/data=!3m1!4b1!4m18!1m7!3m6!1s0x46416f26e31bcfd1:0x59dd91ba2f13eff3!2sOKTS+T%C3%A5sen!8m2!3d59.9578229!4d10.7537873!16s%2Fg%2F11pyzfqnsl!4m9!1m1!4e1!1m5!1m1!1s0x46416f26e31bcfd1:0x59dd91ba2f13eff3!2m2!1d10.7537873!2d59.9578229!3e0?entry=ttu"))
         self.web_view.urlChanged.connect(self.update_address_bar)
+        self.web_view.loadFinished.connect(self.record_cache_stats)
+        self.web_view.loadFinished.connect(self.restore_scroll_position)
+        self.web_view.loadFinished.connect(self.trim_history)
+        self.web_view.loadFinished.connect(self.record_history)
+
+        # Set by the lifecycle manager when the page is discarded
+        self.saved_url = None
+        self.saved_scroll = None
+        # Set while a snapshot is shown and the live page loads behind it
+        self.live_page = None
+        self.live_scroll = None
+        # Back/forward list from the last session, used once the page's own
+        # history runs out
+        self.restored_back = []
+        self.restored_forward = []
+        self.clear_history = False
+
+        entry = tab_snapshots().entry(type(self).__name__) if self.snapshots else None
+        if entry is None:
+            self.web_view.load(self.home_url())
+        else:
+            self.restore_snapshot(entry)
         layout.addWidget(self.web_view)
 
-    def search_text(self, found=None):
-        try:
-            text_to_find = self.search_bar.text()
+    def new_page(self, parent):
+        page = QWebEnginePage(web_profile(), parent)
+        page.setUrlRequestInterceptor(self.blocker)
+        page.findTextFinished.connect(self.show_find_result)
+        page.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
+        page.settings().setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
+        page.settings().setAttribute(QWebEngineSettings.WebAttribute.PdfViewerEnabled, True)
+        return page
+
+    def restore_snapshot(self, entry):
+        url = QUrl(entry["url"])
+        self.restored_back = entry.get("back", [])
+        self.restored_forward = entry.get("forward", [])
+        self.saved_scroll = self.live_scroll = QPointF(*entry.get("scroll", (0, 0)))
+        snapshot = tab_snapshots().snapshot_url(type(self).__name__)
+        if snapshot is None:
+            self.web_view.load(url)
+            return
+
+        self.web_view.load(snapshot)
+        self.live_page = self.new_page(self)
+        self.live_page.loadFinished.connect(self.show_live_page)
+        self.live_page.load(url)
+        self.address_bar.setText(url.toString())
 
-            # Clear Previous Highlights (Optional)
+    def show_live_page(self, ok):
+        page, self.live_page = self.live_page, None
+        if page is None:
+            return
+        if not ok:
+            # Probably offline, so the snapshot stays
+            page.deleteLater()
+            return
+        snapshot_page = self.web_view.page()
+        page.setParent(self.web_view)
+        self.web_view.setPage(page)
+        snapshot_page.deleteLater()
+        self.update_address_bar(page.url())
+        self.saved_scroll = self.live_scroll
+        self.restore_scroll_position(True)
+        self.record_history(True)
+
+    def drop_live_page(self):
+        # The user went somewhere else before the live page was ready
+        if self.live_page is not None:
+            self.live_page.deleteLater()
+            self.live_page = None
+
+    def current_url(self):
+        if self.live_page is not None:
+            return self.live_page.requestedUrl()
+        url = self.web_view.page().url()
+        if url.isEmpty() and self.saved_url is not None:
+            return self.saved_url
+        return url
+
+    def find_flags(self, backward=False):
+        flags = QWebEnginePage.FindFlag(0)
+        if self.case_sensitive_checkbox.isChecked():
+            flags |= QWebEnginePage.FindFlag.FindCaseSensitively
+        if backward:
+            flags |= QWebEnginePage.FindFlag.FindBackward
+        return flags
+
+    def search_text(self, backward=False):
+        text = self.search_bar.text()
+        if not text:
+            # An empty search clears the highlighting
             self.web_view.page().findText("")
+            self.match_label.clear()
+            return
+        self.web_view.page().findText(text, self.find_flags(backward))
+
+    def find_next(self):
+        self.search_text()
+
+    def find_previous(self):
+        self.search_text(backward=True)
+
+    def show_find_result(self, result):
+        matches = result.numberOfMatches()
+        if not self.search_bar.text():
+            self.match_label.clear()
+        elif matches:
+            self.match_label.setText(f" {result.activeMatch()} of {matches} ")
+        else:
+            self.match_label.setText(" No matches ")
+        self.find_finished.emit(result.activeMatch(), matches)
 
-            # Perform the search (PyQt6 Compatibility)
-            if self.case_sensitive_checkbox.isChecked():
-                self.web_view.page().findText(text_to_find, QWebEnginePage.FindFlags.FindCaseSensitive)
-            else:
-                self.web_view.page().findText(text_to_find)
-
-            if found:
-                # Scroll to the found text (Approximate)
-                self.web_view.page().runJavaScript("window.scrollTo(0,0);")
-
-                # Apply highlighting style
-                self.web_view.page().runJavaScript(
-                    f"window.find('{text_to_find}');"
-                )
-            else:
-                print("Not Found.")
-
-
-        except Exception as e:
+    def search_all_tabs(self):
+        window = self.window()
+        if isinstance(window, MainWindow) and self.search_bar.text():
+            window.search_all_tabs(self.search_bar.text(), self.case_sensitive_checkbox.isChecked(),
+                                   self.all_tabs_button)
 
-            print(f"Search Error: {e}")
+    def home_url(self):
+        return QUrl(self.start_url)
 
     def update_address_bar(self, url):
-        self.address_bar.setText(url.toString())
+        if self.live_page is None:
+            self.address_bar.setText(url.toString())
 
     def handle_link_clicked(self, url):
         self.web_view.load(url)  # Navigate to the new URL
 
+
     def load_url(self):
         url = QUrl(self.address_bar.text())
+        self.drop_live_page()
+        self.restored_forward = []
         self.web_view.load(url)
 
     def go_back(self):
-        self.web_view.back()
+        self.drop_live_page()
+        if self.web_view.history().canGoBack() or not self.restored_back:
+            self.web_view.back()
+        else:
+            self.restored_forward.insert(0, self.current_url().toString())
+            self.load_restored(self.restored_back.pop())
 
     def go_forward(self):
-        self.web_view.forward()
-
-class WebBrowserTab4(QWidget):
-    def __init__(self):
-        super().__init__()
+        self.drop_live_page()
+        if self.web_view.history().canGoForward() or not self.restored_forward:
+            self.web_view.forward()
+        else:
+            self.restored_back.append(self.current_url().toString())
+            self.load_restored(self.restored_forward.pop(0))
+
+    def load_restored(self, url):
+        # Entries from the last session are loaded as new pages; the page's
+        # own history is cleared afterwards so back/forward keep walking the
+        # restored list instead of returning to where we came from
+        self.clear_history = True
+        self.web_view.load(QUrl(url))
+
+    def trim_history(self, ok):
+        if self.clear_history:
+            self.clear_history = False
+            self.web_view.history().clear()
+
+    def update_blocked_label(self):
+        self.blocked_label.setText(f" Blocked: {self.blocker.blocked_requests} ")
+        self.blocked_label.setToolTip(
+            f"{self.blocker.blocked_requests} tracker/ad requests blocked in this tab, "
+            f"about {self.blocker.bytes_saved / 1e6:.1f} MB saved")
+
+    def record_history(self, ok):
+        page = self.web_view.page()
+        url = page.url()
+        if not ok or url.scheme() not in ("http", "https"):
+            return
+        title = page.title()
+        tab = type(self).__name__
+        page.toPlainText(lambda text: page_history().add(url.toString(), title, tab, text or ""))
+
+    def open_url(self, url):
+        self.drop_live_page()
+        self.web_view.load(url)
 
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(layout)
+    def record_cache_stats(self, ok):
+        if ok:
+            self.web_view.page().runJavaScript(CACHE_STATS_JS, CACHE_STATS.add)
+
+    def lifecycle_state(self):
+        return self.web_view.page().lifecycleState()
+
+    def set_lifecycle_state(self, state):
+        page = self.web_view.page()
+        if state == page.lifecycleState():
+            return
+        if state == QWebEnginePage.LifecycleState.Discarded:
+            # Chromium drops the whole document, remember where we were
+            self.saved_url = page.url()
+            self.saved_scroll = page.scrollPosition()
+        page.setLifecycleState(state)
+
+    def resume(self):
+        page = self.web_view.page()
+        was_discarded = page.lifecycleState() == QWebEnginePage.LifecycleState.Discarded
+        page.setLifecycleState(QWebEnginePage.LifecycleState.Active)
+        if was_discarded and page.url().isEmpty() and self.saved_url is not None:
+            self.web_view.load(self.saved_url)
+
+    def restore_scroll_position(self, ok):
+        if ok and self.saved_scroll is not None:
+            x, y = self.saved_scroll.x(), self.saved_scroll.y()
+            self.web_view.page().runJavaScript(f"window.scrollTo({x}, {y});")
+        self.saved_scroll = None
+
+
+FIND_ALL_TIMEOUT_MS = 2000
+
+
+class CrossTabSearch(QObject):
+    # Runs one search in several tabs at once and collects the match counts
+    # as the pages answer. Pages that have not answered after
+    # FIND_ALL_TIMEOUT_MS count as no matches.
+    finished = pyqtSignal(list)
+
+    def __init__(self, tabs, text, case_sensitive, parent=None):
+        super().__init__(parent)
+        self.tabs = tabs  # [(tab index, BrowserTab)]
+        self.counts = {}
+        self.slots = []
+        self.done = False
+
+        for index, tab in tabs:
+            slot = lambda active, matches, index=index: self.tab_finished(index, matches)
+            tab.find_finished.connect(slot)
+            self.slots.append((tab, slot))
+            # Show the query in each tab too, so it is there when switching to it
+            tab.search_bar.setText(text)
+            tab.case_sensitive_checkbox.blockSignals(True)
+            tab.case_sensitive_checkbox.setChecked(case_sensitive)
+            tab.case_sensitive_checkbox.blockSignals(False)
+            tab.search_text()
+        QTimer.singleShot(FIND_ALL_TIMEOUT_MS, self.finish)
+
+    def tab_finished(self, index, matches):
+        self.counts[index] = matches
+        if len(self.counts) == len(self.tabs):
+            self.finish()
+
+    def finish(self):
+        if self.done:
+            return
+        self.done = True
+        for tab, slot in self.slots:
+            tab.find_finished.disconnect(slot)
+        self.finished.emit([(index, tab, self.counts.get(index, 0)) for index, tab in self.tabs])
+
+
+class WebBrowserTab(BrowserTab):
+    start_url = "https://www.okts.no/profile/1101668018/dynamisk"
 
-        # Toolbar
-        toolbar = QToolBar()
-        layout.addWidget(toolbar)
 
-        # Address bar and buttons
-        self.address_bar = QLineEdit()
-        self.address_bar.returnPressed.connect(self.load_url)
-        toolbar.addWidget(self.address_bar)
+#tab 3 web
+class WebBrowserTab1(BrowserTab):
+    start_url = "https://shootnscoreit.com/"
 
-        back_button = QToolButton()
-        back_button.setText("<")
-        back_button.clicked.connect(self.go_back)
-        toolbar.addWidget(back_button)
 
-        forward_button = QToolButton()
-        forward_button.setText(">")
-        forward_button.clicked.connect(self.go_forward)
-        toolbar.addWidget(forward_button)
+class WebBrowserTab2(BrowserTab):
+    start_url = "https://www.google.com/maps/dir//sankthanshaugen+okts/data=!4m6!4m5!1m1!4e2!1m2!1m1!1s0x46416f995d1eb63d:0xe60aa231c80e0831?sa=X&ved=2ahUKEwjUzsDis7KEAxXxPhAIHazrBkcQ9Rd6BAgxEAA"
 
-        # Toolbar Additions
-        #self.case_sensitive_checkbox = QCheckBox("Case Sensitive")
-        #toolbar.addWidget(self.case_sensitive_checkbox)  # Add the checkbox to the toolbar
-        self.search_bar = QLineEdit()
-        self.search_bar.returnPressed.connect(self.search_text)
-        toolbar.addWidget(self.search_bar)
 
-        search_button = QToolButton()
-        search_button.setText("Find")
-        search_button.clicked.connect(self.search_text)
-        toolbar.addWidget(search_button)
+class WebBrowserTab3(BrowserTab):
+    start_url = "https://www.google.com/maps/dir/59.920621,10.660327/OKTS+T%C3%A5sen,+T%C3%A5sen+Terrasse,+0873+Oslo/@59.9388828,10.6693672,13z/data=!3m1!4b1!4m18!1m7!3m6!1s0x46416f26e31bcfd1:0x59dd91ba2f13eff3!2sOKTS+T%C3%A5sen!8m2!3d59.9578229!4d10.7537873!16s%2Fg%2F11pyzfqnsl!4m9!1m1!4e1!1m5!1m1!1s0x46416f26e31bcfd1:0x59dd91ba2f13eff3!2m2!1d10.7537873!2d59.9578229!3e0?entry=ttu"
 
-        # Web View
-        self.web_view = QWebEngineView()
-        self.web_view.page().profile().setHttpUserAgent(
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:70.0) Gecko/20100101 Firefox/70.0"
-        )
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PdfViewerEnabled, True)
 
+class WebBrowserTab4(BrowserTab):
+    start_url = "https://dssn.no"
 
-        self.web_view.load(QUrl("https://dssn.no"))
-        self.web_view.urlChanged.connect(self.update_address_bar)
-        layout.addWidget(self.web_view)
 
-    def search_text(self, found=None):
+# ----------------------- IPSC Rulebooks -------------------------
+# Rulebooks are downloaded once and opened from a local file afterwards. The
+# copy is revalidated in the background with ETag/If-Modified-Since at most
+# every REVALIDATE_AFTER_H hours and replaced atomically on a new edition.
+# URLs can be overridden with the QSettings key rulebooks/<name>/url, and
+# any other name under rulebooks/ with a url adds a rulebook (the + button in
+# the rules tab writes these).
+# Only editions whose URL has been checked; other disciplines' rulebooks are
+# linked from https://www.ipsc.org/ipsc-rules/rule-books/
+RULEBOOKS = {
+    "Handgun": "https://www.ipsc.org/wp-content/uploads/2023/12/IPSC-Handgun-Competition-Rules-Jan-2024-Edition-Final-27-Dec-2023.pdf",
+}
+REVALIDATE_AFTER_H = 12
+# The name is also the file name of the local copy
+RULEBOOK_NAME_RE = re.compile(r"^[\w][\w .\-]{0,59}$")
+
+
+def rulebooks():
+    # Built in rulebooks first, then the ones added in settings
+    books = dict(RULEBOOKS)
+    settings = app_settings()
+    settings.beginGroup("rulebooks")
+    for name in settings.childGroups():
+        url = settings.value(f"{name}/url", "", type=str)
+        if url and RULEBOOK_NAME_RE.match(name):
+            books[name] = url
+    settings.endGroup()
+    return books
+
+
+def add_rulebook(name, url):
+    # Returns an error message, or None when the rulebook was saved
+    name, url = name.strip(), url.strip()
+    if not RULEBOOK_NAME_RE.match(name):
+        return "Use letters, digits, spaces, dots or dashes in the name."
+    if name in rulebooks():
+        return f"There is already a rulebook called \"{name}\"."
+    if QUrl(url).scheme() not in ("http", "https"):
+        return "The URL must start with http:// or https://."
+    app_settings().setValue(f"rulebooks/{name}/url", url)
+    return None
+
+
+class RulebookCache(QObject):
+    updated = pyqtSignal(str)  # rulebook name, a new copy is on disk
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self.directory = app_data_dir("rulebooks")
+        self.network = QNetworkAccessManager(self)
+        self.pending = {}
+
+    def remote_url(self, name):
+        return rulebooks()[name]
+
+    def path(self, name):
+        return self.directory / f"{name}.pdf"
+
+    def meta_path(self, name):
+        return self.directory / f"{name}.json"
+
+    def meta(self, name):
         try:
-            text_to_find = self.search_bar.text()
-
-            # Clear Previous Highlights (Optional)
-            self.web_view.page().findText("")
-
-            # Perform the search (PyQt6 Compatibility)
-            if self.case_sensitive_checkbox.isChecked():
-                self.web_view.page().findText(text_to_find, QWebEnginePage.FindFlags.FindCaseSensitive)
-            else:
-                self.web_view.page().findText(text_to_find)
-
-            if found:
-                # Scroll to the found text (Approximate)
-                self.web_view.page().runJavaScript("window.scrollTo(0,0);")
-
-                # Apply highlighting style
-                self.web_view.page().runJavaScript(
-                    f"window.find('{text_to_find}');"
-                )
-            else:
-                print("Not Found.")
-
-
-        except Exception as e:
-
-            print(f"Search Error: {e}")
-
-    def update_address_bar(self, url):
-        self.address_bar.setText(url.toString())
-
-    def handle_link_clicked(self, url):
-        self.web_view.load(url)  # Navigate to the new URL
-
-    def load_url(self):
-        url = QUrl(self.address_bar.text())
-        self.web_view.load(url)
-
-    def go_back(self):
-        self.web_view.back()
-
-    def go_forward(self):
-        self.web_view.forward()
+            return json.loads(self.meta_path(name).read_text())
+        except (OSError, ValueError):
+            return {}
+
+    def url(self, name):
+        # Local copy when we have one, otherwise stream from ipsc.org
+        if self.path(name).exists():
+            return QUrl.fromLocalFile(str(self.path(name)))
+        return QUrl(self.remote_url(name))
+
+    def revalidate(self, name, force=False):
+        if name in self.pending:
+            return
+        meta = self.meta(name)
+        have_copy = self.path(name).exists() and meta.get("url") == self.remote_url(name)
+        if have_copy and not force and time.time() - meta.get("checked", 0) < REVALIDATE_AFTER_H * 3600:
+            return
+
+        request = QNetworkRequest(QUrl(self.remote_url(name)))
+        if have_copy:
+            if meta.get("etag"):
+                request.setRawHeader(b"If-None-Match", meta["etag"].encode())
+            if meta.get("last_modified"):
+                request.setRawHeader(b"If-Modified-Since", meta["last_modified"].encode())
+
+        reply = self.network.get(request)
+        # QSaveFile writes to a temporary file and renames it over the old
+        # copy on commit(), so a half-finished download never replaces it
+        self.pending[name] = (reply, None)
+        reply.readyRead.connect(lambda: self.write_chunk(name))
+        reply.finished.connect(lambda: self.download_finished(name))
+
+    def write_chunk(self, name):
+        reply, target = self.pending[name]
+        if reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute) != 200:
+            return
+        if target is None:
+            target = QSaveFile(str(self.path(name)))
+            target.open(QIODevice.OpenModeFlag.WriteOnly)
+            self.pending[name] = (reply, target)
+        target.write(reply.readAll())
+
+    def download_finished(self, name):
+        self.write_chunk(name)
+        reply, target = self.pending.pop(name)
+        reply.deleteLater()
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+
+        if reply.error() != QNetworkReply.NetworkError.NoError or status not in (200, 304):
+            if target is not None:
+                target.cancelWriting()
+            print(f"Rulebook {name} not updated: {reply.errorString()}")
+            return
+
+        meta = self.meta(name)
+        meta["checked"] = time.time()
+        if status == 200:
+            if not target.commit():
+                print(f"Rulebook {name} could not be saved: {target.errorString()}")
+                return
+            meta["url"] = self.remote_url(name)
+            meta["etag"] = bytes(reply.rawHeader(b"ETag")).decode()
+            meta["last_modified"] = bytes(reply.rawHeader(b"Last-Modified")).decode()
+        self.meta_path(name).write_text(json.dumps(meta))
+        if status == 200:
+            self.updated.emit(name)
+
+_rulebook_cache = None
+
+def rulebook_cache():
+    global _rulebook_cache
+    if _rulebook_cache is None:
+        _rulebook_cache = RulebookCache(QApplication.instance())
+    return _rulebook_cache
+
+
+# Rule numbers start a line, e.g. "5.2.10 Competitors must ..."
+RULE_NUMBER_RE = re.compile(r"^\s*(\d{1,2}(?:\.\d{1,2}){1,3})\.?\s+\S", re.MULTILINE)
+CHAPTER_RE = re.compile(r"^\s*(CHAPTER\s+\d+|APPENDIX\s+[A-Z]\d*)\b[\s:.\-–]*(.*)$", re.MULTILINE | re.IGNORECASE)
+WORD_RE = re.compile(r"\w+")
+RULE_QUERY_RE = re.compile(r"^(?:rule|regel)?\s*(\d{1,2}(?:\.\d{1,2})*)\.?$", re.IGNORECASE)
+
+
+class RulebookIndex:
+    # Inverted index (word -> {page: count}) over the rulebook text, with a
+    # rule number -> page map and the chapter outline. Saved as JSON next to
+    # the PDF and rebuilt only when the PDF's size or mtime changes.
+    VERSION = 1
+
+    def __init__(self, data):
+        self.signature = data["signature"]
+        self.pages = data["pages"]
+        self.postings = {word: {int(page): count for page, count in hits.items()}
+                         for word, hits in data["postings"].items()}
+        self.rules = data["rules"]
+        self.outline = data["outline"]
+        self.words = sorted(self.postings)
+
+    @staticmethod
+    def pdf_signature(pdf_path):
+        stat = Path(pdf_path).stat()
+        return [stat.st_size, stat.st_mtime_ns]
+
+    @classmethod
+    def build(cls, pdf_path):
+        from PyQt6.QtPdf import QPdfDocument
+        document = QPdfDocument(None)
+        if document.load(str(pdf_path)) != QPdfDocument.Error.None_:
+            raise ValueError(f"Could not read {pdf_path}")
+        pages = [document.getAllText(page).text() for page in range(document.pageCount())]
+
+        postings = {}
+        rules = {}
+        outline = []
+        for page, text in enumerate(pages):
+            for word in WORD_RE.findall(text.lower()):
+                hits = postings.setdefault(word, {})
+                hits[page] = hits.get(page, 0) + 1
+            for match in RULE_NUMBER_RE.finditer(text):
+                rules.setdefault(match.group(1), page)
+            for match in CHAPTER_RE.finditer(text):
+                title = " ".join(part for part in match.groups() if part).strip()
+                # The table of contents lists every chapter too, keep the last
+                # occurrence of each heading, which is the chapter itself
+                outline = [entry for entry in outline if entry[0].split()[:2] != title.split()[:2]]
+                outline.append([title, page])
+        outline.sort(key=lambda entry: entry[1])
+
+        return cls({
+            "signature": cls.pdf_signature(pdf_path),
+            "pages": pages,
+            "postings": postings,
+            "rules": rules,
+            "outline": outline,
+        })
+
+    @classmethod
+    def load(cls, index_path, pdf_path):
+        # None when there is no index or it belongs to an older copy of the PDF
+        try:
+            data = json.loads(Path(index_path).read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if data.get("version") != cls.VERSION or data.get("signature") != cls.pdf_signature(pdf_path):
+            return None
+        return cls(data)
+
+    @classmethod
+    def load_or_build(cls, index_path, pdf_path):
+        index = cls.load(index_path, pdf_path)
+        if index is None:
+            index = cls.build(pdf_path)
+            index.save(index_path)
+        return index
+
+    def save(self, index_path):
+        data = {
+            "version": self.VERSION,
+            "signature": self.signature,
+            "pages": self.pages,
+            "postings": self.postings,
+            "rules": self.rules,
+            "outline": self.outline,
+        }
+        Path(index_path).write_text(json.dumps(data), encoding="utf-8")
+
+    def matching_words(self, prefix):
+        start = bisect.bisect_left(self.words, prefix)
+        end = start
+        while end < len(self.words) and self.words[end].startswith(prefix):
+            end += 1
+        return self.words[start:end]
+
+    def search(self, query, limit=50):
+        # Returns (title, page, snippet) tuples, best hit first. Pages are 0-based.
+        query = query.strip()
+        rule = RULE_QUERY_RE.match(query)
+        if rule:
+            number = rule.group(1)
+            return [(f"Rule {n}", page, self.snippet(page, [n]))
+                    for n, page in self.rules.items()
+                    if n == number or n.startswith(number + ".")][:limit]
+
+        terms = WORD_RE.findall(query.lower())
+        if not terms:
+            return []
+        # The last word is still being typed, so match it as a prefix
+        term_words = [[word] for word in terms[:-1]] + [self.matching_words(terms[-1])]
+
+        page_count = max(len(self.pages), 1)
+        scores = {}
+        matched = {}
+        for term_number, words in enumerate(term_words):
+            for word in words:
+                hits = self.postings.get(word, {})
+                idf = math.log(1 + page_count / (1 + len(hits)))
+                for page, count in hits.items():
+                    scores[page] = scores.get(page, 0.0) + count * idf
+                    matched.setdefault(page, set()).add(term_number)
+
+        # Pages containing every search term rank first
+        ranked = sorted(scores, key=lambda page: (len(matched[page]), scores[page]), reverse=True)
+        return [(f"Page {page + 1}", page, self.snippet(page, terms)) for page in ranked[:limit]]
+
+    def snippet(self, page, terms, width=60):
+        text = self.pages[page]
+        lowered = text.lower()
+        positions = [lowered.find(term) for term in terms if lowered.find(term) >= 0]
+        start = max(min(positions, default=0) - width, 0)
+        return " ".join(text[start:start + 2 * width].split())
+
+
+class WebBrowserTab5(BrowserTab):
+    snapshots = False  # The rulebook PDF is a local file already
 
-class WebBrowserTab5(QWidget):
     def __init__(self):
+        self.rulebook = app_settings().value("rulebooks/last", "Handgun", type=str)
+        if self.rulebook not in rulebooks():
+            self.rulebook = "Handgun"
         super().__init__()
 
-        layout = QVBoxLayout()
-        layout.setContentsMargins(0, 0, 0, 0)
-        self.setLayout(layout)
-
-        # Toolbar
-        toolbar = QToolBar()
-        layout.addWidget(toolbar)
-
-        # Address bar and buttons
-        self.address_bar = QLineEdit()
-        self.address_bar.returnPressed.connect(self.load_url)
-        toolbar.addWidget(self.address_bar)
+        self.rulebook_box = QComboBox()
+        self.rulebook_box.addItems(rulebooks().keys())
+        self.rulebook_box.setCurrentText(self.rulebook)
+        self.rulebook_box.currentTextChanged.connect(self.open_rulebook)
+        self.toolbar.insertWidget(self.toolbar.actions()[0], self.rulebook_box)
+
+        add_button = QToolButton()
+        add_button.setText("+")
+        add_button.setToolTip("Add a rulebook by name and PDF URL")
+        add_button.clicked.connect(self.add_rulebook)
+        self.toolbar.insertWidget(self.toolbar.actions()[1], add_button)
+
+        # Rule search panel next to the PDF
+        self.index = None
+        self.index_search = QLineEdit()
+        self.index_search.setPlaceholderText("Search rules or rule number, e.g. 5.2.10")
+        self.index_search.textChanged.connect(self.search_index)
+        self.index_results = QListWidget()
+        self.index_results.itemActivated.connect(self.open_index_hit)
+        self.index_results.itemClicked.connect(self.open_index_hit)
+
+        panel = QWidget()
+        panel_layout = QVBoxLayout()
+        panel_layout.setContentsMargins(0, 0, 0, 0)
+        panel_layout.addWidget(self.index_search)
+        panel_layout.addWidget(self.index_results)
+        panel.setLayout(panel_layout)
+
+        splitter = QSplitter()
+        self.layout().replaceWidget(self.web_view, splitter)
+        splitter.addWidget(self.web_view)
+        splitter.addWidget(panel)
+        splitter.setStretchFactor(0, 3)
+        splitter.setStretchFactor(1, 1)
+
+        rulebook_cache().updated.connect(self.rulebook_updated)
+        rulebook_cache().revalidate(self.rulebook)
+        self.load_index()
+
+    def home_url(self):
+        return rulebook_cache().url(self.rulebook)
+
+    def open_rulebook(self, name):
+        self.rulebook = name
+        app_settings().setValue("rulebooks/last", name)
+        self.web_view.load(self.home_url())
+        rulebook_cache().revalidate(name)
+        self.load_index()
+
+    def add_rulebook(self):
+        name, ok = QInputDialog.getText(self, "Add rulebook", "Name, e.g. Rifle:")
+        if not ok or not name.strip():
+            return
+        url, ok = QInputDialog.getText(self, "Add rulebook", "URL of the PDF:")
+        if not ok:
+            return
+        error = add_rulebook(name, url)
+        if error:
+            QMessageBox.warning(self, "Add rulebook", error)
+            return
+        self.rulebook_box.addItem(name.strip())
+        self.rulebook_box.setCurrentText(name.strip())
+
+    def rulebook_updated(self, name):
+        if name == self.rulebook:
+            self.web_view.load(self.home_url())
+            self.load_index()
+
+    def load_index(self):
+        self.index = None
+        self.index_results.clear()
+        pdf_path = rulebook_cache().path(self.rulebook)
+        if not pdf_path.exists():
+            self.index_search.setEnabled(False)
+            return
+        name = self.rulebook
+        index_path = pdf_path.with_suffix(".index.json")
+        run_in_background(RulebookIndex.load_or_build, index_path, pdf_path,
+                          on_done=lambda index: self.index_loaded(name, index))
+
+    def index_loaded(self, name, index):
+        if name != self.rulebook:
+            return
+        self.index = index
+        self.index_search.setEnabled(True)
+        self.search_index(self.index_search.text())
+
+    def search_index(self, query):
+        self.index_results.clear()
+        if self.index is None:
+            return
+        # Without a query, show the chapter outline
+        if query.strip():
+            hits = self.index.search(query)
+        else:
+            hits = [(title, page, "") for title, page in self.index.outline]
+        for title, page, snippet in hits:
+            item = QListWidgetItem(f"{title} (p. {page + 1})\n{snippet}" if snippet else f"{title} (p. {page + 1})")
+            item.setData(Qt.ItemDataRole.UserRole, page)
+            self.index_results.addItem(item)
+
+    def open_index_hit(self, item):
+        url = self.home_url()
+        url.setFragment(f"page={item.data(Qt.ItemDataRole.UserRole) + 1}")
+        self.web_view.load(url)
 
-        back_button = QToolButton()
-        back_button.setText("<")
-        back_button.clicked.connect(self.go_back)
-        toolbar.addWidget(back_button)
 
-        forward_button = QToolButton()
-        forward_button.setText(">")
-        forward_button.clicked.connect(self.go_forward)
-        toolbar.addWidget(forward_button)
+# ---------------------- Tab Lifecycle ---------------------------
+# Hidden web tabs are frozen (JavaScript stopped) after FREEZE_AFTER_S and
+# discarded (unloaded from memory) after DISCARD_AFTER_MIN, or earlier when
+# the renderer processes together use more than MEMORY_BUDGET_MB.
+FREEZE_AFTER_S = 30
+DISCARD_AFTER_MIN = 15
+MEMORY_BUDGET_MB = 1500  # 0 disables the budget
+LIFECYCLE_CHECK_MS = 5000
+
+try:
+    import psutil
+except ImportError:
+    psutil = None
+
+def query_windows_process(pid, query):
+    # Runs query(ctypes, wintypes, handle) on a process opened for reading
+    # its counters; psutil does the same when it is installed
+    import ctypes
+    from ctypes import wintypes
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.OpenProcess.restype = wintypes.HANDLE
+    kernel32.OpenProcess.argtypes = [wintypes.DWORD, wintypes.BOOL, wintypes.DWORD]
+    kernel32.CloseHandle.argtypes = [wintypes.HANDLE]
+    PROCESS_QUERY_LIMITED_INFORMATION = 0x1000
+    handle = kernel32.OpenProcess(PROCESS_QUERY_LIMITED_INFORMATION, False, pid)
+    if not handle:
+        return None
+    try:
+        return query(ctypes, wintypes, handle)
+    finally:
+        kernel32.CloseHandle(handle)
+
+
+def windows_working_set(ctypes, wintypes, handle):
+    class PROCESS_MEMORY_COUNTERS(ctypes.Structure):
+        _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+            (name, ctypes.c_size_t) for name in (
+                "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage", "QuotaPagedPoolUsage",
+                "QuotaPeakNonPagedPoolUsage", "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+    counters = PROCESS_MEMORY_COUNTERS()
+    counters.cb = ctypes.sizeof(counters)
+    psapi = ctypes.WinDLL("psapi")
+    psapi.GetProcessMemoryInfo.argtypes = [wintypes.HANDLE, ctypes.POINTER(PROCESS_MEMORY_COUNTERS), wintypes.DWORD]
+    if not psapi.GetProcessMemoryInfo(handle, ctypes.byref(counters), counters.cb):
+        return None
+    return counters.WorkingSetSize
 
-        # Toolbar Additions
-        #self.case_sensitive_checkbox = QCheckBox("Case Sensitive")
-        #toolbar.addWidget(self.case_sensitive_checkbox)  # Add the checkbox to the toolbar
-        self.search_bar = QLineEdit()
-        self.search_bar.returnPressed.connect(self.search_text)
-        toolbar.addWidget(self.search_bar)
 
-        search_button = QToolButton()
-        search_button.setText("Find")
-        search_button.clicked.connect(self.search_text)
-        toolbar.addWidget(search_button)
+def process_rss(pid):
+    # Resident memory of a process in bytes, None when it can't be read
+    if not pid:
+        return None
+    if psutil is not None:
+        try:
+            return psutil.Process(pid).memory_info().rss
+        except psutil.Error:
+            return None
+    if sys.platform == "win32":
+        try:
+            return query_windows_process(pid, windows_working_set)
+        except OSError:
+            return None
+    try:
+        pages = Path(f"/proc/{pid}/statm").read_text().split()[1]
+        return int(pages) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, IndexError, ValueError):
+        return None
 
-        # Web View
-        self.web_view = QWebEngineView()
-        self.web_view.page().profile().setHttpUserAgent(
-            "Mozilla/5.0 (Windows NT 10.0; Win64; x64; rv:70.0) Gecko/20100101 Firefox/70.0"
-        )
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.LocalContentCanAccessFileUrls, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PluginsEnabled, True)
-        self.web_view.settings().setAttribute(QWebEngineSettings.WebAttribute.PdfViewerEnabled, True)
 
+class TabLifecycleManager(QObject):
+    def __init__(self, tab_widget, parent=None):
+        super().__init__(parent)
+        self.tab_widget = tab_widget
+        self.last_active = {}
+
+        settings = app_settings()
+        self.freeze_after = settings.value("lifecycle/freeze_after_s", FREEZE_AFTER_S, type=int)
+        self.discard_after = settings.value("lifecycle/discard_after_min", DISCARD_AFTER_MIN, type=int) * 60
+        self.memory_budget = settings.value("lifecycle/memory_budget_mb", MEMORY_BUDGET_MB, type=int) * 1024 * 1024
+        if self.memory_budget and process_rss(os.getpid()) is None:
+            print("Process memory can't be read here (install psutil), the tab memory budget is off")
+            self.memory_budget = 0
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.check)
+        self.timer.start(LIFECYCLE_CHECK_MS)
+
+    def web_tabs(self):
+        for index in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(index)
+            if isinstance(tab, LazyTab):
+                tab = tab.widget
+            if isinstance(tab, BrowserTab):
+                yield tab
+
+    def tab_activated(self, tab):
+        if isinstance(tab, LazyTab):
+            tab = tab.widget
+        if isinstance(tab, BrowserTab):
+            tab.resume()
+            self.last_active[tab] = time.monotonic()
+
+    def check(self):
+        if QWebEnginePage is None:
+            return  # no web tab has been opened yet
+        now = time.monotonic()
+        Frozen = QWebEnginePage.LifecycleState.Frozen
+        Discarded = QWebEnginePage.LifecycleState.Discarded
+
+        hidden = []
+        for tab in self.web_tabs():
+            page = tab.web_view.page()
+            if page.isVisible():
+                self.last_active[tab] = now
+                continue
+            idle = now - self.last_active.setdefault(tab, now)
+            # recommendedState() is Active/Frozen while e.g. audio is playing
+            limit = page.recommendedState()
+            if idle >= self.discard_after and limit == Discarded:
+                tab.set_lifecycle_state(Discarded)
+            elif idle >= self.freeze_after and limit in (Frozen, Discarded) \
+                    and tab.lifecycle_state() != Discarded:
+                tab.set_lifecycle_state(Frozen)
+            if tab.lifecycle_state() != Discarded and limit == Discarded:
+                hidden.append(tab)
+
+        # Over budget: discard the least recently used hidden tab, one per check
+        # so the next measurement sees the effect before discarding more
+        if self.memory_budget and hidden and self.renderer_rss() > self.memory_budget:
+            oldest = min(hidden, key=lambda tab: self.last_active[tab])
+            oldest.set_lifecycle_state(Discarded)
+
+    def renderer_rss(self):
+        # Tabs on the same site can share a renderer, count each process once
+        pids = {tab.web_view.page().renderProcessPid() for tab in self.web_tabs()}
+        return sum(process_rss(pid) or 0 for pid in pids)
+
+
+# ---------------------- Resource Monitor ------------------------
+# Samples the renderer process of every open web tab each
+# RESOURCE_SAMPLE_MS: resident memory, CPU use since the last sample and, for
+# pages that are running, the JavaScript heap Chromium reports in
+# performance.memory. The last RESOURCE_HISTORY_SAMPLES rounds are kept for
+# export. A tab whose renderer goes over TAB_MEMORY_BUDGET_MB is reported
+# once, and again only after it has dropped back under the budget.
+RESOURCE_SAMPLE_MS = 2000
+RESOURCE_HISTORY_SAMPLES = 900  # 30 minutes at the default interval
+TAB_MEMORY_BUDGET_MB = 400  # 0 disables the warning
+
+JS_HEAP_JS = "performance.memory ? performance.memory.usedJSHeapSize : null"
+RESOURCE_COLUMNS = ["time", "tab", "pid", "rss_mb", "cpu_percent", "js_heap_mb"]
+
+
+def windows_cpu_seconds(ctypes, wintypes, handle):
+    times = [wintypes.FILETIME() for _ in range(4)]  # creation, exit, kernel, user
+    kernel32 = ctypes.WinDLL("kernel32")
+    kernel32.GetProcessTimes.argtypes = [wintypes.HANDLE] + [ctypes.POINTER(wintypes.FILETIME)] * 4
+    if not kernel32.GetProcessTimes(handle, *[ctypes.byref(filetime) for filetime in times]):
+        return None
+    # FILETIME counts 100 ns intervals
+    return sum((filetime.dwHighDateTime << 32 | filetime.dwLowDateTime) for filetime in times[2:]) / 1e7
 
-        self.web_view.load(QUrl("https://www.ipsc.org/wp-content/uploads/2023/12/IPSC-Handgun-Competition-Rules-Jan-2024-Edition-Final-27-Dec-2023.pdf"))
-        self.web_view.urlChanged.connect(self.update_address_bar)
-        layout.addWidget(self.web_view)
 
-    def search_text(self, found=None):
+def process_cpu_seconds(pid):
+    # User + system CPU time of a process, None when it can't be read
+    if not pid:
+        return None
+    if psutil is not None:
         try:
-            text_to_find = self.search_bar.text()
+            times = psutil.Process(pid).cpu_times()
+            return times.user + times.system
+        except psutil.Error:
+            return None
+    if sys.platform == "win32":
+        try:
+            return query_windows_process(pid, windows_cpu_seconds)
+        except OSError:
+            return None
+    try:
+        # The command name in field 2 can contain spaces, so split after it
+        fields = Path(f"/proc/{pid}/stat").read_text().rsplit(")", 1)[1].split()
+        return (int(fields[11]) + int(fields[12])) / os.sysconf("SC_CLK_TCK")
+    except (OSError, IndexError, ValueError):
+        return None
 
-            # Clear Previous Highlights (Optional)
-            self.web_view.page().findText("")
 
-            # Perform the search (PyQt6 Compatibility)
-            if self.case_sensitive_checkbox.isChecked():
-                self.web_view.page().findText(text_to_find, QWebEnginePage.FindFlags.FindCaseSensitive)
+class ResourceMonitor(QObject):
+    sampled = pyqtSignal()
+    over_budget = pyqtSignal(str, int)  # tab title, resident bytes
+
+    def __init__(self, tab_widget, parent=None):
+        super().__init__(parent)
+        self.tab_widget = tab_widget
+        # One row per open web tab and round
+        self.history = deque(maxlen=RESOURCE_HISTORY_SAMPLES * tab_widget.count())
+        self.latest = {}  # tab title -> latest sample row
+        self.cpu_times = {}  # pid -> (monotonic time, CPU seconds)
+        self.js_heap = {}  # tab title -> bytes
+        self.warned = set()
+
+        settings = app_settings()
+        self.budget = settings.value("monitor/tab_budget_mb", TAB_MEMORY_BUDGET_MB, type=int) * 1024 * 1024
+        if process_rss(os.getpid()) is None:
+            print("Process memory and CPU can't be read here (install psutil), tab resources stay empty")
+
+        self.timer = QTimer(self)
+        self.timer.timeout.connect(self.sample)
+        self.timer.start(settings.value("monitor/sample_ms", RESOURCE_SAMPLE_MS, type=int))
+
+    def set_budget(self, megabytes):
+        self.budget = megabytes * 1024 * 1024
+        app_settings().setValue("monitor/tab_budget_mb", megabytes)
+        self.warned.clear()
+
+    def web_tabs(self):
+        for index in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(index)
+            if isinstance(tab, LazyTab):
+                tab = tab.widget
+            if isinstance(tab, BrowserTab):
+                yield self.tab_widget.tabText(index), tab
+
+    def process_cpu_percent(self, pid, now):
+        seconds = process_cpu_seconds(pid)
+        if seconds is None:
+            return None
+        previous = self.cpu_times.get(pid)
+        self.cpu_times[pid] = (now, seconds)
+        if previous is None or now <= previous[0]:
+            return None
+        return 100 * (seconds - previous[1]) / (now - previous[0])
+
+    def sample(self):
+        if QWebEnginePage is None:
+            return  # no web tab has been opened yet
+        now = time.monotonic()
+        wall_time = time.strftime("%Y-%m-%d %H:%M:%S")
+        Active = QWebEnginePage.LifecycleState.Active
+        # Tabs on the same site can share a renderer, each process is read once
+        processes = {}
+        latest = {}
+        for title, tab in self.web_tabs():
+            page = tab.web_view.page()
+            pid = page.renderProcessPid()
+            if pid not in processes:
+                processes[pid] = (process_rss(pid), self.process_cpu_percent(pid, now))
+            rss, cpu = processes[pid]
+            if page.lifecycleState() == Active:
+                page.runJavaScript(JS_HEAP_JS, lambda heap, title=title: self.store_js_heap(title, heap))
             else:
-                self.web_view.page().findText(text_to_find)
+                self.js_heap.pop(title, None)
+            heap = self.js_heap.get(title)
+            row = (wall_time, title, pid,
+                   None if rss is None else round(rss / 2**20, 1),
+                   None if cpu is None else round(cpu, 1),
+                   None if heap is None else round(heap / 2**20, 1))
+            latest[title] = row
+            self.history.append(row)
+
+            if not self.budget or rss is None:
+                continue
+            if rss > self.budget and title not in self.warned:
+                self.warned.add(title)
+                self.over_budget.emit(title, rss)
+            elif rss <= self.budget:
+                self.warned.discard(title)
+
+        self.cpu_times = {pid: value for pid, value in self.cpu_times.items() if pid in processes}
+        self.latest = latest
+        self.sampled.emit()
+
+    def store_js_heap(self, title, heap):
+        # Answers arrive after the sample, so they show up in the next one
+        if isinstance(heap, (int, float)):
+            self.js_heap[title] = heap
+
+    def shared_pids(self):
+        pids = [row[2] for row in self.latest.values() if row[2]]
+        return {pid for pid in pids if pids.count(pid) > 1}
+
+    def export_csv(self, path):
+        with Path(path).open("w", newline="", encoding="utf-8") as file:
+            writer = csv.writer(file)
+            writer.writerow(RESOURCE_COLUMNS)
+            writer.writerows(["" if value is None else value for value in row] for row in self.history)
+
+
+class ResourceMonitorDialog(QDialog):
+    HEADERS = ["Tab", "Renderer PID", "Memory (MB)", "CPU %", "JS heap (MB)"]
+
+    def __init__(self, monitor, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Tab resources")
+        self.monitor = monitor
+        self.resize(640, 320)
 
-            if found:
-                # Scroll to the found text (Approximate)
-                self.web_view.page().runJavaScript("window.scrollTo(0,0);")
+        layout = QVBoxLayout()
+        self.setLayout(layout)
+        self.table = QTableWidget(0, len(self.HEADERS))
+        self.table.setHorizontalHeaderLabels(self.HEADERS)
+        self.table.setEditTriggers(QTableWidget.EditTrigger.NoEditTriggers)
+        self.table.verticalHeader().setVisible(False)
+        self.table.horizontalHeader().setSectionResizeMode(0, QHeaderView.ResizeMode.Stretch)
+        layout.addWidget(self.table)
+
+        controls = QHBoxLayout()
+        controls.addWidget(QLabel("Warn when a tab uses more than"))
+        self.budget_box = QSpinBox()
+        self.budget_box.setRange(0, 16384)
+        self.budget_box.setSingleStep(50)
+        self.budget_box.setSuffix(" MB")
+        self.budget_box.setSpecialValueText("Off")
+        self.budget_box.setValue(monitor.budget // 2**20)
+        self.budget_box.valueChanged.connect(monitor.set_budget)
+        controls.addWidget(self.budget_box)
+        controls.addStretch()
+        export_button = QPushButton("Export...")
+        export_button.clicked.connect(self.export)
+        controls.addWidget(export_button)
+        layout.addLayout(controls)
+
+        self.note = QLabel("")
+        layout.addWidget(self.note)
+
+        monitor.sampled.connect(self.show_samples)
+        self.show_samples()
+
+    def show_samples(self):
+        rows = list(self.monitor.latest.values())
+        shared = self.monitor.shared_pids()
+        self.table.setRowCount(len(rows))
+        for row_index, (_, title, pid, rss_mb, cpu, heap_mb) in enumerate(rows):
+            values = [title, f"{pid}{' (shared)' if pid in shared else ''}" if pid else "-",
+                      rss_mb, cpu, heap_mb]
+            over = self.monitor.budget and rss_mb is not None and rss_mb * 2**20 > self.monitor.budget
+            for column, value in enumerate(values):
+                item = QTableWidgetItem("-" if value is None else str(value))
+                if over:
+                    item.setForeground(QBrush(QColor("red")))
+                self.table.setItem(row_index, column, item)
+        if not rows:
+            self.note.setText("No web tab is open.")
+        elif shared:
+            self.note.setText("Tabs marked shared run in the same renderer; its memory is counted for each of them.")
+        else:
+            self.note.setText("")
 
-                # Apply highlighting style
-                self.web_view.page().runJavaScript(
-                    f"window.find('{text_to_find}');"
-                )
-            else:
-                print("Not Found.")
+    def export(self):
+        path, _ = QFileDialog.getSaveFileName(self, "Export tab resources", "tab_resources.csv", "CSV (*.csv)")
+        if not path:
+            return
+        try:
+            self.monitor.export_csv(path)
+        except OSError as e:
+            QMessageBox.warning(self, "Export tab resources", f"Could not write {path}:\n{e}")
+
+
+# ----------------------- Idle Prefetch --------------------------
+# Once the window is up and the user has left it alone for PREFETCH_IDLE_MS,
+# the pages of web tabs that have not been opened yet are loaded one at a
+# time in a hidden page on the shared profile, which fills the HTTP cache.
+# Tabs go in order of how often they were opened before; never-opened tabs
+# are skipped. Any key, click or scroll aborts the running prefetch and
+# pauses it. The application wide event filter that sees that input is only
+# installed while waiting for idle or prefetching; a pause removes it, and it
+# comes back PREFETCH_IDLE_MS later, so normal use is not filtered.
+PREFETCH_ENABLED = True
+PREFETCH_IDLE_MS = 5000
+PREFETCH_TIMEOUT_S = 30
+
+INPUT_EVENTS = frozenset({
+    QEvent.Type.KeyPress, QEvent.Type.MouseButtonPress, QEvent.Type.MouseButtonDblClick,
+    QEvent.Type.Wheel, QEvent.Type.TouchBegin,
+})
+
+
+class PrefetchScheduler(QObject):
+    def __init__(self, tab_widget, parent=None):
+        super().__init__(parent)
+        self.tab_widget = tab_widget
+        self.enabled = app_settings().value("prefetch/enabled", PREFETCH_ENABLED, type=bool)
+        self.queue = None
+        self.page = None
+        self.blocker = None
+        self.current = None
+
+        self.idle_timer = QTimer(self)
+        self.idle_timer.setSingleShot(True)
+        self.idle_timer.setInterval(app_settings().value("prefetch/idle_ms", PREFETCH_IDLE_MS, type=int))
+        self.idle_timer.timeout.connect(self.prefetch_next)
+
+        self.resume_timer = QTimer(self)
+        self.resume_timer.setSingleShot(True)
+        self.resume_timer.setInterval(self.idle_timer.interval())
+        self.resume_timer.timeout.connect(self.resume)
+
+        self.timeout_timer = QTimer(self)
+        self.timeout_timer.setSingleShot(True)
+        self.timeout_timer.setInterval(PREFETCH_TIMEOUT_S * 1000)
+        self.timeout_timer.timeout.connect(self.prefetch_done)
+
+    def start(self):
+        if not self.enabled:
+            return
+        self.resume()
+
+    def resume(self):
+        QApplication.instance().installEventFilter(self)
+        self.idle_timer.start()
+
+    def pause(self):
+        QApplication.instance().removeEventFilter(self)
+        self.idle_timer.stop()
+        self.abort()
+        self.resume_timer.start()
+
+    def stop(self):
+        self.pause()
+        self.resume_timer.stop()
+
+    def record_open(self, tab_class):
+        settings = app_settings()
+        key = f"prefetch/opens/{tab_class.__name__}"
+        settings.setValue(key, settings.value(key, 0, type=int) + 1)
+
+    def build_queue(self):
+        settings = app_settings()
+        opens = {tab_class: settings.value(f"prefetch/opens/{tab_class.__name__}", 0, type=int)
+                 for _, tab_class in TABS if issubclass(tab_class, BrowserTab)}
+        return sorted((tab_class for tab_class, count in opens.items() if count > 0),
+                      key=lambda tab_class: opens[tab_class], reverse=True)
+
+    def is_open(self, tab_class):
+        for index, (_, cls) in enumerate(TABS):
+            tab = self.tab_widget.widget(index)
+            if cls is tab_class:
+                return not isinstance(tab, LazyTab) or tab.widget is not None
+        return False
+
+    def eventFilter(self, watched, event):
+        if event.type() in INPUT_EVENTS:
+            self.pause()
+        return False
+
+    def prefetch_next(self):
+        if self.queue is None:
+            self.queue = self.build_queue()
+        while self.queue and self.is_open(self.queue[0]):
+            self.queue.pop(0)
+        if not self.queue:
+            self.stop()
+            return
+
+        self.current = self.queue.pop(0)
+        if self.current is WebBrowserTab5:
+            # The rules tab shows a local PDF; fetching it is the prefetch
+            rulebook = app_settings().value("rulebooks/last", "Handgun", type=str)
+            rulebook_cache().revalidate(rulebook if rulebook in rulebooks() else "Handgun")
+            self.current = None
+            self.idle_timer.start()
+            return
+
+        load_webengine()
+        if self.blocker is None:
+            from blocklist import BlocklistInterceptor
+            self.blocker = BlocklistInterceptor(self)
+        self.page = QWebEnginePage(web_profile(), self)
+        self.page.setUrlRequestInterceptor(self.blocker)
+        self.page.setAudioMuted(True)
+        self.page.loadFinished.connect(self.prefetch_done)
+        self.page.load(QUrl(self.current.start_url))
+        self.timeout_timer.start()
+
+    def prefetch_done(self):
+        self.timeout_timer.stop()
+        if self.page is not None:
+            self.page.deleteLater()
+            self.page = None
+        self.current = None
+        # Stay quiet for another idle period before the next page
+        self.idle_timer.start()
+
+    def abort(self):
+        if self.page is None:
+            return
+        self.timeout_timer.stop()
+        self.page.triggerAction(QWebEnginePage.WebAction.Stop)
+        self.page.deleteLater()
+        self.page = None
+        # Try the interrupted page again at the next idle period
+        self.queue.insert(0, self.current)
+        self.current = None
+
+
+# ------------------------ Link Health ---------------------------
+# The link tabs check their links in the background: at most
+# LINK_CHECK_CONCURRENCY requests at a time, redirects followed, and results
+# cached for LINK_CHECK_TTL_H hours in link_status.json. A HEAD request is
+# tried first; servers that refuse it get a GET that is aborted as soon as
+# the first body bytes arrive.
+LINK_CHECK_CONCURRENCY = 4
+LINK_CHECK_TTL_H = 24
+LINK_CHECK_TIMEOUT_S = 15
+
+LINK_OK, LINK_REDIRECTED, LINK_BROKEN = "ok", "redirected", "broken"
+LINK_MARKS = {
+    LINK_OK: ("\u2713", "green"),
+    LINK_REDIRECTED: ("\u2192", "darkorange"),
+    LINK_BROKEN: ("\u2717", "red"),
+}
 
+_link_checker = None
 
-        except Exception as e:
 
-            print(f"Search Error: {e}")
+def same_link(url, final_url):
+    # http -> https upgrades, host case and a trailing slash don't count as a redirect
+    def key(url):
+        url = QUrl(url)
+        return url.host().lower().removeprefix("www."), url.path().rstrip("/"), url.query()
+    return key(url) == key(final_url)
 
-    def update_address_bar(self, url):
-        self.address_bar.setText(url.toString())
 
-    def handle_link_clicked(self, url):
-        self.web_view.load(url)  # Navigate to the new URL
+class LinkChecker(QObject):
+    checked = pyqtSignal(str, str, str)  # url, status, detail
 
-    def load_url(self):
-        url = QUrl(self.address_bar.text())
-        self.web_view.load(url)
+    def __init__(self, cache_path, ttl_s=LINK_CHECK_TTL_H * 3600, concurrency=LINK_CHECK_CONCURRENCY,
+                 parent=None):
+        super().__init__(parent)
+        self.cache_path = cache_path
+        self.ttl_s = ttl_s
+        self.concurrency = concurrency
+        self.network = QNetworkAccessManager(self)
+        self.network.setRedirectPolicy(QNetworkRequest.RedirectPolicy.NoLessSafeRedirectPolicy)
+        self.queue = deque()
+        self.running = {}  # url -> reply
+        self.first_bytes = {}  # url -> (status, final url) of an aborted GET
+        try:
+            self.cache = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self.cache = {}
+
+    def check(self, urls, force=False):
+        now = time.time()
+        for url in urls:
+            cached = self.cache.get(url)
+            if cached is not None and not force and now - cached["checked"] < self.ttl_s:
+                self.checked.emit(url, cached["status"], cached["detail"])
+            elif url not in self.running and url not in self.queue:
+                self.queue.append(url)
+        self.start_next()
+
+    def start_next(self):
+        while self.queue and len(self.running) < self.concurrency:
+            self.send(self.queue.popleft(), "HEAD")
+
+    def send(self, url, method):
+        request = QNetworkRequest(QUrl(url))
+        request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, USER_AGENT)
+        request.setTransferTimeout(LINK_CHECK_TIMEOUT_S * 1000)
+        if method == "HEAD":
+            reply = self.network.head(request)
+        else:
+            reply = self.network.get(request)
+            reply.readyRead.connect(lambda: self.got_first_bytes(url, reply))
+        reply.finished.connect(lambda: self.reply_finished(url, method, reply))
+        self.running[url] = reply
+
+    def got_first_bytes(self, url, reply):
+        # Headers of the final response are in, the page itself isn't needed
+        if url not in self.first_bytes:
+            status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+            self.first_bytes[url] = (status, reply.url())
+            reply.abort()
+
+    def reply_finished(self, url, method, reply):
+        reply.deleteLater()
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        final_url = reply.url()
+        error = reply.error()
+        if url in self.first_bytes:
+            status, final_url = self.first_bytes.pop(url)
+            error = QNetworkReply.NetworkError.NoError
+        if method == "HEAD" and (error != QNetworkReply.NetworkError.NoError or (status or 0) >= 400):
+            self.send(url, "GET")
+            return
+
+        del self.running[url]
+        if (status or 0) >= 400:
+            result = (LINK_BROKEN, f"HTTP {status}")
+        elif error != QNetworkReply.NetworkError.NoError:
+            result = (LINK_BROKEN, reply.errorString())
+        elif not same_link(url, final_url):
+            result = (LINK_REDIRECTED, final_url.toString())
+        else:
+            result = (LINK_OK, f"HTTP {status}")
+        self.cache[url] = {"status": result[0], "detail": result[1], "checked": time.time()}
+        self.checked.emit(url, *result)
 
-    def go_back(self):
-        self.web_view.back()
+        self.start_next()
+        if not self.running:
+            self.cache_path.write_text(json.dumps(self.cache, indent=1), encoding="utf-8")
 
-    def go_forward(self):
-        self.web_view.forward()
+def link_checker():
+    global _link_checker
+    if _link_checker is None:
+        ttl_h = app_settings().value("links/check_ttl_h", LINK_CHECK_TTL_H, type=float)
+        _link_checker = LinkChecker(app_data_dir() / "link_status.json", ttl_h * 3600,
+                                    parent=QApplication.instance())
+    return _link_checker
 
 
 class LinkOpener(QWidget):
+    # Grid of buttons opening links in the system browser; LinkOpener1 only
+    # has other links
+    links = [
+        ("OKTS Dynamisk Facebook", "https://www.facebook.com/groups/670259856359608"),
+        ("Oslo-Indoor-Open Facebook", "https://www.facebook.com/p/Oslo-Indoor-Open-100023594956974/"),
+        ("Romansys login", "https://nor.romansys.io/login"),
+        ("IPSC Rulebooks", "https://www.ipsc.org/ipsc-rules/rule-books/"),
+        ("Shootandscoreit", "https://shootnscoreit.com/dashboard/"),
+        ("vihtavuori Ladedata riffel", "https://www.vihtavuori.com/reloading-data/rifle-reloading/"),
+        ("vihtavuori Ladedata Pistol", "https://www.vihtavuori.com/reloading-data/handgun-reloading/"),
+        ("Politiet Våpen", "https://www.politiet.no/tjenester/vapen/"),
+        ("Våpen Forum", "https://www.kammeret.no/"),
+        ("APP forfatter", "https://github.com/techbliss/OKTS"),
+    ]
+
     def __init__(self):
         super().__init__()
 
         self.setWindowTitle("Link Opener")
         self.layout = QGridLayout()
-
-        self.links = [
-            ("OKTS Dynamisk Facebook", "https://www.facebook.com/groups/670259856359608"),
-            ("Oslo-Indoor-Open Facebook", "https://www.facebook.com/p/Oslo-Indoor-Open-100023594956974/"),
-            ("Romansys login", "https://nor.romansys.io/login"),
-            ("IPSC Rulebooks", "https://www.ipsc.org/ipsc-rules/rule-books/"),
-            ("Shootandscoreit", "https://shootnscoreit.com/dashboard/"),
-            ("vihtavuori Ladedata riffel", "https://www.vihtavuori.com/reloading-data/rifle-reloading/"),
-            ("vihtavuori Ladedata Pistol", "https://www.vihtavuori.com/reloading-data/handgun-reloading/"),
-            ("Politiet Våpen", "https://www.politiet.no/tjenester/vapen/"),
-            ("Våpen Forum", "https://www.kammeret.no/"),
-            ("APP forfatter", "https://github.com"),
-
-
-        ]
+        self.buttons = {}
 
         self.create_buttons()
         self.setLayout(self.layout)
 
+        checker = link_checker()
+        checker.checked.connect(self.show_link_status)
+        checker.check(self.buttons.keys())
+
     def create_buttons(self):
         row = 0
         col = 0
         for label, url in self.links:
             button = QPushButton(label)
             button.clicked.connect(lambda _, link=url: webbrowser.open(link))
+            button.setToolTip(url)
             self.layout.addWidget(button, row, col)
+            self.buttons[url] = button
 
             col += 1
             if col > 2:
                 row += 1
                 col = 0
 
-class LinkOpener1(QWidget):
-    def __init__(self):
+        check_button = QPushButton("Check links")
+        check_button.clicked.connect(lambda: link_checker().check(self.buttons.keys(), force=True))
+        self.layout.addWidget(check_button, row + 1, 0)
+
+    def show_link_status(self, url, status, detail):
+        button = self.buttons.get(url)
+        if button is None:
+            return
+        label = next(label for label, link in self.links if link == url)
+        mark, color = LINK_MARKS[status]
+        button.setText(f"{mark} {label}")
+        button.setStyleSheet(f"color: {color};")
+        button.setToolTip(f"{url}\n{status}: {detail}")
+
+class LinkOpener1(LinkOpener):
+    links = [
+        ("Norsegear", "https://www.Norsegear.no"),
+        ("Foto", "https://www.foto.no"),
+        ("JbShooting.no", "https://www.jbshooting.no/"),
+        ("Magne Landrø", "https://www.landro.no/"),
+    ]
+
+# ------------------------- Page Watch ---------------------------
+# Polls the OKTS dynamisk page in the background and marks its tab when the
+# posts on it have changed, so nobody has to open the page just to check.
+# Each poll is one conditional GET of the HTML (If-None-Match and
+# If-Modified-Since, gzip from QNetworkAccessManager); an unchanged page is a
+# bodiless 304 and nothing else on the page is ever fetched. The content
+# section picked out by PAGE_WATCH_SECTION_RE is reduced to its text and
+# hashed, so scripts, tokens and markup churn don't count as changes.
+PAGE_WATCH_ENABLED = True
+PAGE_WATCH_INTERVAL_MIN = 15
+PAGE_WATCH_FIRST_POLL_S = 20
+PAGE_WATCH_TIMEOUT_S = 30
+PAGE_WATCH_SECTION_RE = r"<main\b.*?</main>"
+PAGE_WATCH_BADGE = " \u25cf"
+
+INVISIBLE_HTML_RE = re.compile(r"<(script|style|noscript|template)\b.*?</\1\s*>|<!--.*?-->",
+                               re.DOTALL | re.IGNORECASE)
+HTML_TAG_RE = re.compile(r"<[^>]*>")
+
+
+def page_section_hash(text, section_re=PAGE_WATCH_SECTION_RE):
+    # Hash of the visible text of the content section, or of the whole page
+    # when the section isn't there
+    match = re.search(section_re, text, re.DOTALL | re.IGNORECASE) if section_re else None
+    if match:
+        text = match.group(0)
+    text = HTML_TAG_RE.sub(" ", INVISIBLE_HTML_RE.sub(" ", text))
+    words = html.unescape(text).split()
+    return hashlib.sha256(" ".join(words).encode("utf-8")).hexdigest()
+
+
+class PageWatcher(QObject):
+    changed = pyqtSignal(bool)  # True while there are changes the user hasn't seen
+
+    def __init__(self, url, parent=None):
+        super().__init__(parent)
+        self.url = url
+        settings = app_settings()
+        self.enabled = settings.value("watch/enabled", PAGE_WATCH_ENABLED, type=bool)
+        self.section_re = settings.value("watch/section_re", PAGE_WATCH_SECTION_RE, type=str)
+        self.network = QNetworkAccessManager(self)
+        self.network.setRedirectPolicy(QNetworkRequest.RedirectPolicy.NoLessSafeRedirectPolicy)
+        self.reply = None
+
+        self.timer = QTimer(self)
+        self.timer.setInterval(round(settings.value("watch/interval_min", PAGE_WATCH_INTERVAL_MIN, type=float)
+                                     * 60 * 1000))
+        self.timer.timeout.connect(self.poll)
+
+    def start(self):
+        if not self.enabled:
+            return
+        # Not on startup, the window has better things to do then
+        QTimer.singleShot(PAGE_WATCH_FIRST_POLL_S * 1000, self.poll)
+        self.timer.start()
+        if self.has_changes():
+            self.changed.emit(True)
+
+    def has_changes(self):
+        settings = app_settings()
+        content_hash = settings.value("watch/hash", "", type=str)
+        return bool(content_hash) and content_hash != settings.value("watch/seen_hash", "", type=str)
+
+    def mark_seen(self):
+        settings = app_settings()
+        if self.has_changes():
+            settings.setValue("watch/seen_hash", settings.value("watch/hash", "", type=str))
+            self.changed.emit(False)
+
+    def poll(self):
+        if self.reply is not None:
+            return
+        settings = app_settings()
+        request = QNetworkRequest(QUrl(self.url))
+        request.setHeader(QNetworkRequest.KnownHeaders.UserAgentHeader, USER_AGENT)
+        request.setTransferTimeout(PAGE_WATCH_TIMEOUT_S * 1000)
+        request.setAttribute(QNetworkRequest.Attribute.CacheLoadControlAttribute,
+                             QNetworkRequest.CacheLoadControl.AlwaysNetwork)
+        # Validators only count for the section the hash was made from
+        if settings.value("watch/hashed_section_re", "", type=str) == self.section_re:
+            etag = settings.value("watch/etag", "", type=str)
+            last_modified = settings.value("watch/last_modified", "", type=str)
+            if etag:
+                request.setRawHeader(b"If-None-Match", etag.encode())
+            if last_modified:
+                request.setRawHeader(b"If-Modified-Since", last_modified.encode())
+        self.reply = self.network.get(request)
+        self.reply.finished.connect(self.poll_finished)
+
+    def poll_finished(self):
+        reply, self.reply = self.reply, None
+        reply.deleteLater()
+        status = reply.attribute(QNetworkRequest.Attribute.HttpStatusCodeAttribute)
+        if reply.error() != QNetworkReply.NetworkError.NoError or status not in (200, 304):
+            print(f"Page watch: {self.url} not checked: {reply.errorString()}")
+            return
+        if status == 304:
+            return
+        body = bytes(reply.readAll())
+        content_hash = page_section_hash(body.decode("utf-8", errors="replace"), self.section_re)
+
+        settings = app_settings()
+        settings.setValue("watch/etag", bytes(reply.rawHeader(b"ETag")).decode())
+        settings.setValue("watch/last_modified", bytes(reply.rawHeader(b"Last-Modified")).decode())
+        if settings.value("watch/hashed_section_re", "", type=str) != self.section_re:
+            # First look at the page (or at a new section of it): whatever is
+            # there counts as seen
+            settings.setValue("watch/seen_hash", content_hash)
+            settings.setValue("watch/hashed_section_re", self.section_re)
+        settings.setValue("watch/hash", content_hash)
+        self.changed.emit(self.has_changes())
+
+
+# --------------------- Main Window Setup ------------------------
+# Tab title -> widget class, in display order
+TABS = [
+    ("IPSC Powerfactor", IPSCCalculatorTab),
+    ("PF Matrix", PFMatrixTab),
+    ("Stevneresultater", MatchScoringTab),
+    ("Kronografstasjon", ChronoStationTab),
+    ("Ladedata", LoadDataTab),
+    ("OKTS Dynamiske gruppe", WebBrowserTab),
+    ("Shootandscoreit", WebBrowserTab1),
+    ("sankthanshaugen Maps", WebBrowserTab2),
+    ("Tåsen Maps", WebBrowserTab3),
+    ("DSSN", WebBrowserTab4),
+    ("IPSC Rules books", WebBrowserTab5),
+    ("Eksterne links", LinkOpener),
+    ("Rabatt for okts medlemmer", LinkOpener1),
+]
+
+
+class LazyTab(QWidget):
+    # Lightweight placeholder for a tab. The real widget is only created the
+    # first time materialize() is called, so tabs that are never opened never
+    # start a QWebEngineView (or its renderer process).
+    def __init__(self, tab_class):
         super().__init__()
+        self.tab_class = tab_class
+        self.widget = None
 
-        self.setWindowTitle("Link Opener")
-        self.layout = QGridLayout()
+        layout = QVBoxLayout()
+        layout.setContentsMargins(0, 0, 0, 0)
+        self.setLayout(layout)
 
-        self.links = [
-            ("Norsegear", "https://www.Norsegear.no"),
-            ("Foto", "https://www.foto.no"),
-            ("JbShooting.no", "https://nor.romansys.io/login"),
-            ("Magne Landrø", "https://www.landro.no/"),
-        ]
+    def materialize(self):
+        if self.widget is None:
+            self.widget = self.tab_class()
+            self.layout().addWidget(self.widget)
+        return self.widget
 
-        self.create_buttons()
-        self.setLayout(self.layout)
 
-    def create_buttons(self):
-        row = 0
-        col = 0
-        for label, url in self.links:
-            button = QPushButton(label)
-            button.clicked.connect(lambda _, link=url: webbrowser.open(link))
-            self.layout.addWidget(button, row, col)
+class MainWindow(QMainWindow):
+    def __init__(self, lazy_tabs=None, warm_tab=None):
+        super().__init__()
+        self.setWindowTitle("OKTS Dynamisk APP")
 
-            col += 1
-            if col > 2:
-                row += 1
-                col = 0
+        settings = app_settings()
+        if lazy_tabs is None:
+            lazy_tabs = settings.value("tabs/lazy", LAZY_TABS, type=bool)
+        if warm_tab is None:
+            warm_tab = settings.value("tabs/warm", WARM_TAB, type=str)
 
-# -------- Application Execution --------
-app = QApplication(sys.argv)
-from pathlib import Path
-styleFile = Path("blue_mod_style.css").read_text()
-app.setStyleSheet(styleFile)
-app.setWindowIcon(QIcon('OKTS.png'))
+        self.tab_widget = QTabWidget()
+        for title, tab_class in TABS:
+            if lazy_tabs:
+                self.tab_widget.addTab(LazyTab(tab_class), title)
+            else:
+                self.tab_widget.addTab(tab_class(), title)
+        self.tab_widget.currentChanged.connect(self.activate_tab)
+        self.setCentralWidget(self.tab_widget)
+        self.lifecycle = TabLifecycleManager(self.tab_widget, self)
+        self.prefetch = PrefetchScheduler(self.tab_widget, self)
+        self.resource_monitor = ResourceMonitor(self.tab_widget, self)
+        self.resource_monitor.over_budget.connect(self.warn_over_budget)
+        self.resource_monitor_dialog = None
+        self.page_watch = PageWatcher(WebBrowserTab.start_url, self)
+        self.page_watch.changed.connect(self.show_page_watch_badge)
+
+        # Tools menu and web cache hit/miss counter
+        tools_menu = self.menuBar().addMenu("Tools")
+        clear_cache_action = QAction("Clear web cache", self)
+        clear_cache_action.triggered.connect(self.clear_web_cache)
+        tools_menu.addAction(clear_cache_action)
+        history_action = QAction("Search history...", self)
+        history_action.setShortcut("Ctrl+H")
+        history_action.triggered.connect(self.search_history)
+        tools_menu.addAction(history_action)
+        resources_action = QAction("Tab resources...", self)
+        resources_action.triggered.connect(self.show_resource_monitor)
+        tools_menu.addAction(resources_action)
+        latency_action = QAction("Dump calculator latency", self)
+        latency_action.triggered.connect(self.dump_latency)
+        tools_menu.addAction(latency_action)
+
+        self.cache_label = QLabel(CACHE_STATS.summary())
+        self.statusBar().addPermanentWidget(self.cache_label)
+        CACHE_STATS.changed.connect(lambda: self.cache_label.setText(CACHE_STATS.summary()))
+
+        # The current tab is visible right away, so it is always built
+        self.activate_tab(self.tab_widget.currentIndex())
+        # Warm up after the window is on screen, not before
+        if warm_tab:
+            QTimer.singleShot(0, lambda: self.warm_tab(warm_tab))
+
+    def activate_tab(self, index):
+        tab = self.tab_widget.widget(index)
+        if isinstance(tab, LazyTab):
+            tab.materialize()
+        if index == self.tab_widget.currentIndex():
+            self.lifecycle.tab_activated(tab)
+            self.prefetch.record_open(TABS[index][1])
+            if TABS[index][1] is WebBrowserTab:
+                self.page_watch.mark_seen()
+
+    def closeEvent(self, event):
+        # Tabs that were never opened keep their snapshot from an earlier session
+        tabs = list(self.lifecycle.web_tabs())
+        if tabs:
+            tab_snapshots().save_tabs(tabs)
+        if _page_history is not None:
+            _page_history.write_pending()
+        super().closeEvent(event)
+
+    def search_all_tabs(self, text, case_sensitive, anchor):
+        # Only pages that are loaded can answer; frozen and discarded tabs are skipped
+        tabs = []
+        for index in range(self.tab_widget.count()):
+            tab = self.tab_widget.widget(index)
+            if isinstance(tab, LazyTab):
+                tab = tab.widget
+            if isinstance(tab, BrowserTab) and tab.lifecycle_state() == QWebEnginePage.LifecycleState.Active:
+                tabs.append((index, tab))
+        self.cross_tab_search = CrossTabSearch(tabs, text, case_sensitive, self)
+        self.cross_tab_search.finished.connect(lambda results: self.show_cross_tab_results(results, anchor))
+
+    def show_cross_tab_results(self, results, anchor):
+        menu = QMenu(self)
+        for index, tab, matches in sorted(results, key=lambda result: result[2], reverse=True):
+            action = menu.addAction(f"{self.tab_widget.tabText(index)}: {matches} matches")
+            action.setEnabled(matches > 0)
+            action.triggered.connect(lambda checked, index=index: self.tab_widget.setCurrentIndex(index))
+        menu.popup(anchor.mapToGlobal(anchor.rect().bottomLeft()))
+
+    def search_history(self):
+        HistorySearchDialog(self).exec()
+
+    def open_in_tab(self, tab_name, url):
+        # Pages from tabs that no longer exist open in the first web tab
+        for index, (title, tab_class) in enumerate(TABS):
+            if tab_class.__name__ == tab_name:
+                break
+        else:
+            index = next(index for index, (title, tab_class) in enumerate(TABS)
+                         if issubclass(tab_class, BrowserTab))
+        self.tab_widget.setCurrentIndex(index)
+        tab = self.tab_widget.widget(index)
+        if isinstance(tab, LazyTab):
+            tab = tab.materialize()
+        tab.open_url(url)
+
+    def clear_web_cache(self):
+        clear_web_cache()
+        self.statusBar().showMessage("Web cache cleared", 3000)
+
+    def show_page_watch_badge(self, unseen):
+        index = next(index for index, (_, tab_class) in enumerate(TABS) if tab_class is WebBrowserTab)
+        if unseen and index == self.tab_widget.currentIndex():
+            self.page_watch.mark_seen()
+            return
+        self.tab_widget.setTabText(index, TABS[index][0] + (PAGE_WATCH_BADGE if unseen else ""))
+        self.tab_widget.setTabToolTip(index, "New posts since you last looked" if unseen else "")
+
+    def show_resource_monitor(self):
+        if self.resource_monitor_dialog is None:
+            self.resource_monitor_dialog = ResourceMonitorDialog(self.resource_monitor, self)
+        self.resource_monitor_dialog.show()
+        self.resource_monitor_dialog.raise_()
+
+    def warn_over_budget(self, title, rss):
+        self.statusBar().showMessage(
+            f"{title} uses {rss / 2**20:.0f} MB, over the {self.resource_monitor.budget // 2**20} MB tab budget "
+            "(Tools > Tab resources)", 10000)
+
+    def dump_latency(self):
+        path = app_data_dir() / "calculator_latency.json"
+        CALC_LATENCY.dump(path)
+        summary = CALC_LATENCY.summary()
+        QMessageBox.information(
+            self, "Calculator latency",
+            f"{summary['count']} updates, p50 {summary['p50_ms']} ms, p95 {summary['p95_ms']} ms\n"
+            f"Histogram written to {path}",
+        )
+
+    def warm_tab(self, name):
+        # Build one tab up front so it is ready when first opened.
+        # name can be the tab title or the class name, e.g. "WebBrowserTab5".
+        for index, (title, tab_class) in enumerate(TABS):
+            if name in (title, tab_class.__name__):
+                self.activate_tab(index)
+                return True
+        print(f"Unknown tab to warm: {name}")
+        return False
 
-window = MainWindow()
-window.show()
-sys.exit(app.exec())
+# -------- Application Execution --------
+def create_application(argv, name="OKTS Dynamisk APP"):
+    # Chromium needs shared OpenGL contexts, set before the QApplication exists
+    # because QtWebEngine is only imported later
+    QApplication.setAttribute(Qt.ApplicationAttribute.AA_ShareOpenGLContexts)
+    app = QApplication(argv)
+    app.setOrganizationName("OKTS")
+    app.setApplicationName(name)
+    log_phase("QApplication created")
+    return app
+
+
+def start_main_window(app):
+    # Everything from resources to the first shown window; benchmark.py runs
+    # this too, so it measures the startup that ships
+    # Style sheet and icon are compiled into resources_rc, so the app works
+    # no matter which folder it is started from
+    import resources_rc
+    # QSplashScreen waits for the window to be exposed, which never happens on
+    # the offscreen platform used for benchmarks
+    splash = None
+    if app.platformName() != "offscreen":
+        splash = QSplashScreen(QPixmap(":/okts/OKTS.png"))
+        splash.show()
+        app.processEvents()
+        log_phase("splash shown")
+
+    style_file = QFile(":/okts/blue_mod_style.css")
+    style_file.open(QIODevice.OpenModeFlag.ReadOnly | QIODevice.OpenModeFlag.Text)
+    app.setStyleSheet(bytes(style_file.readAll()).decode("utf-8"))
+    app.setWindowIcon(QIcon(":/okts/OKTS.png"))
+    log_phase("style sheet applied")
+
+    window = MainWindow()
+    log_phase("main window built")
+    window.show()
+    if splash is not None:
+        splash.finish(window)
+    window.prefetch.start()
+    window.page_watch.start()
+    QTimer.singleShot(0, lambda: log_phase("main window visible"))
+    return window
+
+
+def main():
+    app = create_application(sys.argv)
+    window = start_main_window(app)
+    sys.exit(app.exec())
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,1950 @@
+# Resource object code (Python 3)
+# Created by: object code
+# Created by: The Resource Compiler for Qt version 6
+# WARNING! All changes made in this file will be lost!
+
+from PyQt6 import QtCore
+
+qt_resource_data = b"\
+\x00\x00\x01\xba\
+\x00\
+\x00\x08\xedx\x9c\xddU=o\xc20\x10\xdd\xf9\x15\xa7\
+\xcc\x14\x01\x85\x16\xb5\x13\xcaR\x06\x04\x82\xb1\xea`\xc5\
+\x0e\x1c\x8a\xed\xc8v\xa8*\xc4\x7f\xaf\xf3E\xf8Hi\
+ \xe9RO\xce\xf9\xdd\xf3\xbd{\xb6\xb3k\x81\x1d\x8e\
+/\x15'\xc6y\x81^;\x0dx\x92s&\xe2\x883\
+\x99/]\x08\xe5'S\xe0\x13\xcfH\x05\x01r4\x1a\
+B\x1b\xa1\xa8=\x0c\x03\x14\x0c\x88\xa0\xa0\x19\xd1Rt\
+\xc0\x95\xe1\x17\x18\x09*\x0a\x98fFw66\x0c(\
+\xc0\xac-0\x0c\x81\x12C\xc0\x97\x01\xb5\x1c\x16G(\
+\x05K,\xb7L)\xa4,\xe3\xd1\xaf@\x80\xa3\xd6(\
+V\xc0\xc9&\xdf\x1a8#B'\x5c\x14\xb7\xa8\xd1r\
+\xaf\x89\x06!ST\xc7\xc9T\xe4\xdb[\x19\xefI$\
+\x1e\xbb\xc3,\xc1\x14\x0ab\xb1oV\xc5*\x12\x19\xc1\
+\x01\x94\xd6\x13\x03\xfa\xdd\xfe\xe0|5/\x22\xde\xe7\x94\
+=Y\x9e+I#\xcf`B\xb0s8\x0a\xa9\xe2V\
+\xf7\x87\xfb\xf654\xccB\x83\x9e\xae\x92\xb44\xb6n\
+\xa2\xe89\xb6\x0dN\xd2\x91\xf8\xeb\xb9[\x96\xb9`[\
+\x19\xd8\xb6\xdf\x9e9\x0b\xd9\x85\xa0\xe3\xac\xa7\xd2,7\
+ \xd6O\xef\x97\xedN\xf2\x8a\xaf#\xc2\xba.\xf6F\
+\x7f\xea\xe2\xfd\x86L%E\x1f\xd9\xd5\xcc\xf2\xd6\xfeK\
++\x17\xe8\x07\xac\xd1\xeb\xb8d\x1c\x1f\xc6\x91}u.\
+e\x0f\xbbG\xd5?\xf6Ke\x17\xf9\xe5&W\xe1\x98\
+\x12\x11\x91\x00\xc6\xf9=\xbf\xa7\x8eS\x8e\x8a\xb5\xd4t\
+c\xee\xba\xcd>\x8d\xae{\xc3+\x17\xa3'\xaa\xe4\x02\
+\xd6T5E\x81\xd0\xfcA\xbb\xb0\xb5\xfc8\x95\x19W\
+\xdb\xa8\xe5Z\x9a\xa6\xffc\x85\x9e\xec@\x0dF\x15^\
+\xb0\xeb\xd8S\xf5\xd5\xb0\x90\x9e\xfc\x8b\x94\x9fZ\x96\xcc\
+>Z\xfb\xd67\x9ea$\x94\
+\x00\x00\x06\x1d\
+#\
+ Trackers and ad\
+s blocked in the\
+ web tabs. One d\
+omain per line, \
+subdomains\x0a# are\
+ blocked too. Ex\
+tra rules (hosts\
+ file or adblock\
+ \x22||domain^\x22 for\
+mat) can\x0a# be pu\
+t in blocklist.t\
+xt in the app da\
+ta folder.\x0a#\x0a# A\
+nalytics\x0agoogle-\
+analytics.com\x0aan\
+alytics.google.c\
+om\x0agoogletagmana\
+ger.com\x0agoogleta\
+gservices.com\x0ass\
+l.google-analyti\
+cs.com\x0astats.g.d\
+oubleclick.net\x0ah\
+otjar.com\x0ahotjar\
+.io\x0amouseflow.co\
+m\x0afullstory.com\x0a\
+clarity.ms\x0asegme\
+nt.io\x0asegment.co\
+m\x0acdn.segment.co\
+m\x0amixpanel.com\x0aa\
+mplitude.com\x0ahea\
+p.io\x0aheapanalyti\
+cs.com\x0aquantserv\
+e.com\x0ascorecardr\
+esearch.com\x0achar\
+tbeat.com\x0achartb\
+eat.net\x0anewrelic\
+.com\x0anr-data.net\
+\x0abugsnag.com\x0asen\
+try-cdn.com\x0amato\
+mo.cloud\x0astatcou\
+nter.com\x0acrazyeg\
+g.com\x0akissmetric\
+s.com\x0aoptimizely\
+.com\x0asmartlook.c\
+om\x0aluckyorange.c\
+om\x0a# Ads\x0adoublec\
+lick.net\x0agoogles\
+yndication.com\x0ag\
+oogleadservices.\
+com\x0aadservice.go\
+ogle.com\x0aadservi\
+ce.google.no\x0apag\
+ead2.googlesyndi\
+cation.com\x0aadnxs\
+.com\x0aadsrvr.org\x0a\
+criteo.com\x0acrite\
+o.net\x0ataboola.co\
+m\x0aoutbrain.com\x0ap\
+ubmatic.com\x0arubi\
+conproject.com\x0ao\
+penx.net\x0acasalem\
+edia.com\x0asmartad\
+server.com\x0aamazo\
+n-adsystem.com\x0am\
+oatads.com\x0aadfor\
+m.net\x0aadformdsp.\
+net\x0aserving-sys.\
+com\x0abidswitch.ne\
+t\x0ateads.tv\x0ayield\
+lab.net\x0a3lift.co\
+m\x0asharethrough.c\
+om\x0amedia.net\x0azem\
+anta.com\x0aquantco\
+unt.com\x0a# Social\
+ widgets and pix\
+els on third-par\
+ty sites\x0aconnect\
+.facebook.net\x0aad\
+s-twitter.com\x0ast\
+atic.ads-twitter\
+.com\x0aanalytics.t\
+witter.com\x0aads.l\
+inkedin.com\x0asnap\
+.licdn.com\x0apx.ad\
+s.linkedin.com\x0aa\
+nalytics.tiktok.\
+com\x0abat.bing.com\
+\x0act.pinterest.co\
+m\x0a# Consent and \
+tag managers tha\
+t mainly load th\
+e above\x0acookiebo\
+t.com\x0aconsentcdn\
+.cookiebot.com\x0ao\
+netrust.com\x0acdn.\
+cookielaw.org\x0ate\
+aliumiq.com\x0atags\
+.tiqcdn.com\x0a\
+\x00\x00\x08\xac\
+\x00\
+\x00-\x83x\x9c\xddZ\xdbr\xdb6\x10}\x8e\xbe\x02\
+\x89_\xe2\x8cd\x93\xb4\xa4\xda\xf4S\xd3t\xda\xce\xb4\
+3M\x9bi\x1e;\x10\x09Ilh\x82%\xa1\xdan\
+\xa7\xff\xde]\xdc\x08\xf0f\xd9\x923m\x85\xc4\xb6\x00\
+\x10X\x9c\xdd=X,\xf8\xfe\x03\xe7\xf9\x87\xac\x9c\xfc\
+5!\xf8Y\xf1*eUL\xc2\xf2\x8e\xd4<\xcfR\
+\xb2\xcai\xf2\xe9Z\xb7\xc2\x9f\x9b\x8a\xef\x8at\x96\xf0\
+\x9cC\xbf\x93\x00>\xeb\xb5n/i\x9af\xc5F>\
+~\xed\x0e8\xabh\x9a\xed\xea\x98\x5c\xd8\x06^\xd2$\
+\x13\xf7\xd07\x08\xae'\x7fO&\xef?f\xe9\x86\x09\
+)Iw\xa2j\xb3z}\x19L\xe5\xbfS\x1c\xc2\xa9\
+\x8f\xa2`\xaa\xff\xcb&\xbe\x13yV\xb0\x98\x14\xbc`\
+\xee\xd8q&\xd8M\xbc\xe5\x7f\xb0J/\xb8;\xd1\xfb\
+\xef\xe1QZ}\x83\x12\xb3B\xbc&waL\x82)\
+\xb9W\xbf\xee\x22\xf5\x0d~\x85SR\x0b^\xc2w\x03\
+\x83\xa9\x08UE\x92\x9e\xaa\xc5\xba`\xf9\xabU\x12\xd5\
+,g\x89`\xe9g\x13\x0a\x05\xf8\x81\x15\xbb\xb7\xb4\x8a\
+\xa5\x08\x9d\x99c\x22*Z\xd4%\xad`\xbe\x9e\x07\x86\
+en=\xd9oU\xd6n\xba\x03\x97\x15\xab\xeb\xdeq\
+O\xe6\xf3\xf9\xd8\x80\xd7{\xa2\xa7\x0c\x10>\x80\xa2\x02\
+1\x986uQ\xac\xa0\x0c\x9b:\x09 \xe0\x17\x85X\
+Z\xf5\xc1\xd9\x9c\x9c\x5c\xcc\xb1\x9c\xbf\xe9\xb4E\xa6\xad\
+\xd3\x02\xe3\xad\xd7\x94\x06\xc1\x9bs\xd9\xa4m\xe5\x86V\
+\x9b\xac\x98\xad\xb8\x10\xfc&\x9eYO\xd2\xbee\x1ad\
+\xbd\x01\xcf`5\x80\x8a\xe9\xe6\xa9\xda\xfaj\x04\xbd\xa3\
+\x00\x7f\xe8?\xda\x0f\xb4U=b\xcdiV\xd3U\xde\
+\xe99\x0f\xb0\x0c\xa9\xe7\xe4\x22\xc2\xa2\x06\xfarU\x83\
+\xf9$\xe2;\x98\xf8\x97\x8c\xdd\x1e\xd9%\xe6)\x16[\
+\x81JX\xce\xb18^\xb2H\xb1\x9cz\x0b[\xf3d\
+WkY\xce\xdf\x18\xa0#\x0b\xf4\xd3\xa4\x01\xfd\x07\x91\
+\xeb\xa0\xe9\x17\x97AHO\xaf\xc1$pr\x1c\xf4\xeb\
+4\x13\xcf\x0b\xc2\x18\x04\xfd\xac\xaeI\xbd\x16\xf79\xb0\
+\xacD`\xd0/C\x86\xc5{\xcel\x06\x0b\x05\xf1\x8f\
+\xbbz\xfbv\x07V]\x90\xbf&/F\xb8\xe2\x85`\
+wbF\xf3lS\xc4$\x81\xf5\xb2\x0a*o\xc0[\
+\xb6,\xdblE\xac\xcdWV\xddf\xa9\xd8\xc2\x1c\xaa\
+f\xf2\xc2\xae\x22 K\x18Z\xfe\xc4\xf9\x9d\xe9\x07\xa9\
+\xe70\xb8\xa3\x14\x8bgs\xd1\x0aKS\xb5\x80\xaa+\
+,M\xd5\x15T]bq\xd4\x12-\xb0h\xcb\xfc\x8a\
+\xdf\xac\xf8[~\xa7\xa5UN\x9aq\xa0\x8e\xf1]\xfa\
+X\xcbZ,\xb1x\xcb\x92\xe2E\xde\xb2\xe6\x0c\x8b\xb7\
+\xac9\xc5\xe2,KZ\xdf\xf2\xf4\x19l\xabAI\xed\
+\xfaSW\xdb^\x1cp$\x8f\x1e\xddr\x1dix\xe1\
+\xd3\xf0L\xf6\xbfh\x93}\xce\xd6`\xd5s\xebw\xff\
+^\x8b\xdc\xdb\x04]\xd3%\x83t\xdfQGJ+\x18\
+\x91\xde?<\xd3s\xc4JVoqZ\xf1r\x96\xf2\
+[\xa3?R\xefV\x09/D\xc5\xf3\x19\xaf2\xd8\xba\
+c\xa3\xbd\xebN\x87\x92\xd7\x19J\x0d!\x12/I\x85\
+\x9c\xa5;i\xb6\x0a\x17\xa8j/rF\x130d\x16\
+\xb4\xc3j\xd9\xa8\xd7\xed#\xe4\xf5\xf0\x9c\x09\xf6/\xf2\
+\xdb\xae\x16\x84\x92\x1a\xa4\xcc\x19\xc1`\x99\xe8(\xc4<\
+\x07\x02\xce\xa4\x80^\xe8\x8e\xcf\xd6\xf4\x86\x11UIh\
+M\xc4\x96\x91F\xa1\xadQT\xb0\xd23\xd0\x84\xb4`\
+\x05Dg\xb4\xaa\xb8\xb1\x00\x92\xdd\xd0\x0d\xc8\xbc\xab\xf2\
+\xd7\xf196\xff*\x9b\xcf\xcab\xa3\x95\xf2\x0d\xa8\xbd\
+\xc4\xa7\xcd\xe6\xfcY\x9c\xf8\xfd\x07\xd8\x84pS\xf6b\
+\x82\xcf3\xf5\xcf\x09XQ\x8e\xa1\xf2\x16l\xedO\xb0\
+*\x9a\x93\xc1\x93\xdbI$?\x9d\xb3\xdb\xd3\x5c\xe4\x0c\
+\xa4\x93\xe1\xaf\xc3\xefQ\x0f#\xcc/\xb1hF f\
+cV\x86M\x9a\x00W\x1a3\x09\xd5V\x1c.M\xd4\
+\xd9\xac0\xde\xd2\x22\x05\xabmVj,\xe3\xb1K\x09\
+\xd5R\x82A\x98%\xdb)\xa0[\xc8\xaf\xd7f!\xc4\
+\x0d3\x9c\xd5\xb4\xf7\x9d\xa8g%@\x073y \xed\
+j\xadwW[A\xb9\x1a\x1b\xffy`h\x9fZ[\
+\xacD\x86\xd9\xcce\xb2>BT*\xef\xe0\x02=\xff\
+/\xb8\xf4\xc2\x82\xdc\xdbm\x7f\x00\x14\xc5\x95\x92\xeb\x1c\
+\x5c\xa6\xc4\xed#I\xbd\xdde2\x0c\x9d\x9b\xc3\xb1\xc2\
+7\x80Y\xb3\xee\xc7\xf0v\x0b\xa7\xc0^\xa3.\x91\xa2\
+\x87\x84D\xed\xb6:\xf4zp\x93\xa4i\x1e\x86\xc0L\
+d\xc9\x11]\xfei\xec\xd5\xe7\x00\x86\xbe\x1c\xea\x22\xc1\
+\xf5\xb0\xd5\x1a\x12\xeeg\xb7C\x17\xfa\xe0\x16\xf2hn\
+\x8b\x82\xa7q[w%\x9f\xcd\x83\x1f\x9d\x8fsL~\
+\xfe\x00\xb5\xa9\x08\xe6\x00n\xfb\x9f\xe2\x02\xcf?\x1e\x94\
+]\xa9Y\xcb\x80\xe23F\x13\x04\xee\x83\xda\xb1H\xad\
+\x9f\xd5\xfa%\xb4\x9c6\xea\xb7\x0d\xa3\x99Xq0\xa3\
+p\x12\xcd\xb1\xe8DHN\xb3\xe2q\x8f|\xcb(\xc0\
+\x82''\x10N\x1d\x89\xf6\xce^8\xd9O7\xeb\xa9\
+\xf3\x93\xe4d\x19b\xf1\x88d\x11`i\xaa\x96\xc0\x98\
+2\xbd9\xb59R\x99\x15X\xf8\x89o\x0d6\xd6\x0c\
+\x9dl\xbbN\xb1L\xb0\xe8\xf3\xd7\x96%\x9f0\xd4w\
+\x12\x8c6\xb9\x18bQ\xfd\xde\xf1\xe4\x93\xce\xd8\xc5\x22\
+\x139\xd3`\xf4%\x8e\xa4\xe9\xe2%\x04&\x85\xec\xe1\
+FU\x90\x15\x13\xb7\x8c\x15\x04\xf3\x9f5\xc9\x0ay\xcc\
+\x11\x9c\xe7\x80keN9\x87C\xac2\x9f\xfe\xa9[\
+j\xb7\xc1Su9\xed\xae/\xc9y\xcdf+\x99\xcb\
+\x00+u\x9b\xd69\xa7B7\xed\x8b@\xf8\xdfF@\
+\xe7w\x86q\x18\xb8\xf6i\xf9\xd3\xe0\xf0:586\
+\x81\x9f=t\xb3\xa6df\x7f4y{\xf0\xf5\x8fY\
+\x01\x9c\x87\x9e[\xd2\x8a\x0a\xbe\xff\xad\xd4C\xb0J\xd7\
+]z\xb0\x86\x0b,\x9e\xef\xea\xfb\x8c\x06i\xe9\xccG\
+\xf0\xddy\x82\xe5P\x1f\x1b\x84\xc9\xea\xf2Hhy\xbb\
+\xa2\x131)\xf958^\xcct\x0cb;\x1c\x1c\xbc\
+\xbcu\xa2I\x9b\x92:\x88\xd5<\xe7\xc0\xf4\xcb\xd9y\
+\x06\xfb{}\xae&q\x120\xea\x8a\xa8m\xbc6\x90\
+\xdc?k\xf9o\xb2f}\xff\xa6j\xc3\xa0U]\xa9\
+\xb5-\x8c\x17\xffX\xf1\x0d\xba=ha0\x13\x04\x1d\
+\xee\xfbs\xd4f\xf0>rn\x8d\x0et\xb4\xdd\x15\x9f\
+\x86\xa3\x027\xc5\xaf\xa3\xa1\xe8\xac9\xb8\xd8\xac\xcb\x99\
+\x95\xfd\x03]\xc9\x81\x05]\x11\xff\xben%\x03\xd2a\
+\xef\xf6\xafaM\x96Og\x19U\xf43 \xa5\xb9\xea\
+s\x9e\xeef\x1aCk:\xbe\x8e\x1am\x98z\xad\x8e\
+nC\x7f:]\xdf\x9d6\xa6\xe9k5r\x901\x0c\
+_\xd2\x82\x91\xc1\xebU\x8b\x84\x0a\xa7{\x90\x8dsZ\
+\x9bX\xce\x9f-\x90\xae\x89\x1e\x88]\x88\xb9d%\xa8\
+\x8e-\xad\x01G\xb1E\xa7\x15\x9c \xdb\xe5\xb4\x04\xbd\
+\x8a-\xe1\xcam\xe5(v\x1f\x1eK\xdavDZg\
+U-\xe2\x97\xee\xb5\xaeg\xf5\x81\xa6\x8d\xc3e\x9b\xb4\
+\xa5\x93\x99\x8bQ\xe1^\x0e\xdc6wm\xb2ew\xce\
+U\x91^\x8do\x04\x07\xd2P\xd8\x22\x98\xe6\xd6\xff\xb4\
+\xbb\x88\xf6\xcb\x11c\x00<\xac?gI\xc6\x82\x83Q\
+\xe8\xbcX\xc7\x5cW+8\x1aZ\xd2o\x1f\xf4{\x08\
+\xce\xdb\xb5\xad\xa7\x0a\x7fd\xe8\x9d7.lM\xd4\xa9\
+q\xb7lD\xea'\x98\x8a\xeb\xab\xbf\x18\x22\x0a8\xbe\
+a(\x91\xe0\xd1B\x06v\x03\x1dv\x85\xee2b\x8f\
+\xfb\x10\x9dG\x1c=\xd6lP\xb3\xb9\xf0q\x81\x07w\
+\x82\xdfq \x9ao:o\xbb$w\x92\xfe\xa7$\xb9\
+W\x7f\xd8\x96\xb5iY\xb7[,%\x9f\x05\xad\x17X\
+0\x81\xb6\xb0\xa1S\xa7\xed\xc2@ [N[\xc7\xb8\
+f9\xcf\x05\xaa\xde\x02\xaf\x8c\x09\x9a\xa8\xe4J\xdf\xfa\
+\xdb\x1b\xab!no\xae\xd2\x86^a\xf3\x22\xfc\xf0R\
+\x05\xf7\x8e\xc76/!,\xd9M\xeb\x1e\x91\xc1\x09\x1f\
+\x0f\xb2\xa4\xadE/\xddj\xbb\xbf4\xfd\xa7\xa4\xef.\
+\xb2=\x9c7\xde\xef\xb9t\xb5\x8d\xe3jCy\x22\xab\
+\xc5\xc1\x8fM$}\x1dbi\xe2/\xf0\xc8w\xf2\xb3\
+\xff \x18\xc6\xbd\xbb\xc4b\xf3Q\x98\xa6}w\x81E\
+Y\x0clB\x8d\xa6`?V\xd7\x8d\xafx\xf1\x0a\x9e\
+\xa0\x82\x01XLm9%/w%\xc9j\xc2K\xa8\
+\x01\xea\xea\x01/\x96\x07\xe51\xfcb\xf9\x0e\xcas\x22\
+h\x01T\xcb\xf4\x01T`\xec;\x86\xc4Oa\xee\xe2\
+\xa74\xd3\xbe\xb8\xc6\x85\xc9\xa3\xc06[\x0b\x15\xf7C\
+\xd0\xd9\xc6\x0f\xc1\xabMP\xb1\xf7\xab\x09\xaekk\xf8\
+\xec\x11d\xd1\xee\xe0\xf8\xbe\xeekrw\x17m_\x0d\
+[[\xcc\xe0\x0b\x84=c7\xb4=}\xa0]g\x0e\
+\x9c\xfb\xe4\x81QF\xdb\xbd-\xd7\xb9\xbb6\x87'\xd9\
+m\xc5\xef~\xb5O4\x07\xa9~\x01\xc7\xc5\xdfG\xf8\
+q\xd1\x1f+x\x9f\xd8=\xf7\xf7=\x96&\xeb\x95\xa9\
+u\xdc\x14gm\x82g\xfc\xa6c\xfd\xf1]\xd0\x0f\xac\
+\xf6\xdd:M\x8e\xa8\x0f\xd0\xbe\xb7\x81\x1ean\xfe\xae\
+\xacp\xdc\x0f\xc6\x7f\x00\x92\xcd\x88\xde\
+\x00\x00eA\
+\x89\
+PNG\x0d\x0a\x1a\x0a\x00\x00\x00\x0dIHDR\x00\
+\x00\x00\x88\x00\x00\x00\xb0\x08\x06\x00\x00\x00\xd4\x93&\x92\
+\x00\x00\x00\x01sRGB\x00\xae\xce\x1c\xe9\x00\x00\x00\
+\x04gAMA\x00\x00\xb1\x8f\x0b\xfca\x05\x00\x00\x00\
+\x09pHYs\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7o\
+\xa8d\x00\x00d\xd6IDATx^\xed\x9d\x05\x98\
+\x14G\xd3\xc7;\x10<\xb8[\x90\xe0\xee\xee\xee\xee\xee\
+\xee\x124\xc1!\xb8\xbb[p\x0b\x10\xdc\xdd\xdd\xdd\xdd\
+C\x80 \xfb\xf5\xafv\xfanY\xe6\x8e=\xfc\xcb\x9b\
+\xff\xf3\xf4\xddN\xef\xecLOwMwYW}\xe7\
+p8\xd4\x7f\xf8\x0f>\xc1\x9f\xf5\xff?\xfc\x07[\xfc\
+G \xff\xc1W\xfcG \xff\xc1W|U\x1e\xa4y\
+\xd9\xc2\xcb\xef\x5c\xbf\x5c\xe8;\xff\xfe\xad\x1a\xa5\xfey\
+\xfeL\xfd\xfd\xe8\xc9\xbd`\xa1C\xfeU\xa9a\xab^\
+\xb7o\x5c\x8f\xb2n\xc9\x9cZ\x8e7VC\xbfS\xaa\
+J\x93\xb6\xdd\x8bU\xa95I\x8e5\x86tn=\xf0\
+\xda\x85\xf3\xb1\x9f>}\x12\xfc\xe1\xdd{a\xadjA\
+\xed6\x1d{\xe7.Qv\x9eu\xa8\xf4\xf3~w\xeb\
+\xda\x95\xe8\xea\x8dC_\xc9\x89\x88\xd1\x7f\xbc\xfc\xddw\
+\xdf9.\x9d=\x15\xff\x9f\xe7\xcf\x03[\xd5*Z\xec\
+8g\x83\x04\x0d\xf6\xf4\xe1\xbd\xbb\xe1\x9e?}\x1a\xcc\
+\xaaV\xc1C\x87~\x10,x\x88\xc7\xd6\xa1\xfac\xc6\
+\xa4Z\xb3\xc7\x0coj\x1d\x0a\x22F\x8dz\xed\xfb\xef\
+\x03\xbc,X\xbe\xca\x8c\x5c\xc5J/\xb0\xaaU\xa5\xac\
+\xc9\x8e\xbey\xfd&\xf8\xf3\xe7\xcf\xdf\x04\x0e\x1c\xd8_\
+\x88P\xa1\xaf4\xeb1\xa0u\xb7zUf\xff\xf3\xfa\
+E\x907\xafU\xc4\x10\xa1\xc3Xg;\xfb#A\x8a\
+\xb43{\x8c\x9bQ\xc5\xaa\xfa\xa2\xf8\xaa\x04R\xbfH\
+\xce\x0d\x03~_\x9c#x\x88\x90V\x8dRg\x8e\x1e\
+R\xcb~\x9f\xa2Re\xc9\xa1N\x1d>\xd8\xf5\xc6\xe5\
+\x8b1+5jQ\xe3\xf4\x91\x83\xf2\xfd\x0f!C\xa9\
+#\xbbw\xf4]5oF\x8d`!C\x04\x89\x10%\
+\xe6\xb6[\xd7.&\x1e2w\xc5\x8f\xbdZ\xd4U\x9d\
+\x87NP\xc1\xac\xeb\xad\x9a\xff\xbb\xba\x7f\xfbv\xd7z\
+\xed\xbbt\x93\x0a\x8d\xc3\xbb\xb7gj[\xb5\xe4\xb6d\
+i3\xc9\xf1\xb5K\xe7U\xb5\xe6\xed+\x15(Sq\
+V\xde8\xe1^g\xc9_Tf\xd5\xab\xe7\xcf\xa8\xdc\
+%\xcb7\xabP\xaf\xe9\xf0\xa2\xc9\x7f\xbc\x9b ij\
+!\xbc\xfbwn\xa9H\xd1c\xce\xea5\xe1\xf7J\x1c\
+\x83A\x1dZ\x0eN\x9c:m\x8bL\xf9\x0a\xcb\xf1\xf6\
+\xd5\xcb\xd5\xc53\xa7T\xc4(\xd1\xd4\xe6\x15\x7f,;\
+}x_\xe6 \xc1\x82\xfb\xcb_\xb6\xca\xc0\x0d\xcb\x16\
+t\x9f\xb9\xf9\xa0jP4\x87\x1a\xb3t\xa3\xaa\x949\
+\xc9\xe3\xfa\x9dzU\xdb\xbfu\xe3\xe2xIS\xc8\xef\
+\x0bW\xac.\xff\x01\xfd1\xaeO\xd7\xc5\xfdg.*\
+iU}Q|\xb3KL\x80\x80\x01\xd5\xb2\x99Sj\
+l[\xb7\xb2\x80\xff\xef\xbf\xb7j\x9d8\x7f\xf2x\xa2\
+\x10a\xc3E\x1c\xbfrG\x88\x8bgO&x\xf5\xe2\
+e\x90\xc8\xd1c\xa8 A\x82\x09q@p\x94 A\
+\x82Z\xbf\xf0F\xe2T\xe9v\x87\x08\x19\xfaq\xbf\xe9\
+\x0bU\xff\x19\x8bT\xcb\x9e\x83\xd4\xa1\x1d[\xb3\xf0]\
+\x84(\xd1\xfcu\x199YQJT\xab\xab\xd4\x9b7\
+\xfe.\x9e9\x99\x00\xe2\xe0\x5cJfM\x04\xe9s\xe4\
+Y+\x17sA\xe0\xa0\xc1\xbc\xee\xcbgf\x81\xd0\xe1\
+#\xa8\xab\x97.\xc6L\x9b3\x7f\xe8\xf6C\xc6\x85<\
+\xbe\x7fOZ\xebt/\xfc\xf3\xe2e\xd0\x91=:\xf7\
+\x0c\x18\xc8k\xe2\xfa\xa6\xf0\xcd\x12H\xa6<\x05\xd5\xcc\
+m\x07c.\xdc{*R\xec\x04\x89\xadZ\xa5x\xcb\
+\x12\xa6L]\xb4z\xf3v\xea\x87\xe0!T\x99\x1a\xf5\
+c\x95k\xd0,\xbc\xf5\xf5{\xa1\x89\xedU\x82\xe4\xa9\
+\x97\x1d\xdd\xb7K\x8e\x93\xa4\xcd\xa0\xb6\xacXR\xb2[\
+\xa3\x9a\x93\xfd\xf9s\xe9\x8e\xef\xbeS\x7f\xce\xff\xbdR\
+\xdf\xd6\x8dF%O\x9f\xd9\xaaTj\xd3\xf2\xc5\xaf\xb3\
+\x15,\xf6\x87u\xe8+\x12\xa7N\xa7\xf2\x96(\x93$\
+\x7f\xa9\x0a*v\xbc\x84*Q\xaa4E\xab4ic\
+}\xeb\xc4\x8c\xad\x07\xbf\x9f\xb8jk\x92\x06\x9d{Z\
+5\xdf\x16\xbe:\x81\x9c;~D\xa6QS.\xe9\xa9\
+\xf9\xc1\xdd;\xf2\xf9\xe6\xe5\x8b\xea\xc6\xa5\x0b\xce\xcfW\
+/K\xf9\xeb\xd1C\x95\xa3p\x09\x15+~\x22u\xf6\
+\xd8a\x951O\x01\x95*S69\xe7\xaf\xc7\x0f\xdf\
+\xba\x1e\xe7\xdbA\xff~\xf1\xc6\xe5\x8b\xe5\xb3\xe61\xd4\
+\xe8\xa5\x1b\x22\xb3\x8c\x0d\x98\xb9D\xea\x80\xe6[\xd4/\
+C\xc6\xa5k\xd5{p\xce\xb2\xf5\x9aH\xdd\xed\xebW\
+U\xa0\xc0A\xb7\x85\x0a\x1b\xee\xaeT\xb8\xe0\x9a\xd5N\
+\x0a\x9f\xef\xde\xb8\xa6\x1e\xdc\xb9-m\x0d\x1b1\x92\xba\
+{\xeb\x86\xca^\xa8\xb8\x8a\x93(\xa9\x9c\xf3\xf7\xd3\xbf\
+\xe4\xff\x95\xb3\xa7\xe59\xcf\x9f8\xea\xf5\x8c\xe6:\x14\
+\xfa\xe3k\xe2\xab\xf2 m\xab\x94Z\xb8q\xb9\xdf\xd7\
+V\xbd\xdek\x02\xf1\x9eU\x0c\x0el\xdf\xa4\x22D\x8e\
+\xbe9d\xe80\xf7\xad*U\xa6N\xa3Q\xe9s\xe6\
+]c\x1d\x0a\x9e\xfd\xfd4X\x8d\xbc\xe9\xee\xcf\xd9v\
+,\xa0U\xe5\x11\xe6M\x18\xa9^\xfe\xf3O\xabJ\x8d\
+Z\x0e\xb6\xaa\x04\x1b\x97.*\xb9|\xf6\xb4j\xd6\xa1\
+\xbat\xeeL\xdc\xe0!C$\xfe1N|\xab\xc6\x1b\
+\xab\xe6\xcf\xd4\xd7xi\x1dy\x86\x12U\xebL\xe84\
+l\xbc^\xf3\xbe<\xbe*\x81\xec\xda\xb0&o\x93R\
+\xf9V[\x87\x1e\xa3U\x9f!\xaab\x83\xe6\xd6\x917\
+\xa6\x0d\xe9\xab4oR\xa7D\xd5\xda\x13\xad*\xf5\xe6\
+\xf5k\xff\xfam\xfd\x81\xcf\x81\x02\x07~\x1e `\xa0\
+\x17\x7f=~\x14\xf2\xd7zUf\x1c\xdc\xb9\xa5\x08\x8c\
+\xa4r]Z|\xc0\x1d={\xfc\xa3Gv\xe2\x8am\
+i\xf5,p\xe4\xd5\xabW\xdf\xbfx\xfe,\x08\xdf\x05\
+\xfb!\xf8\x93\xef\xfc\xf9{#'j\xb0\x5c\x95\xaaU\
+\xbfF\xd24\x19\xac\x1ao\xe4\xfc1\x84\xfa\xeb\xc9\x13\
+\xeb\xc83L^\xb3#c\x924\x19vZ\x87_\x14\
+_\x95@\x109K\xa7\x89w\xfa\xca\xf9\xb3q\x02\x04\
+\x0c\xa0\x92\xa5sJ\x16\xd7\xf5\x14}\xe3\x8a\xfd\xf2\x00\
+Z\xf5\x1a\xa4*6ji\x1dy\xe3\xe8\xde]\xaae\
+\x85\xc2\x8f\xc2F\x88\xf4H\x13\x86\xa3a\xe7^\xad`\
+\x0c\xb7\xaf[\xd1>h\xb0\x1f4\xe3\x1bdm\xbeR\
+\xe5\xe6N\x1c\xd0c\x1cL\xe4\xd5sg\xd4\xfa\xcb\x8f\
+\x95\x7f\x171\xdb'\x94\xcd\x90H\x05\xd4\x8c\xf33\xbd\
+4\xe4.V\xae\xcf\xe5\x0bg\xe2\xde\xb9v\xa5\x0c\xc7\
+y\xcbT\xea\x14T\x13\xc9\xc2I\xa3Z\xfb\xf3\xe7\xff\
+\xbb\xdb\xd7oDX}\xe6f\xe0\xef\x03\x04\xb0~\xed\
+\x8d\xb4\xa1\xbd\xa4k[\xc4I\x9cT\xe9\x19P=\x7f\
+\xf6\xb7:\xb6o\x0f3\xe5\xb1\xb9;\x8f&\xb1\xbe\xfe\
+\xf2\x80@\xbef\x99:\xb4_\xdb4\xa1\x94\x83rd\
+\xcfN]\xe5p\xac\x98;C\x8eM\xe9R\xbf\xaac\
+P\x87\x16R\xdaU/\xe3\x18\xf7[W9\xcf\x1d\xfa\
+\xadv\xd4\xca\x97Q>kQ\xd9\xd1\xa6r\xc9\x85u\
+\x0be\xdf\xb8w\xebF\xc7\x93\xc7\x8f\x1cE\x93\xc4\xbc\
+\xd0\xb4t\x81\x15|\x07j\xe7w\x9e\xeb\x09\x9a\x94\xcc\
+\xe3x\xf1\xfc\xb9\x83k\xd5\xcc\x93aG\xa9\xb4\x09N\
+\xdc\xb8r\xc9\xa1y\x19\x07\xd7\xe4>|\xd6\xb3\x95\xa3\
+a\x89\xdc\xd6\xaf\xde\x05\xcf\xf3[\xab\x86^\xcf\xd3\xa8\
+x\xae\xb7\x9e\xf5\xfa\xe5\x8br\xde\xd4\xc1\xbf\xc9\xf1\xcc\
+Q\x83[\xe8C\xdb\xbe\xfb\x12\xc5\xb6\xf2K\x16\xcd\x90\
+\x86\xcb\x141\xd0s:\xa3Y\xe9\x02\xba\xca\xe1\xb8u\
+\xfd\xaa#K\xe4 \xd2\x81-\xcb\x15vlX\xb6H\
+\xea\x01\x03\xe4\x13\x81\x80\x16e\x0b8\x1e?\xb8/\xd7\
+\x80\x10(\x8f\x1f=\x94\xefv\xac])\x03\xfa\xf0\xde\
+]96\xc4\xe4\x09z4\xad\xed\xd0\x0c\xa3\xe3\xd9\xb3\
+\xbf\x1d\x9b\xfe\x5c\xe2\xd8\xbaz\xb9\xe3\xcd\x9b7\x8eG\
+\xf7\xef\xbdu\x9f\xdd\x1b\xd7:\xc6\xf6\xe9b\xfd\xea]\
+\xf0\x9c\xaf^\xbe\xb4\x8e\x1c\x8ea\xbf\xb6u\xf4nY\
+\xdf\xd1\xb5Q\x0dG\xb1d1\xa4\x0e\x22\xcb\xfbSX\
+\x07\xfd\xa2\xdb\x1aVW\xd9\xf6\xdd\x97(\xb6\x95_\xba\
+t\xaeSi\xa6y\x83\xcc,R6]\x02\x87&\x1e\
+\xc7\xd3\xbf\x9e8\xc6\xf7\xed&o\x16e\xf5\x82\xd9\xbe\
+\x0e\x00o\x1eD\xf0>0\x98-\xca\x16\xb2\x8e\xbc\xf1\
+\xd7\x93\xc7\x8e{\xb7nZG\xde\xe0\x9e{6\xad\xb3\
+\x8e|\xc6\x98\xde\xbf\x0a\x91\xd8\x81Y\x8cg4\xcfB\
+\x19\xd5\xbd\xa3|G\x9b{6\xab#\x9f\xcd\xec\xd1\xbe\
+F\xb99\xfa\xd0\xb6\xcf\xbeT\xf9\xaa<\x88\xc1\xc1\x1d\
+[\xb2\xd6-\x94m3\x9f3\xe5.\xa0\x86\xce_\xa1\
+\xf44\xac2\xe4\xce/b\xe2\xe8\x1e\x9d\xd4\xf9S\xc7\
+\xe5\x5cD\xd9xIR\xa8\x96\xbd\x07\xabC\xbb\xb6\xa9\
+\xde\xcd\xeb\xaaZ?\xff\xaa\xd05\x00\xf8\x90N5\xcb\
+\xaa\x88\xd1c\xc8\xb1O\xd0\xcb\x85\x8a\x9f<\x95\xea8\
+x\xacU\xa3\xd4\x94\xc1}\xd4\xee\x8dkT\x88\xd0a\
+\xd5\x9b\x97\xafT\xd7q\xd3\x15\xbc\x0b\xf8c\xc6$5\
+sx\x7f\x152l89\xf6\x09\x97\xce\x9dVK\x0e\
+^P\x81\x83\x04U\xb3F\x0dV\x7f\xfc>Y\xf5\x9b\
+\xba@E\xff)\xae\xd2\x04\xa2r\xc5\x08%\xcf\x04\x1e\
+\xde\xbb\xa3j\xb4\xea\xa82\xe7-\xa4\xf4L\x22:\x9e\
+\xec\xfa\xbb\xe2\xc9b\xa8\x07\xf7\xee\xa9\x11\x0bW\xe7s\
+\x97\xc0\xbe8\xdc)\xe6k\x95\xb2\xe9\x13\x1ds\x9dE\
+\xd6.\x9a\xeb\x18\xdc\xa9\x95\xfeJ\xbf\xedz\xc908\
+}\xe4\xa0,=\xa0C\xcdrr~\xc6\x08\x01\x1cW\
+\xcf\x9f\x95:W>\xc47\xf0\x96\xf3\xb6\x1b,\x9d9\
+\xf9\xad\xa5K\x13\x9f\xe3\x97\xfaU\xac#\x87c\xe7\xfa\
+\xd5\x8e\x09\xfd\xba[G\xf6\xd0\x22\xb0\xa3~\xe1l\xf2\
+y\xff\xf6\xcd\xd2\xb6\xc2\x89\xa39\x86w\xf9Y\xea\x98\
+\xb5X:\x0d\xcc\xd2\x07\xaa\xe7N\xeb\xb8}\xe3\x9a\xd7\
+\xecQ4q\x8c\x8bz\x09\x93\x17\xf8k\x96oF\x93\
+Z\xaaV\x831\xd6G5\xfe\xb7\xae*u\xd6\x9c\xea\
+\xc0\x0e\x99TT\xf0P\xa1\x95\xee,\xf9\xec\x0a= \
+\xaa~\x87n\xf2 \x9a\x99\x93:$\x92\x10!C\xaa\
+'\x0f\x1f\xc8\xb1O\xb8w\xfb\xa6\x0a\x1f)\x8a|~\
+\xf6\xf7S\xb5|\xd6\x14U\xbb\xed/r\x0c\x90\xa8~\
+\xf8!\x84:u\xf8\x80\x1cG\x8a\xf6\xa3\xbay\xed\x8a\
+|\xf6\x09\xc7\x0f\xecQ\x89R\xa5\x93\xcf\xd3\xb5\xc8\xcd\
+\xac\x86\xf2\x8dv\x02$\x1eL\x08\x06\xc6\x06\xc5\xfd_\
+\xfc\xfd\xb7\xfaA\x1f\xcf\x18\xd1_\xea\x8aU\xab=\x11\
+\x03\xa2\x1c|E|3\x04R\xa4B\xb5i\x01\x03\x07\
+\xfd\x9b\xcf\xdb\xd7\xadT\xeb\xfe\x98\xaf\xee\xdd\xb8.\x9d\
+\x07.\x9d9)\xff\x11\x1d\xf5\x9b'\x9f\xc3E\x8c\xac\
+*7i\xad\x8aW\xa9#\x0a\xa8\x7f^\xbc\x90\xfa\xd4\
+Ys+\xfd\x06\xcbg\x9fp\xfb\xfa5\x15>\xb2\x93\
+@\x96\xcf\x9e\xa6J\xd7j\xa4\xdeR\xb5k\x94\xaf\xdf\
+T-\x99\xeeT\xa9D\x8c\x16]\xdd\xbe\xea;\x81\x1c\
+\xdc\xbeE\xa5\xca\x9c]\xb4\xa6Z\xb4Vu\xdbwE\
+\x0f\xa3\xc2\xeav\x82\xd7\xaf^\xc9\x7f\x83\xcbgO\xcb\
+\xff\xa3{v\xaaP\xe1\xc2\xab\xe1]\xda\xc9\xd2\xa2\xdb\
+\xf1\xa6X\x95\x9a\x93\xe5\xcb\xaf\x8co\x86@\xf4\xdb\xf3\
+(\x7f\x99\x0a\xb3\xadC\xe1Ani\x029\xbck\xbb\
+\xcc\x1e\xc7\x0f\xec\x95z\x0ca\x06Qb\xc4Rw\xf5\
+9e\xea4R\x8f\x1f>T[V8M$\xcc>\
+\xfb\xb7n\x94\xcf>\xe1\x9e\x1e\xc4p\xd6\x0c\xb2~\xc9\
+\x02\x95\xa3\x88S\xa1\x0b\xbf\xc3\xbdA\x8c\xb8\x09\xd4\xf9\
+\x13G\xe43<\xc5\x13\xcd\xff\xf8\x86\x03;7+\xec\
+6+\xe6\xccP\x89S\xa7\xd7\xbf\x8f\xafn^\xb9\xa4\
+\xa2\xeav\x1a\x04\x0e,\xba5\xc1>\xab\x8d\x10\xf3\xde\
+-\x1bES\x0b\xd2\xe7\xcc\xbf*B\x94hW\xe5\xe0\
++\xe3\x9b!\x10P\xa6\xa6\xf72cpPw\x9e\x96\
+d\xd4\xb1}\xbb\xad\x1aoD\xf91\xa6\xd2\x92\x80\xd8\
+7P0iI@\xea\xe3'K)\xd3\xbdo\xe0-\
+\x8f\x10%\xaa\xbas\xf3\xba\x0a\x13>\xbc\xccL\xd4M\
+\x1d\xd6W-\x9c2F\xec) F\xbc\x84^o\xba\
+o\x80\x885\xaf$\xcb\xe1\xc6\xe5\x8bT\xbe\xd2\x15\xa5\
+\x9e\xebD\xd6\xed\x04\xf8v\x04\x08\x14H>\x83C\xbb\
+\xb7\xcb\xff\x83\xd6RjP\xb2z\x9d\x09\xd6\xc7\xaf\x8e\
+o\x8a@\x12\xa5J\xbb'^\xd2T\xfb\xadC\xc1\x81\
+\x9d[\x10\xb5\xb4t\xb1Z\xcd\x1a3T\xa4\x89\xa7Z\
+\x1a\x00t\xfc\xb5\x8b\xe7\xe5s\xce\x22\xa5\xd4\xb65\xcb\
+e\x1ag\xa9\x08\x11:\xb4\xaf|\xc8\xdd[\xd7U\xe8\
+p\x11\xd4\x81m\x9b\xf4\xb2\x90C\xeav\xad_\xad\x7f\
+\xffZ\xf34\xfa\xad\xb6\xde\xee\xf8ISz\xf1!\xa1\
+\xc2\x86\x17c\xa1\x1d0\x12\xc6O\x96Z\x0ctG\xf7\
+\xee\x14\xc3\x1c\xb8\xa1\x09\x98\x99\x0e\xb0\x04>}\xf2X\
+\x9e\x83rb\xffn\xf5\xea\xe5K\x91\xbc\x0c\xc2\x84\x8f\
+p;k\x81\xa2K\xad\xc3\xaf\x8eo\x8a@@\xd9\xda\
+o\xcf\x22\xc7t\xe7a\xdd\xe5M\x84\xcf\xc0\xa2\x0aS\
+\x0a\xa2\xc6\x8c-\x03\x00\x18\x90'\x8f\x1e\xa9\xfdz\xc0\
+A\xaaL9|\xe5C^\xfd\xf3R\x08\x89\xc1\xd1\x84\
+)u\x07wn\x95\xff\xc08(\xfd\xa8\xc5\xd3Kg\
+\x9d\x16\xd5HQ\xa3\xfb\xc8\xa8r\xaf\x94\x19\xb3\xaa\xcd\
++\x97\xea\xd9,\x990\xb5\xe0\xde\xed[\x9a\xb0\xbcE\
+c\x98h\x9ei\xd1\xe41\xa2N?qh\x9f\xfe\xff\
+\xcc\xfaV\xa9B\x9a\x17\xd3\xb3\x99\xdf\xacy\x9f\x11\xdf\
+\x1c\x81\xe4/[\xe9\xf7 \xc1\xbc\xdd\xf9\x9e?\x7f\xae\
+J\xa5\x89'\xce?M\xbb\xf5\xa7\x03\xado\x94\x0a\x19\
+&\xac\xba\x7f\xeb\xa6|fY\x89\x18U<\xb8\xe4\x18\
+\x8f4\xdf\xf8\x90\xef\xfc;\x1f\x1d\x1e\xc3\xf8\x9b0\x0b\
+\x18\x98%\x86\x81\xbe\xa1\xf9\x08\xf3\xf9\x96\x0f\x04r\x00\
+\x02\xc9\x9cM\xee\x9f\xbd\x90S\xcf\x01^\xbetJ0\
+\x00i\x06\x87\xa6\x925\xeb\x8b\xfe\xe3\xfa\xe5K\xaaV\
+\xde\x8c\xd6\xb7N\x94\xa8\xf6\xed,/\xe0\x9bP\x94\xb9\
+b\xfb\xda\x15\x05\xfb\xb5n8/X\xc8P\xde\xdc\xa8\
+\x1b\xf003\xcc\x1e\x0a\xaf@\x81\x9d\xdeX\xbc\x91\x00\
+\x86\x92\xe7z\xf1\xe2\xf9[L\xa1+8\x97\xf3\xcc\x7f\
+\xf0\xb7\x96\x98\x1c\x968\xcd\x9b\xee~\x1d\x06[\x8b\x9e\
+\xea\xfb\xef\xdf5\xc2!m\xe1[\xc250\xea\x99s\
+^h\xbe#\x90\xd5\x86\xd7Z\xa21m\xb4\xc3\x9d\x1b\
+7_\x0c\x9a\xb58\xc7\xd7\xb2\xdc\xda\x82\x0e\xf8\x96J\
+\xdd\x02Y7\xdb\xa9\xba\xff\x17p|\xff\x1eG\xc7\xda\
+\x15\x7f\xd7\x1fm\xfb\xe6k\x94on\x06\x19\xd8\xbe\xc5\
+\x90\xd7\xaf^6\x8f\x1e'\x9eU\xf3\xbf\x83\xe3ZR\
+\xd3Lq\xdb*\xcd\xda\x0c\xb0\xaa\xbe:\xbe9\x02\xd1\
+R\xc8\xf7\x1dj\x95\x9f\x131J\xb4R\x09\x92\xa7\xb2\
+j\xff\xfd@D\x8f\x9f,\xd5\xafu~\xfe\xa5\x87U\
+\xf5m\xc0u:\xf9V\x8a\x9eE\x06{b\x91\xfd7\
+\x01;\x90~\xe6\xe2\xfa\xa3m\x9f|\xad\xf2\xcd\xcd \
+\x7f\xff\xf5$x\x9b\xca\xa5\x16\x86\x09\x17.O\x8cx\
+\x09\xac\xda\x7f?\xf6m\xdd\xa0\xa5\xa9\xa4#Z\xf5\x1e\
+\xd4\xea[\x12s\xbf9\x02\xc1\x9f3V\xbc\x045\xfe\
+\x97\x88\xc3\xe0\xd0\xce\xad\xea\xfb\x80\x81z5\xea\xdc\xb3\
+\xb3U\xf5\xf5\xe1:\x9d|\x0b\x05\xd7=c\xba\xff_\
+\xc3\xbe-\x1b\x1c\xbf\xd4\xab2]\x7f\xb4\xed\x9b\xafQ\
+\xbe\xfa\x0cr\xf3\xea\xe5\x1fwnX\x93\xf7\xf8\xfe\xdd\
+\xe9n]\xbd\x1a\xed\xcc\xb1#I\x1f\xdc\xbd\x11\x1d\x9d\
+\x82_\x81S\xce_\x8f\x1e\xa9\x07wo\xab\x98z\x06\
+2\xba\x88\xd7o^\xab\x0b'\x9d\x0eG\x9f\x12hb\
+Q\xb2\xd1\x87\xe7O\x1e\x93\xff\x18\xe8\x02\x04p\x9a\xf4\
+\xef\xdc\xbc\xa1\x1e\xdd\x7fg\x0b\x8d\x8f\xd0\xcb\xab\x8a\x1d\
+?\xe9\xa1\x14\x19\xb3lM\x92&\xfd\xae\x8cy\x0a\xac\
+\x0c\x1d.\xfc\x1d\xeb\xeb\xaf\x82\xafF z\x96\x883\
+\xf4\x97\xb6\xfdo^\xbbT\x22G\xe1\x92*A\x8a\xd4\
+\xa2\xa9\x0c\xfaCp1j\xdd\xbcrY\xdd\xba~U\
+\xcc\xfc\x07wlQ'\x0f\xefW\xff\xbc\xf0\xd6J\xba\
+\x22H\xd0\xa0\xea\xd7\x11\x93\xc56\xd3\xb5a5\xd5\xbc\
+\xe7@\x95%_a1\xf2\xedX\xb3B\xcd\x197L\
+\xa5\xce\x9cC\xe5-]\x81\x0d\xd9bO\xd9\xb5a\x8d\
+\x9a2\xa8\xb7\xbap\xda\xe9F\xe0\x13\x92\xa4I\xc7\xde\
+]Q\xa3\x07\x0e\x16L]8qL\xdc\x030\xe8\xb1\
+\xb3o\xf5Y'\x01\xfc>z\x88\x1a\xd2\xa9\xa5\xdav\
+\xf3\x85\x97\xcfG\xb7\xc65e\x9f\xb1;\x02\x07\x09\xa2\
+\xaf\x9b^\xb1?\xf8GMPl\xbd\x88\xa0\x0b\x86<\
+\xecGl\x9e\xc2\x05`\xd3\x8a\xc5/\x93\xa4\xc94\xad\
+a\xa7\xee\xbf\x86\x8b\x14\xe5\xba\xf5\xf3/\x0b\x08\xe4K\
+\x97-+\x97\x15.\x9b.\xd1\xd3\xbd\x9b\xd7\xebC\xcf\
+\xf0\xfc\xf93\xc7\x86?\x168:\xd5\xaa\xe0\xc8\x1a%\
+\xa8x]\x19o\xb2\x83;\xb7:\x9e\xfd\xfd\xd4\xd1\xb8\
+T^\xc7\xd5\x8b\xe7\xc5\xbf\xb3m\xd5R\x8eL\x11\x03\
+:\xcagH\xe4\xb8v\xe9\x82\xe3\xee\xad\x1b\xe2\xad\xd5\
+\xbaRqG\xb5\x5ci\xc4\x9b\x8ck\x1a\xaf4\xbb\x82\
+\xe7\xda\xeb\xd7\xaf\x1d=\x9b\xd7u\xd4\xc8\x93N<\xea\
+g\x8d\x19*\x9e`\xa7\x0e\x1fp\x14J\x14\xd5q\xe1\
+\xd4q\xab\x85\x0e\xc7\xe1=;\xacO\x0eiO\xe1\x84\
+Q\xbc\xae\x953FHq|\xc6q\xda\xd5i\xf9}\
+X\xbfd\xbe\xa3T\xeaxw\x8f\xee\xdd\x95N\x1f\xda\
+\xf6\xe7\xe7,\xb6\x95\x9f\xb3\x1c\xdf\xbf'M\x95\xac\xc9\
+\x9f\xe3\x90l\x07<\xbaq9\x84\x18\xf4\x9b\xea\xd8\xbc\
+\xe2\x0f\xc7\xc9C\xfbe0\x0d\xf0$\x9f8\xa0\xa7#\
+w\xac\xd0\x8e\xfaE\xb2\xcb \xe2\xa9\x8e\x833\x037\
+i`/G\xbdBYe\x00\xd1\xca2(\xa5R\xc7\
+\x91\xc1=w\xe2\xa8\x0c0\xae\x89\x80\xc1jX,\xe7\
+[\x84Aa\xab\x85\x01\xae\x84\xb8=\x9e9zH\xae\
+\xcd\xb5\x8e\x1f\xd8\xeb\xb8x\xfa\x84\xa3n\xc1,r\xad\
+k\x17\xce9\xd8\x06\x01\xb1\xb6\xaaXL\xbc\xd2\xb9\x0e\
+m\x983n\xb8<\x97\x01\x9f\x8f\xed\xdb-\x84\x8c7\
+<^\xfb\xee\xcf\xe8\x0ax\xb2\xb2\xe9\xe2?\xb8~\xe9\
+BL}h\xdb\xaf\x9f\xab|\xd1%\x06%X\xb5\x1c\
+)\x0f\xf7\x9a47a\xccx\x09\xadZ't'\xa9\
+\x85\x93F\xe9u\xf8/\x153~\x22\x15.B$\xcd\
+\xd1\x07\xd4k\xf8=1\x96\x9d<\xb4O\x1co\xf2\x96\
+\xaa\xa0\x0a\x96\xad,a \xb0\xf2\xf6iY_/\x94\
+\xdf\xa9\x1e\xe3g\xaa\x15\xb3\xa7K\xe8\x04\xa6\xf8\xb1}\
+\xba\xa8\x98z\xfa\xceV\xa8\xb8\xd2\xb3\x88\x1a\xf7\xe7\x16\
+/\x0b\xab;n\xdf\xb8\xa6\xca\xa4\x89\xa7\x9e\xfd\xed\xb4\
+\x93D\x88\x14Y\xcd\xdfwFl+v\xd0\x83\xa9\xba\
+\xd4\xaf\xa2f\xef8\xa6\xa6\x0d\xed+NL\xa5k6\
+PMJ\xe6Q\x8d\xbb\xf6U\xfe\xfd\xf9\x97\xf0\x0e\x05\
+\xcbWU\xcd{\x0c\x10\xc7g\x5c\x1c\x97\xcf\x9a\xa6\xd6\
+.\x99\xab\x1e\xeav'L\x99V\xda\x83\x9b\xe1?\xcf\
+\x9f\xab\xbb\xfa\xfb\x0b\xa7\x8e\xa9\xb0\x11\x22\xcb\xae\xc14\
+\xd9rYwsB\xcf\xb6J\x13\xe7\xfaQK\xd6\xe5\
+\xb6\xaa\xbe\x0c\xdc)\xe6s\x16\xddAU\xd9\x03\xe2\x0a\
+\xb6\x02\xb4(_\xc41\xack;Y\x06\x0c\xfey\xf1\
+B\xf6\xa0\xb8\x02\x87e\x1c\x99y+q \xe6\x8dc\
+\xf6`)\xc8\x1b7\xbc\xbc\xb1\xb7\xae]\x91s\xcbe\
+L$\x1b\x9dp6\xfe\xa5ne\xa93`V\xe2\xbe\
+\xae\x18\xdd\xa3\x93\xd7\xec\xb1h\xeax\xab\xd6\x09\x9c\x89\
+\xdd\x97\xc3:\x052\xeb\x19\xe4\xa4,_\xe9\xc2|\xe7\
+\x18\xd3\xb3\xb3,7\xecm\xa1L\x1d\xd2W\xce\xd3<\
+\x85cP\xc7\x96\x8e\xa2I\x7f\x94e\xed\xca\xb93R\
+o\xc0l\xe2\xba\xe4\xb0D\xf6jQO\xf6\xc90s\
+\xb9\x82}C\xfb\xb6l\xcc\xae?\xda\xf6\xef\xe7(\xb6\
+\x95\x9f\xab4,\x96g\x0dS\xb3\x01Ss\xe3\x12\xb9\
+\x1d\xfb\xb6m\xb2j\x1c\x8eu\x8b\xe7\x89Wz\xe5l\
+)\x1cE\x92Dw\xb4\xa9\x5c\xc2\xb1e\xe5RY>\
+\x0cXN\xfa\xb6n\xe4\xa8\x909\xa9CK\x0fR\xb7\
+e\xd52\x99\xfa\xe1C\xb6\xaf]\xe1(\x96\x9c\xd9\xd8\
+\xe1X5\xffw//x\x03\x96\x09\xee\xeb\x0a\x06&\
+mh%^\xe7\xae\xf7\x82P+dL,\xcb\x9d+\
+h\x17\x9e\xef|o\x08+W\xccP\x8e\xaa9R9\
+\x0e\xed\xde.\xe7\xf0}\xf1\x14\xb1\x840\x5c\x97\x18\x96\
++\x9e\x13\x0f\xf8\x12)c\xcb\xb3\xea\x19\xe7\xad}7\
+k\x16\xceqt\xaa]\xd1:r\x82e\xb7{\x93\xda\
+\x13\xf4G\xdb\xfe\xfd\x1c\xc5\xb6\xf2s\x14\x5c\xf8\xf3\xc4\
+\x8d\xf0\x847\xde\x80Nw\xddz\xf0\xc7\x8cI\xc2\xc8\
+\x99\x01\xd2\xbf\x91\xb7/{\xb4\x1f\x1c\xf9\xe3G\x94\x81\
+v\xdd\x02\xc1L\xc0\xb6\x02\x189\x00\xc1\xb1\x9e3x\
+\x0c4\x1b\x93`\x1c[V(*\xdf\xbb\x02\x224\x9b\
+\xb4\x0cx\xcb\xe1]\x5c!\x03\xa5\x19cwT\xcc\x92\
+\xccq\xe7\xe6u\xc7\x81\x1d[\x1c9\x7f\x0c\xe1\xe8\x5c\
+\xa7\x92CKF\xd6\xb7\x0e\xe1;\x98I \x12\x03v\
+\xfb13d\x8a\x14H\x08j\xe6\xa8\xc1\xd67\x0e\xd9\
+$\xd6\xb6JI\xc7\xceu\xab\xac\x1a\x87\xa3K\xc3\xea\
+o\xbd<\xf0Se\xd3'>\xaa?\xda\xf6\xf1\xe7(\
+\xb6\x95\x9f\xa3<y\xf40\xa4\xd9Zh\xf0s\xb5\xd2\
+\xb2l\x18 q\xb8s\xf8,\x13\x85\x12D\x96Y\x81\
+i\xbc\xb8\x9e\x19X6\x0c`\xe0*eM.\x84\xe5\
+\xbalh\xb1S\x06\x0d\xa2avp\xc7\xd0_\xda\xc8\
+\xe0\xbb\x02\xe2peN\xc1\xf4a\xfde\xb0\xddq\xf9\
+\xeciY\xde`R]\xedF,\x930\xa9\xcc\x08\xae\
+n\x0b+\xe7\xcd\x14I\x86\xe5\x0e\xc9\x89Y\xc9\x1d\x10\
+\x10\x0c\xb3\x013\xe7\x90\xce\xad\xad#'rF\x0f\xf5\
+@\xff\xb3\xed\xe3\xcfQ\xbe\xa8G\x99\xeeP\xeb\x93\x13\
+7._P\x84\x8e2\xf8\xeb\xc9c\xf5\xf2\xd5\xdbf\
+\x88\x80\x81\x02\xa9\xa4\xe93\xabfe\x0a\xaa\x83\xbb\xb6\
+\xaa_GMU\xfd\x7fn\xac\xc6\xf7u\x86\x1d\x8b\x1a\
+\xeb'5e\xedn\xf1P\xaf\x98)\x89Z0y\x8c\
+\xf8y\x96\xab\xdbD\xdd\xb9qUM\x1d\xf2\xdb[^\
+\xe5\x06(\xce\xf0Bs\x05\x1e_\xff\xfc\xe3\xdc:a\
+\xc09\xe7O\x1c\xb3\x8e\xbc\xc1}\xfb\xb7m\xa2\x19\xcd\
+\x18\xe2\xee\x88\xc3\x10\xf7\xaa\x963\x8dJ\x9b=\xb7\x1a\
+\xb5d\xbd\x0a\x13!\xa2\xb4E\xf3]\xaas\xdd\xca*\
+\xb8f\xac\x0f\xef\xd9\xae\xd6,\x9a\xab2\xe6)h]\
+\xc9\x1b\xdc_/E\xd6\x11\x81\xf0\xa2{y\xb6\x01\x06\
+\xecK\xe3\x8b\x11\x08Q\x01\x9f<z\xf4\xc4\xb5\x03\x00\
+\xdb\x11\x0d\x88\xff\xd5\xafMc\xaf\xfd-\x06a\xb5D\
+\xc3\x16I~;c\xf8\x005u\xc3>\x91$\xf4\x9b\
+*\xbfGji\xd0\xb1\xbb\x1a\xbb|\xb3:\xb2k\xbb\
+*\x936\x9el\xa3l\xd5g\xa8\xda\xb3i\xad\xea\x5c\
+\xbb\xa2HC\x06;\xd6\xad\x14\xa5\x17\x9aW\x03\xbc\xd2\
+\xf1j7\xfe\xa7\x06\x0c\xf6\xc53'\xbc\x1c\x97\x01\x8a\
+\xac\xa6\xa5\xf2\xaa\xc7\x0f\xef\xcb\xbe\x9c\x11]\xdb\xa9r\
+\xe9\x13j\x82\xbc\xaefl:\xa0*\xd4o&\x9eg\
+x\xcck>C-\x9e:N\xe2\x9e-9tQ\xf5\
+\x9a\xe0\xdc\xd9\x81\xc3\xb4+x\x8e\xfe\xfa\xd9q\xbe6\
+\xa0\x8e\xeb\x18\xe0]\x1f:R$\xa7\x8f\xe5\x17\xc2\x17\
+#\x10v\x89%N\x9dn\xf7\xee\xf5\xde\xf1bb\xc7\
+O\xac\x07p\x9du\xe4\x0c\x0c\x131rTQ\x95\xbb\
+\x82=\xac\x09S\xa6Q\xfd\xa6-T{6\xaeQ\x97\
+\xcf\x9cR\x03\x7f_\xa2\x12\xa6H\xadj\xe4I'j\
+n\xc06\x88\xaec\xa6\xa9\xf1+\xb7I\xc7\xf6lV\
+[\x06s\xf5\xa2\xd9\xaad\xaa\x9f\xf4q\x1d\xd5\xa8x\
+.\xb5z\xfe,\xd5i\xd8\xdb\xae\x9f\x88\x91Y\xf2\x15\
+\xd1\xf7\x8f\xa6.\x9e>a\xd5:\xd1{\xe2\x1c5\xee\
+\xb7\xae\xaae\xb9\xc2\xaa[\xc3\xea\xaal\xda\xf8J\xf3\
+\x1e\xe2\xbd>\xa0]S!`\x22\x17\xb6\xe9;L\x0f\
+\xbc3\x5c\x1a\x0e\xd0\xb5\xf3\xa4\x17\xa7\xe4J\x8dZ\xa9\
+\x22\x95jH\xfd\x11\xfd\x9b\xa0\x9a8\x1f>\xf0&X\
+pK\x8b\xf2l\xba\xaa\xda\xecg\xabFI\xdf\x10j\
+\xcb`\xdb\xda\x15*y\xba\x8c;\xac\xc3/\x03\xf75\
+\xe7s\x96\x15sgTF<4\xc0\xc5\x0e&\x13f\
+\xd27\xe8\xa5C\xa4\x05\xd0\xbdI-\xc7\xc8n\x1d\xe4\
+3 \x0c\x03\xd2\xce\xbc\x89\xa3\xac\x9a\xb7\x01\xc3\x8bT\
+\xc1y\xec\x975\xa1\x1f\x5c\x01\xdf\x03\xff\x81\xc8\x0aS\
+\xfbs\xd5R\xd67o\x03\xa6\x14q\x17~\xe8\xe8\xde\
+]\xb6\x8a-\xaeE4\x82\xd2i\xe2\x8aT\x92>\x9c\
+\x7f\x11\x93\x0d\xfa\xb5m\xe2\xe8\xd3\xb2\x81\xa3q\xf1\x5c\
+V\x8d=P\xf8\x15\x88\x17Q\x94o\x80\xe7G\xe29\
+\xb0}3\x5c\xb4m\xff~\x8eb[\xf9\xb9\x8a^c\
+\x03\x10xe\xd1\x94q\xfa\xd0\x09\xc4P\x88d`\xfb\
+\xe6\xa2\x99t\x07\x16N\x88\xc2\x00\xc9\x07\x95\xb7+\xee\
+\xdf\xbe%\x8c!\x0c\xe3\x89\x83\xfb\xacZ\xcf\x00\xa3I\
+\xd8\x85\x05\x93\xc6X5\x0e!@\xdfBL\xf8\x04\x08\
+\x02b\xee\xda\xa0\x9a0\xcc0\xe0z\xb9\xb3\xbeu\x02\
+\x13\xc0\xca\x05\xb3\x1c\xcdJ\xe7\xf3\xdap\xee\x0a\x08\x8f\
+\xf6 Q\xb9\x86\x91 LD\x83\xa29Q\xc6\xd8\xf6\
+\xed\xe7*\xb6\x95\x9f\xb3h\xde!e\xce\xe8!\x9e\xf2\
+F\x1b\xa0L\xfas\xcety\x83]A\xac\x0e$\x1b\
+W\x1b\x07\x12\x03o\x92\x91\x06\x18Hf\x06\xb0~\xe9\
+B\x87\xe6\x05D\xf1\x86\xb8\xe8.\x11\xb9\x83\x01j^\
+\xa6\xa0c\xf6\xd8aV\x8d7Ftm/R\x90\xab\
+\xf2\xce\x0eHY\xdc\x97\x19\x88\x99\x8cv1C\xd06\
+\xec>\xee\x91\x06D\xaf\xb3j\x99\xa8\xd65\x1f\xf3\x8e\
+2\x0cu>\x91\x0d\xb0\xe5\x18,\x9e6\xc1\x91/^\
+\x84[z\xb9\x8c\xae\x0fm\xfb\xf5s\x95\xafb\xcd\xd5\
+\xd3d\xb6\xb6\xd5K-,\x5c\xb6j\xd8Zm:\xcb\
+\xfe\x16w\xe8\xc1S=4\x0f\x81#\xef\xfc\xbd\xa7\x85\
+\xa3\x07\xf0\x0a\xab\x16\xce\x16\xe9\xe7\xd9_\x7f\xa9s\x9a\
+\xff\xd8\xb5a\x95\x8a\x16\xf3'\xd5\xe8\xd7>*[\xc1\
+b\xb27\x05+\xea\xd1};U\xf2\xf4Y\x14\xbe\xad\
+\xfc^3\xcabRg\xbb\xe6N\xcd\xa8\x1e\xde\xbd]\
+\x85\xd1\xccb\x94\x98\xb1\xbd6\x89\xb3\xa5\x02\xd5x\xf0\
+\x90\xa1\xd5\x99\xa3\x07E\x0d\xcf\x1e\x9b\xf4\xd9\xf3\xaa\x08\
+\xd1\xa2\xab\xa0A\x83\xc9\x16K\xd4\xff\xc7\xf6\xefQ'\
+\x0e\xeeQq\x93$Wg\x8f\x1cRwo\xdfR1\
+\xe3\xc6S\xa9\xb3\xe4\x92\xcd\xde\xcf\x9f>\x15\x8b2\xbc\
+\x89\x81& \x95\xabx\x19\xcd\x8c\x96d\xc9Uk\x17\
+\xcfS\x1d\x87\x8c\x15>\xc6\x1d\xdc{D\x97v\xea\xe0\
+\x8em\x17\x87\xcc[V$v\x82\xc4\xef\x8aS\x9f\x19\
+_\xcd\xdc\xaf\xdf\xcc\xc8\xcdJ\x17\xfa\xf3\xda\x85\xd3)\
+Rg\xcb\xad\x12i&\x94ME\x7fkQ\x97\x8e\x7f\
+\xa5E\xbe\x86\xbf\xf4\x12\xfb\xc6\xda\xf3\xf7\xdf\xe2\xe6\x11\
+\x1d/\x9c:.\xfbM\x82\x85\x08!\xe2!\xd2\xcd\x82\
+\xc9\xa3U\x9e\xe2\xe5T\xc7\xa1\xe3\x84\xc0v\xac])\
+\xe1\x14\xd81\xef\xff{\xff\x9a\x88b\xabH\x9a\x91\x8d\
+\x14\xf5G1\xaf\xb3\x8f\x16{\x0b\xfbjp3\x90k\
+\xebk!n\xb3\xbd\xf3\x9ef\x96\xd9\xd1\x7f\xf3\xea%\
+\xb9\xdf\xa3\x07\xde[9\xc3G\x8c\xa4\xaa4o'\x8c\
+q/M\xc8\xe14s\xdd\xb4k_EdC\xf3{\
+\x02\xe5q\x1fWL\xec\xdfCK]\x81T\xb5\xe6N\
+fT/#\xaau\xc5\xa2*K\x81\xa2\x22R\x07\x0a\
+\x12T=\xba{G\xf7\xc1.ud\xdf\x9e'\xc5\xaa\
+\xd4\x9aP\xaf]\x97nln\x97\x1f|a\xf8\x89@\
+\x1co\xde\xf8;\x7f\xeax\xa2\x9f\x12&9jU}\
+\x144#wf\xe8\xdc\x15q0T\xb5\xad\x5c\x5c:\
+\xb6\xf3\xb0\x89\xc2\xcd3C0[\xb4\xafQF\x08\xc4\
+\x15\x13\xfauW\x13\xfaw\x97}\xb4\x06DI\xe4Y\
+^\xbd|\xa5\x02\x06\x0a(\x86\xb0\x94\x99\xb2K\x9c\x0f\
+f\x10\x8c\x83\xe8T\x80\xf1\xb9@\xace6x\xa4\x8b\
+\xab\x8eF\xf6\xf6j\xe2\x81\x80\x081\xc1\xec\x83t\xc2\
+\xbe\xdb\xe3\x07\xf7\xcav\xcd\x03\xdb6*\xbd\xf4i\xe2\
+t\xeam\xf0I1\xc6>\xe0\xdf\xbf?!\xbe\x0d\x97\
+\xbd6\x09\x0a\xa6\x0f\xeb/3\xde\x88E\xde\xd1\xbc;\
+\xd6*\xaf\x89y\x85*P\xb6\x8a\x8a\x19?\xa1Z\xa3\
+g\xc8d\xe92\xf7\xaf\xdb\xbeK7}\x0d\xe7\xd4\xf6\
+\x118w\xe2h\x92\xd8\xf1\x13\x1dw\x0d\xd5\xe91\xe8\
+TO\x8a\x9eR\x7f\xac[0\xdb\xa6\x8c\x11\x02\xbe\xd0\
+S8\xbak\xdb\xf3<-Z\x0c\xcc\x0cS\x09X\xc7\
+\xe1\xf6\xd1n\xba\x02\xd5s\x99\xb4\xf1\xad#o4\xd1\
+\x0c\x1e\x92\x09\xaaxL\xf7\x18\xe8X\xbb1\xeb/\x9c\
+<V\x82\xcd\x19`P\xc3\xa4NdA$(\xb4\x99\
+\xa8\xb9\x91\x10\xe0oh\x03\xb1\xca\xe0\x0dL\xc1\x85\x00\
+\x9b\x0a\x8c\x22\xfe&\x9c\x9f#zp\x89\x02\x84o\x08\
+\x0c-n\x03\xd8W`\xb2\xd1\xc8\xc2'\xa1]Ee\
+n\xa4\x1bl-H#\xae \x92\x116\x1fW\x86\x1c\
+W\x81\xcc\x11\x03\x89\x0b\x03\x80?#r\xa2\xfeh\xdb\
+w~)\x8c\x15c\xc6\xd81\x86v\xe7\xf8Vl+\
+]\x0b\xa2i\xc5L\xc9\x0f\xa2\xe25F\xa9\xacQC\
+<z\xfd\xea\x95\x7f\xbb\xf3=-t\x80QQ3\xb0\
+\xa8\xd3aJ\x0d\x90^\xe8H\xec\x11\xae` j\xe6\
+Io\x1d\xbd\x0b,\xc0\x18\xb5\xb0y\xe0\xb0\x93/N\
+8\x91p\x10=\xb1\xd300\x10\xa4\xa7\x80\x08Q\x81\
+\x13]\x11\x95;\x12\x06\x8c0m\xe3\xda\x18\xd4P\xa3\
+#\xb5\xb8\x03\x1b\x11D\xee\x0a,\xbe\xf4!\xd1\x1b]\
+A\xfbP\xcf\x03$+\xa4\x1fM\x5c)\xf4\xa1m\xff\
+yR\x18#\xc6\xca\x8c\x1bc\xc8X2\xa6v\xe7\xdb\
+\x15\xdbJS\xfey\xf1<P\xc6\x88\x81\x9f\x99\x1b\x98\
+\xd2\xa1V\x85Yv\xe7{Z\xb6\xad\xf9\xb3 ^]\
+\x06\xedk\x94\x95\xd0\x92\x06\x0c\x08Q\x0e\xd1%`\x8f\
+0\xe0m\xc4bk,\xb8\x06\x0c\x22R\x0bR\x07o\
+:\x16\xdd\xdfG\x0ez\xcb\xdb\xebS\x03\xa3!\x04\x80\
+\x08\x8e\xab\x01\xdek\xcc>\x10\xbdqF\x02\xd8vp\
+Q\xa0\x8d\x06\xcc\x5cX\xa2]\x8duH\x5c\x18\x00\x8d\
+;\x00\xd7\xfe\x14b-c\xe5>~\x8c)ckw\
+\xbe{\xb1\xad4\x05\x0a\xac\x9a+\xedn\xf7\x1b4+\
+Sh\xb9\x96\x06~\xb0\xfb\x8doe\xe5\xdc\x99\x95\xf0\
+\xda.\x98 \xeaU#\xba\x22\xf7\x9b7\x07 zb\
+\xfef\xba\xa5\x13\xcd2\x828\xcb[\x85r\xcd\x80\x19\
+g\xe6\x88\x81\x22\xf6\xe2\x12\xc8\xd4o\xa7\x08\xfb\xdc\xe0\
+\x8dG\x07\xc2\xac\x85\x15\x99\x99\x0b\x97\x02<\xdf\x10c\
+Y\xde\x98\xf5\x5c\x03\x05\x9b\xa5\x0cc\xa0\x01\x0a8W\
+\x1d\x0f\x86;\xfaz\xe8/m\xfb\xdd\xbb}3\xa2\xae\
+\xb2\xedW\x9f\x0ac\xc4\xef\xdd\xc7\xafj\xce4{<\
+]\x01l+]\x8b\x16\xff\x82\x12\xb1\xd8\xfd&%S\
+\xc7;u\xf6\xf8\x91$v\xbf\xb1+\xb3F\x0fi\xce\
+\x1b\xd2\xb7McdzQ(\xe1v\xc7\x7f\xb3\x9ek\
+ID\xde~L\xe4\x10\x07\xba\x05\xf4\x14\xb8\xefa\xd5\
+\x84P\x00\xff\xd9\x89\xc6u\x98\xf2\xcf\x1c;,\xf5\xdf\
+\x02 Z\xf4*\xf8\x81d\x8b\x1aL\xf4)\x10\xad\x9e\
+5\x1dU\xb2\xa7\x94\x99\x91e\x93\x19\x07BA)\x07\
+\xb1\xc0C\x01\xf4'\xe8=p\x83\x80/\xc3U\x01\xc2\
++\x9d:\xcey\xddG\xc1\xf4)\xb6\xfd\xeb^\x18\x1b\
+\xc6\xc8}\xdc\x18K\xc6\xd4\xee7v\xc5\xb6\xd2\xae\x8c\
+\xee\xd9\xb9\x87\xfb\xcd2E\x0a\xfat\xd9\xcc)0\x09\
+\xb6\xbfq-Us\xa4\xde\xbbl\xd6T\xfd\xd1\xa9\x18\
+\xa3S\xb8\x06\x9eaF\xd9\xc4\x92\xc0\xe0\xf3\xe6tk\
+\x5cS\xb4\x87L\xb5\x10\x0f\xe0m\x84\x88\xf0(\xc37\
+\xe4}J\xac\xaf\x09f\x15\x82\xfe\xc2\xaf\xe0\xcf2\xa1\
+\x7f\x0f\xe1\x8f\xd0\xf4\xb2\xfc\xd1~^\x0e\x96$\x9e\x0f\
+\xdf\x16\x98\x5cf\x1d\x08\x0b\x1f\x13\x88\x0a\xf0\xbb\x92\xa9\
+~b\x86!\x14\xb5m\xff\xba\x16\xc6\x84\xb1q\x1f/\
+\xc6\xd0\xee|\xdf\x8am\xa5Oe\xd5\x82Y\x152F\
+\x0c\xf2\xb7\xfb\x8d{6\xad3\xde\xb75\x8d\xe9\x8c\x0d\
+Q\xe9\xc3\xfa\x13\x9f\x0e:\x8f\x82D@g\x18\xa7\x1a\
+\xfc<x\xc3\x90:\xdc\x81\xda\x99\xce\xe6m\xc2&\xf2\
+\xff\x05,\x91K\xa6O\x14\xa9\x09\x7f\x18W\x9e\x0a\x89\
+\x87\xa5\x07b\xc1f\x04\xef\x02C\xcd\x12\xa5g\x009\
+\x07\x82\x82\xef\xa2\x9fu?e\xd2U\xb6}La\x0c\
+\x18\x0b\xf7\xf1a\xcc\x18;\xbb\xdf\xbc\xaf\xd8V\xfaV\
+N\x1c\xd8\x9b\x1a\x1e\xc2\xbd\x11\x153\xa78p\xf5\xc2\
+\xb9\xd8\xee\xe7\xeb\xe5#q\xc5l)\xf7\xe3\xe2\xc7\x1b\
+\x05C\x87\xf8w\xff\xcem\xfd\xb5C:'O\xec0\
+\xc2\xed\xe3\xf8\x83\x0a\xda\x15\xcc(\x10\x12\xd33K\xd2\
+\xffW@\x000\xab\xbc$\xa8\xe3\x99)\x00F8\xfc\
+q\x11\xa9\xf19ev46\x1aDv\x96\x22\x96$\
+\x8c\x91\xb9c\x85{6yP\x9f\xf6\x9a\xe8D\x7f\xe5\
+Z\xe8{\xc6\xc0}\x5c\x18+\xc6\xcc\xfd|O\x8bm\
+\xe5\xfb\x8a\x9e\xda#\xd5\xcc\x9bq\xbb{c\xb2G\x0b\
+\xf9p\xe3\xd2E%\xccy\xf3&\x8cj\x98/N\xc4\
+g\xc6\x9f\x13N\x1d&\x0c\x22a\xca4\x9e^\xa6\xce\
+]\xfcdf\xe1\xed\x99<\xa8\xf7[\x92\xc1\xffg\xe0\
+\x93\x8b\x14\x83X\x0fck\xc0\x9e\x1d\xf6\xfb\x18\xbd\x09\
+\xcb+:\x18f\x13\xc3\x98#\xdd\xc1\xa35,\x96k\
+\x9d\x9eE#\xeb*\xe9g\xfa\x9c\xbew\x1f\x0f\xc6\x88\
+\xb12\xe7}H\xb1\xad\xf4\xa4`\x99\xc5\x81\xd6\xbdQ\
+\x94\x81\x1d[\x0eb\xaa\xab\x957\x83\x97\x979\x03\xcc\
+,1mh?1D\xa1\x9c\x82\x91\x83\x8f\xe0\xedb\
+\xfa\x9d;~\x84\x9c\x0b\xe05\xe8H\xf7\x19\xe5\xdf\x00\
+^\x84\xfe?7\x95\xd9\x04\xde\x04\x1e\x04F\x1c\xe6\x14\
+\xa0\x13\x81XXV\xe1K\xe8G\xa4=\x03\xdc)\x0b\
+'\xfb\xf1\x1a{\x8c4\xf3>\xc0n\x0c\x18\x1b\xc6H\
+\x9fn;~\x9e\x16\xdbJ\xbf\x949c\x877I\x1b\
+\xee\xfb\x97\xee\x0d\xe4\x81\xaf]p\xce\x10\xf0\x1b\xf8A\
+\xb8:\xe4\xd2I\xb5\xf3g\x12\x11\x97\xef\xd10\xf2v\
+\xa0\x85D\x9f\x81\xbf*\x84\xf3o\x06\x9e\xed0\xb0\xf0\
+V\xe8|\x00ZT\xa4\x17\x94\x87\x06HF\xe8S\x5c\
+\x89\x04\x0dn\xfa\x08\xef\xf6;c\xc1\x98\xe8Sl\xc7\
+\xcb\xaf\xe5\xa3=\xca\xca\xd5k2b\xf4\xa25yC\
+\xb8%\xfa\xc3@V3o:\xa5\x19O5}X?\
+q\xdd\xd3S\xa4\xf5\xad\xd3\xd7\x94\xfd\xb2D\x18\x1e\xdc\
+\xb1\xa5\x1c\xbfz\xf1B5-\x99W\xfd\x18'\x9e\xea\
+;u\xbeW\xa6\x85\x7f+\xb0\xeaN^\xbbK\x02\xdb\
+1\x18Zj\x91\x0dY\xe1\xc2GT\xb1\x13y'\x99\
+z\xf3\xea\x95\x8a\x1c#\x96:\xbck\x1b;\x13e_\
+\xf1\xc0\xf6\xcd\xd4\xeb\x7f^\xbd\x95/\x961`,\x18\
+\x13\xab\xea\xe3\xe1N1\x1fZn\x5c\xba\x18\xa3h\xf2\
+X\xe7\xdf\xa1\xe80\xdf\x89\xb6\x11\x9e\x03}\x87\x01\x89\
+t\xe0\xd8\xd96\xc0\xf2\xc2\xb9L\xb9F\x14\xfe_\x02\
+\xde\xefUs\xa6\x96>@u\x8f\xe8\x8b\x1e\xc80\xab\
+\x80\x19\x04\x1d\x12\x9b\xaa\xd8\xa8\xe5\xda\xc7\x14T\xe8\x8c\
+\x81>\xd5v|>\xb4\xd8V~H\xd1\xbcF\xb4\xe2\
+\xc9b^\x22u\x97{\xe3)\xb5\xf2e\x10\xb1\x0e]\
+\x06\x1eW\xec5\xe13\x80\xf9b\x9auU\xb7\xff\xaf\
+\x01[\x0e\x86C^$\xb1\xfdl^/\x9f\x0d\x83z\
+\xef\xf6-\xbdl\x87\xb3\xed\xdb\x82\xf1#iF\xde^\
+\xba\xf9\xd8b[\xe9\x97r\xe7\xc6\xb5(\x9d\xebV\x9e\
+\xc1\xda\x87\xe6\x13\xb9\x9f\xd9!M\xe8w\x1f\x04\xce\x1d\
+q\x95\xef\x0d \x1a\xeaP\x14\xfd\xaf\x03\x85\x18D\x82\
+I\x81~\xc1e\x11)\x0eF\x16\xf1\xd7\xbd?1\x18\
+\xa2h\xdc\xbcr\xa9\x1c\x97L\x1d\xf7\xf4\xea\x05\xb3\xcb\
+\xebK\xd9\x8e\xd5\x87\x94\x8fr\x18\xda\xbajy\xe1\xee\
+\xcdjO\x7fp\xfbVh\x02\xe3\xe3\x8d\x8eg\x14\xf1\
+7\x08o}d\xcf\xce\xb7|$\x00~\x12\xcdz\x0c\
+\x94\x0d\xca\x04\xa8mT4\xa7x}\xe7)Y\xce:\
+\xe3\x7f\x1b\xf8\xc44.\x91[\x1c\xa4F/\xdd\xa8f\
+\x0e\x1f\xa0\xc6\xfd\xd6E\x0f\x96u\x82\x05|^\xd8\x0b\
+\x84\x8f\x0aqJ\xee\xdc\xba)\x91\xa6\x19\x83\xec\x85K\
+\xcd\xfeu\xc4\xc4\xda\x81\x838\xd3\xab|\x0c>\x98@\
+\xe6O\x1e\xd3`\xc6\xf0\xfe#\xcb\xd4l\xe8\x0f\xf7\xfc\
+;\xb7\xae\xab3G\x0f\xab\xe1\xf3W\xaa\xb49\xf2H\
+\xa4b\x82\xbf\x10j\xfa\xb1M\x00\xfc\x5c\xc5JK\x94\
+\xe4\xb4Ys\xca\xde\x92/\x89JY\x93[\x9f\xde\xc6\
+/\xc3&\xca\xf6\x0a\xbb\xef\xb3\x15,\xae\xd8{\xf3%\
+\xa0g\x0fU=W\x1a\xf5J3\xa7\xec\xb5qG\xf4\
+\xd8?\xa9\xc1\xb3\x97I\xba\x12\xf6\xdetk\x5cC\xed\
+Z\xbfFUk\xd1N\x1d\xdb\xbbS\xc5I\x94L\xed\
+\xdf\xb6\xe5\xe0\xa8%k\xf2\xdae\x09\xf7\x0b>H\x8a\
+\x99=vX\xb3\x85\x13F\x8e\x9e\xb2f\x97?\xbc\xa3\
+\xaa\xb5l/)\xd4\xc3E\x88\xa8\x22h*\x06\x8b\xa6\
+\x8cSm*\x97\x10\xe2\x88\x14\xcd\xe9O\xea\x8a\xf5\x7f\
+,P\x87vlV\xe9s\xe6\xb5j\xbe\x1cF.Z\
++\xf1\xd4!hJ\xe2T\xe9\xd4\x90\xb9\x7f\x0aq\x80\
+I\xabw\xa8\xf8IR\xc8w\xf1\x12'W\xddFO\
+Su\xdbu\x91\xef\xbe\x04\xc8e\xa3'x[\xe2\xf0\
+\xe7\xef;\x89\x17?uh?u\xed\xc29\xc9\x9a\x15\
+$H0\x15#N\x5c\xaf\x0cV\x84\xc0(Q\xbdv\
+\x8aFEs\xad\x7f\xfc\xe0~\x18\xa9\xfc@\xf8\x99@\
+v\xac[Y`\xc1\xe4\xd1\x83G\xfd\xb1A\x12 3\
+\x03!\xa2\x12B\x8a\xddj\xe7\x8e\x1fU\x95\xb3$S\
+\xfb\xb6lP\xc93d\x91\xdft\x199E\xd5l\xd9\
+A>\xbb\x82\x0c\xd45r\xa7SKg~\xd9\xe4J\
+\xb8\x0f\xd6l\xd5\xd1:R*o\xc9\xf2*B\xe4\xa8\
+\xd6\x91s\x97\x1d[$\x8bV\xae\xa9\xba\x8c\x9e*N\
+\xc9\xcc\x88_\x02\xf4\x05}r\xf3\xca\xbbI\x03\xe8C\
+\xfa\x19\xdf\xdd\x98z\xf6hR:\x9fl\xe8b\xa6I\
+\x97=\xaf\xb8B\xd6l\xd5Iv\x15\xb2\xf5\xb4p\xa5\
+\xeaI\xdb\xd7(;O\x8f\x91\xef\xd9\x9c}\x03\x03\xec\
+i\xc1\xdc\x5c$i\xf4\xeb\xc6\x90\x84\xa3\x0f\x0a\x1d\x18\
+%\xb4{\xd8T\x10YQ\x91\xa3\xf0\xc2Z\x89\x22\x08\
+\xeb-@1\x94%r\xe0w\x98-\x0a\xd6[\xf7x\
+ \x9f\x1b\xe6\xdex\xaf\x19\xc0d\xa3\xfa\xc7.\xf2\xbe\
+m\x13\x9f\x12<;}\xe0\xda'\xa6\xc0\x8c\xa2H\x04\
+\xf8\x96\xc0\xb0\x12\x09\x01\x0d,b/\xdf\xa3\x85f\xdb\
+\x05m\x86\xe97\x222VsL\x1e\xfa\xa3\xed\x98\xbe\
+\xaf\xf8i\x06Y0at\xc3\xccy\x0aG\xfe)a\
+\x12u\xff\xf6-u\xf6\xd8a\x95>W>\xb5s\xfd\
+*\x95Q\xff'\xaa\xe0\x94u{\xc4Qx\xce\x98a\
+*E\xc6l\x12\x05\x90h@\x00\xc5\x10\xa9\xba\xc2\x84\
+{7\xb5(oN\xcd<\xe9\xd5\x95sg\xac\x9a\xaf\
+\x83\xe1]~\x16/\xf6\xdf\xa6\xcd\x97-\x10_\x02<\
+3\xcfn7\x93F\xf91\x86DJB9\x06H\x15\
+\x9b4mF\xbd\xcc\x0fU\xfe\xf4\xac\xc6\x9e\xe5Zz\
+\xd6 oN\xd6\x02\xc5$-I\xa9\x1a\x0d\xd4\xa2\xa9\
+\xe3\xe4\xfc\x16=\x06\xa8\xc9\x83zw\xd6\x84\xf3n\x8a\
+\x0a\x0f\xe0'\x02\xf9c\xd6\xd4\xeaej;\xf3\xb9\xfd\
+9g\xba\x84Xb\x8fI\xc2\x14id\xbd\xceR\xb0\
+\x98L\xdf\x10\x0f\x19\xa2\xc2E\x8e\xa2\xf2X\xf9l\xc1\
+\xdaEsU\xd0\x1fB\xa8\xb9\xbbN\xaa\xb4\xd9rZ\
+\xb5\xde8{\xec\x88\xaa\x963\xb5\xda\xa0\xf9\x93\xaf\x81\
+\xe1\xdd\xda\x8bw\xf9\xd0\xb9+|\x0c?\xf5\xa9\xc1\xb3\
+\xf2\xcc<\xbb;\xe8\xa3i\x1b\xf6\xa9\xde\x93\xe6J\xe8\
+*4\xad\x10\x08\xfbu\xaa6m\xab\xa6\x0d\xe9+\xe7\
+\x15\xadZ[\xed\xda\xb8FUi\xdaF\xf6\x04\xe5/\
+[I\xad^8[\x96J\xa2\x10\xc4M\x944\x8a&\
+\xb0\x0fc\xf6\xec\xa6\x15\xbb\x82\xbe\x83%\xc4\x80\x1dc\
+xA\xe1W\x89\x7f&\xe6|\xa3\xd4As\x8ag9\
+K\x8c1\xebcO\xc05\x10%\x10\xc0xGp\x18\
+\xbb)\x95\xc2VL\xa3H\xfb\x5c0\xf7\xc2(\xc6n\
+8\x96G\xd3\xde\xcf\x0d\x9e\x8dgt}f\xd7B\xdf\
+\xd0G\x06\x84\xc8\x226\x0a6,4\xaax\xd2\xb3\xdc\
+\x18\xed4NV\xf4?K=\x1elx\xe2\x99\x1d\x87\
+\x18H\x07\xb4k>D\x7f\xb4\x1d[\xdf\x8am\xa5]\
+\xc1\x9b\x09\xe3\x1a\xfe\x0bxwc\x9e\xc7\xc8\x86\xb5\x16\
+\xb35\x0d\x02l\x1b\x84/\xc1\xd3\x9bN7 \xb90\
+f{w\xe0\x0a\x80\xcb\xbf]'\xe1Lc\xac\xc1\x9f\
+\x03\xe6>\xb8B\xf2\x1fU\xbf\xab\x91\xecs\x81g\xe2\
+\xd9\xcc\xfd]\x0b}\xe1\x1e\xee\x0a\xc0\xa3\xc0c\xd0\x87\
+\xf0\x17l\xcb\xa0\x0e_\x12\xc6\x84HDl\x07\x01\x5c\
+\x1f_]^b^T\x94\x90l{\xd0_\xd9\x8e\xad\
+o\xc5\xb6\xd2\xbd\xe0\x8c\x92/~\xe4\xeb4\x1e\x07\x16\
+\x1e\xc4\xec9\xc5\xf1\x05\xcd\x1f\xde\xd8P3\xdb\x03\x98\
+Q\x88\xa0\xc3\xa6jp\xf3\xeaeQ\x1b\xbb\xfb{\x18\
+\xe0\x08d\xa7)\xa40k\xb9Z\x81?%\xcc= \
+j\xac\xa9|\xc6+\xde\xddk\xfeS\x82g\xe1\x99\xcc\
+\xbd]\x0b}\xe0\x9bS\x94\x89R\xc4\x0c1\xa0]3\
+yQ!\x126\x83\xf3\xb2\xfeZ\xaf\x8a\x97\xcb\x04D\
+\xc15\xb1\xdb\xe0\xbe\xc8\xe71\xbd~\xed\xa6\xbf\xb2\x1d\
+c\x9f\x8am\xa5k\xd1\xcc\xcd\xf7\x153%;\x84\xdb\
+\x1c3\x05^\xd8\xec\xc6\xc7\xb9\x16_\x0e<\xd0ql\
+\xa1\x81\x14\xa4\x17$\x00\x1cr\x0d\x08\x0fe|\x1d|\
+\x02\x06+66\xb9v\x98)p\xe9x\xb5\xbbN\xb9\
+\x9f\x02\xe6\xfaH1l\x1c\xc7\x09\x9ac\xbc\xbb\x5c\xc3\
+G}\x0a\xd0v\x9e\x81g1\xf7u-<\xfb\xfb\xee\
+\x89\x84E\x7f\xe3\x08\x8d+\x04\x1ex\xd8l\x00}\x8f\
+;g\x86\xf0\xdf\x8b\x8b#~4\xc4\x91E\xa2\xc1\x9b\
+\x9e\x8df\x18\x007\xfd\xb9\xa4\x98>\xddv\xac\xed\x8a\
+m\xa5k\xc1\x1b\x1d\xff\x0c@\xac\x0a\x9cW\xa0d\xf8\
+\x09\xd6\xc4\xb9\x13F\xca\x03\xe2\x1d\xc6V\x06v\x9f\xb9\
+\x06\xa6\xe37\xcc\x1e\x9e\x0c.S%\xcb\x92{\xe7\x99\
+\x82!\xf0S\xf2\x08\xe6\xbaF\xcc\xa5\xfdf\x86\xc4\xae\
+\xf4\xa9x \xda\xec\x93\x11\x93\xc23\xf3\xec\x9e\x00K\
+/\xaa\x03\x5c1Yj\x98\xf9\x08\xb9\x89\xc8\x8b\xda\x01\
+C(\xf7b\x09c\x96g+\x08\xcb\x10\xc0[\xadX\
+\x92\x18\x17\xf5sy\xecHd[\xe9Z\x8a\xa5\xfc\xe9\
+\xac\xd1{\x10\xce\x805\x8d\x88\xc5\x8d\x8a\xe7\x92\xc0/\
+\xecb\xe3!\xd9\x0f\xc2TF\xfc\x0bW\xc0lq\xbe\
+\xa7`\xca\x84\xbfq\xefDSp\xc13N\xce\x1f\x0b\
+sMW=\x08a(L=NN\x1f\x0b\xdaJ\x9b\
+\xcd5\xdd\x0b\xcf\xca3\xfb\x058v\xc3x\x02\x18S\
+\x96~<\xd0\x98\xc9yA\x99i\xe6O\x1a-\x1e{\
+|F\xbfb\xf6\xe4\xc0+\xfa\xc5\xa0g[i\x0a\x0e\
+\xc70F\x80Y\x03\xa7c\xc0\xae8\xe3O\xca\xf2\x81\
+?%[\x1a\xe1\xa0\xe1\xb6\x0d\x98\x06\xe9\x1c\xa8\xdbS\
+\xb0\xae\xdau\xa4k\xc1\xe3\x8a\xad\x03<\xfc\xc7\xc0\x5c\
+\xcf\x95@\x00\xc1~\xcdw\xef[\x1a}\x02m\xa3\x8d\
+\xb4\xd5\x5c\xcb\xa7b\x17E\xd17\x10\xe8\x97e\x90{\
+\xa0\x84\xa4\x8f\x91\x12\x09\x03\xcelmf\xd9\x8e\xb5\xca\
+KhN\x08\x90U\x80e\x08\xe7g\xbf\xa4\x1c\xf1U\
+\x0fr\xe6\xc8\xa1\xe4\x09\x92\xa7\x16\xab+\x89\x86\xf3\x96\
+*/q\xb3\x22D\x8e&\x91\x03\xf5\xb4\xa8\xf6n^\
+\xa7*4l!\x86#\xbe\xcb\x98\xd7;z\x9f&(\
+\x95\xadP\x09?\xe9\x14\xf6n\xd9`}\xf2\x19\xec\xea\
+\x1f\xd4\xa9\x95jW\xad\xf4[A\xf0\xfc\x02\xec\x18\x06\
+z\xbd\xb6>9\xd1\xba\xcfP\x15\xd7\xf2\xe8\xfa\xadu\
+\x03\xa5;U:\xcbS\xd0&\xdaF\x1b]#\x10\xf8\
+\x04O\x9e\xd9\x15\x05\xcaV\x92\x08\x05d\x0aG\x09\x89\
+\xb7\xd9\xcd+\x97T\xf2\xf4\x99U\xc1rU\xd5\x9aE\
+s\xe4\xbc\xf2\x0d\x9a\xab\xe9\xc3\xfaJJWt$\x7f\
+\xce\x9e\xa6\x12\xea\xf1<y\xf8`\x0a9\xc1\x03\xf8J\
+ wn\xde\x88\x1c*\x5cxQ\xe6`\xbb\xd0\x14\xab\
+Fto\xaf\x1av\xee)\xdf\xaf[2O\xa5\xcb\x99\
+Ol1X\x15\xd1@\xd2H\x83\xa53&\x8a=\xc3\
+/ \x0f\xbf\xa7 \xbe{\xb5\x1c\xa9\x84x\xfd\x02b\
+\x8e\xe8\xa9\xd8:Rjp\xe7\xd6\xaaR\xe6\xa4\xcc\x98\
+r\xcc\xf3t\x1d3]}\x1f\xe0{\x09'A\xe4\xc5\
+\x92)c+=\x8b\xca\xf7\xbe\x81\xb6\xd0&\xda\xe6)\
+\xfc\xf2\xcc\x80|\xbe\x84\x8a0\xa9FJT\xaf\xe7\xa5\
+\x85-\x5c\xbe\xaaZ8i\xb4|N\x966\xa3\x0a\x1c\
+\xf4\x07\x89\xeaH\xec\x11\xcd{\xa8`\xc1\x83\xab\x87w\
+oE\x94\x13<\x81\xfb\x94\xe2Z\xc6\xf6\xe9\xda\x85}\
++f\x87\x17K\x89\xab\xb3\x0f\x9c\xb7\xd9c\x0bc\xea\
+\xea\x95n\x98S\xbf\x02)\x08q\xcdn*\xf6\xa9\xb0\
+\x06\xfbe)@b\xb1+&l\x83\x01\x1b\xb4\x5c\xbf\
+76%\x9f@\x1b|\xd2\xe9\xf8TxV\xf7\xfbz\
+\x02\x5c5\xd9t\xc6oQ\x1f\xe0Xd\xc2V\xc1`\
+\xf3=\xa0\xdd(,\xf1Xc\xa9G\xc7\x92-\xf2\x0f\
+x\x83\xdb\x8e\xb9{\xb1\xad4\x05\x02a=f\xedb\
+\x9df\x83\xb4\xd1e\xb0\x1f\xd6\xec\xd0\xc7@\x04C\xc4\
+:h\x00\x13\x858\xf6\xa1`\xdb\x83\x9d\xef\xa5o\x85\
+\x0dF~e\xf8>\x05\xb8'\xf7\xb6k\x93O\x85g\
+\xe3\x19?\x14\xf0\x1fx\xe8\x99\x10\x1a(\x22M\x12\x02\
+\xb6\xab\xb29\xcb\x00\xc6\x1b\xff_\xc6\x11^\xd1/\xd1\
+\x9a}]b\xc2\x84\x8fp\x9b\x10L'\x0e\xecUm\
+*\x17W\xdd\xc7\xcc\x90\xe9\x17L\x19\xd8[Um\xd2\
+V>o^\xb9T\xa5\xc9\x9aK\x05\xb3\xc28\x81m\
+k\x96\xab,\x05\x8aXG~\x07ND\xa3\x16\xafS\
+a\x22\xbc\x1dp\xd67,\x9f5U\xd5\xcc\x95\xf6\x8b\
+\x1a\xfc\xc4\xd0\xa6\xef\xc9\xbd=\x05\xcf\xc4\xb3}\x8c\xa3\
+\x14\x1eg\xd8\xbe\xb6\xaf]!\xc7\xc5\xab\xd6Q\x8b\xa7\
+9\x0dt9\x8a\x96R'\x0e\xee\xf5\xe2\xb3\x0a\x96\xab\
+\xa2\x97\xcb\x00\xaaO\xab\x06\xea\xde\x9d\xdb*p\xb0\x1f\
+\xde\x8ef\xec\x0b|%\x90\x90\xa1\xc3\xdc?vp\x8f\
+\xa4\xf9\xd2\xd4\xa7\xfcY\xd6MM\x85\xea\xdc\xa9c*\
+w\x89\xb2r\xbcz\xc1,\x95\xa7\xb8\xf33\xd0S\x99\
+:\xaf\xd7s\xac\x8e\x1f\x83\xd4YsJ\xe4\xe2\x14\x19\
+\xbc\xf9\x9a\xf7\xe1\xec\x89c\xaaJ\xf6\x94j\xdd\xe2y\
+V\xcd\xe7\x03\xf7\xe0^\xdc\xd3S\xf0,<\x13\xcf\xf6\
+\xb1\xc8\x94\xa7\xa0\x04\xe3\x03D\x8d\x86\xc7\xd0K\x8a\x10\
+O\x8d\x96\x1d\xd4\xc4\x81\xbd\xe4;@X\xad\x83\xdb7\
+\xa9\x1eMj*\xbfx\x99\xf9H /\x9e?\x0b2\
+\xbe_\xf7_c\xc7O\xa4F,Z#1\xbf\x08\xe4\
+\x06&\xeb\xd9\x83\x1b\xd2\x10\x18W$\x19\xd7\x07>\xbc\
+s\x9bJ\x942\x9d\x9c\xf3\xb1\xc0cj\xcc\xd2\x8d\xaa\
+r\xe3VV\xcd\xfb\xf1\xf7\xd3\xa7\xaa}\xcdrj`\
+\xfb\xe6\xd2i\x9f\x1a\x5c\x93ks\x0f\xee\xe5)x\x06\
+\x9e\x85g\xfa\x14 \xfa\x22\xb1\xd6n[\xfb\x8d2\xe4\
+.\xa0\xb6\xad^.\x9f\xbf\xd73\xfd\xcay3$\x1a\
+#\xb8\xa8\xc7\xaey\x8f\x81\xe2\x0ap\xfb\xfa\xa5\x14k\
+\x16\xce)/_\xbc\x07>\x8e\xe0\xc4\x01\xbd:e\xce\
+[0\x11\x0ft\xf6\xf8\x11u\xe5\xc2Y1%k^\
+D\xad\xd07>}\xe4\x90\xcc$L\xb1D\xf83\x89\
+\xfc\xc0\xc1]\xdbT\x8aLY\xad\xa3\x8f\x07~\x19-\
+z\x0eT\xfd\xa7-P?h.\xdcS\xcc\x1e;L\
+\xd5-\x94E:\xf1S\x81kqM\xae\xed)h3\
+m\xe7\x19>\xa5\x8f\x09.\x86\xb1\x13&Q\x87wm\
+\x97\xe3x\x89\x93\xe9\xa5e\x9f|^9w\xa6&\xe4\
+\x97\xaa_\xebF\xb2\xd4\x5c:wZ6\xb0Um\xd6\
+VM\xdb\xb8_\x0d\xeb\xdcj\xd4_\x8f\x1f9}\x14\
+}\x81-\x81\xf0\xc3E\xd3\xc67\xaf\xfd\xf3\xafr<\
+\xbeoW\xd5k\xe2\x1c\xf5\xa7^g\x87\xfc\xd2Zv\
+\xbce\xc8\x99G\xcd\x1d7B]\xbdx\x8e\xa5H\xce\
+38\xa9y\x16\xf7L\x0a\x9f\x02\xac\xad\xf8G\xc4I\
+\xec\xb9Xxl\xdf\x1eU%[\x0a\xaf\xb5\xfac\xc0\
+5\xb8\x16\xd7\xf4\x14\xb4\x956\xd3\xf6\xcf\x81$\xa9\xd3\
+{\x89\xf9\xbc\xa8d\xd0\xb8~\xf1\xbc\xda\xb9~\xa5J\
+\x97=\x97z\xfa\xd7cU6CBU\xa2Z=\x15\
+4xH\x89\x1cI\xe8\xce<\xa5+\x86\x99;ad\
+c\xf9\xa1/\xb0%\x90\xd5\x0bfW\xc8\x92\xbb\xc0\x0f\
+\xb8\xd3\xef\xdf\xbaQ\x85\x0a\x1dN\x02\xbf\xc6M\x9a\x5c\
+5\xe9\xd2W\x85\x8f\x1cE%N\x93Q-\xd2L\xd1\
+\xf65\xefv<\x0e-\xf8q~\x0e\xb0\xd6\xb2]\xb1\
+x\xd5\xdaV\xcd\xfbA|\xd3\xe6e\x0b\xa91=;\
+\xbf\x93\x92\xc4\x13\xf0\x1b~\xcb5\x5cc\xa5\xbe\x0f\xb4\
+\x91\xb6\xbaf\x95\xf8\xd4\xa0\x9f\xcf\x1c=d\x1d)\xf2\
+\xf2\xa8\x9e\xcd\xeb\xc8\xf2\x8e\xd2,a\xca\xb4*}\xce\
+\xfc2~\xcc\x1eS\x879\x9d\x8ch\xdb\x92\x19\x93j\
+\xc9\x81/\xb0%\x90-+\x97\x16\xcd\x92\xdf)\x81\xa0\
+\x80)]\xbb\xa1\x04|\x0d\x1f)*\xb1RU\xe2T\
+\xe9U\xf4\xd8qD\x894o\xc2\x88\xb7\xa2\x04\xa3E\
+\x84I%\xbe\xe8\xe7\x02\x9a\xc1\xce\xc3&\xa8\xae\xa3\xa6\
+H\x0eZO\x01\xd3F\x1a\x0f\x12\x0cz\x0a\xce\xe57\
+\xae\x0c\xdf\xfb@\x9bH\xffA\x1bi\xeb\xe7D\x1c\xbd\
+\xc4\x5c:\xe7La\x122Thq\x03\xdd\xb3y\x83\
+D\x9eN\x9c:\x9d:ux\xbf\xaa\xd3\xf6\x175u\
+H\x1f\x95*S6u\xf7\xfa5Qj\x127\xf6\xbb\
+7\xaf\x7f:\x7f\xf2Xb\xf9\xb1\x0f\xb0%\x90c\xfb\
+w\xa7c\x89@\xc5~\xfc\xc0\x1e\xc9\xe3\x02\xa1\x94\xad\
+\xd3X]8sR\xcf\x1e\xe9U$+\x11P\xa0@\
+\x81%\x8d\x87\x01\xd3\x1b\xd1\x8c\xbf\x04p\xef\x9f\xba~\
+\x8f\x84\xbf\xf6\x14t^\xd5l)\xd5\xfe\xed\x9b\xad\x1a\
+\x9f\xc19\x9c\xcbo<\x05m\xa1M&\xfd\xc7\xe7\x86\
+\xa8\xd95_\x84\xb0\x10G\xf3 \xa5k:]B\xa3\
+\xc6\x8a#Dp\xe7\xc65!\x14^\x5c\x18\xd6\x125\
+\xeaK:\x14\xc0\xecrl\xef\xeetr\xe0\x03\xde!\
+\x10\xf8\x8f\x07w\xef\x84'C5\xcb\x07\x1b\x86\xde\xe8\
+)v\xff\xd6\x0d\xc25_9{Z|Py3\xe2\
+$L,\x11\x89\x0dc\x04\xf0Q\x8d\x1c\xd5>\xfd\xa8\
+;P\xc4\xb0&\x0e\xe9\xdcZ\xfd\x5c\xb5\x94j[\xa5\
+\xa4\x1a\xd4\xa1\x85\x16\xddV\xc9\x03{\x02\x9c\xa2I0\
+\x94\xbftE\xab\xe6\xfd`\x17Z\xa3b9\xc5\xa7\x93\
+6\xb8\x83:\xbe\xe3\x1c\xce\xf5\x14\xb4\x81\xb6\xd0&w\
+\xc0'\xa0\x1a\xf7K9\xb6o\xb7\xf5k\x9fA\x14h\
+\xfa\xea\xfe\x9d[r\xbc\x7f\xdbF\x952c\x16\xd9\xa6\
+\x81\x94\x19^\xf3%O\xffz\xa2\xb2\x15(&\xea\xff\
+|\xa5*\xa8\xf5\x7f\xcc\x97s\x89Q\x7f\xf9\xdci_\
+\xdf\xaew\x08DO\xa9\x91B\x84rz\xa13x\xe8\
+:X\xe3H!\xceM\x99\x9eb%p&\xb9!\x95\
+x\xee\x12\xe5$&\xba\x01[\x01C\x84}\xd7k\xdd\
+\x1d\x97\xce\x9cR\xb5\xf2eP-\xca\x15\x92\xbc\xb14\
+\xbc@\x99J\xb2\xde\xb7\xae\x5cL\x1cy]\x09\xcf7\
+\xc04\xf7\x9c\xf0\xbbj?h\xb4\x84\xe4\xf6\x04\xaf_\
+\xbf\x11'\xe5Vd\xadz\xe8\xcdW\xf0\xb9u\xa5\xe2\
+\xf2\x1d\xe7x\x02\xee\xc9\xbdi\x83O!+6._\
+,\xa9\xda)\xbc\x00<?Dc\xeaH4DF)\
+\xbc\xd7{4\xad%u\xab\xe6\xffn\xfd\xdag\xc0k\
+\x90\x0c\x81\x8cZ\x04\xff\xbfx\xf6\x94*T\xa1\xba\x17\
+\xe1\x93\xb4\xe9\xee\x8d\xeb\xc2\xcc\x1e\xda\xb9U\x9c\xca\x83\
+h\xa9\x0a\xa2\x09\x1924\xf1\xe8}\xd5D\xbeC \
+\xeb\x96\xcc/CBc@`}\xe2\x9ck*SQ\
+b\xc4\x96:\xa8\x12\x8d\xe9\xdd[7T\x98p\x11U\
+\xca\xcc\xd9e\x9d3x\xf4\xe0\x9e\xac\x85\xbe\x81u\x12\
+\xe2`\x93\xd5\x98e\x9b\xd4\xcf\x03F\xca\xde\x5c\x88\xb1\
+m\xbf\xe1j\xc2\xca\xed\xea\xea\xf9\xb3\xaa^\xc1,\x92\
+\xb9\xc9S\x90\xdcx\xe2\xaa\x1d*j\xccws\xd4\xf9\
+\x84\xad\xab\x96\x89\xb2\x0bm1\x85\xcf\x9a\x07\xb3\xbe}\
+?\xb8\x17\xf7\xe4\xde\x9e\x80\x80\xff='\xceR\x8d\xbb\
+\xf4\x11+\xb8\x01\xbfo\xf4koI\x10\xdd\xb2\xb7\xf7\
+\x92\xed\x09B\x85\x0e\xab\x1ej\x029\xa9_(\xb2p\
+\x11_\xe5\x815\xa3\xf0b\xdf\xbf{[E\xd6\xcb\xfe\
+%+\x93V\x9eb\xce\x97>@\xe0\xc0j\xab\xe67\
+\xffy\xf1<\xb0|a\x83\xb7\x08D/%\xfe\xe7O\
+\x18\xd3\xe0\x85\xb5\xe1\x9a\xc0\xf2\xe0\xfe\xdd;\xb2A\x18\
+\xb0a\x18\xa0\x9c\xe1{\x14i\x97\xcf{\xab\xb6\xff~\
+\xf2\xc4k\x1f\x8c\x1d\x9e?\x7f\xa6\xdaT)\xa1\x1e?\
+|\xa8\x9a\xe8\xceJ\xa2\xf9\x19w\xf0\x90M\xba\xf5\xd3\
+\xe7>W\x1dk\x94\x15\xa6\xd7S\xf0\xdb\x19Z\xce\xcf\
+Q\xb8\x84U\xf3~\x5c\xbf|I\xd5\xd4\x04[3o\
+\x06\xf9\xec)\xb8\x07\xf7\xe2\x9e\x9e \x9e\x96\x021\xbb\
+\xbf\x0f\xe5\xeb5UIm\xfa\xc5'\x90\xe6\xe4\x99\xee\
+\xa3\xab\x9a\xff\x8b\xa5g\x8c\x98q\xe2\xcbl\x02\xa2\xc5\
+\xfaI\x96\xa0\xc0A\x83\xaa\x07\xf7\x9d\x0a\xd4t\xd9s\
+\xab\x07\xb7o)2R\xc0N\xacY\xe0\xb3\xd2\xec-\
+\x02\xd9\xb2jY\x91\x18q\xe3D#w\x0a\xbe\x1ei\
+\xb3yg\x01\x7f\xf9\xd2\x99\xd5 \x5c$\xa7tB\xca\
+\x0e\xb6V\xb2\xf7\x85\x8c\x09\x06\x9a\x1a\xadO\xf6`\xcf\
+\xee\xb5\x8b\x17\xf4,\xf4\x83*\xe6\x8b\xa8Z\xbcJm\
+\x15<\x84s\xd7\xfa\xbc\xf1~\x0b\x98\x03\x81\xf6\x9b\xbe\
+P\xb5\x14\xc5\x94g[&\xf1\xdb\xf0T\x04\xe6\x9a\x5c\
+\x9b{\xf8\xf62\xb8\x02\xddC\xddv]=\xd2.3\
+K\xd7i\xd7E\xc1\x07z\x82\x80z&x\xfd\xea\x95\
+z|\xef\xae\x8a\xa0_`\xb2m\xa2\xb8d\x7fR\xe8\
+\xb0\xe1\xe5\x9e\xaf\xf4\xf7\xfe\x94s\x07&\xbcG\xf8(\
+\xd1D$F\x9f\xb5`\xea\xb8z\xf2\x85\x0d\xdej\xed\
+\xf29\xd3\xab\x96\xa9\xd5H\xf2\xe6\xb3\xac\x10\xc2\x01@\
+i75\xf3\x09\xd2e\xcf#\xaaf\xd2ad\xca[\
+P\x96\x1bO\x9cb\x0c\x96\xcfr\xfa0\xa4\xcc\x9c\xc3\
+W\x11\x90\x07L\xa3\xef\x05V\xce\x9d!\xff\xfd\x02:\
+\xb9R\xe3V\x92\xb3?\xa2&\xe2O\x05\xae\xc55\xb9\
+6\xf7\xf0\x14H5~\x99\xd5\xb0\xb3\xb0\xbf\xd6/\xe0\
+\xc5\x0ej\xcd\xf4\xf9JWR\xeb43\x1a:|\x04\
+\x91n\xd8\xf0\x8dTj\x98\x7ffn\x92C\x16,_\
+M/G73]:{*\xbe|\xe1\x06/\x02\xd1\
+\x17\x0fvp\xeb\xe6B\xd9\x0a\x15W\xb1\xb5t\xe2\xaa\
+|\xd9\xbc\xf2\x0fu\xea\xa8S[\xc7\x85\xd7/[(\
+S\x17\x22.`\xc7\xb9'\x801:u\xd8y\x1d\xee\
+\xf1>\xb0\xc5\x13`\x0cse$\xfd\x02\x9cffl\
+9\xa42\xe5.`\xd5|8\xb8\x06\xd7\xe2\x9a\xdf\x1a\
+\xb0\xd6\x06\xd4\xe3\xf1B/\xe1 E\xfa\xccj\xc9\xf4\
+\x092s\xa1\x92\x87\xef{\xf2\xe8\x91(>\x0dPh\
+\x92U\xb3\x80&\xa65\x8b\xe6y[[]\xe0E \
+[W.+\x92<c\xe6 \xbc\xb9(\xc2v[{\
+A\xe1\xb4\x99\xa2HMj\xcc\xc7k\x16\xccV\x87w\
+\xef\x90)\x99\x81\xc3\xeb\xcc\x00.\x9e\x002v\xb8w\
+\xf3\x86\xf5\xc9\x99\x0b\xf7} \xa1\x8f\x81_\x94[\xee\
+\x08\xa5\xa5\xaa\xc1s\x97\xab\x06\x9dzxL\xcc\xae\xe0\
+7\xfc\x96kp\xado\x0d\xa4Y\x0b\xa2\xfb\x1d\x09\x05\
+\x1e\x0f`\x0f\xe3eDZ\x02\xb85\x22\xfe.\x9e:\
+^\x8e\xb1\xa3=\xd2c\x17/Ir\x95)\x7fa\xb5\
+~\xf1{\x08d\xfb\xda\x95\x05\xd8\x88\x0d\xf0+\xdd\xba\
+z\x99LI\x93\x06\xf6R\xf5\xdawS\x19r\x15\x10\
+\xd9\xfc\x95\xe6EvmX\xad\x9e?{&\x5c3\x91\
+\x0b\xb1\xf4\x1a0\xc5qc;\xbcy\xe375\xf7\xf7\
+.\x86-\xd6\xd0\x8f\x01D^\xa0tE\x99\xf9\xfc\x0a\
+~\xc3o=\xe1\x1f\xbe\x06 \x90PZ\xd4Ei\x86\
+\xff\x0e8\xbc\xcb)\xfd!\xa5!\x02o\xd3\xff;\x0c\
+\x1e\xab\x05\x8a\xd3\x22N\x93+/\xad^\xc21\x1e\x12\
+\x1f\xe5\xe6\xb5K\xc9\xee\xdfy\xd7\x15\xd1\xeb\x895\xd3\
+\x996^R\xa7/+~\x1ctF\xaf\xa6uD\xa9\
+\xe2\xdf\x9f\x7f\xe1\xbeg\x8d\x19\x22~\xa8\x10\x07\xc0x\
+u\xee\xf8\x11\x15?Y*9\x06\xc8\xe40Kvp\
+\xcd6\x0d_\xf3>\xc0\x99\x1b|\xec\x9b\x8b\x1e\xa2j\
+\xce\xd4\x9a\xb7:k\xd5x\x0e~\xc3o\xb9\xc6\xb7\x08\
+\x08\x80~\x8fOr\xc5\x13G$\x8c\x95Q\x0f\xa0\x0d\
+\x1e\xd1\xbd\x83\x08\x1c,'\xcc\xfa\xbd[\xd6\x13\xbfU\
+\x12@\x02\xc6\x9a\xb1?\xb6o\x8f\xb7\xa3\xae\x05/\x02\
+\xb9{\xfdZT\xfc\x14`b\xba\xd4\xaf\xaa\x07$\xbc\
+X\x04\x89\xc4\x83\xa98e\xc6\xac\xa2r'\xdcQ\xa8\
+0aT\xc8\xd0\xa1\xd5\xaa\xf93\xd5N\xbd\x14\xa5\xb7\
+\x98I\x80!\xef\xc6\x15'C\xeb\x0e\x1e\x82\xf0I\xc0\
+\x13\xaf\xaf\x0b\xa7O\xca\x7fbo}\xa8m\x07\xee~\
+\xe8/mDK\xcb\x1a\xfc\xa1\xe0\xb7\x5c\x83kq\xcd\
+o\x05H\x9b\xf0va\xc2G\x14\xe9\xe4\xb9fT\xe7\
+\x8e\x1b.;\x09\x18'\xc6p\xe5\x9c\xe9\xaay\xcf\x01\
+r>\xa6\x10\xa3\xd3\x9a6\xf47\xd1\xfd\x80p\x11\x19\
+\xb7KN\xfb\x89\x0b\xbc\x08\xe4\xe9\xf3\xa7\xb27\x81\xf8\
+\x18\xe4\xaao\xda\xbd\xbfJ\x95%\xa7h8QZ\x81\
+\x8eC\xc7\x0b\xc3\x939\x7fQg\x92@-\x85\xe0\x94\
+\x92!\x8f7\x03\x18\xe5\xc7X\xa2n\xf7\x09d\xa5\x04\
+\xfb\xb6\xac\xb7Us\x1b8\xd5\xf0\xce\xb4\xedyJ|\
+X\x80;\xb4\xbe\xf5\x8bdW3F\x0c\xb4j>\x1e\
+\x5c\x8bkr\xedo\x01\xc4\x05\x81\x115\x12U\xe6\xbc\
+\x85\xd5\x98^\x9dU~\xcdx2c\x90u\xb3\xe1\xaf\
+}\x9cv\x19\xddf,\xcbej5\x94\xff\x8d\x7f\xe9\
+\xa3\x9a\x97/$JO\xf0\xe6\xf5\xdb\x81y\x81\x17\x81\
+\x84\x0c\x1d\xf6\x1e\x06\xb9%\xd3\xc6\xab\xf0\x9a\x9a\x1e\xe9\
+e\x02\xc6'u\x96\x1c\xb2f\x01D\xda\xd4Ys\x89\
+xJL\xb2\xe1\x0bV\xa9\x88\xba\x01\x0b&:\xdd\xec\
+A\x14\xbd\x0e\xc2I\x1b/'w\x94\xab\xdfT\x1ch\
+nk\x86u\xd3\x9fK\xac\xdaw\xc1w\xb7\xae]\x15\
+\xcb\xa8'\xca%w`}\xae\x925\xb9:d9\xd3\
+|JpM\xae\xcd=\xbe6\xae\x9c?\xa3\x07\xdb)\
+\xa1b\x90\xfbs\xce4\xd5\xaa\xcfP\xd1\xa0F\x8b\x1d\
+W\xc6!\xbb\x96L\xc1e=k\xa7\xcc\x98M\xf8\x15\
+l7\xe8\xb0H\x03\xdb\xa3q-\x99\xf5\x83\x87\x08\xf5\
+\x8et\xe1E \x09\x93\xa5\xda?epoU\xa3e\
+Ga4\x9f=\xfb[\xa8\x12\xa5\xcb\x8b\x17N\x9e\x03\
+\xb0V\xbd\xd6\xcc&\xdf\x13+\x0b\xff\x909\xe3\xbc\xbd\
+\xab\x90\x82p\x05\xc0\x0b\xcd\x0e,\x15\xbf\x0c\x9f$\x9f\
+\x07\xb4k*\xca\x1cw`\xcf!\xd44\xe88d\x9c\
+\x9f\x96\x17\x96H\xd2\xa66-\x9dO\xdd\xbf\xeby\x80\
+\xbfJ\x8dZJ\xf1\x14\x5c\x9b{\x8c\xef\xdb\xcdK\xb7\
+\xe0W\xbc\xd4\xcb\x83\x81\x91>\xfc\x0a\xfa\x19O2\xb0\
+B/%Q\xf52S\xa1~3YJBk\xbe\x8d\
+\xdc\xc2lr\x03\xa7\xb4PA\x04J\x18~\x96&$\
+Nf\x92\xa0\xfa\x85=\xb2g\x87J\x902\xf5;\xc6\
+//\x02\xd1\xd3\xd4\xc5\x12U\xeb\x0aUa\x84c)\
+\xb9s\xd3\xa9\xaeM\x9e.\xb3\x97o#\xd3\xd9\xc3\xbb\
+w\x84\x03\xbe\xaa)2{\xe1\x12\xea\x99^\x03\x11\x9b\
+\x0c\xe2&I\xe1\xab\xa1\x8dPT\xbd&\xfc.\xdc7\
+\x1b\x98\xf0\x08gY\xa20\x8bU\xc9\x91J\x98X4\
+\x95xd{\x0a\xc2G6/\x93_\x8d\xed\xd3E\x0f\
+\x9ag;\xe1\x82\x87\x0c\xa9\xfa\xcfX\xa4Z\xf6\x1a$\
+\x85\xcf\xd4y\x02\xeeA\x109\xee\xc9\xbd=\x05K6\
+\x9b\xb0\x86v\xf6\xf6j\x1f\xf0s\x135_3\x8e\x84\
+\x0e\xf5\x0bPC\x18\xef=\x0c}\x85+:\xdd\x0c\x10\
+oYb\x22\xbaH\x98\x17\xf4\x18\x113\x9fY\x85I\
+\x00>\x05\xa9\xb4i\xb7~zI\x17\xcb\xf0;\x91\xf3\
+\xbc\x08\xe4\xf9\xb3\xbf\x83F\x8f\x13O2PC\x1c\x88\
+L\x86\x91\xc4\x88vl\xef.\xf9\xcc\xf7\xf0\x07\x0c\xf2\
+\xd1}\xbbe\xc6\xc0/\x12;\x80\x01\xd9\xa7q\x5c\xf6\
+\x0d\xf9\xb4\xd8\xb8h\xff9U\xaa\xa63\x9eV\xbd\x02\
+\x99\xa5,\x9d9I\xfcN\x96\x1c\xba(^P\x9e\x02\
+\xae\xbdj\xb6\x14\x9ai\xf6|\xdaO\x982\xb5\x9a\xbe\
+\xe9\xc0[\x1aN>S\xc7w\x9e\x82{roO\x0d\
+\x8bg\xf4[OP~T\xe9\x04\x14\xa6\xa4\xc8\x90U\
+4\x9b\xe7Oy\xbfh\x9e\x80\xf4\xf2\xc9,\xaf\x7fv\
+6\x1a\xed\xf7\xeb\xd7/e\x0c]\xddAC\xe8\xa5\x05\
+\xe5\xe6\xd5\x0b\xe7\xf4\xac\x12[\xf9\x0f\xe0\xb4|\xf3\xd2\
+\x03\xbb8f^\x04\x12(p\xe0\xe7/\xf4\xb2\x81\xee\
+\x01\xaaB\x81\x82#\x0a\x0a*\xdc\xda\x1e=t\xda[\
+\x98\x96\x1e?\xb8\xa7\x99\xcd\xb2\xa2\xda\x05h\xf1\x5c\x95\
+c\xc9\xd2g\xd6\x0d\xdf\xf6^\xdb\x06R\x0d[:'\
+\xac\xdc\xa6\x96\x1d\xbf&\x0556.\xfb\xaeJ2\xdf\
+\x00\xb1\x92\xcd\xba\x81f\x1co\xd9\xc4\x15\xf5\x09\x10\xe1\
+\x84\x15\xdb\xbc\xa6_WP\xc7w\x9c\xe3)\xb87m\
+\xa0-\xbe1\xdf\x00\xc2\xc7\xc9\xca\xae\xf8\xe5\xa5`|\
+\xe8{\x96`\xee\x89M,`\xc0@2\x0bUh\xd0\
+B\xb2D\x18\xc0G\xa2\xbe\x07(\xd1\xb0\xd2\x03\xf8I\
+#\x95\xe9k9\x0dn.\xf0\x22\x90\x80A\x82<\x83\
+\x1f@\xbc\x85\xbf`\xff'>\x04\x9b\x96;\x19\xc9\xb8\
+z\x9dc\xdd\x82\x11:\xb0c\xab\xec\xd7-Z\xb1\xba\
+|\x87\xb5\x15\xd1\xca\x80X\x9e\xdfi\xd9\x1a\xea\xfe\x9c\
+\xa0C\xf0\xe7\x18\xa6%/O}7\x82\x06\x0b\xa6\xfa\
+L\x9a\xa3~\xee?\xc2k\x13\x98\x1d\xf8\x8es8\x97\
+\xdfx\x02\xda@[h\x93\xab\x01\xf3s\x81%%c\
+.\xa7\x04\x89\x8e\xe6\xe6\xd5+\xf2\xa2\x22\xf2\xa6\xcb\x91\
+W\xf5\xd7\xcb\x16\xce^\x00[L\xea\xcc\xd9\x85\x18\xb6\
+\xae\xfcC\xa5\xc9\x96Kx\xa7\xb0\x9a\xb8\x1eZV^\
+\xbb\xd0\xdd^\x04\x12.|\xa4\x9bPd\xa4\xe8?*\
+\x87u\xd1Ly\x0b\xe9\xe9\x7f\xac|&\xb4%\x9df\
+l\x22\xbd[\xd4\xd5\xe2\xb0S\x8dK\xa3\x8e\xee\xdb%\
+\xbb\xfb\x01\x8eE\x19\xd9\xa3\xb1j\x99\x1c\x7f\x0e\xe0m\
+UU\xf3*h\x0a=\x05\x1e\xe6lZ\xca\xe3\x87\xb8\
+\xf0\x9c\xcbo\xfc\xe2IO\x9bh\x9b'\x1ea\x1f\x03\
+\xa2\x1eb0\x05\x93\x07\xf5\x12\x93\x00\xe3\x83\xf4\xd9\xbd\
+Q\x0d\xd1#\x19\xde\x08\xde\x03l\xb46\x95\xb3\xc9\x1e\
+\x7f\x1f<\xd2n\x5c\xbe\xa4\x82\x87\x0es\xdf\xd7\x19$\
+F\x9cx\xa7\xd9\xae\xc7te\xd6&\xa6\x9f\x93\x87\x0e\
+\x88g\x99\x81aV#F\x8f!S\xea\xcc\x11\x03\xe5\
+m)R\xa9\xa6\x9a4\xd0\xb9\xeb\x1f\xe0\xf4\x8c5\xf1\
+s\x80=)u\x0af\xf6\x93\xef\xc6\xc7x\x98\xf3\x1b\
+\xbfz\xd2\xd36\xda\xe8\x97\xfd3~\x01\xcb\xfb\x11\xbd\
+T\xa4\xcb\x99W<\xd4\xe0_r\x14)%\xcbG\xed\
+\x02\x99\xf4\xff\xad\x0a\xcf@\xf4$\xae\x986\xbc\x9f\xcc\
+\x1cH\xa8\x10O\x92t\x19\xd5\x89C\xfbT\xcc\x9f\xe2\
+9u\x19n\xf0\x22\x90D\xa9\xd3\xeea\x8aB\x99\x82\
+\x13\x10@C\x07\x06uj\xe9\xc5O@ \xdc8W\
+\xd1\xd2\xa28\xc3\x8d\x9e\xc6\xd6\xef\xd0M\x1d\xd9\xbdC\
+\xc2A\x03\xac\xc2\xb8\xba}\xca\xb7\x88\xe5\xad]\xf52\
+\xb2\xab\x0d\x8fzO\x80\x1e\xa5\xeb\xe8\xa9\x1f\xeda\xce\
+o\xc5\x93^_\xcbSOz\xdaH[i3m\xff\
+\x94\xd8\xbar\x99J\x9f3\x9f0\x9dS\x86\xf4\xd1\xfc\
+R\x13\x15;^B\xf5\xfb\xa8\xc1\xa2\xac\x84\x97{\xaa\
+g\x08|E\x8c*a\xc5\xdc\x19\x9a9vjN\x01\
+\xd2LF}\x8d#\xbb\xb6c.y;H\x8a\x05/\
+\x02\x09\x1f9\xea5-\x16\x1d\xc7\x88S\xb6n\x13!\
+\x08\xe3_I\x90\xdc\xb1\xbd~\x91\xcfg\x8f\x1f\x96\xed\
+{\x87vnQ\x85\xcaWU\xbfM\x9a\xabB\x87\x09\
+'S\x15\xb3\xc8\xe4A\xbd\xe5<\x94jY\x0a\x14U\
+KfL\x94cO\x81\xb5q\xee\xf8\x11\xc2(\xbb\x02\
+q\xaez\xce\xd4\x92\x04\xc0S\xc4\x8a\x97@<\xcc\x0b\
+W\xa8f\xd5|<\xb8\x16\xd7\xe4\xda\x9e\x826\xd3v\
+\x9e\xc1\x15<#\xcfj,\xac~\x01\xc1`\x08d|\
+x\xcf\x0e\x910+4l\xaeBG\x88\xa82\xe4\xce\
+\xa7\xfaL\x9e+\x96\xf7\x1f\x7f\x8a\xa7y\x8d\xdc\xa2+\
+a\xcf\xee\xa0\x0e\xcd\xe5\xb7&\xee<\xd2i\xa0\xa0A\
+\xd5\xf6\xb5,U\x05\xbc\x1d\x8b]\x01\xf7k\x8a\x1e\xdc\
+\x0e\xae\x01\xe7\xc8\xdbJ\xa8\x02\x82\xa3\x11\xffj\xca\xe0\
+>\x8e|q\xc2ItCbb\x11\x0a\x82BL\x0c\
+BR\x11\x8b\x82({&U\xfa\xce\xf5\xab%\xe0\x9a\
+\x9e\x89\xe4\xf8}\xd0\xb3\x97$ &4\x82\x09\xca\x0b\
+L\xfeX\xf7\x10\x0a\xbe\x152Zyz\xdf\x0f\x01\xd7\
+\xe6\x1ev\xf7\xf6\xa9\xf0\x0c<\x8b\x01\xcf\xc8\xb3\xf2\xcc\
+<\xbb\xa7\xd0\xb3\xb8\xc4^\xd1K\x85d\x0f%\xb0.\
+ \xf2$1\x5c\x00\xa17HgO\x5cUBxp\
+>YG\x197\x02\x10\x1a\x10\xcb,_\xdc\x08\xb7\xb4\
+\x00\x12P\x1f\xbeE\x0f\x94\xb7\x0e\x1e\xde\xbb\x1b\x96\xfc\
+\xab\xc4\xd6\x02d`\xe4\xc1\x08nO\xdcM\x02\xd5\xd1\
+ @\xb6J\x13t\x96\x80%\xcb\xacl\xd9\xe4V\xa3\
+\xe3\x00\x0f@\xc3\x88]\xe6)\x88\xbb\xda\xadqM!\
+:R\x87\x92\xc3\xcd\xbd\xa3}+\x10\xa8^\xf7\xad\xab\
+}~p/\xeei\xd7\x16\x9f\x0a\xcf\xc4\xb3\xf1\x8c<\
++\xcf\xec\x170\xf8\x84#%j!\xf7\xd6\xc2\x85\xd4\
+Ch&\xa0\x0fAc\x08\x5cG\xb4e\xee\xd9\xb2B\
+Q\xaf\xcfd\xb5\x02DJ$\x88\xde\xc4\x01=\x09,\
+\xf7\x16-\x98\xf2N\x05a/\xa12f\x01\x02\xe3r\
+A\x02\xbf\xea%G\xa8\x9ft\xa7\x5c\x98\xe0\xad\x04\xb0\
+\x03\x84Y$;6 \xff>\xb3\x0d!\x1a\x01a2\
+\x09\xb8\xe6I\x18LW\x10\x00\xc5t\xa8\xa7\x85\xf8\xad\
+&\x9a\xdf\x97\x04\xf7\xe4\xdevm\xf2\xad\xb8\x06y\xf1\
+\x14D\x09\x22\xb0\xa0\xe6i\xe4E$U=\xa0\xbf\x99\
+\xa1\xf4L \x9f\x89\x89\x0a\x88\x9dZ&m|\x99\xe9\
+Y\x01\xb8/Q\x8d\x00/~\xd1\x14\xb1\xcf\xbdx\xfe\
+,\xb0>|\x87\x16(^<\x88A\xf9\xfa\xcd\x86%\
+M\x97yM\x8b2\x05\xb4||OD'\xdc\x00\x8e\
+\xed\xdf\xadJ\xd6\xa8'\xbb\xe6\xe6\x8c\x19*\x8a\xb23\
+\xc7\x0e\x89n\x04\x17\xbc\x93Z\x02\x02X\x0d\xb3\xe4+\
+\xa2\xa6\x0c\xb5\x02\xcdW\xae)&h\x13C\xcbSx\
+\xea\xb0k\xc0\xda;s\xf3A[/\xf9\xcf\x0d\xee\xc9\
+\xbdi\x83_\xe0\xd7g\x04\xf3\xc6\x8dP\x05\xcaT\x16\
+\xaf\xf4\xb5\x7f\xccS5Z\xb4\x93\xfa\xe3\x07\xf6\xaa\x04\
+\xc9R\x89f{\xc5\xbc\x99\x92\x01\x02\x91w\xc6\xc8\x81\
+\xea\xe7\xfe#EEA\xac2\xc4u\x1c\xcf\x09&\xb3\
+a\xe9\xc27\xbfM\x9c]!`\xa0\xc0>z\x9a\xbf\
+C Z\xfcq\xc4K\x9a\xfc\x10\xd4\xc3\x9eT\xec\x0d\
+\xe9s\xe5Wk\x17:#\xe7\x91\xb0f\xd1\xe41\x22\
+&5\xea\xd4K\xadY8[T\xebz\xc6\x11\x0f4\
+\xe79\x1d\xc59\x19\xd7{\xb8\xff\x9am~Q\x13\xfb\
+w\xf7S\xac\x0e\xa3\xfe}\x1f \xe0z\xed\xbbJ\x86\
+\x064\xb3_\x0b\xdc\x9b6\xd0\x16O\xdd\x1a=}F\
+\x03$\xa1\x85S\xc7\x8au{\xca\x90\xdfT\x8e\xc2%\
+%\xba$8\xa9E\xd5$z\x1c\x18\x03\xf4Y\xe8o\
+\x96\xce\x9a*\xbe\xbf\xe8@\x90N\x91f\x22E\x89\xae\
+\xe6h\xd1\x1b]\x8df\x01\xfc\xc5M\x92\xec\xb0\x5c\xc0\
+\x07\xbcC \xe0\xd1\x83\xfba\xaa4o\xa7\x9av\xeb\
+\xaf\x82h.\x17\xd5\xf7!Ku\x9eMK&\xaf^\
+\xbd\x14\xbb\x03.\x8a\xd9\x8b\x94\x14\x8b/\x92\xcc\x99#\
+NGgR{\x11P\x06\x1d\x09(U\xb3\xbe\xc8\xde\
+\xbf\x8f\x1a$\xc7\x9e\x80\xf3\xdf\x07\xc4\xeda\xf3VJ\
+\xba\xb0o\xc1\x1d\x906\xd0\x16\xda\xe4\x89\xc1\xcf\x93g\
+t\x05\x99\xa4\x085E\x22\xe6\x15s\xa7\xabZ\xad;\
+Y\xdf(ut\xefN\xb1\xb4\xa39\xc5\x02\xce\x0b\xbc\
+n\xd1\x1c\x85\x01\x16\xac\x983CU\xd7\xe3\x88\xd9$\
+\xf2\x8f1\xd4\xdc]N\x9b\x8f^z|\xdc4\x05l\
+{\xd5\xf1\xfa\x8d?\xfc\x04P\x0c1\x93`eeO\
+\x07\xdb\x0f\xf0a\xccZ\xb0\xb8\xdaa\x85}0\x1b\xaa\
+~J\x92L\x8d\xe9\xf3\x8b\xd7&'\xdc\x06\x16O\x1d\
+'T\x8f\xac\xde\xac\xc7\x005i@O\xaf\x0d=\xbe\
+\x01u0\xf1=\xdf\x07\xa6N\xe3G\xfb\xa1\xe0\xcdb\
+\x9b%V\xe5\xb2\xe9\xe2\xab\xe6e\x0a\x8au\x19\xd5\xb4\
+f\xae\xad\xb3\xfc\x06\xda\xd4n\xc0(\xeb\xc8g\xf0\x8c\
+\x9ez\xa7!\xb6n^\xbeXUn\xdcZf\x80\xb4\
+Ys\x0bA\x80\xf5K\xe6\x8b&\x9b\xc1\xc7B\x0b\xa1\
+\xa2\xbc\x84-\xc8\xa1_`\xd8\x80\x0b'\x8f\x89\x88~\
+l\xff.\xb1\xf8\x9axrz\xf9\xf7\xd5\x8e`K \
+\x01\x02\x05\xfc\x07s;7C!\x86\xb55s\xdeB\
+\xea'+\x9eg\xdal\xb9\xd4\xde\xad\xde\xdaU@\xf2\
+?2/j\x89F\x88\x00\xbd?\xdb\x16\x16Oq\x06\
+V\xcb_\xaa\x82\x18\x88\xfa\xb7}\xff^\x0f\x14:\x17\
+\xcf\xd8*\xf6\xf4Z\x1aP\x15\xab\xe2\x0ck\x11\xc2-\
+p\x8d_\x81K\x82\xe6\xf6e\xeb(\xc1s\x07\xcc\x5c\
+\xa22\xe7/,~*\xa5R\xc7Q\xbf\xeb\xf5\xfbC\
+a\xdaF[i\xb3\x1dxF\x9e\xd5\x13\xf4iU_\
+\xcc\xf2\xcc\xde\xbcx\xd5[9s\x00\xce\x18>@\xb5\
+\xafYVfw\xcc\xfb\x06\xfb\xb6m\x12\x85'\x9e\xee\
+w\xae_Um\xfa\x8f\x10\x22\xa3\xbe@\xd9\xca^/\
+r\x90\xf7\x05\xb4s\xe5XM\x19\xdb\xbbKW\xc3a\
+#\xabg\x89\x14Xt\x1f\x06H8p\xc3\x88\xb4\xaf\
+\xac\xbcn\xe4P\xa3\x0e)\x87\x82X\x8c\xe8kBe\
+\x82\x8b\xa7O\x8ahgBz\xdb\x81\xeb!\xa7\x1bN\
+\xdf\xb5\xf0[\xa3\x1fA\xb67A\xea?\x04He\xc4\
+\x16%k\xb5\x09\xedi\xa0\x97O\xaf4\x1a\x1f\x0a\xda\
+F\x1b\x01m\xa6\xedv\xcf\xc4\xb3\x9a>\xf4\x09\xf4-\
+a\xb5\x01y\xff\x90J\x1e\xdc\xbd\xe3\xa5\xd7@\xfd@\
+P\x7f\x03r\xc7\xd0v#\xad\x18\x904\x00\xc9\x05\x90\
+\x0c*c\xc4\xc0\x04h\xb5\xa5\x01Slg\x10\xec2\
+l\xaa\x01\xf0\x13\xc9\xd2gR#\xbayg\xad\x8c\xa5\
+%\x15\xa2\x10o\xfas\xb1jS\xa9\xb8xC\x19\xb3\
+9\xd3\x1c\x9a\xd6\xb6UJ\xe8)z\xb0\xf8\x94@\xdd\
+ F\xdc\xf8\xaa^\x87\xee\x8a\xf0\xd6>\xb9$\x22\xed\
+\x5c\xbd\xe0\xed[b\x90,]F\xe1\xbeG\xf5\xe8 \
+\x9aA<\xb2\x09\x86\xf2\xa18u\xf8\x80x\xab\xb3\xa9\
+\xd9\xdd\xaa\x8b!\xabP\xb9\xaa\xd6\xd1\x87\x81\xb6\xd1F\
+\xdaJ\x9bi;\xcf\xe0\x0e\x9e\xd57\x09\x0f\xcf0\x82\
+\xbf\xb4\xed\xe7\xdc~\xca\xee}\xb6\xb72\xc3]\xbbt\
+^5\xfa\xb5\x8f\xec2\x88\x1a\xc3\xe9\x0cN\x88\x87\xe6\
+Z\x02e\xab\xac\xd9x\x06h\xc7\x1f3'\xaaj\xcd\
+~\x96c\xa2JG\x8b\x15\xe7\xfd.\xfevTs\xe9\
+\xcc\xa9x\xe451\xda=\xa8\x0d\x85\xcc\xa2)\xe3\xe4\
+\x18\x108\x97\x5c$\x04\x92\xaf\x9a3\xb5\xe4-\x81j\
+I\xc8\xb3e\xe5R\xc9\x0aA`\x7fr\xb0\x18%\x1a\
+@yF\xa6\x08\xb2W\xb9\xbf9\x04\xa4\xb5\xcb\x8c\x80\
+\x8e\x01\xf9\x1e\xa0\x83\xe1\x1a\xad*\x16\xb3\xcd`\xe5)\
+P\xf2qm\xde\xc0\x87\xf7\xeeZ\xb5\xde\xd8\xbdq\xed\
+G\xcd \xb4\x8d6\xd2V\xda\x0cx\x06;}\x09\xcf\
+\xcc\xb3\xbbCK}\x92\xd6\xc3$T\xe2\x18\x1d\x08\x19\
+5H\xae\xc0\xccG\xb6,~\xcflNR\x00\x92\x07\
+\x10\x01;W\xccP\x92(\x090\xdb\x94\xcf\x90\xc8K\
+g\x02\x08\xfc\xdb\xadI\xad\x89\xfa\xa3-\x0d\x98b[\
+I)\x99*\xce\x19\xd7,\x04Lg\x10\x0di8Y\
+nX:\xe4\xe1\xf4\x03\x93\xeb\x8de\x85)\x9bp\xd4\
+<\x84Qss\x0d\xbe'd\xb4\x81Q\xa9\xa3Mt\
+\x85Q\xe4\xd8\x95\xd1\xbd~\x91\xce\xe6aQ\xfd\xa3\xbd\
+u_\x1a\xfc\x02L\x03\xe6\xda\xa4\xd0\xb8|\xf6\xb4\xf5\
+\x8d\x13(\xf6\x8c\xda\xfaC@\xdbh#m\xa5\xcd\xb4\
+\x9dgp}&\xd7\xc2\xb3\xbb\x83\x9ct\xfc\xc6\x00\x0d\
+7/&\x84\x02h\x1f\x1aS\xb4\xb9\xf4?\x8a2\x12\
+\x0e\x99\x08\xd5\x98:\xf4\x8c\xe2\x95\xcd\x8b(\xcb\x80\xb1\
+@\xf9\xb9v\xf1<\xd6\x1b\xdb\xf17\xc5\xb6\x922}\
+h\xff6P&\x1a;0\xee\xb7\xae\x92f\x8c\x060\
+\x9b\xf0\xe6e\x8b\x1aLf\x02\xd4\xb5\xcc\x0a\x83;\xb5\
+\x92s\xa1T\x08\x09\xf00\xac\x99\xeea\xb9Y\xe7\xd1\
+\xb8\x92\xf0\x06\xf0\x16\xf3\xc6\xbav\x1a9\xe4\x081\xcd\
+9\xa8\xec!4:\x01\x9b\xc33+.\xf9\xc7\x807\
+\xd1\xdc\x8bN%\xc7,o+\xfc\xc9\xa7\x00m\xa4\xad\
+\xb4\x99\xb6\xf3\x0c<\x0b\xcf\xc4\xb3\xb9>+\xcf\xee:\
+\x93q\x1ef\x0d\x08\x0b\xa0Ngv6\xfc\x1bZn\
+\xf8'\x08\x1b\xde\x8eY\x9cP\xe9\xf0#\xf5\x0bg\x93\
+k2\x8bp\xccs1VF\x9b=\xa1\x7f\x0f\xfd\xdb\
+(\xd7\xf4\xd8\xbc7\xb1\x90m%E?\x5cP\x92\x09\
+\xb5(_D.\xcc\x12\xc2C\x02\x06\x97\xa4z4\x02\
+;\x0b\x0c\x14F<\xbd\xce\xc9\xf7\x10\x05\xd3\xabI\xce\
+G\x1e;\x88\xc1\x04\x987\xd0k\xafL\x89,I$\
+\xefq\xed0\x8a\xeb\x92FG\xa1\xc6\xd7\x22\xb7U\xf3\
+\xf1`\x00\xc9\xd0\xe4~_\x06\xd25\xa5\xda\xc7\x826\
+\xd3v3\xd8\x80gs\xbf\xafI`\x84\x0d\x8c\xfe5\
+\xb1\xef!Xl_-\xcb\x15\x96c^Z\xbegL\
+\x00\xdf\x93i\x94Y\x84\xa5\x11\xc2\xe1z\x8c\xcd\x93\x87\
+\x0f\x84\xd8H\x13\x07\xf8\x9e\x17|\xd9\xcc)\xd5\xf5\xa1\
+\xed\xd8\xbb\x16\xdbJS4#\x97\x02\xe3\x1d)OI\
+g\xca \x9b\xb4\xa6X\x0a\xcb\xa5O(\x8d\xa1\xc1p\
+\xcc\xbc\x05\xaeD\xc2:g\x1e\x82\xb7\x86s\xc9\xc8\xe8\
+\x0af\xa6L\x9a\xc3g\xf9r\xed,\xee\x85\xdd\xe1K\
+\x00\xa3\x17\xb6$\xde2\xd76\xf4lV\xc7:\xe3\xd3\
+\x83g\xe3\x19]\xef\xc7,6\x7f\xe2h\xc9(u\xfb\
+\xc65\xebLg_\xb3$\xb3\xb4\xc3\xab`\x83\xc1\xf0\
+\x06 \x0e$N\xf3\x82N\x1a\xd8K\xf8\x0d\xfa\xd3,\
+E|\xcf\x12\xb6l\xd6T\x99\xcd\xfa\xb6nLZ\x0e\
+\xdb1w/\xb6\x95\xae\x05\x22)\x9a$\xe6\x05\x1a\xc0\
+\xb2\xc2\x92\x82Y\x1f^\x83\xd9\x85Bjv\x80X\xc7\
+y\xae\xeb9\x22\x1aY\x8fx\x10\xd2v\xb2\xdc\x5c:\
+\xc7\xb4xB2H\xc0\xa3d\x8b\x1a\xf4\xad\x8e\xa20\
+e~i\xc07\x91\x91\x89g0\xed`\x1d\xff\x5c\xe0\
+\x19]\x9f\x99\xc2\x8c:\xb6O\x17\xe9\x1b\xfa\x88\x17\x88\
+e\x82\xd4f,A\xf0\x1d\xe6%\x05\xa6\xcf!\x0ex\
+\x1df\x11x\x12\xf8A@zT\xb3\xc4q\xfd\x91\xdd\
+;\xf6\xd2\xd5\xb6cmWl+\xdd\xcb\xf4a\x03Z\
+\x1b\xc6\x07\xa6\x94\xb5\x8d\xe9\x8b\x19\x03b\x81W\x81\xe9\
+\x83\x08Xn`\xa4\xdc\xd3|\x01,\xbb\xeeo\x8dO\
+\xc5\xe8\x10>\x17\x90\xb0\xd0\x17\xd8\x01\x09\xcc\xe8-\x5c\
+\xf3\xe3|j\xf0\x8c\xee\xcfmWH\x85\xea\xba\xdc\x02\
+\x88\x19k:|\x093 \x80\xf7\xe3\xb9\xc6\xf7\xed&\
+|\x079\x06\xf9\x9e\xdf\xc3\xf3\xe4\x8c\x1d\x16&\xc7v\
+\x8c}*\x1e\x190\x12\xa5L\xb3\x97\x1dZ\xc4\xd8\xca\
+\x98\xa7\xa0*Y\xbd\x9e\x1a\xd2\xa9\xa5z\xf2\xf8\xb1\xec\
+\xd6j\xd3\x7f\xa4\xc4\x04G\xc5\xdbe\xd4T\x156|\
+D\xd5\xb0x.\xd9\xe8\x8c\xc6\x8e\x1b\xb1\xe7\x97\xccM\
+\xc4\x0f\xf7\x04\x89R\xbe\xb3\xd1\xfc\x93\xe2\xec\x89\xa3j\
+\xd1d\xa7C\xb6;\x08\x02\xc7\x860\xa0\xa7i\xf9\xff\
+9\xe0\xe93\xb2q\x5c3\xfdJ\x13\xab\xf4%\xce\xe1\
+\x84\x04_\xf6\xfbd\xd5k\xd2\x1cQ\xb9\xe37|\xed\
+\xc2Y\x09]\x85\x9df\xf3\x8a%\xea\xe2\xe9\xe3\xaa\xcb\
+\xe8i\xb2\x15\x96\x88\x0dIR\xa6\xf3\xb3\xff\xa7G\x04\
+\x92,}\xa6\xed\xfe\xfc\x05x\x94\xbfTE\xf5\xe7\xec\
+\xa9*W\xb12\xea\xe7\x01\xa3\x14\xfb\x85G\xf7\xea,\
+{?5\x11\xa9\x85\xba\xc3Q:\xf5\x99:_\x05\x0f\
+\x19J6:\x97J\x19[\xf6\xb1N\x1b\xd6\xdf\xba\x9a\
+g i\x00.y\x9f\x0b\x81\x02\x07\x96|\xf8fc\
+\xba;B\x86q\x86\x9b |\xd3\xe7\x02\x01n\xfd\x82\
+\xe9\xc3\x07\xa8\x82\x09\xa3\xa8F%\xf2\xa8+\xe7\xcf\xa9\
+\x9a\xad;\xcb^\x17v\x15\x10O\xbf\xcf\x94y\xb2c\
+\x0f\x05 [O\xa6\xac\xdd\xad\x16L\x1c\xa9\xf2\x95\xac\
+ !!2\xe5\xc9\xbf\xca\xba\x94\xc7\xf0\x88@p\x87\
+\xcfU\xbc\xd4\xc2\x93\x87\xf7K\x12\xa1\xdf\xda4T\xa5\
+j\xd4Wm\xf5\xcc\x81k=\xfb_\xeaw\xea\xa1\xce\
+\x9f<&V\xde\x08\x91\xa3\x8a%\x18\xdc\xbbsG\x9d\
+>f\xbfO\xd7'\x84\x8f\x18I\xed\xdc\xb8Zv\xd1\
+\xfb\xa4q\xfdX\x04\x08\x14X\x9c\x8a;\xd4*\xf7\xce\
+\x1e\x16f\x8d=\x9b\xd6\xa8\xc8\xd1\x7f\x94D\x8e\x9f\x03\
+lHc\xffq\xb0\xe0\xf6qU}\xc2=+\xb0o\
+\xcc\xb8\xf1%\xc46/\xd1\x80\x0e-$8\x0c\xf1W\
+\xd8\x99HBF\x5c\x0f4\xff\xa4\xfb\xfe\xb0\xf8\xae\x9e\
+;y\xfcu\x9e\x92\xe5\xe6\xca\x8f\xfd\x00\x8f\x08\x04\x94\
+\xa8Vg\xc2\x86e\x0bU\xd1\xaa\xb5U\x80\xef\x03\xa8\
+\xf9\x13G\xa9\xb2\xb5\x1b\xc9\x86\xe7\x0e\xd5\xcb\x88\x0b}\
+\x9b\xbe\xc3T\x8c\x9f\x9c\x81{\xd3\xe5\xc8\xa3\x02\x06\xb4\
+7R\xbd\x0fe\xeb5\x95\xbd(\x98\xac+dJ\xa2\
+\xd6X\xbe(\x9f\x128\xd6\x84\x09\x17N]8y\x5c\
+\x12\x1a\xe2\x9a\xc0\xf6\x01\xde@\x92\x1ej~J\x0d\x9b\
+\xbfR\x0c\x96\x9f\x1a\xa4U\xa9\x9d/\xa3*Z\xb9\x96\
+\xaa\xde\xc2\xdb\x84\xe1\x17\xb0\x93\x00K\xf4\xcb\x97\xffH\
+\x10_\x1c\xb5p,G\x15?x\xee\x9f\xb2\xbf\x9a\xcc\
+\x1cd\x09\xfbs\xee\x0c\x95%o\xe1\xe5\xe1\x22F\xf6\
+\x8e\x01\xe6)\x5c\x19\x92\xf7\x95\x9a\xf93o\xc5\x87R\
+\x18S\xcd\xac\xe2\xda\x06c\x8a\xc6\x90l\xcf\xc6\xcd\xf0\
+\xf8\x81\xbd\x22\x96\xd91\x5c\xef+\xd54go\xc4[\
+\xae\x8dR\x07\xb9\x1d\x86\xcb\x95{\xffX\xa0\x9b\xc1\x88\
+F\x8eY\x98g\xc4t$2T\xd6\xe8g\x5c5\xbf\
+\x9f\x0a\xdc\x0b\x7fT\xb2\x97\x9b\xbe\xda\xbef\x85H)\
+\xee\x8a3O\x0a}L_\xd3O\xe8:\xe8'\xc3x\
+\xa3b\x80aE\xff\x82d\xa4g\xf6\xcc\xba\xdav\x5c\
+}+\xb6\x95>\x15n\x824c\x9ca\xd1\x8f`O\
+\x81`\x0c\xb7<\xa0}3G\xe6H\x81m\x1f\xc8\xa7\
+\x92V_\x93\x07\xe2\x9a\x88\xc1\x14\xc3\x99\x03\xac\xc7\xa8\
+\xc3\xf1\x90G\x9e\xff\x18\x15\xfb\xd7\x00\x8aFDOL\
+\x10d!g@\xb1\xcbh&^\x06\x0fQ\x16\xe2/\
+\xa1\xa5\xbfL\x11\xfc\xe6\xbd\x8f\xb4U9[J\xf9l\
+$.\xb2\xa1\xa3\xc1\xe5\xbe\x8cQ\xcb\xf2E\xff\xd0\xd5\
+\xb6c\xfa\xbeb[\xe9[\xf9\xb5~\xb5\xa9\x98\xa8\xd1\
+\xf2A(\xe8\x0d\x00\x19\x1c\xdd\x1b\xefIiR\x22\xaf\
+\xe3\xe4\xa1\xfd\xf2@\xa8\xb9\x99=\x98\xa5x\x1bH\xb5\
+j\x8ctt\xaa8M\xc7\x0d/\x1d\xcd[nT\xc7\
+\xdf*\xd0\x9c\xa2\x1a\x87\xe0\x99\x99\x8c\xf2\x8b~\xc3l\
+\xc1s\xa0H\xc4\xab\x1d\x91\x97\xb4\xb2G\xf6\xed\x125\
+\x02\xcfo\xd7_>\x95\xdc\xfa7(\xd1\xd0\x9d`(\
+\xa4\xbf\xf0|\xcf\x1a)\xd8_W\xce\x9dA)b;\
+\x9e\xef+\xb6\x95\xbe\x95\xbf\x1e?\x0a\x81\x0a\x1e\xd5\xad\
+\xd1\xd4\xf1\xbfO\xab\x06\xb6\x0d\xf7\xa9\xa0\x85\xc5\xb7\x01\
+\xa3\x91fF\xbdR\xbd\x1b\x90\xee\x93e\x0c\x9d\x0a\x1e\
+\xf4\x86\x18 L\xde8f+\xbe\xa3S\xbf\x94\xc6\xd5\
+S0\xc3\xa1H\xe4\x19\xe9'\xe3\xc3\xc2\xb2\xc2L\xc9\
+r\x82\x96\xd6Xy\x01\xc4\x84n\x89\x19\x81s\xae_\
+\xb9\xe4(\x95:\xaem\xdf\xf9T\xfa\xb6n\xe4\xf8\xe7\
+\x99si\xc4\x1f\x87\xd9i\xc9\xf4\x89\xb5\xf4\xa1\xedX\
+zRl+\xdfW\xc8\xe9\x8f\x0a\x9e\x87\xbfs\xe3\xba\
+\xd8\x08\xec\x1a\xecSaI1\xd6K\x8cP\x5c\x07\x05\
+\x1aI\x9c\xaf]8'\xf5\x00e\x10\xb3\x08*p\xd6\
+[\xd4\xf5\xc6\xa0E\xe7N\x1c\xd0S\xea!\x16\xec\x18\
+\xae\xcb\xd2\xd7\x00\x0a6\x96\x0dL\x0aXq\x8f\xee\xdd\
+%\xbc\x0c\xfc\x01f{\x96g^\x86C\xbb\xb7[\xbf\
+p\xba\x00`\xba\x87\x98r\xc7\x0a-\x9ag\xc0\xf3\xb1\
+u\xc1\xaf3\x09c\x81J\x9d\xfe\xec\xdb\xa6\x09\xe6x\
+\xdb1\xf4\xb4|\xc7\x9f\x0f\xc1\xe9#\x07S4-\x9d\
+\x7f\xd5\x93G\x0f#\xf8U\x99\xd4\xa4K\x1f\x09\x83\x14\
+?i\x0a\xd9\xe4\x0d\xc6\xf6\xe9\x22\xa1\xa3\xd0\xad\x10\x04\
+\x85Xh\xb1\xe2&\x908!\x04Y\x9b<\xb0\x97\xba\
+\xab\xb9v\xa4\x8a2\xb5\x1b\x8bg7\x9e\xe4\xdc\x9bP\
+\x9dD\x15&Xl\x8c8\xf1%E\x09\xba\x19\x5c\x1c\
+\x91\x84>'p\xc4\xd9\xbe\xfaO\xd1\xa9h&T\xb6\
+\x9fj\x89O\xc2g\xfc1}\xa2\x9a;a\x848S\
+\x1d\xd8\xb1E\x15\xabR[\x22E\xea\xf9_<\xcf\xf5\
+\xcc\xa2vnX%i\xce\x22D\x8a\xac~\xdfvD\
+\x9e\x89\xe7\x9d=z\x88\xb8\x06nY\xb5L\x8d\xea\xe1\
+\xed\x9c\xec)JT\xaf;\xbe\xd3\x10\x9fc\xb0{\x8a\
+\x0f&\x903G\x0f%o^\xa6\xd0\x9fwn]\xf7\
+S t\xc6\xab\xd3\xd0\x09\xe2\x10\xed\x0a\xf4\x1d\xc5\x92\
+\xc5\xd0\xe2\xe5\x1b\x09{\x89W\x17\x996q\xea\xbdy\
+\xe5\x12K\x9b\xea=q\x8extO\x1c\xd0C\xe9\x99\
+K\x15\xa9XC\x95\xa9\xd3\xc8\xcbs\x0aGcr\xd9\
+\x12U\xe0\xd8\xbe]\x12Q'M\x96\x9c\x12\xd0\x06\xa5\
+\x149\xf2?FleK\x01b1\xce\xc0\x87vl\
+U\xfb\xb6m\x14\xed1\xfb\x80\xf2\x97\xad$!2\x0e\
+\xed\xda\xa6\xf4, \x89\xa5\x8bT\xa8\xae\xcai\x91\x9d\
+\x80\xff\x9aY\x94\x8d\xd3?%H$\xd1\x13\x88\x1f\x16\
+ @ \xb5u\xcd\x9frm\xe2\x8a\xb5\xfem\xa8|\
+6@\x8c\xc53\x8f\xbd\xd1z\xa6\xb1j=C\xf8H\
+\xd1\xae\x0e\x9d\xb7\xacH\xdc$\xc9\xbdc\xaa\x7f\x00>\
+\x88@\xb6\xaf]Q\xb0}\xf5\xf2s\x9e\xfd\xfd\xc4\xe9\
+\x1a\xed!\x02\x07\x0e\xac\xaa\x90Xo\xc8o*W\x91\
+\xd2\xaay\xaf\x81o\xe5\x90\xfd\xb9Ziut\xf7v\
+!\x026\x1d\xff:b\x92t.\x81b\x09\x06\xbbt\
+\xc6D\x09\xef\xd8\xacG\x7f\x89\x1a0g\xecP\xb5g\
+\xf3z\x99q\xd0\xf2\xe6)U\xde\xebzh\x17wo\
+\x5c+o.[6\x88U\x8eR\x89\xbd(\x04z#\
+Vh\x98p\x11\xe4\x8d5\xfbi \x1e\xf4\x0b\x00o\
+\xfcGw\xef\x90pG]\xb72I^\xbftA6\
+\xa9\xb3\xff\x04\xa2\xc3y\x9b\xecR8?\x13Pg\xf5\
+\xc2Y\x12\x96\x1c\xafq6\xb6\xe39NR\xa0!\x9d\
+ZI\xa0\xb8\xb6}G\xa8\x0c\xb9\xf3\xcb\xf59\x9f\x98\
+\xb3\xc4\x95%\xfa\xe0\xdc\x9d'\xc4%\xd3`\xf9\xeci\
+jh\xe7V*\xfaO\xf1T\xf3\x1e\x03T\xe3\xe2\xb9\
+%=\x8a_\x10$h\xf0'\xbfM\x9dS>S\x9e\
+\x82\x1f\x9c\xf2\xd3\xcf\x042w\xfc\xc8\xc6\x03:4G\
+V\xf3,\xcf\x86\x0bZ\xf6\x1e\xac*5l!;\xd2\
+y`\xbd\xc8\xa9\x02\xe5\xaaH\xee9\xde>\x06\xb1Z\
+\xae4j\xc0\x8c\xc5j\xc6\xf0\xfe2\x0d\x93\x8e\xd5\xa8\
+\xa4!\x8a\xbem\x1bI\xf0<b\x7f\x92\x84\x07U9\
+\x8a\xa0\xb5\x8bfKG\xe3\x13\x9bU\xbf\xd1l\x16J\
+\xa4\x7fgf\x0c\xcd\xd5\xab\xcbgOI\xd0\x1bBx\
+rm\x94{\x0f\x1f\xdc\x95h\x83\x04\xd4\xe3\x1c\x06\x95\
+\xad\x1d\xa8\xda\xf1L\x87\xe0 *v\xc1\xe1\xd5\xcf6\
+\x0ff*\xe2p\x10\xcf~\xe7\xfaU\x12\x05!g\x91\
+R\xfa9\xaaymd\x22\x0cT\xdf6\x8d$$F\
+\xcd6\x9dU\xd5\xa6mE9\xc7L0\xb8cK\x89\
+/K\xa2c\x96\x90 z9\x22\xc9\x103\x06\x91\x82\
+\xe6\x8f\x1f!\xb1\xca\x8aT\xa8\xa6:\xeb\x97\x84\xdd\xf8\
+l\xc1\xe0w~\xc5w\xfe\xfd\xbfn\xd3gh\xf3r\
+u\x1b\x8f\xb4\xaa\xfc\x04\x8f\x09D\xb3\xd9\xfe\x06vh\
+1d\xce\xb8\xe1M\xad*?!V\x82\x84j\xd6\xd6\
+#^\xa1\x07\xd0X\xfeR\xcf;\x82![\x03\x08^\
+C\xe7\xe3(M\xa8\xcc\x83z\x1a\x1f\xdd\xb3\xa3h\x1b\
+I\xbf\xc1tN{\x17N\x19\xabF\xe9\x19\x85\x99\x80\
+\xf3 \x0a@f\xf0\xad\xab\x96\xab]\x9b\xd6\xc8\x12\xf0\
+\xf2\x9f\x172\xa8\x84\x0a\xc7\xd1\x9a7\xf4\xc7\x9f\xe2J\
+\x98\xad\xf7\x85\xf6\xc6\x11\x1b\x15<\xeda\xbb\xc0\xa5\xd3\
+'%\xf8\x1cAv\xd8J\x9a,m&\x95^\xcf\x06\
+\xd94\x0fE\x84c\x03x\xa2I\xfd{H\xdc\x94\x8c\
+\xb9\x0b\xca\xb2av\xd0\xd1\xbeNu*\xeaY\xe8G\
+\xd5\xa6\xcf\x10\xbd\x14.P\xc3\xbb\xb6\xd3\xcbMX\xe1\
+\x95\x5c\xc3v&L\x91J2YAT\xe0\xb6&\xe8\
+\xda\xf93\xa9\x9b\x1f\xe8\xa8]\xbe^\xd3\xe1\xad\xfb\x0c\
+i\xf1\x9d?\x7f~\xda\xad\xe5\x11\x81\xe8i7X\xa7\
+Z\x15f\x93p\xc8\xaa\xf2\x13\xbe\xff\xde\xbf&\x8c\xef\
+%\xc4f\xa9\xea\xf5U\xbe2\x15%\x01@\xc3b9\
+5c\xb9Q\x85\x0e\x1f^5\xef\xd6_\x11e\xf1{\
+}\xde\x84\xbe\xdd\xd4\xf6\xf5+\xf5C5\x935|\xda\
+\xd0\xbe\xea\xfc\x89\xa3\x12\xc0\xc5\xbc\xa1l#\xec\xf7s\
+\x13\xfd\xc6-R\xd5\x9b\xb5S$\x816\xde\xe9<\x13\
+\x83J\x1e8\x96 \x06\xf5\x96\xe6c\x98\x19\x1e\xe9A\
+\xe7\x91\xfd\xfb\xf7\xa7Bj\x22q\x0d*\xc3 \xb1a\
+\x8cs\x98\xceI\x1cDP8\xac\xbb,s\xec\x89%\
+\x9eW\xdd\xf6]%|SX=\xbb\x04\x0f\xe1\xbd\x83\
+\x0e\x9bT\x8f&\xb5dyc\xe3\x94I\xa6\x0c\x1f5\
+mX?\xb5f\xd1\x1c\xd5\xa8s/\x99q\xc8m\x8b\
+\x01\xada\xc7\x9e*i\xda\x0cB\x8c\xb3\xc6\x0c\xf5\x8a\
+\x07?u\xddn!\xfc=\x9b\xd7I\x12\xa6-\xab\x96\
+J;x\xae\x7f^|\x98\x859k\xfe\x22\xcbzM\
+\x9a]A\xcf\xaa\x9e\xe7\x93\xa73}+wn\x5c\x8b\
+R1[\xca\xfdv\x22\x95\xa7e\x5c\xef.\xa2f\xc6\
+\xe9\x16\x9fV\xeap`A!\x84R\x0c\x9d\x00\xa2\xec\
+\xfa\xa5\x0b\xf5-\x9d\xc0\xeb\x1cE\x12\x8e/(\x96P\
+\x00q\x1e\xceI\xc6\x15\x0fl\xfas\x89\xf8\xa3\xa0x\
+B\xe3z\xfe\xe41q\x19D\xf45\x22\xe2\x92\xe9\x13\
+\x1d\xc5\x93\xc7\x14\xdfM\xe3P\xc3\xfe\x10DO\x9c\x82\
+s\xc7\x0c-z\x17\xfc+\x88\xb5\x81G\x17\xee\x92x\
+\xedO\x1b\xdaO\x1cxP\x91\xafY8G\xf46\x5c\
+\x13\xcd1\x85\xfd/h\x93\xf1\xb9E\xbf\xc15\x5c\xf5\
+\x1b{6\xad\x13\x0f0\xda\x80\xbe\x06q\x1cq\x97\xfb\
+\x98\xe7\xd0\xc4!>\xbd</\xae\x8ex\x83\x95I\x1b\
+OT\xf0\xf8\xdcpML\x03(\xbf\x9a\x96)\xe8\xd5\
+\xaf\x1fR\x18K-\x10D\xd5\xb7\xb5\x1do\xf7b[\
+i\xca\xc9C\xfbS\xe2\xdcjw#O\x0b\xb2<\x9e\
+\xd7(\x81x@\x80\x8f&\xde\xd6(\xc2\x8c7\x1a\xba\
+\x00:\x9c\xc10\xa0\x03\xe9\x1c\x06\x1a\xcf(\x80\x1ed\
+\xdb\x9a?\xdfr\xf0\xe5<l)(\x99P\x9e\xf1=\
+@\xc7\x80\xdd\x03_X\x08\x10{\x0e\x83\x0eQ\xa0\xdd\
+\x84X D\x88\x09\xa0WA\x17\x83\xae\x02\xe2\xc1\x13\
+\x0bM(D\x8a\x9e\x02\xad1\xb15\xf0\xeb\x04(\xef\
+ x\x08\x0a\x22\xc5s\xce\x00\xc5\x17\x84\x8d.\x04\xe0\
+eG_@\x04\xc6]\x10\xe0|\x8cf\x9a\xf8\x1dh\
+T\xef\xdd\xba)D\x01\xc1\xa1/1\x9ad^\x10\xb6\
+3@X\xb4\xc1\xae\xaf=-\x8c)c\xab/k;\
+\xee\xae\xc5Gk.\xd9\xb7\xeb\xe6\xcf\xba\xc5\xafb\xac\
++\xd8\xe5\xde\xa4\xcboj\xca\xfa\xbd\xc2\xfc\xf5iY\
+_\x18\xd4\xc8\xd1cH\xc0Z6\x03\x11\xf8\x0e7\x81\
+\xfce*I\x08\x85\x9d\xebV\x8a4\x83\xa3\x11\xbfa\
+Y\xc1\x229\xee\xb7.\xaaS\xed\x0a\xea\x9c>7D\
+\xa80\x12k\x1c\xd1\x18i#@\x80\x80\xaa\xdb\xd8\xe9\
+\xaaM\xdf\xe1\x22i\x98PO\xac\xdf\xb7\xf4\xda-Y\
+\xc2_\xbd\x94\xe5$j\xcc\x9fD\x22I\x91)\x9b\xe8\
+b\x82\x86p\xee-\x06,\x05\xc4\x1d\xfd!D(\x15\
+C\xf3,!B\x86Vd\x00}\xa1\x97\x1b\xa4\x0dB\
+\x84\xc7\xd2R\x0b\xcc$`\x99\xe1~\xc1\xf45fn\
+=,\x16l\xda\x03\xf3\x0b#\x8c\xcf\x09\xbc\x0c\xdb+\
+\xd9\xfbK\xf0\xda\xdf\xb7\x1c\x92\xcc\x19\x80x\xf4\x0d\xf4\
+2[\xb9I\x1b5h\xd6\x1f\xc2\x14\x13\x96\x01\x1f\x14\
+2`\x12V\x03k-9{\xe6O\x1c-}A\xd6\
+\x86\x9f\x12z\x1eq\xd1\x0e\x8c)c\xcb\x18[U>\
+\xc2\x96\x07\x99=fh\xf3A\x9d[\x0f\xfc\x10I\xc5\
+\x15?\xc6Mp\xf2\xea\xb9S\x09\x10\xfb\x90\xf3\xcdf\
+cWtmPM\x8b\xa2\x9b\xc5\x01\x89\xfd\xbfH\x12\
+\xd3\xf5z\xbdZ\x8b\x87\xdd\xc6\xce\xf0b@!\xa26\
+\x95\x8b\x8b\xa3\x0c\xe22\xe6l\x80\xe8\xfa\xcc\xca\xd2i\
+@\x90\xb9\xc4Z\xf4\x0d\x1d>\xa2\xecz\x1f\xbbt\xa3\
+jV\xb6\x80*[\xb7\xa9\xba\x8d\x04\xa2E\xdfv\x03\
+G\xab\x96\xe5\x0a\xa9\xa1\x0bV\xa9JY\x92\xa9\xdd\xf7\
+\x1d\x12w\x1d \x19\x11=p\x85\x964\xca\xd6n\xac\
+\xfaki\xa4n\x87\xee\x92\x85\x9c\xc1#\xe1A\xb8\x08\
+\x91%9\x0f\xedq\x05\xbc\x0d\xd1\xa8\x0d\xf0\x06C\xf7\
+\xc3\xe6wv\xfe\x03\x08q\xa4f\xb2\x89\x8f\xdey\xd8\
+Da\x9e!*b\xac\xae\xd5|\xca,Ml\xee\xb1\
+CxaV\xce\x9d)\xbb\xec\x1e\xdc\xbd\xff$O\xa9\
+\xb2\xf3\x96z\x90{\xdf7 \xe1\xb4\xea9\xb0u\x85\
+\x06\xcd\xdfV\xc0\xb8\xe0\xad\x19\x04I\xa5o\xeb\xc6#\
+\x91V>\x9682\xe4\xca\xb7z\xfe\xae\xe3\x89z\x8c\
+\xff\xbd\xe2\xc9\x03\xfb\x0eW\xce\x96R\xe9\xa9T\x12\x06\
+\xf3F\xcc\x9b0R\xb6\x1c\x12\x90\x86\x90\x91-\xca\x15\
+\x96\x84\xc6H\x0d\x84\x9b\xe83e\xbe\x1a\xf6k\x1b\xf1\
+R\x03\xe8\x1b&\xad\xde\xa9E\xde\xb4*|\x94\xa8\x92\
+\x8et\xfd\xc5\x87\x12P.k\xbe\xc2j\xda\x86\xbdj\
+\xc6\xa6\xfdj\xcc\x1f\xebU\x97\x91ST\xee\x92\xe5\x85\
+\xc1\x8c\x938\xb9\xba\xabg\x1bR\xa0\xc1\xe0\xa1W\xb8\
+r\xf1\x9cH\x1eO\xc9\xb3\x12.\x82\x9eJ\xe5\x16\xea\
+\xb5\xe5\xc1F\x9cQ\xc4\xde\xe81\xe3H\x10\x16\x14d\
+\xbc\xdd\xb7\xb5\x04A@a\xea\xc8B^\xabug5\
+t\xde\x9fj\xe2\xea\xedzf8(z\x9b\x92\x9a\x09\
+\xa7]\x14\x12D\x92t\xb9\xc7\xb8\x99^\xc4\x81xM\
+\x0a\x8e\x08Q\xa3K$BBl\xea\xa5Ki\x9eC\
+2z\x11\xe1z\xe7\xc65j\xf1\xb4\x09\xe2\xa3\x82\x9b\
+\xa1\xe6O\x94^\x0e\xd5\xc0\x8e\xad\xfe\xce\x94\xa7\xf0\xa8\
+E\x07N\xc7\xfbu\xf8\xc4\xda\xf4\xb1\x5c\xf4\x03\xc1\x18\
+3\xd6\x8c9coU\xbf\x05\xaf\x19DwH\xf0\xf6\
+5\xca\xcd\xdd\xb1n\xe5Gg\xff\x0b\x1e<\xd4\xc39\
+\xbb\x8e&!r\xa2U%\xaay\xcd\xe4\x95\x9f2\xe4\
+\xb7\xf6$#F\x8a\xd1\x8dR\xfb\xb7oQ\x89R\xa5\
+Qu\x7f\xee\xa2f\x8e\x1c\xa8\x8e\xee\xd9)a\xa4\xab\
+\xb5l/\x12\x02\x0a%$\x91\xcaM\xdb\x88\xca\x9a)\
+\xbb}\xd5\xd2Z\xe4<,\xe9H \x9cY\xa3\x06\x8b\
+\xaa\x9d<\xbcFu\x0f\xe8\xf8;\xd7\xaeJ\xb0\xfbE\
+\xd3\xc7\x0b\x01\x10>\xe1\xd7z\x95\xd5\x9c]'T\xa1\
+\x84Q\xd5\x9e\x07\x0e\x956\xf4w\xf2\x1f=\x03\x8a9\
+\xc4X\x88\xeb\x1f\xbd,\xb1|\x91\x94\x87`-\xeb\x97\
+.P\xa3\x96\xacW\x9a!V\xcb\x8ez\xc7\xbd\xc7;\
+lB\xdf\xeeZj\xda\xa1F\xeb\xef1\x0f\xf4m\xdd\
+H|C\xfbN[\xa8\xd2\xeb\xd9\x88\x99q\xb1\x9ey\
+XzXR\xd8uO\xc4\x1f\xc4\x5c\x96\xc1\xda\xfa\xf9\
+\x09\x9d=\xacK[Y\x82\xd93\x0c\xf6m\xdd\xa4\xe2\
+&Ky\xa0n\x9b\xce=3\xe4\xce\xbf\xcaU\x02\xd1\
+\x02D\xd4\xf2\xe9\x93\x1c}\xf2\xe4\xa1g\xb9Y}A\
+\xc6\xdc\x05V\xfe6en9=\xfb9c\x9f\x1a\x18\
+f\xa4j\xeet\xbb\xec\x18\x9a\x0f)\xbem\xca\xc1]\
+\x00\xe6\xd08\xcc \xd9\xc0\x84\x22-\x00\xa4\x09#\x85\
+\xe0\xe2\x0f\xe7\x8f\xb5\x18f\x92M@\x00\xa9\xc1\xec\x05\
+\xc1aF\xf3,^\xfbj\xd8\xe5\x8e\xb4\x83O\x04&\
+v,\xc1H-0\xb0\x9c\xa3Eu\xafv\xb2\x8d\x03\
+\xf0\x19\x0b,\x0c*\xed\xc1+\xdc\x9c\xd3\xb9N%\xb9\
+\x17\x11\x0e0\xc2\x01b\xae\xc1@r\x1e\xfe\x16|\xc7\
+\xb9\x18\x0e\xb7\xaf]![&a4\x0d\x83\x0a\xd8l\
+f\x0c\x91\xfc\x16F\x18k+L'\xcc\xe9\x95sg\
+\x84q\x86\x89F\xe2\x03\xb8\x00d\x8d\x1a\xe2\xd1\xc53\
+'\xe3\xebC\xdb\xfe\xa4\xafM[?\xb6@\x03\xee\xd7\
+\xf7\x9aVr\x15.\xe9\x8c\xd1\xfc\x91@\xd6.\x5c\xa9\
+\xfaT\xeb\xf0\x1dt\x1e6\xae^\xb4\x9f\xe2ooZ\
+&\xbf\xe82*6j)q9&kf\xb5c\xad\
+\xf2\xa2\x01E\xedL\x1e\x9ay\x13G\xaa\x22\x89\xa3I\
+\x06%B\x84\x9b$\xc6\xe83\xba\x8e\x99\xa6\xdf\xcc\xfc\
+\xaaf\x9et\xb2\xe6\xaf8yC\xcd\xde~D\x1cy\
+\xd1etoZ\x8b<\xc0\xe4\xc1\x91x%\x8d\xf5\xec\
+\x82\x16\x14EV\xbeR\xe5\xf5=\x8ey\x05Q\x81G\
+0\xe1\xb34g-yp\x88\x8a4e\xed.u\xf5\
+\xe2Y\xe1\x07\x1av\xee%jxf\x82\x04)\xd2\xa8\
+\xda\xf92\xc9\x0c@\xfe\xdfA\xb3\x97\xa9\x95\xa7n\xa8\
+\x9e\x93\xe6\xa8\xb6\x95KH\xaa\xb6\xe1\x0b\xd7\xbc\xe5\x94\
+\x1c?y*a\xd0\xb5\x04\xa2\xea\x16\xc8,<\xcc\x82\
+\xdd\xa7$\x1e<~\xbch\x90\xe1\xb7\xc6\xaf\xdc&\xb3\
+\xcb\xe4A\xbd\xd5\xa2i\x13^\xf7\x994\xabb\x8c8\
+\xf1\x9d1\xcfm@_\xd3\xe7\xd6\xe1G\xc1\x8e\x06\xbc\
+\x96\x18\xd2\xb2\xd7\xc8\x9ba\xe7\x89\x03{\xd3H\xc5\x07\
+@?\xd8\x1d=HI\xc3\x84\x8f\xf8n\x96 \x17\xe8\
+7&l\xbd\x2297\xf8\xff\xce\x91t\xc8\xfc\x95\xe2\
+\xe4\x8cd\xf1\x8b\x9e\xfa\x1f\xeb\xf5\xbd\xbb^\xb3Iw\
+\x0e\x03J\x12\xc5\xa9\x83\xfb\xe8%\xe5\xa8X<\xe1)\
+\x88\x1e\xfc\xfc\xef\xbf$\xf7?\x99\xb9\x03i\x86\x95e\
+$\x93\xe6E\xf2i\xde\x83u\x1di\xa2d\x8aXj\
+\xed\xf9\xfbBxd\x09_2u\x9cX[Qz\x15\
+\xaaPM\xb5\xacPX-\xdcwV\xe5\x8a\x19J-\
+9|Il&0\xa1\x10\x92\x16E\xc5\xc7\x16\xaf\xfc\
+\x16\xbd\x06\xcb\xf11=\xc0\xfd\x7f\xffC\xad^0K\
+\x91\xbe\xbeA\xe7\x9e\xa2:\xdf\xb4|\xb1H$\x07\xb7\
+o\x92\xac\x0f\xf0\x1d\x18\x06\xc3G\x8e&\xda\xdf[\xd7\
+.\xab\xd3G\x0f\xc9g\x22\x22\x97\xaf\xdbDx ~\
+;\xbag'\xb5`\xd2h\x89\xc0D\xaa00mH\
+_\x89z\xd4e\xc4\xe4\x9aE*\xd7pf\xa2\xf6\x05\
+Z\xa2\x8bX!S\xd2#\x9a\xd1\xf5\xceO\xebG$\
+L\x99f\xef\x945;3\xf8\xd3\x8c\xabU%\xf0\x9a\
+A\xf8\xe2\x97a\x13\xea\xf8\xb3\x09\xe8\xee):\x0e\x1a\
+[\xff}\xc4\x01B\x86\x09{o\xec\xd2\xf5\xb9^;\
+\xbe;RO\xbfQ\xd8-\xe8\xb0\x09\xab\xb6K\x94\xe7\
+\xe6zv\x19\xd3\xb3\xb3Lq\x88\xbf\xc3\x17\xad\x914\
+f\xc9\xb5x\x98\xa5`Q\x95B\x0fv\x14-\xaeF\
+\x8d\xf5\x93Zr\xe8\x82\xfc.\xbb\xe6\x11H\x1eP&\
+]|a\xeaH\xe7nR^\x5c\xd5L)\xfcG4\
+\xcd\xa0\x92\xd7\x86\xdf!\x15\xb8J\x1b\xfaM\x91\x98a\
+hc\x99Y\x08c\xcd\x7f\xda\x00Cy\xe5\xec)\xb9\
+'<\x04iD\x0f\xef\xd9.\xfb~\x0a%\x8c\xac\xfa\
+\xff\xdcXr\xe3\xff\xac%\xa3%\x07\xceifu\xb2\
+\xba\xaf\x09\x97@\xfb\xb4\x15\xe7dx\x99j\xcd\xdbK\
+\xd2\x22\x9e\x95\x90\xe5\x95\xb3&\x17\x15\xfe\xec\x1d\xc7\x84\
+8\xb8?\xd7\x1c\xd1\xb3\xd3kL\xf5\x9e\x10\x07\xa0\xcf\
+\xe9{\xeb\xd0\xcf`\xcce\xec\xdd\x88C`\xd6\x1aS\
+\xc6\xf4\xfa\xb5\x9b\xdd\xfa\xf4\xbe\xd2\xb5Au\x82\x80\xbc\
+s=\xdf\x8a~\x93\xc3\xd4+\x9cc\x03\xeb\xf5\xfa%\
+\xf3u\x95\x13\xac\xc9\x83:\xb6\x14?T\x13\x1b\x83\x88\
+\xc0(\xd2\x8c\xe7\xd9\xccQ\x83EI\xa5\x99_QJ\
+\x19\xa0P\x1a\xd8\xbe\xb9\xf8\xaf\x12#\x14\xe0\x88\x03_\
+\x83\x12\xaey\x99\x82\xc2#\xa0\x88\x82\x0f\x00\xf0;(\
+\xef\xd8\x99F,\x13\xf8\x08\xe2n\xb0\x9b\xadP\x82\xc8\
+\x12\x9c\xd68-Q\xc7^d\xb4\xa6\xb5\xf2e\x14\x1e\
+\x07\x1e\xc9\x00\x05\x1e\xfc\x14J@SO\xa4\x03\x94i\
+8\x0f\xf1=|\x07[X\x8d\xc2\x0d\xc0w\xe08\x95\
+)R\xd0\xa7\x9e\x84e\xb0+\x8c\x81\xdd\xd8\xbc\xaf0\
+\xe6v\xd7\xa3\xbcS\xa1\xa7\xbd\x80e3$9bw\
+!\x9fJ\xd1\xc41.\xea7.\xb8\xfb\xb5<)\xba\
+\x13\x03\x0ch\xd7l(\xd7A\x9d\xed\x1a\xea\x8a\xce\x84\
+\x10PS\xe3]\x86\xb6\x91\xb8$x\xa1\xc1(\x12\xee\
+\x00\xcf)\x06\x11\x06\x13b1@\xbd\x0dc\x8bf\x12\
+-'\xbb\xe1qq\x84\x89%<\x02\x9aQ\xae\x07\xf8\
+\x1e\x02\xe1\xfe\x10\x08\x0c\xa5\x84Q\xd0\x04Dl\x0d\xb4\
+\xbe\x10\x18\x9aX\xee\x03*eM\xee\x15i\x80\xb6-\
+\x9a:^v\xe0\xa3F\xc7\x8c\xc0\xbe[\xbc\xcaW\xcd\
+\xff]4\xb2\xf8\xdd\xe2z\x88\xbb\xa4\xfb\x96O\xd4\xeb\
+\xf8\xda\x96L\x1d\xf7\xb4\xa7\x1aN\xbb\xc2\x180\x16\xee\
+\xe3\xe3[a\xac\x19s\xbb\xebQl+\xf5\xf4\x97.\
+mX\xff\xaf\xec.\xe8^\xd2\x85\xf1\xf7z\xef\x96\x0d\
+9\xec\xae\xe3\x97\xb2s\xfd\xea\xbc\x04\xadA\x22\xc0^\
+A\x87\xba\x03\x1b\x07\x03\x8c\xca\x9a7\x10\xf06\xff9\
+g\xba\xa3q\xa9\xbc28\xcc:\x10\x14*mT\xf0\
+8\x05C,\x9c\x8f\x9d\x86\x99\x00\x95?v\x15\xea\x01\
+\x03\xca`\xb3\x9f\x15w=\x08\x0d\x02\x00\x0c2\x0e\xd9\
+|\x874\xc4\xf6\x0e@\x1b\x99\xa1\x98\x1d\x98\xad R\
+f%\xd3n|B\x8d=\x85\xf6\xb8\x83v\xe3\xb7*\
+;\xf1\xc3}\xff\xb2\xff\xcfM\x87\xe9e/\x98\xfe\xca\
+\xb6\x7f<-\x8c\x05cb7V\xee\x851f\xac\xed\
+\xaec\x8a\xadrDs\xdf\xbb+7l\xe1Q\x0c\xc8\
+\x8a\xfa\xbc\xd4Yrl\xb4\x0e?\x18\xe9s\xe6]3\
+\x7f\xf7\xc9\x04-{\x0f\xad\xbfg\xcb\xc6\xa3U\xb2\xa7\
+R\xfa-\x17\xdd\xc4\xdaEs%i\x22\xe9\xd2\x90x\
+n^\xbe(i\xe1\x91*`(I|8b\xc1j\
+\xb5p\xef\x19\xf1 \x1b\xd9\xad\x9d\xc4n\x85\x878u\
+\xf8\x80lC\xbc|\xfe\x8c\x84\xe3$V\x18\xcc\x22\xfb\
+U\x03hf\xd7\x80tl\xe0\x07-\xc1\x04\xd4\xe7\x99\
+c\xf8\x85k\x9ao\x89cy\xad\xe1s\x02\xd2f\xcd\
+\xa9&j\xc9\x0bg\xa2\xae\xa3\xa6\xaa?\x8e^Q\x8d\
+\xbb\xf4\x11f\x19\x1c\xd0L-Q\x0c\x89kJ\xb4i\
+$)\xa4\x15R\x96ibS\xf9\xe3\x86W\x83\xda\xb5\
+\xf8+i\xdaL\x13\x16\xea\xe7\xd6\x0cq3?YY\
+}\x00c\xc1\x98X\x87\xbe\x821f\xac\xadC[\xf8\
+h\xee\xd7\x1d\x18\xa4l\xc6$Go\x5c<\xef\xed\xec\
+\xe0\x86X\xf1\x13\x1f\x9b\xb9y_\xea\x00\x01\x03\xf9\xcd\
+\x1f\xce\x03\x9c=~$\xe9\xba\xc5\xf3\xcb\x1c\xda\xbd-\
+\xf3\xd1=\xbb\xd3\xd9y\xaf\xa1RgO0\xe9\xb7\xf0\
+\xf54L)\xd9#\xef\xde\xbc\xa1\x1at\xec.v\x1d\
+\xec>(\xe1Z\xf7\x1e\xa2&\x0f\xe9\xa3\x86\xcf_%\
+\x89~\xc8\xe3\x86\x98I@\xb8\xbeS\x17H\x06\xcb\x22\
+\x95j\x88I\x80p\x9eK\x8f\x5cV\xfb\xb7n\x94\xdf\
+\x14\xabTK\x06\x9d\x88\xc6\xdd\xc6LW\xa1\xc2GP\
+\xd5r\xa4\x92\xc4\x8c\x00s=\xa9\xea\xd9\x9d\x87\xe9\xc0\
+\xa7dG\x98\x1f\x92\xa7\xcf\xb4=c\xce|\xab\xb3\x15\
+*\xf6G\xa0\xc0A>,\x1f\xaa/x\xf9\xcf\x8b@\
+\x95\xb3\xa5\xdew\xe1\xd4\xb1\xc4V\xd5;\x88\x1c3\xf6\
+\xf9y;\x8e&y\xef\xfd\xdd\xa7\x14\xd7\xa2\x99\xa8\xdc\
+vS\x13%]\xf8\x00\xff\x10;\xc4\xeew\x9f\xa3h\
+&.\xfc\x99c\x87\x93j&\xb1.K\x02\xeb\xfe\x89\
+\x83\xfb\xc4\xcak\x94N0\x86\xc4=\x83y4\xd1\x8c\
+\x08\xa2G!\x92\x10S=J/\xf6\xa7`Ev\xe5\
+'XV\xb8\x0e\x8a:-.\x8a\xa2\x0bf\x99\xeb`\
+\xcd%\xfe\x06K\x09K\x86\xf1<\xc7\xba\x8a\xd7=\xa6\
+z\x98V\xee\x0f\x03\xcc5\xe0\x9fP\xba\xd5\xcc\x9bq\
+;\xfdt\xe5\xfc\xd9\x9f|[\xeb?u\xe1\x9e\x8c\x91\
+\xdd\xd8Q\x18[\xbb\xdf\xb9\x17\xdbJ\xd7\xd2\xadq\xcd\
+Iv7\x98<\xa8w\x07\xbb\xf3?w\xd1|D\x22\
+4\xa2h\x19\xd9\xd1g\x80O\x05\x03\x87\xdb?\x0c\x1f\
+|\x06\x1aK\x06\x0fM+|\x04\xfc\x84\xeb3\x98\x00\
+q\x10\x08\xc4\x06\x81h^Hx\x1d\xd7\xf3`\x84\xf5\
+\xe0\x0a\x81\xb0\x0f\x87-\x9a@\xa4\x15\xcd\xe0\xc2{\xa0\
+\xd15@\xd3\x0b\xe3\x09!\xffR\xaf\xcat]e\xfb\
+,\x9f\xbb0F\xae\xcfa\x0acjw\xbe]\xb1\xad\
+t-\xba\xe3C\xe7\x8d\x17\xe9\x86\xeb\x0d\x1a\x16\xcf\xbd\
+\xf6\xcd\xeb\xd7\xfe\xec\xce\xff\x12\x051\xb0d\xda\xf8'\
+aJ\xd9\x17\xcc\xa0\x19\x89\x02\xff\x0d\x13\xeb\x8b\xc8\x8c\
+\x88\x92\x88\xb6\x10\x0bR\x0a*x\x08\x80\x99\x06\x89\x02\
+@ 8\xe4@ \xfcGl\xe69!:DS\x98\
+M\x92\xf80c\x98m\xa0\xecyE\x9aB\xd4\x06\xa8\
+\xea\x91\x9a\x08V\x8bSQ\xc6\x08\x01_\xf4l^w\
+\x9c\x9e\x8d\xc2\xe9\xafm\x9f\xe3s\x17\xc6\x88\xb1r\x1d\
+;\xc6\x921\xb5;\xdf\xae\xd82\xa9\xae\x08\x1e*\xf4\
+\x83v\xfd\xbc\xfdP\xc3\x84\x8fp\xbb\xc7\xb8\x19U\xfc\
+\xea\xdb\xf8)\x91\xbbx\x99\xf9\x0bv\x9dH8f\xe9\
+\xc6\xeczM\x1f?\xbeo\xb7;\xc5\x92\xc5\x14k1\
+\xc6.\xbd\xc6K\x88j\x18[\xb2\x1d\x9c>\xa2\x19\xd5\
+d\xa9\xd4\x95\x0bg\xc4\xad\x11# \xbe\xb1Fuo\
+T\xee0\xae\x00\xd7C\xd4\xefXual\xa3\xc7\x8a\
++\x9a^\xb6b\xc0h\xe6+]Iu\xa8U^T\
+\xfa\x94Zy3\xa8\xdc1C\xa9f\xe5\x0b\xbf>w\
+\xfc\xe8\xd6\xfa\x1d{6Zy\xf2Fd\x94]\xa1\xc2\
+\x86\xf3<?\xfc'\x06c\xd4}\xec\xf4\xaa\x8c\x99U\
+\xa5\x18K\xc6\xd4:|?\xec\xa8\xc6\xae\xb4\xa9Tb\
+\x11b\x11\xe2\xa8\xdd\xf7_\xb3\xe87\xfe\xbb#{w\
+\xa6\x9f>|`\xabr\x19\x93\x1e6oJ\xb6\xc8?\
+<\xe13o>\xb3\x02K\x04\xcb\x01z\x0d\x8cp\x88\
+\xad\xc0\xcc\x1c\xcc$\x86wAy\x86\xc2\x0c/2\xc4\
+j\x22\x00\xb8\x1a\xfa\x8a&\x8fu\x9e\xff\xf4\xc9\xc0\xf6\
+-\x06\xafZ0\xab\x02\x8a?\xfdS\xdb6~\xcd\xc2\
+\x98\xd1N\xc6\xd0\xee{\xdf\x8am\xa5]\xc17u\xe9\
+\x8c\xc9\x84\xea\xb5\xfd\xfe[)z\x16\x08\xac\x079\xcb\
+\xf3g\x7f\x07y\xfd\xea\x95\x7f\xac\xc7l\xf3di\xc0\
+\x1d\x11m%|\x03\x83k\x22@C \x0c\xbeaV\
+\x01\x04\x82N\x86%\x04\xbe\x86\xe5\x89\xe5&k\xd4`\
+\xaf\xae_\xba\x10S\x9f\x22\xfc\xd0\xc7l\x8c\xfe\x92\x85\
+\xb1c\x0c\xed\xbe\xf3\xad\xd8V\xfe\x9bJ\xd9\xb4\x09\x8f\
+C\x1c8\x17\xc3\xab\x18\x18\xb5:@\xc9\x86\xe4\xc1L\
+\xe1J \xc6\xf9\x18\xa6\x13\x09\x05\xc9\x89\xe0\xb6\xfa\xdc\
+\xe2\xba\xda\xf6~\xff\xb6\xf2^\x1e\xe4\xff3n^\xbe\
+\x14\xe3\xaf\xc7\x0f\x12\xe2\x0d\xb6`\xc2H\x09\xf9\x84\xb3\
+\xcf\xaf\xf5\xaah1\xd0;Ml\x90 \xce\xcdU\xf8\
+\x98\xbabT\xb7\x0eNo\xae8\xe1\xd4\xadkW\xd5\
+\xe4\x01\xbdd/\xcc\xb6\xb5+\x9c\xe9\xae\xff\x07\xf0\xaf\
+&\x90+\x17\xce\xc6\xc15\xa0y\xd9\x82\xaaI\xf7\xfe\
+\x0dG,\x5c\x93\xbbH\xc5\x9am\xf5\xc49\xf3\xe6\xb5\
+\xab\xf7\xff\xb6\xb6Y\x02\xe3nhr\x05\xe3j\xa0\x19\
+\xce-\x09\x92\xa7\xe9\xff\xf3\x80\xd1\x95fn>\x90R\
+\xcf\x1c\xa7\xc9\x97\x7f\xed\x82\xcf\xca\xc3\x7f\x1d\xec\xa6\x95\
+\x7fK\xb9\x7f\xfbV\x04\xc4<;\x0f\xb7\x9eM\xeb\x8c\
+7\xd6^\xec,\xe840\xcc!.\x13\x88\x05\x1e\xc5\
+]De\x0do_\xa3\xec\xdc9c\x87#G\xbfu\
+\xbd\x7fk\xb1\xad\xfc_(S\x87\xf6k\x8b\x22\x0b\xcb\
+-\x96]\x08\x02#\x17n\x05\xc4!\xc9\x1b'<~\
+\x7f\xb6\xbf\xfd_*\xb6\x95\xff\x0b\xe5\xc9\xa3\x87!\xab\
+\xe6L\xb3'S\xc4@\xcfG\xf6\xe8\xd4\x13\x11\x15\xa9\
+\x04\x93;>\x19\xcbgM\xabj\xf7\xbb\xff\xb5\xe2\xa3\
+\xb1\xee?\xfc\x07\xf0\xaffR\xff\xc3\xc7\xe3?\x02\xf9\
+\x0f\xbe\xe2?\x02\xf9\x0f\xbe@\xa9\xff\x03\x84\xe8\xbb\xbb\
+\xae\xe8\x89\x1a\x00\x00\x00\x00IEND\xaeB`\x82\
+\
+"
+
+qt_resource_name = b"\
+\x00\x04\
+\x00\x07b\xb3\
+\x00o\
+\x00k\x00t\x00s\
+\x00\x0d\
+\x08\xe0\x8c>\
+\x00r\
+\x00u\x00l\x00e\x00s\x00e\x00t\x00s\x00.\x00j\x00s\x00o\x00n\
+\x00\x0d\
+\x02\xcc\x1e4\
+\x00b\
+\x00l\x00o\x00c\x00k\x00l\x00i\x00s\x00t\x00.\x00t\x00x\x00t\
+\x00\x12\
+\x0f&r\x03\
+\x00b\
+\x00l\x00u\x00e\x00_\x00m\x00o\x00d\x00_\x00s\x00t\x00y\x00l\x00e\x00.\x00c\x00s\
+\x00s\
+\x00\x08\
+\x00\x96]\xc7\
+\x00O\
+\x00K\x00T\x00S\x00.\x00p\x00n\x00g\
+"
+
+qt_resource_struct = b"\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00\x00\x00\x02\x00\x00\x00\x04\x00\x00\x00\x02\
+\x00\x00\x00\x00\x00\x00\x00\x00\
+\x00\x00\x00x\x00\x00\x00\x00\x00\x01\x00\x00\x10\x8f\
+\x00\x00\x01\x8d\xbd\xa5\x8d\x80\
+\x00\x00\x00.\x00\x00\x00\x00\x00\x01\x00\x00\x01\xbe\
+\x00\x00\x01\xa1O!'\xc3\
+\x00\x00\x00\x0e\x00\x01\x00\x00\x00\x01\x00\x00\x00\x00\
+\x00\x00\x01\xa1O*?\x91\
+\x00\x00\x00N\x00\x01\x00\x00\x00\x01\x00\x00\x07\xdf\
+\x00\x00\x01\x8d\xbd\xa5\x8d\x80\
+"
+
+def qInitResources():
+    QtCore.qRegisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+def qCleanupResources():
+    QtCore.qUnregisterResourceData(0x03, qt_resource_struct, qt_resource_name, qt_resource_data)
+
+qInitResources()
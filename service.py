@@ -0,0 +1,328 @@
+# Headless JSON API for power factor, chrono and scoring checks.
+#
+#     python service.py [--host 127.0.0.1] [--port 8765] [--rulesets extra.json ...]
+#
+# Uses the same rules as the app (ipsc.py and rulesets.json) without loading
+# Qt. A small HTTP/1.1 server on asyncio: keep-alive and pipelined requests
+# are served from one connection, and every endpoint takes a whole batch of
+# shots or competitors per request. uvloop is used when it is installed.
+#
+#   GET  /rulesets   disciplines, seasons and division limits
+#   POST /pf         {"shots": [{"weight": 124, "velocity": 1350}, ...]}
+#   POST /classify   {"competitors": [{"division": "Standard", "pf": 171.2}, ...]}
+#   POST /chrono     {"competitors": [{"division": "Standard", "declared": "Major",
+#                                      "weights": [124], "velocities": [...]}, ...]}
+#   POST /score      {"stage_max_points": [100, 60],
+#                     "competitors": [{"division": "Standard", "pf": 171.2,
+#                                      "stages": [{"A": 8, "C": 2, "time": 10.5}, null, ...]}, ...]}
+#                    (null or {} for a stage not shot)
+#
+# Every POST body may also name "discipline" and "season"; the default is
+# the newest season of ipsc.DEFAULT_DISCIPLINE.
+import argparse
+import asyncio
+import json
+import math
+from pathlib import Path
+
+from ipsc import (
+    DEFAULT_DISCIPLINE, SCORE_COLUMNS, PF_CLASS_NAMES, compile_rulesets, calculate_power_factor,
+    power_factor_classes, score_match, chrono_check,
+)
+
+try:
+    import uvloop
+except ImportError:
+    uvloop = None
+
+SERVICE_HOST = "127.0.0.1"
+SERVICE_PORT = 8765
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 8 * 1024 * 1024
+
+REASONS = {200: "OK", 400: "Bad Request", 404: "Not Found", 405: "Method Not Allowed",
+           411: "Length Required", 413: "Payload Too Large", 500: "Internal Server Error"}
+
+
+class RequestError(Exception):
+    def __init__(self, message, status=400):
+        super().__init__(message)
+        self.status = status
+
+
+def load_rulesets(extra_paths=()):
+    texts = [Path(__file__).with_name("rulesets.json").read_text(encoding="utf-8")]
+    texts += [Path(path).read_text(encoding="utf-8") for path in extra_paths]
+    return compile_rulesets(*texts)
+
+
+class PowerFactorService:
+    def __init__(self, rulesets):
+        self.rulesets = rulesets
+        self.routes = {
+            ("GET", "/rulesets"): self.list_rulesets,
+            ("POST", "/pf"): self.power_factors,
+            ("POST", "/classify"): self.classify,
+            ("POST", "/chrono"): self.chrono,
+            ("POST", "/score"): self.score,
+        }
+        # The ruleset list never changes while running
+        self.rulesets_body = json.dumps([
+            {"discipline": ruleset.discipline, "season": ruleset.season,
+             "divisions": {name: {"minor": limits.minor, "major": limits.major}
+                           for name, limits in ruleset.divisions.items()}}
+            for ruleset in rulesets.values()
+        ]).encode("utf-8")
+
+    def handle(self, method, path, body):
+        # Returns (status, JSON bytes)
+        path = path.split("?", 1)[0]
+        handler = self.routes.get((method, path))
+        if handler is None:
+            if any(route_path == path for _, route_path in self.routes):
+                return 405, json.dumps({"error": f"{method} not allowed"}).encode("utf-8")
+            return 404, json.dumps({"error": f"No such endpoint: {path}"}).encode("utf-8")
+        try:
+            if method == "GET":
+                return 200, handler()
+            try:
+                request = json.loads(body)
+            except ValueError as e:
+                raise RequestError(f"Invalid JSON: {e}")
+            if not isinstance(request, dict):
+                raise RequestError("The body must be a JSON object")
+            # allow_nan=False: bare NaN/Infinity tokens are not JSON
+            return 200, json.dumps(handler(request), allow_nan=False).encode("utf-8")
+        except RequestError as e:
+            return e.status, json.dumps({"error": str(e)}).encode("utf-8")
+        except (KeyError, TypeError, ValueError, IndexError) as e:
+            return 400, json.dumps({"error": f"Bad request data: {e!r}"}).encode("utf-8")
+
+    def ruleset(self, request):
+        discipline = request.get("discipline", DEFAULT_DISCIPLINE)
+        season = request.get("season")
+        if season is None:
+            seasons = [name for d, name in self.rulesets if d == discipline]
+            if not seasons:
+                raise RequestError(f"Unknown discipline {discipline!r}")
+            season = max(seasons)
+        ruleset = self.rulesets.get((discipline, str(season)))
+        if ruleset is None:
+            raise RequestError(f"No {discipline} ruleset for season {season!r}")
+        return ruleset
+
+    def items(self, request, key, default=None):
+        items = request.get(key, default)
+        if not isinstance(items, list):
+            raise RequestError(f"{key!r} must be a list")
+        return items
+
+    def record(self, value, what):
+        if not isinstance(value, dict):
+            raise RequestError(f"{what} must be a JSON object, not {value!r}")
+        return value
+
+    def number(self, value, what):
+        # float() takes "nan" and "inf", and json.loads NaN and Infinity;
+        # none of them is a measurement
+        try:
+            number = float(value)
+        except (TypeError, ValueError):
+            raise RequestError(f"{what} must be a number, not {value!r}")
+        if not math.isfinite(number):
+            raise RequestError(f"{what} must be a finite number, not {value!r}")
+        return number
+
+    def count(self, value, what):
+        number = self.number(value, what)
+        if number < 0:
+            raise RequestError(f"{what} can't be negative")
+        return number
+
+    def division(self, ruleset, name):
+        thresholds = ruleset.divisions.get(name)
+        if thresholds is None:
+            raise RequestError(f"Unknown {ruleset.discipline} division {name!r}")
+        return thresholds
+
+    def list_rulesets(self):
+        return self.rulesets_body
+
+    def power_factors(self, request):
+        # Every shot is classified for every division of the ruleset, or only
+        # for the one named on the shot or the request
+        ruleset = self.ruleset(request)
+        default_division = request.get("division")
+        results = []
+        for index, shot in enumerate(self.items(request, "shots")):
+            shot = self.record(shot, f"Shot {index}")
+            pf = calculate_power_factor(self.number(shot["weight"], f"Shot {index} weight"),
+                                        self.number(shot["velocity"], f"Shot {index} velocity"))
+            pf = self.number(pf, f"Shot {index} PF")
+            division = shot.get("division", default_division)
+            if division is None:
+                classes = {name: PF_CLASS_NAMES[thresholds.code(pf)]
+                           for name, thresholds in ruleset.divisions.items()}
+            else:
+                classes = {division: PF_CLASS_NAMES[self.division(ruleset, division).code(pf)]}
+            results.append({"pf": round(pf, 3), "classes": classes})
+        return {"discipline": ruleset.discipline, "season": ruleset.season, "results": results}
+
+    def classify(self, request):
+        ruleset = self.ruleset(request)
+        competitors = [self.record(competitor, f"Competitor {index}")
+                       for index, competitor in enumerate(self.items(request, "competitors"))]
+        divisions = [competitor["division"] for competitor in competitors]
+        for name in set(divisions):
+            self.division(ruleset, name)
+        pfs = [self.number(competitor["pf"], f"Competitor {index} PF") for index, competitor in enumerate(competitors)]
+        classes = power_factor_classes(divisions, pfs, ruleset.divisions) if competitors else []
+        return {"discipline": ruleset.discipline, "season": ruleset.season,
+                "results": [PF_CLASS_NAMES[code] for code in classes]}
+
+    def chrono(self, request):
+        ruleset = self.ruleset(request)
+        results = []
+        for index, competitor in enumerate(self.items(request, "competitors")):
+            competitor = self.record(competitor, f"Competitor {index}")
+            declared = competitor.get("declared", "Minor")
+            if declared not in PF_CLASS_NAMES[1:]:
+                raise RequestError(f"declared must be Minor or Major, not {declared!r}")
+            pf, code, next_step = chrono_check(
+                declared, self.division(ruleset, competitor["division"]),
+                [self.number(weight, f"Competitor {index} weight") for weight in self.items(competitor, "weights", [])],
+                [self.number(velocity, f"Competitor {index} velocity")
+                 for velocity in self.items(competitor, "velocities", [])])
+            results.append({"pf": None if pf is None else round(pf, 3),
+                            "result": PF_CLASS_NAMES[code] if next_step is None else "Retest",
+                            "next_step": next_step})
+        return {"discipline": ruleset.discipline, "season": ruleset.season, "results": results}
+
+    def score(self, request):
+        import numpy as np
+        ruleset = self.ruleset(request)
+        competitors = [self.record(competitor, f"Competitor {index}")
+                       for index, competitor in enumerate(self.items(request, "competitors"))]
+        stage_max_points = [self.count(points, "stage_max_points")
+                            for points in self.items(request, "stage_max_points")]
+        if not competitors or not stage_max_points:
+            raise RequestError("A match needs competitors and stages")
+        hits = np.zeros((len(competitors), len(stage_max_points), len(SCORE_COLUMNS)))
+        times = np.zeros((len(competitors), len(stage_max_points)))
+        for index, competitor in enumerate(competitors):
+            stages = self.items(competitor, "stages")
+            if len(stages) > len(stage_max_points):
+                raise RequestError(f"Competitor {index} has more stages than stage_max_points")
+            for stage, sheet in enumerate(stages):
+                what = f"Competitor {index} stage {stage + 1}"
+                if sheet is None or self.record(sheet, what) == {}:
+                    continue  # stage not shot
+                hits[index, stage] = [self.count(sheet.get(column, 0), f"{what} {column}") for column in SCORE_COLUMNS]
+                times[index, stage] = self.count(sheet["time"], f"{what} time")
+        divisions = [competitor["division"] for competitor in competitors]
+        for name in set(divisions):
+            self.division(ruleset, name)
+        pfs = [self.number(competitor["pf"], f"Competitor {index} PF") for index, competitor in enumerate(competitors)]
+        scores = score_match(hits, times, divisions, pfs, stage_max_points, ruleset.divisions)
+        results = []
+        for index in range(len(competitors)):
+            results.append({
+                "class": PF_CLASS_NAMES[scores["classes"][index]],
+                "hit_factor": np.round(scores["hit_factor"][index], 4).tolist(),
+                "stage_points": np.round(scores["stage_points"][index], 4).tolist(),
+                "match_points": round(float(scores["match_points"][index]), 4),
+                "percent": round(float(scores["percent"][index]), 2),
+                "place": int(scores["place"][index]),
+            })
+        return {"discipline": ruleset.discipline, "season": ruleset.season, "results": results}
+
+
+class HttpProtocol(asyncio.Protocol):
+    # Requests are parsed straight from the receive buffer; a response is
+    # written as soon as its body is complete, so pipelined requests on one
+    # connection are answered in order without a task per request.
+    def __init__(self, service):
+        self.service = service
+        self.buffer = bytearray()
+        self.transport = None
+
+    def connection_made(self, transport):
+        self.transport = transport
+
+    def data_received(self, data):
+        self.buffer += data
+        while self.transport is not None and not self.transport.is_closing():
+            end = self.buffer.find(b"\r\n\r\n")
+            if end < 0:
+                if len(self.buffer) > MAX_HEADER_BYTES:
+                    self.respond(400, b'{"error": "Headers too large"}', keep_alive=False)
+                return
+            try:
+                request_line, *header_lines = self.buffer[:end].decode("latin-1").split("\r\n")
+                method, path, version = request_line.split(" ")
+                headers = {}
+                for line in header_lines:
+                    name, _, value = line.partition(":")
+                    headers[name.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+            except ValueError:
+                self.respond(400, b'{"error": "Malformed request"}', keep_alive=False)
+                return
+            connection = headers.get("connection", "").lower()
+            keep_alive = connection != "close" if version == "HTTP/1.1" else connection == "keep-alive"
+            if "chunked" in headers.get("transfer-encoding", "").lower():
+                self.respond(411, b'{"error": "Send a Content-Length"}', keep_alive=False)
+                return
+            if length > MAX_BODY_BYTES:
+                self.respond(413, b'{"error": "Request too large"}', keep_alive=False)
+                return
+            if len(self.buffer) < end + 4 + length:
+                return  # wait for the rest of the body
+            body = bytes(self.buffer[end + 4:end + 4 + length])
+            del self.buffer[:end + 4 + length]
+            try:
+                status, response = self.service.handle(method, path, body)
+            except Exception as e:
+                status, response = 500, json.dumps({"error": repr(e)}).encode("utf-8")
+            self.respond(status, response, keep_alive)
+
+    def respond(self, status, body, keep_alive=True):
+        self.transport.write(
+            f"HTTP/1.1 {status} {REASONS[status]}\r\n"
+            f"Content-Type: application/json\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n".encode("latin-1") + body)
+        if not keep_alive:
+            self.transport.close()
+
+    def connection_lost(self, exc):
+        self.transport = None
+
+
+async def serve(service, host, port):
+    loop = asyncio.get_running_loop()
+    server = await loop.create_server(lambda: HttpProtocol(service), host, port)
+    print(f"Serving on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="OKTS power factor and scoring JSON API")
+    parser.add_argument("--host", default=SERVICE_HOST)
+    parser.add_argument("--port", type=int, default=SERVICE_PORT)
+    parser.add_argument("--rulesets", nargs="*", default=[],
+                        help="extra rulesets.json files, e.g. the one in the app data folder")
+    args = parser.parse_args()
+
+    service = PowerFactorService(load_rulesets(args.rulesets))
+    if uvloop is not None:
+        uvloop.install()
+    try:
+        asyncio.run(serve(service, args.host, args.port))
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()